@@ -0,0 +1,199 @@
+"""
+    Timing, memory and baseline comparison helpers for the hot path benchmarks.
+
+    Measurements are saved as JSON so a run can be stored as a baseline and later
+    runs compared against it, failing when an operation got slower than a threshold.
+"""
+
+import argparse
+import json
+import platform
+import sys
+import tracemalloc
+from collections.abc import Callable, Iterable, Mapping
+from dataclasses import asdict, dataclass
+from math import inf
+from pathlib import Path
+from time import perf_counter
+from typing import Any
+
+# Small sizes are looped until at least this many elements were processed,
+# so their timings aren't dominated by timer resolution.
+_TARGET_ELEMENTS = 100_000
+
+
+@dataclass(frozen=True)
+class Measurement:
+    structure: str
+    operation: str
+    size: int
+    value: float
+    unit: str
+
+    @property
+    def key(self) -> tuple[str, str, int]:
+        return self.structure, self.operation, self.size
+
+
+@dataclass(frozen=True)
+class Case:
+    """An operation timed on a structure; [prepare] receives the elements and returns
+    the callable to time. Cases with a [max_size] are skipped above it (e.g. quadratic ones).
+    """
+
+    structure: str
+    operation: str
+    prepare: Callable[[list[int]], Callable[[], object]]
+    max_size: int | None = None
+
+
+@dataclass(frozen=True)
+class Regression:
+    current: Measurement
+    baseline: Measurement
+
+    @property
+    def ratio(self) -> float:
+        return self.current.value / self.baseline.value
+
+
+def time_per_element(prepare: Callable[[], Callable[[], object]], size: int, repeat: int) -> float:
+    """Best of [repeat] runs of the operations returned by [prepare], in ns per element.
+
+    [prepare] runs outside the timed region, so e.g. a dequeue benchmark doesn't pay
+    for filling the queue.
+    """
+    loops = max(1, _TARGET_ELEMENTS // max(size, 1))
+    best = inf
+    for _ in range(repeat):
+        operations = [prepare() for _ in range(loops)]
+        start = perf_counter()
+        for operation in operations:
+            operation()
+        best = min(best, perf_counter() - start)
+        del operations
+
+    return best / (loops * max(size, 1)) * 1e9
+
+
+def bytes_per_element(build: Callable[[], object], size: int) -> float:
+    """Peak memory traced while [build] creates a structure of [size] elements, per element.
+
+    Elements should be created beforehand, so only the container is charged.
+    """
+    tracemalloc.start()
+    structure = build()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del structure
+
+    return peak / max(size, 1)
+
+
+def save(measurements: Iterable[Measurement], path: str | Path) -> None:
+    document = {
+        "python": platform.python_version(),
+        "machine": platform.machine(),
+        "measurements": [asdict(measurement) for measurement in measurements],
+    }
+    Path(path).write_text(json.dumps(document, indent=2))
+
+
+def load(path: str | Path) -> list[Measurement]:
+    document: dict[str, Any] = json.loads(Path(path).read_text())
+    return [Measurement(**measurement) for measurement in document["measurements"]]
+
+
+def compare(
+    current: Iterable[Measurement],
+    baseline: Iterable[Measurement],
+    threshold: float = 0.1,
+    thresholds: Mapping[str, float] | None = None,
+) -> list[Regression]:
+    """Measurements that grew more than their threshold over the matching baseline one.
+
+    [threshold] is the default allowed relative growth (0.1 is 10%); [thresholds]
+    overrides it per operation name. Measurements missing from either side are ignored.
+    """
+    thresholds = thresholds or {}
+    baseline_by_key = {measurement.key: measurement for measurement in baseline}
+    regressions: list[Regression] = []
+
+    for measurement in current:
+        previous = baseline_by_key.get(measurement.key)
+        if previous is None or previous.value <= 0:
+            continue
+        allowed = thresholds.get(measurement.operation, threshold)
+        if measurement.value > previous.value * (1 + allowed):
+            regressions.append(Regression(measurement, previous))
+
+    return regressions
+
+
+def parse_thresholds(values: Iterable[str]) -> dict[str, float]:
+    """Parses `operation=threshold` command line pairs"""
+    thresholds: dict[str, float] = {}
+    for value in values:
+        operation, _, threshold = value.partition("=")
+        thresholds[operation] = float(threshold)
+
+    return thresholds
+
+
+def main(description: str, cases: list[Case], builders: Mapping[str, Callable[[list[int]], object]]) -> int:
+    """Command line entry point shared by the hot path benchmarks, returning the exit code:
+    1 when a regression against `--baseline` was found.
+    """
+    parser = argparse.ArgumentParser(description=description)
+    parser.add_argument(
+        "--sizes", type=int, nargs="+", default=[10, 1_000, 100_000, 1_000_000, 10_000_000]
+    )
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--output", help="write the measurements to this JSON file")
+    parser.add_argument("--baseline", help="JSON file from a previous run to compare against")
+    parser.add_argument("--threshold", type=float, default=0.1, help="allowed slowdown, 0.1 is 10%%")
+    parser.add_argument(
+        "--operation-threshold",
+        action="append",
+        default=[],
+        metavar="OPERATION=THRESHOLD",
+        help="per operation override of --threshold, e.g. contains=0.25",
+    )
+    parser.add_argument("--no-memory", action="store_true", help="skip the tracemalloc pass")
+    args = parser.parse_args()
+
+    measurements: list[Measurement] = []
+    print(f"{'structure':<16} {'operation':<14} {'size':>12} {'value':>12}")
+    for size in args.sizes:
+        items = list(range(size))
+        for case in cases:
+            if case.max_size is not None and size > case.max_size:
+                continue
+            value = time_per_element(lambda: case.prepare(items), size, args.repeat)
+            measurements.append(Measurement(case.structure, case.operation, size, value, "ns/element"))
+            print(f"{case.structure:<16} {case.operation:<14} {size:>12,} {value:>9.1f} ns")
+
+        if not args.no_memory:
+            for structure, build in builders.items():
+                value = bytes_per_element(lambda: build(items), size)
+                measurements.append(Measurement(structure, "memory", size, value, "bytes/element"))
+                print(f"{structure:<16} {'memory':<14} {size:>12,} {value:>9.1f} B")
+
+    if args.output:
+        save(measurements, args.output)
+
+    if args.baseline:
+        thresholds = parse_thresholds(args.operation_threshold)
+        regressions = compare(measurements, load(args.baseline), args.threshold, thresholds)
+        for regression in regressions:
+            current = regression.current
+            print(
+                f"REGRESSION {current.structure}.{current.operation}[{current.size:,}]:"
+                f" {regression.baseline.value:.1f} -> {current.value:.1f} {current.unit}"
+                f" ({regression.ratio:.2f}x)",
+                file=sys.stderr,
+            )
+        if regressions:
+            return 1
+
+    return 0
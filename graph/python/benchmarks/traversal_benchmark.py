@@ -0,0 +1,107 @@
+"""
+    Traversals over a CSRGraph against the usual dict of lists with a set of visited nodes.
+
+    Generates a random graph where every node has `--degree` edges to random nodes,
+    plus a random DAG of the same size for the topological sort, then times a full
+    traversal from node 0 with each function, and the memory of each representation.
+
+    Run from `graph/python`:
+        python -m benchmarks.traversal_benchmark [--nodes N] [--degree N]
+"""
+
+import argparse
+import random
+import sys
+from array import array
+from collections.abc import Iterator
+from time import perf_counter
+from typing import Any, Callable
+
+from graph.csr import CSRGraph
+from graph.traversal import bfs, bfs_levels, bfs_levels_array, dfs, topological_sort
+from queue.queue import Queue
+
+
+def bfs_dict_of_lists(adjacency: dict[int, list[int]], source: int) -> Iterator[int]:
+    """The hand-rolled BFS this module replaces"""
+    visited = {source}
+    queue = Queue[int]()
+    queue.enqueue(source)
+    while queue.is_not_empty:
+        node = queue.dequeue()
+        yield node
+        for target in adjacency[node]:
+            if target not in visited:
+                visited.add(target)
+                queue.enqueue(target)
+
+
+def random_graph(nodes: int, degree: int, *, acyclic: bool) -> CSRGraph:
+    """Every node has `degree` edges to random nodes, or to random higher nodes if `acyclic`"""
+    generator = random.Random(42)
+    if not acyclic:
+        offsets = array("q", range(0, nodes * degree + 1, degree))
+        return CSRGraph(offsets, array("i", generator.choices(range(nodes), k=nodes * degree)))
+
+    # The last node has nowhere to go.
+    offsets = array("q", range(0, (nodes - 1) * degree + 1, degree))
+    offsets.append(offsets[-1])
+    random_fraction = generator.random
+    targets = array(
+        "i", (node + 1 + int(random_fraction() * (nodes - node - 1)) for node in range(nodes - 1) for _ in range(degree))
+    )
+
+    return CSRGraph(offsets, targets)
+
+
+def timed(operation: Callable[[], Any]) -> tuple[float, Any]:
+    start = perf_counter()
+    result = operation()
+    return perf_counter() - start, result
+
+
+def report(label: str, seconds: float, visited: int, edges: int) -> None:
+    print(f"{label:<26} {seconds:>7.2f} s  {visited:>11,} nodes  {edges / seconds / 1e6:>6.1f} M edges/s")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--nodes", type=int, default=1_000_000)
+    parser.add_argument("--degree", type=int, default=10)
+    args = parser.parse_args()
+
+    seconds, graph = timed(lambda: random_graph(args.nodes, args.degree, acyclic=False))
+    print(f"{graph.node_count:,} nodes, {graph.edge_count:,} edges, generated in {seconds:.1f} s")
+
+    csr_bytes = sum(len(values) * values.itemsize for values in (graph.offsets, graph.targets))
+    adjacency = {node: graph.neighbors(node).tolist() for node in range(graph.node_count)}
+    dict_bytes = sys.getsizeof(adjacency) + sum(sys.getsizeof(neighbors) for neighbors in adjacency.values())
+    # Each list holds its own int objects, but for the small ones CPython caches.
+    dict_bytes += sum(sys.getsizeof(target) for neighbors in adjacency.values() for target in neighbors if target > 256)
+    print(f"memory: CSRGraph {csr_bytes / 2**20:,.0f} MiB, dict of lists {dict_bytes / 2**20:,.0f} MiB")
+
+    cases: dict[str, Callable[[], int]] = {
+        "bfs, dict of lists + set": lambda: sum(1 for _ in bfs_dict_of_lists(adjacency, 0)),
+        "bfs": lambda: sum(1 for _ in bfs(graph, 0)),
+        "bfs_levels": lambda: sum(len(level) for level in bfs_levels(graph, 0)),
+        "dfs": lambda: sum(1 for _ in dfs(graph, 0)),
+    }
+    try:
+        import numpy  # noqa: F401
+
+        cases["bfs_levels_array"] = lambda: sum(len(level) for level in bfs_levels_array(graph, 0))
+    except ImportError:
+        print("numpy isn't installed, skipping bfs_levels_array")
+
+    for label, case in cases.items():
+        seconds, visited = timed(case)
+        report(label, seconds, visited, graph.edge_count)
+    del adjacency
+
+    dag = random_graph(args.nodes, args.degree, acyclic=True)
+    seconds, visited = timed(lambda: sum(1 for _ in topological_sort(dag)))
+    report("topological_sort (DAG)", seconds, visited, dag.edge_count)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,16 @@
+"""
+    Graph algorithms in python lang, built on the Queue and Stack of this repository.
+
+    `queue/python` and `stack/python` aren't installed packages, so they're put first
+    on `sys.path`. Import `graph` before the standard library `queue` module is
+    imported, since this repository's `queue` package takes its name.
+"""
+
+import sys
+from pathlib import Path
+
+_ROOT = Path(__file__).resolve().parents[3]
+
+for _directory in (_ROOT / "stack" / "python", _ROOT / "queue" / "python"):
+    if str(_directory) not in sys.path:
+        sys.path.insert(0, str(_directory))
@@ -0,0 +1,82 @@
+"""
+    Fixed-size set of small integers as a bit array implementation in python lang
+"""
+
+from collections.abc import Iterable, Iterator
+
+
+class Bitset:
+    """
+    A set of the integers 0 to `size` - 1 taking one bit each, `size` / 8 bytes in a
+    `bytearray`: 125 KB for a million nodes, where a set of ints takes tens of MB.
+    Bit `i` is bit `i % 8` of byte `i // 8`, the layout of NumPy's `packbits` with
+    `bitorder="little"`.
+    """
+
+    _bits: bytearray
+    _size: int
+
+    def __init__(self, size: int, elements: Iterable[int] = ()) -> None:
+        if size < 0:
+            raise ValueError("size must be a non-negative integer")
+
+        self._bits = bytearray((size + 7) >> 3)
+        self._size = size
+        for element in elements:
+            self.add(element)
+
+    @property
+    def size(self) -> int:
+        return self._size
+
+    @property
+    def bits(self) -> bytearray:
+        """The underlying bytes, for hot loops that test and set bits inline"""
+        return self._bits
+
+    def add(self, element: int) -> None:
+        """
+        :raises IndexError: if `element` isn't between 0 and `size` - 1
+        """
+        self._check(element)
+        self._bits[element >> 3] |= 1 << (element & 7)
+
+    def discard(self, element: int) -> None:
+        if 0 <= element < self._size:
+            self._bits[element >> 3] &= ~(1 << (element & 7)) & 0xFF
+
+    def test_and_add(self, element: int) -> bool:
+        """Adds `element`, returning whether it was already there
+
+        :raises IndexError: if `element` isn't between 0 and `size` - 1
+        """
+        self._check(element)
+        byte, mask = element >> 3, 1 << (element & 7)
+        present = self._bits[byte] & mask
+        self._bits[byte] |= mask
+
+        return bool(present)
+
+    def clear(self) -> None:
+        self._bits = bytearray(len(self._bits))
+
+    def __contains__(self, element: object) -> bool:
+        if not isinstance(element, int) or not 0 <= element < self._size:
+            return False
+        return bool(self._bits[element >> 3] & (1 << (element & 7)))
+
+    def __len__(self) -> int:
+        """Number of elements in the set, counting the bits in O(size / 8)"""
+        return int.from_bytes(self._bits, "little").bit_count()
+
+    def __iter__(self) -> Iterator[int]:
+        """The elements, in increasing order"""
+        for byte_index, byte in enumerate(self._bits):
+            while byte:
+                low = byte & -byte
+                yield (byte_index << 3) + low.bit_length() - 1
+                byte ^= low
+
+    def _check(self, element: int) -> None:
+        if not 0 <= element < self._size:
+            raise IndexError(f"{element} isn't between 0 and {self._size - 1}")
@@ -0,0 +1,153 @@
+"""
+    Directed graph in compressed sparse row (CSR) form implementation in python lang
+"""
+
+from array import array
+from collections.abc import Iterable, Mapping, Sequence
+from typing import Any, Self
+
+# Formats of the integer buffers accepted as is, like those of NumPy arrays.
+_INTEGER_FORMATS = frozenset("bBhHiIlLqQnN")
+
+
+class CSRGraph:
+    """
+    A directed graph whose nodes are the integers 0 to `node_count` - 1. The targets
+    of every edge are stored in one flat array, grouped by source, and `offsets[node]`
+    is where the targets of `node` start: its neighbors are
+    `targets[offsets[node] : offsets[node + 1]]`.
+
+    Offsets are 64-bit, and targets 32-bit while the node ids fit, so a graph takes
+    about 8 bytes per node and 4 per edge, against hundreds of bytes per node for a
+    dict of lists. Both are `array.array`s, which NumPy can wrap without copying.
+    """
+
+    _offsets: array[int]
+    _targets: array[int]
+
+    def __init__(self, offsets: Any, targets: Any) -> None:
+        """
+        :param offsets: `node_count` + 1 non-decreasing integers, from 0 to the number of edges
+        :param targets: the target of every edge, grouped by source node
+        :raises ValueError: if the arrays aren't a valid CSR graph
+        """
+        self._offsets = _int_array(offsets, "q")
+        node_count = len(self._offsets) - 1
+        self._targets = _int_array(targets, _target_typecode(node_count))
+
+        if node_count < 0 or self._offsets[0] != 0 or self._offsets[-1] != len(self._targets):
+            raise ValueError("offsets must go from 0 to the number of edges")
+        if any(start > end for start, end in zip(self._offsets, self._offsets[1:])):
+            raise ValueError("offsets must be non-decreasing")
+        if self._targets and not (0 <= min(self._targets) and max(self._targets) < node_count):
+            raise ValueError(f"targets must be node ids, between 0 and {node_count - 1}")
+
+    @classmethod
+    def from_edges(cls, node_count: int, edges: Iterable[tuple[int, int]]) -> Self:
+        """Builds the graph of `edges`, `(source, target)` pairs, keeping their order for each source
+
+        :raises ValueError: if a node isn't between 0 and `node_count` - 1
+        """
+        sources = array("q")
+        targets = array(_target_typecode(node_count))
+        for source, target in edges:
+            sources.append(source)
+            targets.append(target)
+        if sources and not (0 <= min(sources) and max(sources) < node_count):
+            raise ValueError(f"sources must be node ids, between 0 and {node_count - 1}")
+
+        # Counting sort of the edges by source.
+        offsets = array("q", bytes(8 * (node_count + 1)))
+        for source in sources:
+            offsets[source + 1] += 1
+        for node in range(node_count):
+            offsets[node + 1] += offsets[node]
+        sorted_targets = array(targets.typecode, bytes(targets.itemsize * len(targets)))
+        cursors = offsets[:-1]
+        for source, target in zip(sources, targets):
+            sorted_targets[cursors[source]] = target
+            cursors[source] += 1
+
+        return cls(offsets, sorted_targets)
+
+    @classmethod
+    def from_adjacency(cls, adjacency: Sequence[Iterable[int]] | Mapping[int, Iterable[int]]) -> Self:
+        """Builds the graph of a list of neighbor lists, or of a dict from node to neighbors
+
+        :raises ValueError: if a neighbor isn't a node of the graph
+        """
+        if isinstance(adjacency, Mapping):
+            node_count = max(adjacency, default=-1) + 1
+            neighbor_lists: Iterable[Iterable[int]] = (adjacency.get(node, ()) for node in range(node_count))
+        else:
+            node_count = len(adjacency)
+            neighbor_lists = adjacency
+
+        offsets = array("q", [0])
+        targets = array(_target_typecode(node_count))
+        for neighbors in neighbor_lists:
+            targets.extend(neighbors)
+            offsets.append(len(targets))
+
+        return cls(offsets, targets)
+
+    @property
+    def offsets(self) -> array[int]:
+        return self._offsets
+
+    @property
+    def targets(self) -> array[int]:
+        return self._targets
+
+    @property
+    def node_count(self) -> int:
+        return len(self._offsets) - 1
+
+    @property
+    def edge_count(self) -> int:
+        return len(self._targets)
+
+    def neighbors(self, node: int) -> array[int]:
+        """The targets of the edges leaving `node`, in order
+
+        :raises IndexError: if `node` isn't a node of the graph
+        """
+        if not 0 <= node < self.node_count:
+            raise IndexError(f"node {node} isn't between 0 and {self.node_count - 1}")
+
+        return self._targets[self._offsets[node] : self._offsets[node + 1]]
+
+    def degree(self, node: int) -> int:
+        """Number of edges leaving `node`"""
+        return self._offsets[node + 1] - self._offsets[node]
+
+    def __len__(self) -> int:
+        return self.node_count
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}(node_count={self.node_count}, edge_count={self.edge_count})"
+
+
+def _target_typecode(node_count: int) -> str:
+    return "i" if node_count <= 2**31 else "q"
+
+
+def _int_array(values: Any, typecode: str) -> array[int]:
+    """`values` as an array of `typecode`, copying integer buffers of the same width in one step"""
+    if isinstance(values, array) and values.typecode == typecode:
+        return values
+
+    result = array(typecode)
+    try:
+        view = memoryview(values)
+    except TypeError:
+        result.extend(values)
+        return result
+
+    with view:
+        if view.format in _INTEGER_FORMATS and view.itemsize == result.itemsize and view.c_contiguous:
+            result.frombytes(view.cast("B"))
+        else:
+            result.extend(view.tolist())
+
+    return result
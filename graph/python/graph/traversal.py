@@ -0,0 +1,209 @@
+"""
+    Breadth-first and depth-first traversals and topological sort over a CSRGraph
+
+    The traversals are generators, yielding each node as soon as it's reached, so a
+    search can stop early without visiting the whole graph. Visited nodes are kept
+    in a `Bitset`, one bit per node, tested and set inline in the loops. BFS goes
+    through a `Queue`, DFS and topological sort through a `Stack`.
+"""
+
+from array import array
+from collections.abc import Iterable, Iterator
+from graphlib import CycleError
+from typing import TYPE_CHECKING, Any
+
+from graph.bitset import Bitset
+from graph.csr import CSRGraph
+from module.stack import Stack
+from queue.queue import Queue
+
+if TYPE_CHECKING:
+    import numpy
+
+
+def bfs(graph: CSRGraph, sources: int | Iterable[int]) -> Iterator[int]:
+    """Yields the nodes reachable from `sources`, in breadth-first order
+
+    :param sources: a node, or several nodes to start from at once
+    :raises IndexError: if a source isn't a node of `graph`
+    """
+    offsets, targets = graph.offsets, graph.targets
+    bits = Bitset(graph.node_count).bits
+    queue = Queue[int]()
+    queue.enqueue_many(_mark_sources(graph, sources, bits))
+    dequeue, enqueue_many = queue.dequeue, queue.enqueue_many
+
+    while len(queue):
+        node = dequeue()
+        yield node
+
+        reached = []
+        for target in targets[offsets[node] : offsets[node + 1]]:
+            byte, mask = target >> 3, 1 << (target & 7)
+            if not bits[byte] & mask:
+                bits[byte] |= mask
+                reached.append(target)
+        enqueue_many(reached)
+
+
+def bfs_levels(graph: CSRGraph, sources: int | Iterable[int]) -> Iterator[list[int]]:
+    """Yields the nodes reachable from `sources` one level at a time, level-synchronously:
+    the sources, then the nodes one edge away from them, and so on. Each level is
+    expanded in a single pass over its nodes.
+
+    :param sources: a node, or several nodes to start from at once
+    :raises IndexError: if a source isn't a node of `graph`
+    """
+    offsets, targets = graph.offsets, graph.targets
+    bits = Bitset(graph.node_count).bits
+    frontier = Queue[int]()
+    frontier.enqueue_many(_mark_sources(graph, sources, bits))
+
+    while len(frontier):
+        level = frontier.dequeue_many(len(frontier))
+        yield level
+
+        reached = []
+        append = reached.append
+        for node in level:
+            for target in targets[offsets[node] : offsets[node + 1]]:
+                byte, mask = target >> 3, 1 << (target & 7)
+                if not bits[byte] & mask:
+                    bits[byte] |= mask
+                    append(target)
+        frontier.enqueue_many(reached)
+
+
+def bfs_levels_array(graph: CSRGraph, sources: int | Iterable[int]) -> Iterator["numpy.ndarray[Any, Any]"]:
+    """Like `bfs_levels`, expanding each level with vectorized NumPy operations over the
+    CSR arrays, which NumPy reads in place. Requires `numpy`.
+
+    Each level is yielded as a sorted array of node ids, instead of in discovery order.
+
+    :raises IndexError: if a source isn't a node of `graph`
+    """
+    try:
+        import numpy
+    except ImportError as error:
+        raise ImportError("bfs_levels_array requires numpy, install it with `pip install numpy`") from error
+
+    offsets = numpy.frombuffer(graph.offsets, dtype=numpy.dtype(graph.offsets.typecode))
+    targets = numpy.frombuffer(graph.targets, dtype=numpy.dtype(graph.targets.typecode))
+    visited = Bitset(graph.node_count)
+    frontier = numpy.array(sorted(set(_mark_sources(graph, sources, visited.bits))), dtype=numpy.int64)
+    bits = numpy.frombuffer(visited.bits, dtype=numpy.uint8)
+
+    while frontier.size:
+        yield frontier
+
+        starts = offsets[frontier]
+        counts = offsets[frontier + 1] - starts
+        total = int(counts.sum())
+        if not total:
+            break
+
+        # Index of every edge leaving the frontier: each run of `count` indexes begins at its `start`.
+        run_starts = numpy.cumsum(counts) - counts
+        edges = numpy.arange(total, dtype=numpy.int64) + numpy.repeat(starts - run_starts, counts)
+        reached = targets[edges].astype(numpy.int64)
+        reached = numpy.unique(reached[(bits[reached >> 3] >> (reached & 7)) & 1 == 0])
+        numpy.bitwise_or.at(bits, reached >> 3, (1 << (reached & 7)).astype(numpy.uint8))
+        frontier = reached
+
+
+def dfs(graph: CSRGraph, sources: int | Iterable[int]) -> Iterator[int]:
+    """Yields the nodes reachable from `sources` in depth-first preorder, neighbors in edge order
+
+    :param sources: a node, or several nodes to search from one after the other
+    :raises IndexError: if a source isn't a node of `graph`
+    """
+    offsets, targets = graph.offsets, graph.targets
+    bits = Bitset(graph.node_count).bits
+    stack = Stack[int]()
+    starts = [sources] if isinstance(sources, int) else list(sources)
+    for source in starts:
+        _check_node(graph, source)
+    stack.push_all(starts[::-1])
+    pop, push_all = stack.pop, stack.push_all
+
+    # Nodes are pushed once per edge reaching them while unvisited, and skipped if popped again.
+    while len(stack):
+        node = pop()
+        byte, mask = node >> 3, 1 << (node & 7)
+        if bits[byte] & mask:
+            continue
+        bits[byte] |= mask
+        yield node
+
+        neighbors = targets[offsets[node] : offsets[node + 1]]
+        neighbors.reverse()
+        push_all([target for target in neighbors if not bits[target >> 3] & (1 << (target & 7))])
+
+
+def topological_sort(graph: CSRGraph) -> Iterator[int]:
+    """Yields every node after all the nodes with an edge to it, from an iterative depth-first search
+
+    The order is only known once the search is over, so the first node comes after
+    O(nodes + edges) work, the others in O(1) each.
+
+    :raises graphlib.CycleError: if `graph` has a cycle, with the nodes of one in `args[1]`
+    """
+    offsets, targets = graph.offsets, graph.targets
+    done = Bitset(graph.node_count).bits
+    on_path = Bitset(graph.node_count).bits
+    path: list[int] = []
+    postorder = array("q")
+    stack = Stack[int]()
+    push, pop = stack.push, stack.pop
+
+    for root in range(graph.node_count):
+        if done[root >> 3] & (1 << (root & 7)):
+            continue
+
+        push(root)
+        while len(stack):
+            node = pop()
+            if node < 0:
+                # All the nodes reachable from ~node are done, so it is.
+                node = ~node
+                byte, mask = node >> 3, 1 << (node & 7)
+                on_path[byte] &= ~mask
+                done[byte] |= mask
+                path.pop()
+                postorder.append(node)
+                continue
+
+            byte, mask = node >> 3, 1 << (node & 7)
+            if done[byte] & mask:
+                continue
+            on_path[byte] |= mask
+            path.append(node)
+            push(~node)
+
+            for target in targets[offsets[node] : offsets[node + 1]]:
+                byte, mask = target >> 3, 1 << (target & 7)
+                if on_path[byte] & mask:
+                    cycle = path[path.index(target) :] + [target]
+                    raise CycleError("graph has a cycle", cycle)
+                if not done[byte] & mask:
+                    push(target)
+
+    yield from reversed(postorder)
+
+
+def _mark_sources(graph: CSRGraph, sources: int | Iterable[int], bits: bytearray) -> list[int]:
+    """The distinct `sources`, marked as visited in `bits`"""
+    marked = []
+    for source in [sources] if isinstance(sources, int) else sources:
+        _check_node(graph, source)
+        byte, mask = source >> 3, 1 << (source & 7)
+        if not bits[byte] & mask:
+            bits[byte] |= mask
+            marked.append(source)
+
+    return marked
+
+
+def _check_node(graph: CSRGraph, node: int) -> None:
+    if not 0 <= node < graph.node_count:
+        raise IndexError(f"node {node} isn't between 0 and {graph.node_count - 1}")
@@ -0,0 +1,53 @@
+import unittest
+from array import array
+
+from graph.bitset import Bitset
+from graph.csr import CSRGraph
+
+
+class TestCSRGraph(unittest.TestCase):
+    def test_from_edges(self):
+        graph = CSRGraph.from_edges(4, [(2, 0), (0, 1), (2, 3), (0, 2)])
+        self.assertEqual(graph.node_count, 4)
+        self.assertEqual(graph.edge_count, 4)
+        self.assertListEqual(list(graph.offsets), [0, 2, 2, 4, 4])
+        self.assertListEqual(list(graph.neighbors(0)), [1, 2])
+        self.assertListEqual(list(graph.neighbors(2)), [0, 3])
+        self.assertEqual(graph.degree(1), 0)
+        self.assertRaises(IndexError, graph.neighbors, 4)
+        self.assertRaises(ValueError, CSRGraph.from_edges, 2, [(0, 2)])
+        self.assertRaises(ValueError, CSRGraph.from_edges, 2, [(2, 0)])
+
+    def test_from_adjacency(self):
+        self.assertListEqual(list(CSRGraph.from_adjacency([[1], [2], []]).targets), [1, 2])
+        graph = CSRGraph.from_adjacency({0: [2], 2: [0, 1]})
+        self.assertEqual(len(graph), 3)
+        self.assertListEqual(list(graph.offsets), [0, 1, 1, 3])
+
+    def test_validates_arrays(self):
+        graph = CSRGraph(array("q", [0, 1, 1]), memoryview(array("i", [1])))
+        self.assertEqual(graph.targets.typecode, "i")
+        self.assertRaises(ValueError, CSRGraph, [0, 2], [0])
+        self.assertRaises(ValueError, CSRGraph, [0, 2, 1], [0, 1])
+        self.assertRaises(ValueError, CSRGraph, [0, 1], [1])
+
+
+class TestBitset(unittest.TestCase):
+    def test_set_operations(self):
+        bitset = Bitset(20, [3, 17])
+        self.assertIn(3, bitset)
+        self.assertNotIn(4, bitset)
+        self.assertNotIn(25, bitset)
+        self.assertFalse(bitset.test_and_add(9))
+        self.assertTrue(bitset.test_and_add(9))
+        bitset.discard(3)
+        self.assertListEqual(list(bitset), [9, 17])
+        self.assertEqual(len(bitset), 2)
+        self.assertEqual(len(bitset.bits), 3)
+        self.assertRaises(IndexError, bitset.add, 20)
+        bitset.clear()
+        self.assertEqual(len(bitset), 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,77 @@
+import importlib.util
+import random
+import unittest
+from graphlib import CycleError
+
+from graph.csr import CSRGraph
+from graph.traversal import bfs, bfs_levels, bfs_levels_array, dfs, topological_sort
+
+#  0 -> 1 -> 3 -> 5
+#  |         ^
+#  v         |
+#  2 ------> 4      6 (unreachable)
+EDGES = [(0, 1), (0, 2), (1, 3), (2, 4), (4, 3), (3, 5)]
+
+
+class TestTraversal(unittest.TestCase):
+    def setUp(self):
+        self.graph = CSRGraph.from_edges(7, EDGES)
+
+    def test_bfs(self):
+        self.assertListEqual(list(bfs(self.graph, 0)), [0, 1, 2, 3, 4, 5])
+        self.assertListEqual(list(bfs(self.graph, [4, 6, 4])), [4, 6, 3, 5])
+        self.assertRaises(IndexError, list, bfs(self.graph, 7))
+
+    def test_bfs_levels(self):
+        self.assertListEqual(list(bfs_levels(self.graph, 0)), [[0], [1, 2], [3, 4], [5]])
+        self.assertListEqual(list(bfs_levels(self.graph, [2, 1])), [[2, 1], [4, 3], [5]])
+
+    @unittest.skipUnless(importlib.util.find_spec("numpy"), "requires numpy")
+    def test_bfs_levels_array(self):
+        graph = _random_graph(2000, 6000, seed=3)
+        levels = [sorted(level) for level in bfs_levels(graph, [0, 1])]
+        self.assertListEqual([level.tolist() for level in bfs_levels_array(graph, [1, 0])], levels)
+
+    def test_dfs(self):
+        self.assertListEqual(list(dfs(self.graph, 0)), [0, 1, 3, 5, 2, 4])
+        self.assertListEqual(list(dfs(self.graph, [2, 0])), [2, 4, 3, 5, 0, 1])
+
+    def test_traversals_visit_each_reachable_node_once(self):
+        graph = _random_graph(5000, 20000, seed=1)
+        reachable = set(bfs(graph, 0))
+        self.assertEqual(len(reachable), len(list(bfs(graph, 0))))
+        self.assertSetEqual(set(dfs(graph, 0)), reachable)
+        self.assertSetEqual({node for level in bfs_levels(graph, 0) for node in level}, reachable)
+
+    def test_topological_sort(self):
+        order = list(topological_sort(self.graph))
+        self.assertListEqual(sorted(order), list(range(7)))
+        position = {node: index for index, node in enumerate(order)}
+        self.assertTrue(all(position[source] < position[target] for source, target in EDGES))
+
+        dag = _random_graph(3000, 12000, seed=2, acyclic=True)
+        position = {node: index for index, node in enumerate(topological_sort(dag))}
+        self.assertEqual(len(position), 3000)
+        self.assertTrue(
+            all(position[node] < position[target] for node in range(3000) for target in dag.neighbors(node))
+        )
+
+    def test_topological_sort_reports_a_cycle(self):
+        graph = CSRGraph.from_edges(4, [(0, 1), (1, 2), (2, 3), (3, 1)])
+        with self.assertRaises(CycleError) as context:
+            list(topological_sort(graph))
+        self.assertListEqual(context.exception.args[1], [1, 2, 3, 1])
+        self.assertRaises(CycleError, list, topological_sort(CSRGraph.from_edges(1, [(0, 0)])))
+
+
+def _random_graph(nodes: int, edges: int, *, seed: int, acyclic: bool = False) -> CSRGraph:
+    generator = random.Random(seed)
+    pairs = [(generator.randrange(nodes), generator.randrange(nodes)) for _ in range(edges)]
+    if acyclic:
+        pairs = [(min(pair), max(pair)) for pair in pairs if pair[0] != pair[1]]
+
+    return CSRGraph.from_edges(nodes, pairs)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,14 @@
+"""
+    Benchmarks of the Queue package.
+
+    The regression harness is shared with the stack package, in the `benchmarking`
+    package at the root of the repository, which is put on `sys.path`.
+"""
+
+import sys
+from pathlib import Path
+
+_ROOT = str(Path(__file__).resolve().parents[3])
+
+if _ROOT not in sys.path:
+    sys.path.append(_ROOT)
@@ -0,0 +1,68 @@
+"""
+    Batched enqueue_many/dequeue_many against per-item enqueue/dequeue loops.
+
+    Run from `queue/python`:
+        python -m benchmarks.batch_benchmark [--items N]
+"""
+
+import argparse
+import importlib.util
+from time import perf_counter
+from typing import Callable
+
+from queue.queue import Queue
+
+
+def timed(operation: Callable[[], object]) -> float:
+    start = perf_counter()
+    operation()
+    return perf_counter() - start
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--items", type=int, default=1_000_000)
+    args = parser.parse_args()
+
+    items = list(range(args.items))
+    results: dict[str, float] = {}
+
+    def enqueue_loop() -> None:
+        queue = Queue[int](max_capacity=args.items)
+        for item in items:
+            queue.enqueue(item)
+
+    def dequeue_loop() -> None:
+        for _ in range(args.items):
+            loaded.dequeue()
+
+    results["enqueue loop"] = timed(enqueue_loop)
+    results["enqueue_many"] = timed(
+        lambda: Queue[int](max_capacity=args.items).enqueue_many(items)
+    )
+    results["from_sequence"] = timed(
+        lambda: Queue[int].from_sequence(items, max_capacity=args.items)
+    )
+
+    loaded = Queue[int].from_sequence(items)
+    results["dequeue loop"] = timed(dequeue_loop)
+
+    loaded = Queue[int].from_sequence(items)
+    results["dequeue_many (all)"] = timed(lambda: loaded.dequeue_many(args.items))
+
+    loaded = Queue[int].from_sequence(items)
+    results["dequeue_many (chunks of 1000)"] = timed(
+        lambda: [loaded.dequeue_many(1000) for _ in range(args.items // 1000)]
+    )
+
+    if importlib.util.find_spec("numpy") is not None:
+        loaded = Queue[int].from_sequence(items)
+        results["dequeue_array (all)"] = timed(lambda: loaded.dequeue_array(args.items, "int64"))
+
+    print(f"{args.items:,} items")
+    for label, elapsed in results.items():
+        print(f"{label:<30} {elapsed * 1e3:>9.1f} ms {elapsed / args.items * 1e9:>8.1f} ns/item")
+
+
+if __name__ == "__main__":
+    main()
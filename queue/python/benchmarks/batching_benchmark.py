@@ -0,0 +1,108 @@
+"""
+    Micro-batching consumers against one sink call per element.
+
+    A producer thread feeds a BlockingQueue, and the consumer writes every element
+    to a sink: an in-memory SQLite table, where a batch is one `executemany` in one
+    transaction, and a stand-in for a remote call costing `--rpc-ms` per call
+    whatever its size. Prints the throughput of each consumer and, for the batched
+    ones, the distribution of the batch sizes.
+
+    Run from `queue/python`:
+        python -m benchmarks.batching_benchmark [--items N] [--batch N] [--linger SECONDS] [--workers N]
+"""
+
+import argparse
+import sqlite3
+import threading
+import time
+from time import perf_counter
+from typing import Any, Callable
+
+from queue.batching import BatchStats, consume_batches
+from queue.blocking_queue import BlockingQueue
+from queue.empty_queue_exception import EmptyQueueException
+
+Row = tuple[int, str]
+
+
+def sqlite_sink() -> tuple[Callable[[Row], Any], Callable[[list[Row]], Any]]:
+    connection = sqlite3.connect(":memory:", check_same_thread=False)
+    connection.execute("CREATE TABLE events (id INTEGER PRIMARY KEY, payload TEXT)")
+    lock = threading.Lock()
+
+    def insert_one(row: Row) -> None:
+        with lock, connection:
+            connection.execute("INSERT INTO events VALUES (?, ?)", row)
+
+    def insert_batch(batch: list[Row]) -> None:
+        with lock, connection:
+            connection.executemany("INSERT INTO events VALUES (?, ?)", batch)
+
+    return insert_one, insert_batch
+
+
+def rpc_sink(latency: float) -> tuple[Callable[[Row], Any], Callable[[list[Row]], Any]]:
+    return (lambda row: time.sleep(latency)), (lambda batch: time.sleep(latency))
+
+
+def fed_queue(items: int) -> BlockingQueue[Row]:
+    """A queue a producer thread fills with `items` rows then closes"""
+    queue = BlockingQueue[Row](max_capacity=10_000)
+
+    def produce() -> None:
+        for index in range(items):
+            queue.put((index, "payload"))
+        queue.close()
+
+    threading.Thread(target=produce, daemon=True).start()
+    return queue
+
+
+def one_by_one(queue: BlockingQueue[Row], sink: Callable[[Row], Any]) -> None:
+    while True:
+        try:
+            row = queue.get()
+        except EmptyQueueException:
+            return
+        sink(row)
+
+
+def report(label: str, items: int, seconds: float, stats: BatchStats | None = None) -> None:
+    line = f"  {label:<34} {items / seconds:>12,.0f} items/s"
+    if stats is not None:
+        sizes = {bucket: count for bucket, count in stats.as_dict()["sizes"].items() if count}
+        line += f"  mean batch {stats.mean_size:,.1f}, {sizes}, flushes {stats.flushes}"
+    print(line)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--items", type=int, default=200_000)
+    parser.add_argument("--batch", type=int, default=500)
+    parser.add_argument("--linger", type=float, default=0.005)
+    parser.add_argument("--workers", type=int, default=4)
+    parser.add_argument("--rpc-ms", type=float, default=2.0)
+    args = parser.parse_args()
+
+    sinks = {"sqlite": sqlite_sink, "rpc": lambda: rpc_sink(args.rpc_ms / 1000)}
+    for name, make_sink in sinks.items():
+        # Calls costing milliseconds each would take minutes one by one.
+        items = args.items if name == "sqlite" else args.items // 20
+        print(f"{name} sink, {items:,} items")
+
+        insert_one, _ = make_sink()
+        queue = fed_queue(items)
+        start = perf_counter()
+        one_by_one(queue, insert_one)
+        report("one by one", items, perf_counter() - start)
+
+        for workers in (1, args.workers):
+            _, insert_batch = make_sink()
+            queue = fed_queue(items)
+            start = perf_counter()
+            stats = consume_batches(queue, insert_batch, args.batch, args.linger, workers=workers)
+            report(f"consume_batches, {workers} worker(s)", items, perf_counter() - start, stats)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,90 @@
+"""
+    Throughput of BlockingQueue against the standard library queue.Queue.
+
+    Run from `queue/python`:
+        python -m benchmarks.blocking_queue_benchmark [--items N] [--capacity N]
+"""
+
+import argparse
+import threading
+from time import perf_counter
+from typing import Any, Callable
+
+from benchmarks.stdlib import stdlib_queue
+from queue.blocking_queue import BlockingQueue
+
+THREAD_COUNTS = (1, 2, 4, 8, 16)
+
+_SENTINEL = object()
+
+
+def run(
+    put: Callable[[Any], None],
+    get: Callable[[], Any],
+    *,
+    producers: int,
+    consumers: int,
+    items: int,
+) -> float:
+    """Moves `items` elements from `producers` to `consumers` threads, returns items/sec"""
+    per_producer = items // producers
+
+    def produce() -> None:
+        for item in range(per_producer):
+            put(item)
+
+    def consume() -> None:
+        while get() is not _SENTINEL:
+            pass
+
+    consumer_threads = [threading.Thread(target=consume) for _ in range(consumers)]
+    producer_threads = [threading.Thread(target=produce) for _ in range(producers)]
+
+    start = perf_counter()
+    for thread in consumer_threads + producer_threads:
+        thread.start()
+    for thread in producer_threads:
+        thread.join()
+    for _ in consumer_threads:
+        put(_SENTINEL)
+    for thread in consumer_threads:
+        thread.join()
+    elapsed = perf_counter() - start
+
+    return per_producer * producers / elapsed
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--items", type=int, default=200_000)
+    parser.add_argument("--capacity", type=int, default=1024)
+    args = parser.parse_args()
+
+    print(f"{'threads':>8} {'BlockingQueue':>16} {'queue.Queue':>16} {'ratio':>7}")
+
+    for threads in THREAD_COUNTS:
+        blocking = BlockingQueue[Any](max_capacity=args.capacity)
+        ours = run(
+            blocking.put,
+            blocking.get,
+            producers=threads,
+            consumers=threads,
+            items=args.items,
+        )
+
+        reference_queue = stdlib_queue().Queue(maxsize=args.capacity)
+        reference = run(
+            reference_queue.put,
+            reference_queue.get,
+            producers=threads,
+            consumers=threads,
+            items=args.items,
+        )
+
+        print(
+            f"{f'{threads}x{threads}':>8} {ours:>12,.0f}/s {reference:>12,.0f}/s {ours / reference:>7.2f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,122 @@
+"""
+    BroadcastQueue against copying every element into one Queue per subscriber.
+
+    Each subscriber receives every element. Elements are published in rounds of
+    `--round` elements, after which every subscriber reads what it got, one element
+    at a time or in a single batch. The memory column is what the queues take to
+    hold a backlog of `--round` elements no subscriber has read yet. Copying into
+    BlockingQueues is the thread-safe baseline, like BroadcastQueue.
+
+    Run from `queue/python`:
+        python -m benchmarks.broadcast_queue_benchmark [--items N] [--round N]
+"""
+
+import argparse
+import tracemalloc
+from time import perf_counter
+from typing import Any, Callable
+
+from queue.blocking_queue import BlockingQueue
+from queue.broadcast_queue import BroadcastQueue
+from queue.queue import Queue
+
+SUBSCRIBER_COUNTS = (1, 2, 4, 8, 16)
+
+
+def copied_queues(
+    subscribers: int, size: int, cls: type[Queue[int]] = Queue
+) -> tuple[Callable[[list[int], bool], None], Callable[[bool], None]]:
+    queues = [cls() for _ in range(subscribers)]
+
+    def publish(elements: list[int], batched: bool) -> None:
+        if batched:
+            for queue in queues:
+                queue.enqueue_many(elements)
+        else:
+            for element in elements:
+                for queue in queues:
+                    queue.enqueue(element)
+
+    def consume(batched: bool) -> None:
+        for queue in queues:
+            if batched:
+                queue.dequeue_many(len(queue))
+            else:
+                dequeue = queue.dequeue
+                for _ in range(len(queue)):
+                    dequeue()
+
+    return publish, consume
+
+
+def broadcast_queue(subscribers: int, size: int) -> tuple[Callable[[list[int], bool], None], Callable[[bool], None]]:
+    queue = BroadcastQueue[int](max_capacity=size)
+    readers = [queue.subscribe() for _ in range(subscribers)]
+
+    def publish(elements: list[int], batched: bool) -> None:
+        if batched:
+            queue.enqueue_many(elements)
+        else:
+            enqueue = queue.enqueue
+            for element in elements:
+                enqueue(element)
+
+    def consume(batched: bool) -> None:
+        for reader in readers:
+            if batched:
+                reader.dequeue_many(len(reader))
+            else:
+                dequeue = reader.dequeue
+                for _ in range(len(reader)):
+                    dequeue()
+
+    return publish, consume
+
+
+def items_per_second(factory: Callable[..., Any], subscribers: int, items: int, size: int, batched: bool) -> float:
+    """Elements published per second, each one read by every subscriber"""
+    publish, consume = factory(subscribers, size)
+    elements = list(range(size))
+    start = perf_counter()
+    for _ in range(items // size):
+        publish(elements, batched)
+        consume(batched)
+
+    return items // size * size / (perf_counter() - start)
+
+
+def backlog_bytes(factory: Callable[..., Any], subscribers: int, size: int) -> int:
+    """Bytes taken by the queues to hold `size` unread elements, not counting the elements"""
+    elements = list(range(size))
+    tracemalloc.start()
+    publish, _ = factory(subscribers, size)
+    publish(elements, True)
+    allocated, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    return allocated
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--items", type=int, default=200_000)
+    parser.add_argument("--round", type=int, default=1024)
+    args = parser.parse_args()
+
+    factories: dict[str, Callable[..., Any]] = {
+        "Queue copies": copied_queues,
+        "BlockingQueue copies": lambda subscribers, size: copied_queues(subscribers, size, BlockingQueue),
+        "BroadcastQueue": broadcast_queue,
+    }
+    print(f"{args.items:,} elements in rounds of {args.round:,}, throughput in elements/s")
+    print(f"{'subscribers':<12} {'':<22} {'one by one':>12} {'batched':>12} {'backlog':>12}")
+    for subscribers in SUBSCRIBER_COUNTS:
+        for label, factory in factories.items():
+            single = items_per_second(factory, subscribers, args.items, args.round, False)
+            batched = items_per_second(factory, subscribers, args.items, args.round, True)
+            memory = backlog_bytes(factory, subscribers, args.round)
+            print(f"{subscribers:<12} {label:<22} {single:>12,.0f} {batched:>12,.0f} {memory:>10,} B")
+
+
+if __name__ == "__main__":
+    main()
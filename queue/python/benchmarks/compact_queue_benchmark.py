@@ -0,0 +1,52 @@
+"""
+    Memory taken by many small Queues against CompactQueues.
+
+    Builds N instances of each class, empty then holding 4 elements, and reports the
+    bytes traced per instance, not counting the elements nor the list holding them.
+
+    Run from `queue/python`:
+        python -m benchmarks.compact_queue_benchmark [--instances N]
+"""
+
+import argparse
+import gc
+import tracemalloc
+from typing import Any
+
+from queue.compact_queue import CompactQueue
+from queue.queue import Queue
+
+ELEMENTS = (1, 2, 3, 4)
+
+
+def bytes_per_instance(cls: type[Any], instances: int, elements: tuple[int, ...]) -> float:
+    """Bytes per instance of `cls` holding `elements`"""
+    gc.collect()
+    holder: list[Any] = [None] * instances
+    tracemalloc.start()
+    for index in range(instances):
+        queue = cls()
+        queue.enqueue_many(elements)
+        holder[index] = queue
+    allocated, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del holder
+
+    return allocated / instances
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--instances", type=int, default=1_000_000)
+    args = parser.parse_args()
+
+    print(f"{args.instances:,} instances")
+    print(f"{'':<14} {'empty':>12} {'4 elements':>12}")
+    for cls in (Queue, CompactQueue):
+        empty = bytes_per_instance(cls, args.instances, ())
+        full = bytes_per_instance(cls, args.instances, ELEMENTS)
+        print(f"{cls.__name__:<14} {empty:>10.0f} B {full:>10.0f} B")
+
+
+if __name__ == "__main__":
+    main()
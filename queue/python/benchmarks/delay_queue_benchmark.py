@@ -0,0 +1,116 @@
+"""
+    DelayQueue (hierarchical timing wheel) against a heapq-based scheduler.
+
+    Schedules N timers with random delays, cancels a share of them, then moves a
+    fake clock forward in steps, taking every due element at each step. The heapq
+    scheduler cancels lazily: it flags the entry and skips it when it's popped.
+
+    Run from `queue/python`:
+        python -m benchmarks.delay_queue_benchmark [--timers N] [--cancel RATIO] [--steps N] [--horizon SECONDS]
+"""
+
+import argparse
+import heapq
+import random
+from itertools import count
+from time import perf_counter
+from typing import Any, Callable
+
+from queue.delay_queue import DelayQueue
+
+
+class Clock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class HeapScheduler:
+    """The usual heapq scheduler: entries are `[deadline, sequence, element, cancelled]`"""
+
+    def __init__(self, clock: Clock) -> None:
+        self._heap: list[list[Any]] = []
+        self._sequence = count()
+        self._clock = clock
+
+    def enqueue(self, element: object, delay: float) -> list[Any]:
+        entry = [self._clock() + delay, next(self._sequence), element, False]
+        heapq.heappush(self._heap, entry)
+        return entry
+
+    def cancel(self, entry: list[Any]) -> None:
+        entry[3] = True
+
+    def dequeue_due(self) -> list[object]:
+        heap = self._heap
+        now = self._clock()
+        due = []
+        while heap and heap[0][0] <= now:
+            entry = heapq.heappop(heap)
+            if not entry[3]:
+                due.append(entry[2])
+        return due
+
+
+def timed(operation: Callable[[], Any]) -> tuple[float, Any]:
+    start = perf_counter()
+    result = operation()
+    return perf_counter() - start, result
+
+
+def run(scheduler: Any, clock: Clock, delays: list[float], cancelled: list[int], steps: int) -> tuple[float, float, float, int]:
+    """Seconds to schedule, cancel and expire every timer, and the number of elements expired"""
+    enqueue = scheduler.enqueue
+    insert_seconds, handles = timed(lambda: [enqueue(index, delay) for index, delay in enumerate(delays)])
+    cancel = scheduler.cancel
+    cancel_seconds, _ = timed(lambda: [cancel(handles[index]) for index in cancelled])
+
+    horizon = max(delays)
+
+    def expire() -> int:
+        expired = 0
+        for step in range(1, steps + 1):
+            clock.now = horizon * step / steps
+            expired += len(scheduler.dequeue_due())
+        # The wheel rounds deadlines up to its tick.
+        clock.now = horizon + 1
+        return expired + len(scheduler.dequeue_due())
+
+    expire_seconds, expired = timed(expire)
+
+    return insert_seconds, cancel_seconds, expire_seconds, expired
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--timers", type=int, default=1_000_000)
+    parser.add_argument("--cancel", type=float, default=0.5, help="share of the timers cancelled before expiring")
+    parser.add_argument("--steps", type=int, default=10_000, help="clock steps until the last deadline")
+    parser.add_argument("--horizon", type=float, default=60.0, help="longest delay, in seconds")
+    args = parser.parse_args()
+
+    generator = random.Random(42)
+    delays = [generator.uniform(0, args.horizon) for _ in range(args.timers)]
+    cancelled = generator.sample(range(args.timers), int(args.timers * args.cancel))
+
+    wheel_clock, heap_clock = Clock(), Clock()
+    schedulers: dict[str, tuple[Any, Clock]] = {
+        "heapq": (HeapScheduler(heap_clock), heap_clock),
+        "DelayQueue": (DelayQueue[int](tick=0.001, clock=wheel_clock), wheel_clock),
+    }
+
+    print(f"{args.timers:,} timers over {args.horizon:g} s, {len(cancelled):,} cancelled, {args.steps:,} clock steps")
+    print(f"{'':<12} {'insert':>10} {'cancel':>10} {'expire':>10} {'total':>10}")
+    for label, (scheduler, clock) in schedulers.items():
+        insert_seconds, cancel_seconds, expire_seconds, expired = run(scheduler, clock, delays, cancelled, args.steps)
+        assert expired == args.timers - len(cancelled)
+        total = insert_seconds + cancel_seconds + expire_seconds
+        print(
+            f"{label:<12} {insert_seconds:>8.2f} s {cancel_seconds:>8.2f} s {expire_seconds:>8.2f} s {total:>8.2f} s"
+        )
+
+
+if __name__ == "__main__":
+    main()
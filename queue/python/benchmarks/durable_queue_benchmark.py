@@ -0,0 +1,66 @@
+"""
+    Sustained throughput and memory of DurableQueue with a backlog larger than memory.
+
+    For backlogs of 10x and 100x `memory_items`, enqueues the whole backlog (spilling
+    it to disk) then drains it, and reports items/sec plus the peak Python memory
+    traced by tracemalloc, which should stay flat as the backlog grows.
+
+    Run from `queue/python`:
+        python -m benchmarks.durable_queue_benchmark [--memory-items N] [--payload-bytes N]
+"""
+
+import argparse
+import tempfile
+import tracemalloc
+from time import perf_counter
+
+from queue.durable_queue import DurableQueue, FsyncPolicy
+
+
+def run(memory_items: int, backlog: int, payload: bytes, policy: FsyncPolicy) -> tuple[float, float, int]:
+    with tempfile.TemporaryDirectory() as directory:
+        tracemalloc.start()
+        with DurableQueue[bytes](
+            directory,
+            memory_items=memory_items,
+            segment_bytes=16 * 1024 * 1024,
+            fsync_policy=policy,
+        ) as durable_queue:
+            start = perf_counter()
+            for _ in range(backlog):
+                durable_queue.enqueue(payload)
+            enqueue_rate = backlog / (perf_counter() - start)
+
+            start = perf_counter()
+            while durable_queue.is_not_empty:
+                durable_queue.dequeue()
+            dequeue_rate = backlog / (perf_counter() - start)
+
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+
+    return enqueue_rate, dequeue_rate, peak
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--memory-items", type=int, default=10_000)
+    parser.add_argument("--payload-bytes", type=int, default=100)
+    args = parser.parse_args()
+
+    payload = b"x" * args.payload_bytes
+    print(f"memory_items={args.memory_items:,}, {args.payload_bytes} byte payloads")
+    print(f"{'policy':<10} {'backlog':>12} {'enqueue/s':>12} {'dequeue/s':>12} {'peak memory':>14}")
+
+    for policy in (FsyncPolicy.NEVER, FsyncPolicy.INTERVAL):
+        for multiplier in (10, 100):
+            backlog = args.memory_items * multiplier
+            enqueue_rate, dequeue_rate, peak = run(args.memory_items, backlog, payload, policy)
+            print(
+                f"{policy.value:<10} {backlog:>12,} {enqueue_rate:>12,.0f} {dequeue_rate:>12,.0f}"
+                f" {peak / 1024 / 1024:>11.1f} MiB"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,116 @@
+"""
+    Hot paths of Queue (enqueue, dequeue, __contains__, __iter__, from_sequence)
+    against list, collections.deque and the standard library queue.Queue, at sizes
+    from 10 to 10M, plus the memory each structure takes per element.
+
+    Store a run with `--output baseline.json`, then check later runs against it with
+    `--baseline baseline.json [--threshold 0.1] [--operation-threshold contains=0.25]`;
+    the exit code is 1 when an operation got slower than its threshold.
+
+    Run from `queue/python`:
+        python -m benchmarks.hot_paths_benchmark [--sizes N ...] [--no-memory]
+"""
+
+import sys
+from collections import deque
+from functools import partial
+from typing import Any, Callable
+
+from benchmarking.regression import Case, main
+from benchmarks.stdlib import stdlib_queue
+from queue.queue import Queue
+
+# Quadratic cases, like list.pop(0) shifting the whole list, are only measured up to this size.
+_QUADRATIC_LIMIT = 100_000
+
+
+def enqueue_all(queue: Queue[int], items: list[int]) -> Callable[[], None]:
+    def operation() -> None:
+        for item in items:
+            queue.enqueue(item)
+
+    return operation
+
+
+def dequeue_all(queue: Queue[int]) -> Callable[[], None]:
+    def operation() -> None:
+        for _ in range(len(queue)):
+            queue.dequeue()
+
+    return operation
+
+
+def append_all(sequence: list[int] | deque[int], items: list[int]) -> Callable[[], None]:
+    def operation() -> None:
+        for item in items:
+            sequence.append(item)
+
+    return operation
+
+
+def pop_all(pop: Callable[[], int], size: int) -> Callable[[], None]:
+    def operation() -> None:
+        for _ in range(size):
+            pop()
+
+    return operation
+
+
+def put_all(stdlib: Any, items: list[int]) -> Callable[[], None]:
+    def operation() -> None:
+        for item in items:
+            stdlib.put_nowait(item)
+
+    return operation
+
+
+def filled_stdlib_queue(items: list[int]) -> Any:
+    stdlib = stdlib_queue().Queue()
+    for item in items:
+        stdlib.put_nowait(item)
+
+    return stdlib
+
+
+def contains_missing(structure: Any) -> Callable[[], bool]:
+    return lambda: -1 in structure
+
+
+def iterate(structure: Any) -> Callable[[], None]:
+    def operation() -> None:
+        for _ in structure:
+            pass
+
+    return operation
+
+
+CASES = [
+    Case("Queue", "enqueue", lambda items: enqueue_all(Queue[int](), items)),
+    Case("Queue", "dequeue", lambda items: dequeue_all(Queue[int].from_sequence(items))),
+    Case("Queue", "contains", lambda items: contains_missing(Queue[int].from_sequence(items))),
+    Case("Queue", "iter", lambda items: iterate(Queue[int].from_sequence(items))),
+    Case("Queue", "from_sequence", lambda items: lambda: Queue[int].from_sequence(items)),
+    Case("deque", "enqueue", lambda items: append_all(deque(), items)),
+    Case("deque", "dequeue", lambda items: pop_all(deque(items).popleft, len(items))),
+    Case("deque", "contains", lambda items: contains_missing(deque(items))),
+    Case("deque", "iter", lambda items: iterate(deque(items))),
+    Case("deque", "from_sequence", lambda items: lambda: deque(items)),
+    Case("list", "enqueue", lambda items: append_all([], items)),
+    Case("list", "dequeue", lambda items: pop_all(partial(list(items).pop, 0), len(items)), _QUADRATIC_LIMIT),
+    Case("list", "contains", lambda items: contains_missing(list(items))),
+    Case("list", "iter", lambda items: iterate(list(items))),
+    Case("list", "from_sequence", lambda items: lambda: list(items)),
+    Case("queue.Queue", "enqueue", lambda items: put_all(stdlib_queue().Queue(), items)),
+    Case("queue.Queue", "dequeue", lambda items: pop_all(filled_stdlib_queue(items).get_nowait, len(items))),
+]
+
+BUILDERS: dict[str, Callable[[list[int]], object]] = {
+    "Queue": lambda items: Queue[int].from_sequence(items),
+    "deque": deque,
+    "list": list,
+    "queue.Queue": filled_stdlib_queue,
+}
+
+
+if __name__ == "__main__":
+    sys.exit(main(__doc__ or "", CASES, BUILDERS))
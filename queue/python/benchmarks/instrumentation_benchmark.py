@@ -0,0 +1,44 @@
+"""
+    Overhead of InstrumentedQueue against the plain Queue, per enqueue + dequeue pair,
+    with every element sampled for the dwell histogram and with the default sampling.
+
+    Run from `queue/python`:
+        python -m benchmarks.instrumentation_benchmark [--items N]
+"""
+
+import argparse
+from time import perf_counter
+from typing import Callable
+
+from queue.instrumented_queue import InstrumentedQueue
+from queue.queue import Queue
+
+
+def round_trip(factory: Callable[[], Queue[int]], items: int) -> float:
+    queue = factory()
+    start = perf_counter()
+    for item in range(items):
+        queue.enqueue(item)
+    for _ in range(items):
+        queue.dequeue()
+    return (perf_counter() - start) / items * 1e9
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--items", type=int, default=1_000_000)
+    args = parser.parse_args()
+
+    factories: dict[str, Callable[[], Queue[int]]] = {
+        "Queue": Queue[int],
+        "InstrumentedQueue(sample_every=64)": InstrumentedQueue[int],
+        "InstrumentedQueue(sample_every=1)": lambda: InstrumentedQueue[int](sample_every=1),
+    }
+    baseline = round_trip(Queue[int], args.items)
+    for name, factory in factories.items():
+        elapsed = round_trip(factory, args.items)
+        print(f"{name:<36} {elapsed:>7.1f} ns/item  ({elapsed / baseline:.2f}x)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,54 @@
+"""
+    Membership checks of IndexedQueue against the linear scan of Queue, as in
+    "is this job already pending?" before every enqueue, plus the memory each
+    queue takes per element (the multiset adds a dict entry per distinct element).
+
+    Run from `queue/python`:
+        python -m benchmarks.membership_benchmark [--checks N]
+"""
+
+import argparse
+import random
+import tracemalloc
+from time import perf_counter
+
+from queue.indexed_queue import IndexedQueue
+from queue.queue import Queue
+
+
+def per_check(queue: Queue[int], candidates: list[int]) -> float:
+    start = perf_counter()
+    for candidate in candidates:
+        if candidate not in queue:
+            pass
+    return (perf_counter() - start) / len(candidates) * 1e9
+
+
+def bytes_per_element(queue_class: type[Queue[int]], jobs: list[int]) -> float:
+    tracemalloc.start()
+    queue = queue_class.from_sequence(jobs)
+    allocated, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del queue
+    return allocated / len(jobs)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--checks", type=int, default=1_000)
+    args = parser.parse_args()
+
+    print(f"{'pending':>10} {'queue':<14} {'per check':>14} {'memory':>12}")
+    for pending in (1_000, 10_000, 100_000):
+        jobs = list(range(pending))
+        # Half of the candidates are pending, half are new.
+        candidates = [random.randrange(pending * 2) for _ in range(args.checks)]
+        for queue_class in (Queue, IndexedQueue):
+            queue = queue_class[int].from_sequence(jobs)
+            elapsed = per_check(queue, candidates)
+            memory = bytes_per_element(queue_class, jobs)
+            print(f"{pending:>10,} {queue_class.__name__:<14} {elapsed:>11,.0f} ns {memory:>8.1f} B/el")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,108 @@
+"""
+    PriorityQueue and IndexedPriorityQueue against heapq.
+
+    Two workloads: pushing then popping random priorities, and Dijkstra's shortest
+    paths on a random graph, where heapq needs lazy deletion (push duplicates and
+    skip stale entries) and IndexedPriorityQueue uses decrease-key.
+
+    Run from `queue/python`:
+        python -m benchmarks.priority_queue_benchmark [--items N] [--nodes N] [--degree N]
+"""
+
+import argparse
+import heapq
+import random
+from time import perf_counter
+from typing import Callable
+
+from queue.priority_queue import IndexedPriorityQueue, PriorityQueue
+
+Graph = list[list[tuple[int, int]]]
+
+
+def timed(operation: Callable[[], object]) -> float:
+    start = perf_counter()
+    operation()
+    return perf_counter() - start
+
+
+def push_pop_heapq(priorities: list[int]) -> None:
+    heap: list[int] = []
+    for priority in priorities:
+        heapq.heappush(heap, priority)
+    while heap:
+        heapq.heappop(heap)
+
+
+def push_pop_priority_queue(priorities: list[int], arity: int) -> None:
+    priority_queue = PriorityQueue[int](arity=arity)
+    for priority in priorities:
+        priority_queue.enqueue(priority)
+    while priority_queue:
+        priority_queue.dequeue()
+
+
+def random_graph(nodes: int, degree: int) -> Graph:
+    return [
+        [(random.randrange(nodes), random.randint(1, 100)) for _ in range(degree)]
+        for _ in range(nodes)
+    ]
+
+
+def dijkstra_heapq(graph: Graph) -> list[float]:
+    distances = [float("inf")] * len(graph)
+    distances[0] = 0
+    heap: list[tuple[float, int]] = [(0, 0)]
+    while heap:
+        distance, node = heapq.heappop(heap)
+        if distance > distances[node]:
+            continue  # stale entry left behind instead of a decrease-key
+        for target, weight in graph[node]:
+            candidate = distance + weight
+            if candidate < distances[target]:
+                distances[target] = candidate
+                heapq.heappush(heap, (candidate, target))
+    return distances
+
+
+def dijkstra_indexed(graph: Graph, arity: int) -> list[float]:
+    distances = [float("inf")] * len(graph)
+    distances[0] = 0
+    priority_queue = IndexedPriorityQueue[int](arity=arity)
+    priority_queue.enqueue(0, 0)
+    while priority_queue:
+        node, distance = priority_queue.dequeue_with_priority()
+        for target, weight in graph[node]:
+            candidate = distance + weight
+            if candidate < distances[target]:
+                distances[target] = candidate
+                priority_queue.enqueue_or_decrease(target, candidate)
+    return distances
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--items", type=int, default=200_000)
+    parser.add_argument("--nodes", type=int, default=50_000)
+    parser.add_argument("--degree", type=int, default=8)
+    args = parser.parse_args()
+
+    priorities = [random.randrange(1_000_000) for _ in range(args.items)]
+    print(f"push then pop {args.items:,} random priorities")
+    print(f"  {'heapq':<28} {timed(lambda: push_pop_heapq(priorities)) * 1e3:>9.1f} ms")
+    for arity in (2, 4, 8):
+        elapsed = timed(lambda: push_pop_priority_queue(priorities, arity))
+        print(f"  {f'PriorityQueue(arity={arity})':<28} {elapsed * 1e3:>9.1f} ms")
+
+    graph = random_graph(args.nodes, args.degree)
+    expected = dijkstra_heapq(graph)
+    print(f"Dijkstra on {args.nodes:,} nodes, {args.nodes * args.degree:,} edges")
+    print(f"  {'heapq + lazy deletion':<28} {timed(lambda: dijkstra_heapq(graph)) * 1e3:>9.1f} ms")
+    for arity in (2, 4):
+        assert dijkstra_indexed(graph, arity) == expected
+        elapsed = timed(lambda: dijkstra_indexed(graph, arity))
+        print(f"  {f'IndexedPriorityQueue({arity})':<28} {elapsed * 1e3:>9.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
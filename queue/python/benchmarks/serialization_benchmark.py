@@ -0,0 +1,65 @@
+"""
+    Binary dump and load of Queues against plain pickle.
+
+    Run from `queue/python`:
+        python -m benchmarks.serialization_benchmark [--items N]
+"""
+
+import argparse
+import io
+import pickle
+from time import perf_counter
+from typing import Any, Callable, Optional
+
+from queue import serialization
+from queue.queue import Queue
+
+
+def timed(operation: Callable[[], Any]) -> tuple[float, Any]:
+    start = perf_counter()
+    result = operation()
+    return perf_counter() - start, result
+
+
+def bench_pickle(queue: Queue[Any]) -> tuple[float, float, int]:
+    """Seconds to pickle and unpickle `queue` with protocol 5, and the pickle size"""
+    buffers: list[pickle.PickleBuffer] = []
+    dump_seconds, data = timed(lambda: pickle.dumps(queue, protocol=5, buffer_callback=buffers.append))
+    load_seconds, _ = timed(lambda: pickle.loads(data, buffers=buffers))
+
+    return dump_seconds, load_seconds, len(data) + sum(buffer.raw().nbytes for buffer in buffers)
+
+
+def bench_dump(queue: Queue[Any], typecode: Optional[str]) -> tuple[float, float, int]:
+    """Seconds to dump and load `queue`, and the dump size"""
+    file = io.BytesIO()
+    dump_seconds, _ = timed(lambda: serialization.dump(queue, file, typecode=typecode))
+    file.seek(0)
+    load_seconds, _ = timed(lambda: serialization.load(file))
+
+    return dump_seconds, load_seconds, len(file.getvalue())
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--items", type=int, default=1_000_000)
+    args = parser.parse_args()
+
+    cases: dict[str, tuple[Queue[Any], Optional[str]]] = {
+        "ints": (Queue.from_sequence(range(args.items)), "q"),
+        "floats": (Queue.from_sequence([index / 3 for index in range(args.items)]), "d"),
+        "strings": (Queue.from_sequence([str(index) for index in range(args.items)]), None),
+        "64 KiB bytearrays": (Queue.from_sequence([bytearray(65536) for _ in range(256)]), None),
+    }
+
+    print(f"{'':<20} {'':<8} {'dump':>10} {'load':>10} {'size':>14}")
+    for label, (queue, typecode) in cases.items():
+        results = {"pickle": bench_pickle(queue), "dump": bench_dump(queue, None)}
+        if typecode is not None:
+            results[f"dump {typecode!r}"] = bench_dump(queue, typecode)
+        for method, (dump_seconds, load_seconds, size) in results.items():
+            print(f"{label:<20} {method:<8} {dump_seconds * 1e3:>7.1f} ms {load_seconds * 1e3:>7.1f} ms {size:>14,} B")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,107 @@
+"""
+    Scaling of ShardedQueue against a single locked queue, with threads and processes.
+
+    Each run starts N producers and N consumers. Threads share a BlockingQueue,
+    or a ShardedQueue of N lanes, either BlockingQueues (one lock per lane) or
+    plain Queues (unlocked enqueues, behind the sharded queue's lane locks on dequeue). Processes share a
+    SharedMemoryQueue, or a ShardedQueue of N SharedMemoryQueue lanes.
+
+    Run from `queue/python`:
+        python -m benchmarks.sharded_queue_benchmark [--items N] [--threads N ...] [--processes N ...]
+"""
+
+import argparse
+import multiprocessing
+import threading
+from time import perf_counter, sleep
+from typing import Any, Callable
+
+from queue.blocking_queue import BlockingQueue
+from queue.full_queue_exception import FullQueueException
+from queue.queue import Queue
+from queue.shared_memory_queue import SharedMemoryQueue
+from queue.sharded_queue import ShardedQueue
+
+_SENTINEL = -1
+
+
+def produce(shared: Queue[int], items: int) -> None:
+    for item in range(items):
+        while True:
+            try:
+                shared.enqueue(item)
+                break
+            except FullQueueException:
+                pass
+
+
+def consume(shared: Queue[int], lane: int) -> None:
+    if isinstance(shared, ShardedQueue):
+        shared.home_lane = lane % shared.lanes
+    try_dequeue = shared.try_dequeue
+    while (item := try_dequeue()) != _SENTINEL:
+        if item is None:
+            # Empty: let the producers run instead of spinning on the GIL.
+            sleep(0)
+
+
+def run(shared: Queue[int], workers: int, items: int, worker: Callable[..., Any]) -> float:
+    """Moves `items` elements from `workers` producers to `workers` consumers, returns items/sec"""
+    per_producer = items // workers
+    consumers = [worker(target=consume, args=(shared, lane)) for lane in range(workers)]
+    producers = [worker(target=produce, args=(shared, per_producer)) for _ in range(workers)]
+
+    start = perf_counter()
+    for consumer in consumers + producers:
+        consumer.start()
+    for producer in producers:
+        producer.join()
+    for _ in consumers:
+        produce_sentinel(shared)
+    for consumer in consumers:
+        consumer.join()
+
+    return per_producer * workers / (perf_counter() - start)
+
+
+def produce_sentinel(shared: Queue[int]) -> None:
+    while True:
+        try:
+            shared.enqueue(_SENTINEL)
+            return
+        except FullQueueException:
+            pass
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--items", type=int, default=200_000)
+    parser.add_argument("--capacity", type=int, default=4096, help="capacity of each shared memory lane")
+    parser.add_argument("--threads", type=int, nargs="+", default=[1, 2, 4, 8, 16, 32])
+    parser.add_argument("--processes", type=int, nargs="+", default=[1, 2, 4, 8, 16, 32])
+    args = parser.parse_args()
+
+    print(f"threads: items/s, {multiprocessing.cpu_count()} CPUs")
+    print(f"{'workers':>8} {'BlockingQueue':>16} {'locked lanes':>16} {'plain lanes':>16}")
+    for workers in args.threads:
+        single = run(BlockingQueue(), workers, args.items, threading.Thread)
+        locked = run(ShardedQueue([BlockingQueue() for _ in range(workers)]), workers, args.items, threading.Thread)
+        plain = run(ShardedQueue(workers), workers, args.items, threading.Thread)
+        print(f"{f'{workers}x{workers}':>8} {single:>14,.0f}/s {locked:>14,.0f}/s {plain:>14,.0f}/s")
+
+    print("processes: items/s")
+    print(f"{'workers':>8} {'SharedMemoryQueue':>18} {'sharded':>16}")
+    for workers in args.processes:
+        with SharedMemoryQueue("q", max_capacity=args.capacity) as shared:
+            single = run(shared, workers, args.items, multiprocessing.Process)
+
+        lanes = [SharedMemoryQueue("q", max_capacity=args.capacity) for _ in range(workers)]
+        sharded = run(ShardedQueue(lanes), workers, args.items, multiprocessing.Process)
+        for lane in lanes:
+            lane.close()
+            lane.unlink()
+        print(f"{f'{workers}x{workers}':>8} {single:>16,.0f}/s {sharded:>14,.0f}/s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,112 @@
+"""
+    Cross-process throughput of SharedMemoryQueue against multiprocessing.Queue.
+
+    A child process produces `(int64, float64)` records and the parent consumes them.
+
+    Run from `queue/python`:
+        python -m benchmarks.shared_memory_queue_benchmark [--items N] [--capacity N]
+"""
+
+import argparse
+import multiprocessing
+import struct
+from time import perf_counter
+from typing import Any
+
+from benchmarks.stdlib import stdlib_queue_imports
+from queue.empty_queue_exception import EmptyQueueException
+from queue.full_queue_exception import FullQueueException
+from queue.shared_memory_queue import SharedMemoryQueue
+
+with stdlib_queue_imports():
+    import multiprocessing.queues  # noqa: F401
+
+RECORD = struct.Struct("qd")
+BATCH = 512
+
+
+def produce_per_item(shared_queue: SharedMemoryQueue, items: int) -> None:
+    for index in range(items):
+        while True:
+            try:
+                shared_queue.enqueue((index, 0.5))
+                break
+            except FullQueueException:
+                pass
+    shared_queue.close()
+
+
+def produce_batched(shared_queue: SharedMemoryQueue, items: int) -> None:
+    written = 0
+    while written < items:
+        try:
+            with shared_queue.write_slots(min(BATCH, items - written)) as view:
+                count = len(view) // RECORD.size
+                for slot in range(count):
+                    RECORD.pack_into(view, slot * RECORD.size, written + slot, 0.5)
+        except FullQueueException:
+            continue
+        written += count
+    shared_queue.close()
+
+
+def produce_pickled(mp_queue: Any, items: int) -> None:
+    for index in range(items):
+        mp_queue.put((index, 0.5))
+
+
+def bench_shared(items: int, capacity: int, *, batched: bool) -> float:
+    with SharedMemoryQueue(RECORD, max_capacity=capacity) as shared_queue:
+        target = produce_batched if batched else produce_per_item
+        producer = multiprocessing.Process(target=target, args=(shared_queue, items))
+
+        start = perf_counter()
+        producer.start()
+        received = 0
+        if batched:
+            while received < items:
+                try:
+                    with shared_queue.read_slots(BATCH) as view:
+                        received += sum(1 for _ in RECORD.iter_unpack(view))
+                except EmptyQueueException:
+                    pass
+        else:
+            while received < items:
+                if shared_queue.try_dequeue() is not None:
+                    received += 1
+        producer.join()
+
+        return items / (perf_counter() - start)
+
+
+def bench_multiprocessing(items: int, capacity: int) -> float:
+    mp_queue = multiprocessing.Queue(maxsize=capacity)
+    producer = multiprocessing.Process(target=produce_pickled, args=(mp_queue, items))
+
+    start = perf_counter()
+    producer.start()
+    for _ in range(items):
+        mp_queue.get()
+    producer.join()
+
+    return items / (perf_counter() - start)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--items", type=int, default=200_000)
+    parser.add_argument("--capacity", type=int, default=4096)
+    args = parser.parse_args()
+
+    results = {
+        "multiprocessing.Queue": bench_multiprocessing(args.items, args.capacity),
+        "SharedMemoryQueue per item": bench_shared(args.items, args.capacity, batched=False),
+        "SharedMemoryQueue batched": bench_shared(args.items, args.capacity, batched=True),
+    }
+
+    for label, throughput in results.items():
+        print(f"{label:<28} {throughput:>14,.0f} records/s")
+
+
+if __name__ == "__main__":
+    main()
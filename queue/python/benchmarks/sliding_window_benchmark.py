@@ -0,0 +1,55 @@
+"""
+    Rolling min/max/sum over streaming windows of 1k to 1M elements: rescanning a
+    Queue after every new element against the O(1) aggregates of SlidingWindowQueue.
+
+    Both process `--steps` elements once the window is full; the rescan is O(window)
+    per step so it only runs `--rescan-steps` of them and reports ns per step.
+
+    Run from `queue/python`:
+        python -m benchmarks.sliding_window_benchmark [--steps N] [--rescan-steps N]
+"""
+
+import argparse
+import random
+from time import perf_counter
+
+from queue.queue import Queue
+from queue.sliding_window_queue import SlidingWindowQueue
+
+
+def rescan(window_size: int, stream: list[int], steps: int) -> float:
+    queue = Queue[int].from_sequence(stream[:window_size])
+    start = perf_counter()
+    for value in stream[window_size : window_size + steps]:
+        queue.dequeue()
+        queue.enqueue(value)
+        min(queue), max(queue), sum(queue)
+    return (perf_counter() - start) / steps * 1e9
+
+
+def sliding(window_size: int, stream: list[int], steps: int) -> float:
+    queue = SlidingWindowQueue[int](window_size=window_size)
+    queue.enqueue_many(stream[:window_size])
+    start = perf_counter()
+    for value in stream[window_size : window_size + steps]:
+        queue.enqueue(value)
+        queue.min(), queue.max(), queue.sum()
+    return (perf_counter() - start) / steps * 1e9
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--steps", type=int, default=200_000)
+    parser.add_argument("--rescan-steps", type=int, default=100)
+    args = parser.parse_args()
+
+    print(f"{'window':>10} {'rescan Queue':>16} {'SlidingWindowQueue':>20}")
+    for window_size in (1_000, 10_000, 100_000, 1_000_000):
+        stream = [random.randrange(1_000_000) for _ in range(window_size + args.steps)]
+        rescanned = rescan(window_size, stream, args.rescan_steps)
+        slid = sliding(window_size, stream, args.steps)
+        print(f"{window_size:>10,} {rescanned:>13,.0f} ns {slid:>17,.0f} ns")
+
+
+if __name__ == "__main__":
+    main()
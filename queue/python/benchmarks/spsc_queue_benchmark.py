@@ -0,0 +1,115 @@
+"""
+    Micro-benchmarks of SPSCQueue against Queue and collections.deque.
+
+    Reports ns/op (one enqueue plus one dequeue per item) and items/sec for a
+    single thread alternating enqueue/dequeue, for fill-then-drain bursts, and
+    for a producer thread feeding a consumer thread.
+
+    Run from `queue/python`:
+        python -m benchmarks.spsc_queue_benchmark [--items N] [--capacity N]
+"""
+
+import argparse
+import threading
+from collections import deque
+from time import perf_counter, sleep
+from typing import Any, Callable
+
+from queue.queue import Queue
+from queue.spsc_queue import SPSCQueue
+
+
+def alternating(enqueue: Callable[[Any], None], dequeue: Callable[[], Any], items: int) -> float:
+    start = perf_counter()
+    for item in range(items):
+        enqueue(item)
+        dequeue()
+    return perf_counter() - start
+
+
+def bursts(
+    enqueue: Callable[[Any], None], dequeue: Callable[[], Any], items: int, capacity: int
+) -> float:
+    burst = range(capacity)
+    start = perf_counter()
+    for _ in range(items // capacity):
+        for item in burst:
+            enqueue(item)
+        for _ in burst:
+            dequeue()
+    return perf_counter() - start
+
+
+def pipeline(
+    try_enqueue: Callable[[Any], bool], try_dequeue: Callable[[], Any], items: int
+) -> float:
+    """One producer thread, one consumer thread, both yielding the GIL on full/empty."""
+
+    def produce() -> None:
+        for item in range(items):
+            while not try_enqueue(item):
+                sleep(0)
+
+    producer = threading.Thread(target=produce)
+    start = perf_counter()
+    producer.start()
+    received = 0
+    while received < items:
+        if try_dequeue() is not None:
+            received += 1
+        else:
+            sleep(0)
+    producer.join()
+    return perf_counter() - start
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--items", type=int, default=1_000_000)
+    parser.add_argument("--capacity", type=int, default=1024)
+    args = parser.parse_args()
+
+    spsc = SPSCQueue[int](max_capacity=args.capacity)
+    queue = Queue[int]()
+    plain_deque: deque[int] = deque()
+
+    def deque_try_enqueue(item: int) -> bool:
+        if len(plain_deque) >= args.capacity:
+            return False
+        plain_deque.append(item)
+        return True
+
+    def deque_try_dequeue() -> Any:
+        return plain_deque.popleft() if plain_deque else None
+
+    def queue_try_enqueue(item: int) -> bool:
+        if len(queue) >= args.capacity:
+            return False
+        queue.enqueue(item)
+        return True
+
+    def queue_try_dequeue() -> Any:
+        return queue.dequeue() if queue.is_not_empty else None
+
+    candidates: dict[str, tuple[Callable[[Any], None], Callable[[], Any], Callable[[Any], bool], Callable[[], Any]]] = {
+        "SPSCQueue": (spsc.enqueue, spsc.dequeue, spsc.try_enqueue, spsc.try_dequeue),
+        "Queue": (queue.enqueue, queue.dequeue, queue_try_enqueue, queue_try_dequeue),
+        "deque": (plain_deque.append, plain_deque.popleft, deque_try_enqueue, deque_try_dequeue),
+    }
+
+    print(f"{args.items:,} items, capacity {args.capacity}")
+    print(f"{'':<10} {'alternating':>22} {'bursts':>22} {'2 threads':>22}")
+
+    for label, (enqueue, dequeue, try_enqueue, try_dequeue) in candidates.items():
+        cells = []
+        for elapsed in (
+            alternating(enqueue, dequeue, args.items),
+            bursts(enqueue, dequeue, args.items, args.capacity),
+            pipeline(try_enqueue, try_dequeue, args.items),
+        ):
+            cells.append(f"{elapsed / args.items * 1e9:>6.1f} ns {args.items / elapsed:>11,.0f}/s")
+        print(f"{label:<10} " + " ".join(f"{cell:>22}" for cell in cells))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,48 @@
+"""
+    Access to the standard library `queue` module.
+
+    This project's `queue` package shadows the standard library one, so the
+    benchmarks load it straight from the interpreter's stdlib directory.
+"""
+
+import importlib.util
+import os
+import sys
+import sysconfig
+from collections.abc import Iterator
+from contextlib import contextmanager
+from types import ModuleType
+
+_stdlib_queue: ModuleType | None = None
+
+
+def stdlib_queue() -> ModuleType:
+    """Loads (once) and returns the standard library `queue` module"""
+    global _stdlib_queue
+
+    if _stdlib_queue is None:
+        path = os.path.join(sysconfig.get_path("stdlib"), "queue.py")
+        spec = importlib.util.spec_from_file_location("_stdlib_queue", path)
+        assert spec is not None and spec.loader is not None
+        module = importlib.util.module_from_spec(spec)
+        spec.loader.exec_module(module)
+        _stdlib_queue = module
+
+    return _stdlib_queue
+
+
+@contextmanager
+def stdlib_queue_imports() -> Iterator[None]:
+    """Lets standard library modules that `import queue` (`multiprocessing.queues`,
+    `concurrent.futures.thread`, ...) be imported against the real stdlib module.
+    Import them inside this block and they keep working afterwards.
+    """
+    shadowing = sys.modules.get("queue")
+    sys.modules["queue"] = stdlib_queue()
+    try:
+        yield
+    finally:
+        if shadowing is None:
+            del sys.modules["queue"]
+        else:
+            sys.modules["queue"] = shadowing
@@ -0,0 +1,90 @@
+"""
+    WorkStealingExecutor against concurrent.futures.ThreadPoolExecutor.
+
+    Two workloads:
+      - a parallel tree sum, forking two subtasks per node. ThreadPoolExecutor
+        can't block on subtasks from its own workers without deadlocking, so it
+        gets the tree split into independent subtrees instead;
+      - CPU-bound leaf tasks, where threads are serialized by the GIL and the
+        process mode of WorkStealingExecutor runs them in parallel.
+
+    Run from `queue/python`:
+        python -m benchmarks.work_stealing_benchmark [--depth N] [--workers N ...]
+"""
+
+import argparse
+from time import perf_counter
+from typing import Any, Callable
+
+from benchmarks.stdlib import stdlib_queue_imports
+from queue.work_stealing import WorkStealingExecutor
+
+with stdlib_queue_imports():
+    from concurrent.futures import ThreadPoolExecutor
+
+
+def timed(operation: Callable[[], object]) -> float:
+    start = perf_counter()
+    operation()
+    return perf_counter() - start
+
+
+def tree_sum(depth: int) -> int:
+    return 1 if depth == 0 else tree_sum(depth - 1) + tree_sum(depth - 1)
+
+
+def forked_tree_sum(executor: WorkStealingExecutor, depth: int, leaf_depth: int) -> int:
+    if depth <= leaf_depth:
+        return tree_sum(depth)
+    left = executor.submit(forked_tree_sum, executor, depth - 1, leaf_depth)
+    right = executor.submit(forked_tree_sum, executor, depth - 1, leaf_depth)
+    return executor.join(left) + executor.join(right)
+
+
+def split_tree_sum(executor: Any, depth: int, split_levels: int) -> int:
+    subtrees = [executor.submit(tree_sum, depth - split_levels) for _ in range(2**split_levels)]
+    return sum(subtree.result() for subtree in subtrees)
+
+
+def cpu_bound(size: int) -> int:
+    return sum(value * value for value in range(size))
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--depth", type=int, default=18)
+    parser.add_argument("--leaf-depth", type=int, default=6)
+    parser.add_argument("--tasks", type=int, default=64)
+    parser.add_argument("--task-size", type=int, default=200_000)
+    parser.add_argument("--workers", type=int, nargs="+", default=[1, 2, 4, 8])
+    args = parser.parse_args()
+
+    expected = 2**args.depth
+    split_levels = args.depth - args.leaf_depth
+    print(f"tree sum, depth {args.depth}, leaves of depth {args.leaf_depth}")
+    print(f"  {'sequential':<36} {timed(lambda: tree_sum(args.depth)) * 1e3:>9.1f} ms")
+    for workers in args.workers:
+        with WorkStealingExecutor(workers) as executor:
+            elapsed = timed(lambda: executor.join(executor.submit(forked_tree_sum, executor, args.depth, args.leaf_depth)))
+        print(f"  {f'WorkStealingExecutor({workers}) fork/join':<36} {elapsed * 1e3:>9.1f} ms")
+        with ThreadPoolExecutor(workers) as pool:
+            assert split_tree_sum(pool, args.depth, split_levels) == expected
+            elapsed = timed(lambda: split_tree_sum(pool, args.depth, split_levels))
+        print(f"  {f'ThreadPoolExecutor({workers}) split':<36} {elapsed * 1e3:>9.1f} ms")
+
+    sizes = [args.task_size] * args.tasks
+    print(f"{args.tasks} CPU-bound tasks")
+    for workers in args.workers:
+        with ThreadPoolExecutor(workers) as pool:
+            elapsed = timed(lambda: list(pool.map(cpu_bound, sizes)))
+        print(f"  {f'ThreadPoolExecutor({workers})':<36} {elapsed * 1e3:>9.1f} ms")
+        with WorkStealingExecutor(workers) as executor:
+            elapsed = timed(lambda: list(executor.map(cpu_bound, sizes)))
+        print(f"  {f'WorkStealingExecutor({workers})':<36} {elapsed * 1e3:>9.1f} ms")
+        with WorkStealingExecutor(workers, mode="process") as executor:
+            elapsed = timed(lambda: list(executor.map(cpu_bound, sizes)))
+        print(f"  {f'WorkStealingExecutor({workers}, process)':<36} {elapsed * 1e3:>9.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
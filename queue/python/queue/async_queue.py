@@ -0,0 +1,187 @@
+"""
+    asyncio-native Queue implementation in python lang
+"""
+
+import asyncio
+from collections import deque
+from collections.abc import AsyncIterator, Iterable
+from typing import Optional, TypeVar, override
+
+from queue.empty_queue_exception import EmptyQueueException
+from queue.full_queue_exception import FullQueueException
+from queue.queue import Queue
+
+E = TypeVar("E")
+
+
+class AsyncQueue(Queue[E]):
+    """
+    A Queue for asyncio code. `put` suspends while the queue holds `max_capacity`
+    elements and `get` suspends while it is empty, each waiter parked on its own
+    future so nothing polls. It's not thread-safe: use it from a single event loop.
+    """
+
+    _getters: deque[asyncio.Future[None]]
+    _putters: deque[asyncio.Future[None]]
+
+    def __init__(self, *, max_capacity: Optional[int] = None) -> None:
+        super().__init__(max_capacity=max_capacity)
+        # `put` suspends while the queue is full.
+        self._internal_deque = deque()
+        self._getters = deque()
+        self._putters = deque()
+
+    @Queue.max_capacity.setter
+    def max_capacity(self, new_capacity: Optional[int]):
+        Queue.max_capacity.fset(self, new_capacity)  # type: ignore
+        self._wakeup_putters()
+
+    async def put(self, element: E) -> None:
+        """Adds `element` to the end of the queue, suspending until a slot is free"""
+        while self.is_full:
+            await self._wait(self._putters)
+
+        self.put_nowait(element)
+
+    def put_nowait(self, element: E) -> None:
+        """Adds `element` only if a slot is free right now.
+
+        :raises FullQueueException: if the queue is full
+        """
+        if self.is_full:
+            raise FullQueueException()
+
+        self._internal_deque.append(element)
+        _wakeup_next(self._getters)
+
+    async def get(self) -> E:
+        """Removes and returns the first element, suspending until there is one"""
+        while not self._internal_deque:
+            await self._wait(self._getters)
+
+        return self.get_nowait()
+
+    def get_nowait(self) -> E:
+        """Removes and returns the first element only if one is available right now.
+
+        :raises EmptyQueueException: if the queue is empty
+        """
+        if not self._internal_deque:
+            raise EmptyQueueException()
+
+        item = self._internal_deque.popleft()
+        _wakeup_next(self._putters)
+
+        return item
+
+    async def get_many(self, max_items: int) -> list[E]:
+        """Removes up to `max_items` elements once at least one is available.
+
+        The batch is taken without suspending after the wait, so cancelling the
+        call either removes nothing or returns the whole batch.
+
+        :returns: the removed elements in FIFO order, never empty
+        :rtype: list[E]
+        """
+        if max_items < 1:
+            raise ValueError("max_items must be a positive integer")
+
+        while not self._internal_deque:
+            await self._wait(self._getters)
+
+        internal_deque = self._internal_deque
+        items = [internal_deque.popleft() for _ in range(min(max_items, len(internal_deque)))]
+        self._wakeup_putters()
+
+        return items
+
+    @override
+    def enqueue(self, element: E) -> None:
+        self.put_nowait(element)
+
+    @override
+    def enqueue_many(self, elements: Iterable[E]) -> None:
+        """Enqueues all `elements` at once if they all fit right now.
+
+        :raises FullQueueException: if the batch doesn't fit, in which case nothing is enqueued
+        """
+        elements = list(elements)
+        super().enqueue_many(elements)
+
+        for _ in elements:
+            if not _wakeup_next(self._getters):
+                break
+
+    @override
+    def dequeue(self) -> E:
+        return self.get_nowait()
+
+    @override
+    def dequeue_many(self, n: int) -> list[E]:
+        items = super().dequeue_many(n)
+        self._wakeup_putters()
+
+        return items
+
+    @override
+    def try_dequeue(self) -> Optional[E]:
+        try:
+            return self.get_nowait()
+        except EmptyQueueException:
+            return None
+
+    @override
+    def clear(self) -> None:
+        """Clears queue elements"""
+        self._internal_deque.clear()
+        self._wakeup_putters()
+
+    async def __aiter__(self) -> AsyncIterator[E]:
+        """Yields elements in FIFO order as they arrive, suspending while the queue is empty"""
+        while True:
+            yield await self.get()
+
+    async def _wait(self, waiters: deque[asyncio.Future[None]]) -> None:
+        waiter = asyncio.get_running_loop().create_future()
+        waiters.append(waiter)
+
+        try:
+            await waiter
+        except BaseException:
+            waiter.cancel()
+            try:
+                waiters.remove(waiter)
+            except ValueError:
+                pass
+            # This waiter may have been woken just before being cancelled,
+            # hand the wakeup over so no element or slot goes unnoticed.
+            if not waiter.cancelled():
+                self._wakeup_after_cancel(waiters)
+            raise
+
+    def _wakeup_after_cancel(self, waiters: deque[asyncio.Future[None]]) -> None:
+        if waiters is self._getters and self._internal_deque:
+            _wakeup_next(waiters)
+        elif waiters is self._putters and not self.is_full:
+            _wakeup_next(waiters)
+
+    def _wakeup_putters(self) -> None:
+        if self._max_capacity is None:
+            free_slots = len(self._putters)
+        else:
+            free_slots = self._max_capacity - len(self._internal_deque)
+
+        for _ in range(free_slots):
+            if not _wakeup_next(self._putters):
+                break
+
+
+def _wakeup_next(waiters: deque[asyncio.Future[None]]) -> bool:
+    """Wakes the oldest waiter still pending, returns whether one was woken"""
+    while waiters:
+        waiter = waiters.popleft()
+        if not waiter.done():
+            waiter.set_result(None)
+            return True
+
+    return False
@@ -0,0 +1,252 @@
+"""
+    Micro-batching consumers of Queues
+
+    `batches` turns a queue into a stream of lists, each one yielded as soon as it
+    holds `max_size` elements or `max_bytes` bytes, or its first element has waited
+    `max_linger` seconds. `consume_batches` hands them to a sink running on worker
+    threads, with a bound on the batches waiting for or being processed by the sink.
+"""
+
+import threading
+from bisect import bisect_left
+from collections import deque
+from collections.abc import Callable, Iterator
+from time import monotonic
+from typing import Any, Optional, TypeVar
+
+from queue.blocking_queue import BlockingQueue
+from queue.empty_queue_exception import EmptyQueueException
+from queue.queue import Queue
+
+E = TypeVar("E")
+
+# Upper bounds of the batch size histogram buckets.
+BATCH_SIZE_BUCKETS: tuple[float, ...] = (1, 2, 4, 8, 16, 32, 64, 128, 256, 512, 1024, float("inf"))
+
+# What ended a batch: it was full, it reached `max_bytes`, its first element waited `max_linger`, or the queue closed.
+FLUSH_REASONS = ("size", "bytes", "linger", "close")
+
+
+class BatchStats:
+    """
+    Counts the batches yielded by `batches`: a histogram of their sizes, each bucket
+    counting the batches up to its `BATCH_SIZE_BUCKETS` bound and above the previous
+    one, what ended them, and the elements discarded at close or whose sink failed.
+    """
+
+    counts: list[int]
+    batches: int
+    elements: int
+    bytes: int
+    flushes: dict[str, int]
+    discarded: int
+    failed: int
+    _mutex: threading.Lock
+
+    def __init__(self) -> None:
+        self.counts = [0] * len(BATCH_SIZE_BUCKETS)
+        self.batches = 0
+        self.elements = 0
+        self.bytes = 0
+        self.flushes = dict.fromkeys(FLUSH_REASONS, 0)
+        self.discarded = 0
+        self.failed = 0
+        self._mutex = threading.Lock()
+
+    def record(self, size: int, nbytes: int, reason: str) -> None:
+        with self._mutex:
+            self.counts[bisect_left(BATCH_SIZE_BUCKETS, size)] += 1
+            self.batches += 1
+            self.elements += size
+            self.bytes += nbytes
+            self.flushes[reason] += 1
+
+    def record_failure(self, size: int) -> None:
+        with self._mutex:
+            self.failed += size
+
+    @property
+    def mean_size(self) -> float:
+        return self.elements / self.batches if self.batches else 0.0
+
+    def as_dict(self) -> dict[str, Any]:
+        with self._mutex:
+            return {
+                "batches": self.batches,
+                "elements": self.elements,
+                "bytes": self.bytes,
+                "mean_size": self.mean_size,
+                "sizes": {f"le_{bound:g}": count for bound, count in zip(BATCH_SIZE_BUCKETS, self.counts)},
+                "flushes": self.flushes.copy(),
+                "discarded": self.discarded,
+                "failed": self.failed,
+            }
+
+
+def batches(
+    queue: Queue[E],
+    max_size: int,
+    max_linger: Optional[float] = None,
+    max_bytes: Optional[int] = None,
+    *,
+    size_of: Callable[[E], int] = len,  # type: ignore[assignment]
+    flush_on_close: bool = True,
+    stats: Optional[BatchStats] = None,
+) -> Iterator[list[E]]:
+    """Dequeues the elements of `queue` in batches, in FIFO order, each yielded as soon as
+    it holds `max_size` elements, or `max_bytes` bytes, or its first element has waited
+    `max_linger` seconds. It waits for elements without spinning, and ends once the
+    queue is closed (see `BlockingQueue.close`) and drained. A queue that isn't
+    thread-safe can't be fed while waiting, so it's closed once it's empty.
+
+    :param max_linger: most seconds the first element of a batch waits for others, `None` waits for a full batch
+    :param max_bytes: most bytes in a batch, as measured by `size_of`, unless a single element is bigger
+    :param size_of: size in bytes of an element, only called with `max_bytes`
+    :param flush_on_close: yield the elements left once the queue is closed, or discard them, counted in `stats`
+    :param stats: records the size of every batch and what ended it
+    :raises ValueError: if a limit isn't positive
+    """
+    if max_size < 1 or (max_bytes is not None and max_bytes < 1) or (max_linger is not None and max_linger < 0):
+        raise ValueError("max_size and max_bytes must be positive, max_linger non-negative")
+
+    return _batches(queue, max_size, max_linger, max_bytes, size_of, flush_on_close, stats)
+
+
+def consume_batches(
+    queue: Queue[E],
+    sink: Callable[[list[E]], Any],
+    max_size: int,
+    max_linger: Optional[float] = None,
+    max_bytes: Optional[int] = None,
+    *,
+    workers: int = 1,
+    max_in_flight: Optional[int] = None,
+    size_of: Callable[[E], int] = len,  # type: ignore[assignment]
+    flush_on_close: bool = True,
+) -> BatchStats:
+    """Calls `sink` with each batch of `queue`, on `workers` threads, until the queue is closed and drained.
+
+    Batching pauses while `max_in_flight` batches are queued for or being processed
+    by the sink, so a slow sink makes elements wait in `queue` instead of piling up
+    in memory. If the sink raises, no more batches are made, and the first error is
+    raised once the batches in flight are done. Their elements are counted in `failed`.
+
+    :param max_in_flight: most batches given to the sink and not done yet, twice `workers` by default
+    :returns: the statistics of the batches
+    :raises ValueError: if `workers` or `max_in_flight` isn't positive, or a limit of `batches` isn't
+    """
+    max_in_flight = 2 * workers if max_in_flight is None else max_in_flight
+    if workers < 1 or max_in_flight < 1:
+        raise ValueError("workers and max_in_flight must be positive integers")
+
+    stats = BatchStats()
+    stream = batches(
+        queue, max_size, max_linger, max_bytes, size_of=size_of, flush_on_close=flush_on_close, stats=stats
+    )
+    in_flight = threading.BoundedSemaphore(max_in_flight)
+    inbox = BlockingQueue[list[E]]()
+    errors: list[BaseException] = []
+
+    def work() -> None:
+        while True:
+            try:
+                batch = inbox.get()
+            except EmptyQueueException:  # closed and drained
+                return
+            try:
+                sink(batch)
+            except BaseException as error:
+                stats.record_failure(len(batch))
+                errors.append(error)
+            finally:
+                in_flight.release()
+
+    threads = [threading.Thread(target=work, name=f"batch-worker-{index}", daemon=True) for index in range(workers)]
+    for thread in threads:
+        thread.start()
+    try:
+        for batch in stream:
+            in_flight.acquire()
+            if errors:
+                in_flight.release()
+                stats.record_failure(len(batch))
+                break
+            inbox.put(batch)
+    finally:
+        inbox.close()
+        for thread in threads:
+            thread.join()
+
+    if errors:
+        raise errors[0]
+
+    return stats
+
+
+def _batches(
+    queue: Queue[E],
+    max_size: int,
+    max_linger: Optional[float],
+    max_bytes: Optional[int],
+    size_of: Callable[[E], int],
+    flush_on_close: bool,
+    stats: Optional[BatchStats],
+) -> Iterator[list[E]]:
+    # Elements taken from the queue but not batched yet: they didn't fit in the previous batch.
+    pending: deque[E] = deque()
+    closed = False
+
+    while True:
+        batch: list[E] = []
+        nbytes = 0
+        deadline = None
+        reason = None
+
+        while reason is None:
+            while pending:
+                if max_bytes is not None:
+                    element_bytes = size_of(pending[0])
+                    if batch and nbytes + element_bytes > max_bytes:
+                        reason = "bytes"
+                        break
+                    nbytes += element_bytes
+                batch.append(pending.popleft())
+                if len(batch) >= max_size:
+                    reason = "size"
+                    break
+                if max_bytes is not None and nbytes >= max_bytes:
+                    reason = "bytes"
+                    break
+            if reason is not None:
+                break
+            if closed:
+                reason = "close"
+                break
+
+            timeout = None
+            if batch and max_linger is not None:
+                if deadline is None:
+                    deadline = monotonic() + max_linger
+                timeout = deadline - monotonic()
+                if timeout <= 0:
+                    reason = "linger"
+                    break
+
+            polled = queue._poll(max_size - len(batch), timeout)
+            if polled is None:
+                closed = True
+            elif polled:
+                pending.extend(polled)
+            elif batch:
+                reason = "linger"
+
+        if closed and not flush_on_close:
+            if stats is not None:
+                stats.discarded += len(batch) + len(pending)
+            return
+        if batch:
+            if stats is not None:
+                stats.record(len(batch), nbytes, reason)
+            yield batch
+        if closed and not pending:
+            return
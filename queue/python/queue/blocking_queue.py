@@ -0,0 +1,308 @@
+"""
+    Thread-safe, blocking Queue implementation in python lang
+"""
+
+import threading
+from collections import deque
+from collections.abc import Iterable, Iterator
+from time import monotonic
+from typing import Any, Optional, TypeVar, override
+
+from queue.closed_queue_exception import ClosedQueueException
+from queue.empty_queue_exception import EmptyQueueException
+from queue.full_queue_exception import FullQueueException
+from queue.queue import Queue
+
+E = TypeVar("E")
+
+
+class BlockingQueue(Queue[E]):
+    """
+    A thread-safe Queue that applies backpressure instead of losing items.
+    Producers block while the queue holds `max_capacity` elements and consumers
+    block while it is empty. Every state change goes through a single lock
+    shared by the `not_empty`, `not_full` and `all_tasks_done` conditions.
+    """
+
+    _mutex: threading.Lock
+    _not_empty: threading.Condition
+    _not_full: threading.Condition
+    _all_tasks_done: threading.Condition
+    _unfinished_tasks: int
+    _closed: bool = False
+
+    def __init__(self, *, max_capacity: Optional[int] = None) -> None:
+        super().__init__(max_capacity=max_capacity)
+        # `put` blocks while the queue is full.
+        self._internal_deque = deque()
+        self._unfinished_tasks = 0
+        self._create_conditions()
+
+    @Queue.max_capacity.setter
+    def max_capacity(self, new_capacity: Optional[int]):
+        with self._mutex:
+            Queue.max_capacity.fset(self, new_capacity)  # type: ignore
+            self._not_full.notify_all()
+
+    def put(self, element: E, *, timeout: Optional[float] = None) -> None:
+        """Adds `element` to the end of the queue, waiting for a free slot if needed.
+
+        :param timeout: seconds to wait for a free slot, `None` waits forever
+        :raises FullQueueException: if no slot became free within `timeout`
+        :raises ClosedQueueException: if the queue is closed, or gets closed while waiting
+        """
+        self._put(element, block=True, timeout=timeout)
+
+    def put_nowait(self, element: E) -> None:
+        """Adds `element` only if a slot is free right now.
+
+        :raises FullQueueException: if the queue is full
+        :raises ClosedQueueException: if the queue is closed
+        """
+        self._put(element, block=False, timeout=None)
+
+    def get(self, *, timeout: Optional[float] = None) -> E:
+        """Removes and returns the first element, waiting for one if needed.
+
+        :param timeout: seconds to wait for an element, `None` waits forever
+        :raises EmptyQueueException: if no element arrived within `timeout`, or the queue is closed and empty
+        """
+        with self._not_empty:
+            self._wait_for_element(block=True, timeout=timeout)
+            return self._take_one()
+
+    def get_nowait(self) -> E:
+        """Removes and returns the first element only if one is available right now.
+
+        :raises EmptyQueueException: if the queue is empty
+        """
+        with self._not_empty:
+            self._wait_for_element(block=False, timeout=None)
+            return self._take_one()
+
+    def get_many(self, max_items: int, timeout: Optional[float] = None) -> list[E]:
+        """Removes up to `max_items` elements in a single critical section.
+
+        Waits until at least one element is available, then takes everything
+        that is ready without waiting for the batch to fill up.
+
+        :param timeout: seconds to wait for the first element, `None` waits forever
+        :returns: the removed elements in FIFO order, empty if `timeout` expired
+        :rtype: list[E]
+        """
+        if max_items < 1:
+            raise ValueError("max_items must be a positive integer")
+
+        with self._not_empty:
+            try:
+                self._wait_for_element(block=True, timeout=timeout)
+            except EmptyQueueException:
+                return []
+
+            internal_deque = self._internal_deque
+            count = min(max_items, len(internal_deque))
+            items = [internal_deque.popleft() for _ in range(count)]
+            self._not_full.notify(count)
+
+            return items
+
+    def task_done(self) -> None:
+        """Marks one previously dequeued element as processed.
+
+        :raises ValueError: if called more times than there were elements enqueued
+        """
+        with self._all_tasks_done:
+            unfinished = self._unfinished_tasks - 1
+            if unfinished < 0:
+                raise ValueError("task_done() called too many times")
+            if unfinished == 0:
+                self._all_tasks_done.notify_all()
+            self._unfinished_tasks = unfinished
+
+    def join(self) -> None:
+        """Blocks until every enqueued element has been marked with `task_done`."""
+        with self._all_tasks_done:
+            while self._unfinished_tasks:
+                self._all_tasks_done.wait()
+
+    def close(self) -> None:
+        """Signals that no more elements will come: once the queue is empty, consumers stop
+        waiting, `get` raises `EmptyQueueException` right away and `batches` ends. Producers,
+        waiting ones included, get a `ClosedQueueException`, a `FullQueueException`.
+        """
+        with self._mutex:
+            self._closed = True
+            self._not_empty.notify_all()
+            self._not_full.notify_all()
+
+    @property
+    def closed(self) -> bool:
+        return self._closed
+
+    @override
+    def enqueue(self, element: E) -> None:
+        self.put_nowait(element)
+
+    @override
+    def enqueue_many(self, elements: Iterable[E]) -> None:
+        """Enqueues all `elements` at once if they all fit right now.
+
+        :raises FullQueueException: if the batch doesn't fit, in which case nothing is enqueued
+        :raises ClosedQueueException: if the queue is closed
+        """
+        elements = list(elements)
+
+        with self._mutex:
+            if self._closed:
+                raise ClosedQueueException()
+            if (
+                self._max_capacity is not None
+                and len(self._internal_deque) + len(elements) > self._max_capacity
+            ):
+                raise FullQueueException()
+
+            self._internal_deque.extend(elements)
+            self._unfinished_tasks += len(elements)
+            self._not_empty.notify(len(elements))
+
+    @override
+    def dequeue(self) -> E:
+        return self.get_nowait()
+
+    @override
+    def dequeue_many(self, n: int) -> list[E]:
+        with self._mutex:
+            items = Queue.dequeue_many(self, n)
+            self._not_full.notify(n)
+
+            return items
+
+    @override
+    def try_dequeue(self) -> Optional[E]:
+        try:
+            return self.get_nowait()
+        except EmptyQueueException:
+            return None
+
+    @property
+    @override
+    def peek(self) -> E:
+        with self._mutex:
+            if self._internal_deque:
+                return self._internal_deque[0]
+            raise EmptyQueueException()
+
+    @override
+    def clear(self) -> None:
+        """Clears queue elements, counting them as processed for `join`"""
+        with self._mutex:
+            removed = len(self._internal_deque)
+            self._internal_deque.clear()
+            self._unfinished_tasks = max(0, self._unfinished_tasks - removed)
+            if self._unfinished_tasks == 0:
+                self._all_tasks_done.notify_all()
+            self._not_full.notify_all()
+
+    @override
+    def __contains__(self, item: object) -> bool:
+        with self._mutex:
+            return item in self._internal_deque
+
+    @override
+    def __iter__(self) -> Iterator[E]:
+        with self._mutex:
+            return iter(list(self._internal_deque))
+
+    def __getstate__(self) -> dict[str, Any]:
+        """Pickles the elements and the unfinished task count, the lock is created again on load"""
+        with self._mutex:
+            state = self.__dict__.copy()
+            state["_internal_deque"] = self._internal_deque.copy()
+        for name in ("_mutex", "_not_empty", "_not_full", "_all_tasks_done"):
+            del state[name]
+
+        return state
+
+    def __setstate__(self, state: dict[str, Any]) -> None:
+        self.__dict__.update(state)
+        self._create_conditions()
+
+    def _create_conditions(self) -> None:
+        self._mutex = threading.Lock()
+        self._not_empty = threading.Condition(self._mutex)
+        self._not_full = threading.Condition(self._mutex)
+        self._all_tasks_done = threading.Condition(self._mutex)
+
+    def _put(self, element: E, *, block: bool, timeout: Optional[float]) -> None:
+        with self._not_full:
+            if self._closed:
+                raise ClosedQueueException()
+            if self._max_capacity is not None:
+                if not block:
+                    if len(self._internal_deque) >= self._max_capacity:
+                        raise FullQueueException()
+                elif timeout is None:
+                    while len(self._internal_deque) >= self._max_capacity:
+                        self._not_full.wait()
+                        if self._closed:
+                            raise ClosedQueueException()
+                elif timeout < 0:
+                    raise ValueError("timeout must be a non-negative number")
+                else:
+                    deadline = monotonic() + timeout
+                    while len(self._internal_deque) >= self._max_capacity:
+                        remaining = deadline - monotonic()
+                        if remaining <= 0:
+                            raise FullQueueException()
+                        self._not_full.wait(remaining)
+                        if self._closed:
+                            raise ClosedQueueException()
+
+            self._internal_deque.append(element)
+            self._unfinished_tasks += 1
+            self._not_empty.notify()
+
+    @override
+    def _poll(self, max_items: int, timeout: Optional[float]) -> Optional[list[E]]:
+        with self._not_empty:
+            try:
+                self._wait_for_element(block=True, timeout=timeout)
+            except EmptyQueueException:
+                return None if self._closed else []
+
+            internal_deque = self._internal_deque
+            count = min(max_items, len(internal_deque))
+            items = [internal_deque.popleft() for _ in range(count)]
+            self._not_full.notify(count)
+
+            return items
+
+    def _wait_for_element(self, *, block: bool, timeout: Optional[float]) -> None:
+        """Waits on `not_empty` until an element is available. Caller must hold the lock.
+
+        :raises EmptyQueueException: if `timeout` expired, or the queue is closed and empty
+        """
+        if not block:
+            if not self._internal_deque:
+                raise EmptyQueueException()
+        elif timeout is None:
+            while not self._internal_deque:
+                if self._closed:
+                    raise EmptyQueueException()
+                self._not_empty.wait()
+        elif timeout < 0:
+            raise ValueError("timeout must be a non-negative number")
+        else:
+            deadline = monotonic() + timeout
+            while not self._internal_deque:
+                remaining = deadline - monotonic()
+                if remaining <= 0 or self._closed:
+                    raise EmptyQueueException()
+                self._not_empty.wait(remaining)
+
+    def _take_one(self) -> E:
+        """Pops the first element and wakes one producer. Caller must hold the lock."""
+        item = self._internal_deque.popleft()
+        self._not_full.notify()
+
+        return item
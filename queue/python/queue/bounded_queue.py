@@ -0,0 +1,285 @@
+"""
+    Bounded ring buffer Queue with overflow policies implementation in python lang
+"""
+
+import threading
+from collections.abc import Callable, Iterable, Iterator, Sequence
+from enum import Enum
+from time import monotonic
+from typing import Any, Optional, Self, TypeVar, override
+
+from queue.empty_queue_exception import EmptyQueueException
+from queue.full_queue_exception import FullQueueException
+from queue.queue import Queue
+
+E = TypeVar("E")
+
+
+class OverflowPolicy(Enum):
+    """What a BoundedQueue does with an element enqueued while it's full"""
+
+    REJECT = "reject"
+    """`enqueue` raises `FullQueueException`, the queue is left untouched."""
+    DROP_OLDEST = "drop_oldest"
+    """The oldest element is discarded to make room for the new one."""
+    DROP_NEWEST = "drop_newest"
+    """The new element is discarded."""
+    BLOCK = "block"
+    """`enqueue` waits for a free slot, raising `FullQueueException` if its timeout expires."""
+    SPILL = "spill"
+    """The new element is handed to the `spill` callback instead, e.g. to write it to disk."""
+
+
+class BoundedQueue(Queue[E]):
+    """
+    A thread-safe FIFO queue over a ring of `max_capacity` slots allocated up front,
+    so its memory never grows while it runs. What happens to elements that don't
+    fit is chosen by its `OverflowPolicy`, and every element a policy discarded
+    (or, for `BLOCK`, gave up on) is counted in `overflows`.
+
+    Changing `max_capacity` copies the elements into a new ring once, in O(n).
+    """
+
+    _slots: list[Optional[E]]
+    _head: int
+    _size: int
+    _overflow_policy: OverflowPolicy
+    _spill: Optional[Callable[[E], None]]
+    _overflows: dict[OverflowPolicy, int]
+    _mutex: threading.Lock
+    _not_full: threading.Condition
+
+    def __init__(
+        self,
+        *,
+        max_capacity: int,
+        overflow_policy: OverflowPolicy = OverflowPolicy.REJECT,
+        spill: Optional[Callable[[E], None]] = None,
+    ) -> None:
+        """
+        :param max_capacity: number of preallocated slots
+        :param overflow_policy: what to do with elements enqueued while the queue is full
+        :param spill: called with each overflowing element under `OverflowPolicy.SPILL`
+        """
+        if max_capacity < 1:
+            raise ValueError("max_capacity must be a positive integer")
+        if overflow_policy is OverflowPolicy.SPILL and spill is None:
+            raise ValueError("OverflowPolicy.SPILL needs a spill callback")
+
+        self._max_capacity = max_capacity
+        self._slots = [None] * max_capacity
+        self._head = 0
+        self._size = 0
+        self._overflow_policy = overflow_policy
+        self._spill = spill
+        self._overflows = dict.fromkeys(OverflowPolicy, 0)
+        self._create_conditions()
+
+    @classmethod
+    @override
+    def from_sequence(cls, sequence: Sequence[E], *, max_capacity: Optional[int] = None) -> Self:
+        """
+        :raises ValueError: if `max_capacity` is missing, or is less than the length of `sequence`
+        """
+        if max_capacity is None:
+            raise ValueError("A BoundedQueue needs a max_capacity")
+
+        return super().from_sequence(sequence, max_capacity=max_capacity)
+
+    @property
+    @override
+    def max_capacity(self) -> int:
+        return self._max_capacity  # type: ignore
+
+    @max_capacity.setter
+    def max_capacity(self, new_capacity: int) -> None:
+        """Moves the elements into a new ring of `new_capacity` slots
+
+        :raises ValueError: if `new_capacity` is `None`, or less than the number of elements in queue
+        """
+        with self._mutex:
+            if new_capacity is None or new_capacity < max(self._size, 1):
+                raise ValueError(f"Your new capacity should be a positive integer, at least {self._size}")
+
+            slots: list[Optional[E]] = [None] * new_capacity
+            slots[: self._size] = self._ordered()
+            self._slots = slots
+            self._head = 0
+            self._max_capacity = new_capacity
+            self._not_full.notify_all()
+
+    @property
+    def overflow_policy(self) -> OverflowPolicy:
+        return self._overflow_policy
+
+    @overflow_policy.setter
+    def overflow_policy(self, policy: OverflowPolicy) -> None:
+        if policy is OverflowPolicy.SPILL and self._spill is None:
+            raise ValueError("OverflowPolicy.SPILL needs a spill callback")
+        with self._mutex:
+            self._overflow_policy = policy
+            self._not_full.notify_all()
+
+    @property
+    def overflows(self) -> dict[str, int]:
+        """Number of elements each policy rejected, dropped, spilled or timed out on
+
+        :rtype: dict[str, int]
+        """
+        with self._mutex:
+            return {policy.value: count for policy, count in self._overflows.items()}
+
+    @override
+    def enqueue(self, element: E, *, timeout: Optional[float] = None) -> None:
+        """Adds `element` to the end of the queue, applying the overflow policy if it's full
+
+        :param timeout: seconds `OverflowPolicy.BLOCK` waits for a free slot, `None` waits forever
+        :raises FullQueueException: if the queue is full under `REJECT`, or no slot became free within `timeout`
+        """
+        with self._not_full:
+            if self._size < self._max_capacity or self._make_room(timeout):  # type: ignore[operator]
+                self._append(element)
+                return
+            policy = self._overflow_policy
+            self._overflows[policy] += 1
+
+        if policy is OverflowPolicy.SPILL:
+            self._spill(element)  # type: ignore[misc]
+        elif policy is not OverflowPolicy.DROP_NEWEST:
+            raise FullQueueException()
+
+    @override
+    def enqueue_many(self, elements: Iterable[E]) -> None:
+        """Enqueues all `elements` in order, each one going through the overflow policy.
+
+        :raises FullQueueException: under `REJECT` if the batch doesn't fit, in which case nothing is enqueued
+        """
+        elements = list(elements)
+        with self._mutex:
+            policy = self._overflow_policy
+            if policy is OverflowPolicy.REJECT and self._size + len(elements) > self._max_capacity:  # type: ignore[operator]
+                self._overflows[policy] += len(elements)
+                raise FullQueueException()
+            if policy in (OverflowPolicy.REJECT, OverflowPolicy.DROP_OLDEST, OverflowPolicy.DROP_NEWEST):
+                for element in elements:
+                    if self._size < self._max_capacity or self._make_room(None):  # type: ignore[operator]
+                        self._append(element)
+                    else:
+                        self._overflows[policy] += 1
+                return
+
+        # Blocking and spilling happen one element at a time, without holding the lock in between.
+        for element in elements:
+            self.enqueue(element)
+
+    @override
+    def dequeue(self) -> E:
+        with self._mutex:
+            if not self._size:
+                raise EmptyQueueException()
+            return self._pop_head()
+
+    @override
+    def dequeue_many(self, n: int) -> list[E]:
+        with self._mutex:
+            if n > self._size:
+                raise ValueError(f"Your value for n should be less or equal to {self._size}")
+            return [self._pop_head() for _ in range(n)]
+
+    @override
+    def try_dequeue(self) -> Optional[E]:
+        with self._mutex:
+            return self._pop_head() if self._size else None
+
+    @property
+    @override
+    def peek(self) -> E:
+        with self._mutex:
+            if not self._size:
+                raise EmptyQueueException()
+            return self._slots[self._head]  # type: ignore[return-value]
+
+    @override
+    def clear(self) -> None:
+        with self._mutex:
+            self._slots = [None] * self._max_capacity  # type: ignore[operator]
+            self._head = 0
+            self._size = 0
+            self._not_full.notify_all()
+
+    @override
+    def __len__(self) -> int:
+        return self._size
+
+    @override
+    def __contains__(self, item: object) -> bool:
+        return item in self.snapshot()
+
+    @override
+    def __iter__(self) -> Iterator[E]:
+        """Iterates over a copy of the elements, in FIFO order"""
+        with self._mutex:
+            return iter(self._ordered())
+
+    def __getstate__(self) -> dict[str, Any]:
+        """Pickles the ring, the policy and its counters, the lock is created again on load"""
+        with self._mutex:
+            state = self.__dict__.copy()
+            state["_slots"] = self._slots.copy()
+            state["_overflows"] = self._overflows.copy()
+        del state["_mutex"], state["_not_full"]
+
+        return state
+
+    def __setstate__(self, state: dict[str, Any]) -> None:
+        self.__dict__.update(state)
+        self._create_conditions()
+
+    def _create_conditions(self) -> None:
+        self._mutex = threading.Lock()
+        self._not_full = threading.Condition(self._mutex)
+
+    def _make_room(self, timeout: Optional[float]) -> bool:
+        """Frees a slot as the policy allows, `True` if there's one now. Caller must hold the lock."""
+        policy = self._overflow_policy
+        if policy is OverflowPolicy.DROP_OLDEST:
+            self._pop_head()
+            self._overflows[policy] += 1
+            return True
+        if policy is not OverflowPolicy.BLOCK:
+            return False
+
+        deadline = None if timeout is None else monotonic() + timeout
+        while self._size >= self._max_capacity:  # type: ignore[operator]
+            if self._overflow_policy is not OverflowPolicy.BLOCK:
+                return self._make_room(timeout)
+            remaining = None if deadline is None else deadline - monotonic()
+            if remaining is not None and remaining <= 0:
+                return False
+            self._not_full.wait(remaining)
+
+        return True
+
+    def _append(self, element: E) -> None:
+        """Stores `element` in the slot after the last one. Caller must hold the lock with a free slot."""
+        self._slots[(self._head + self._size) % len(self._slots)] = element
+        self._size += 1
+
+    def _pop_head(self) -> E:
+        """Takes the first element out of its slot. Caller must hold the lock and the queue not be empty."""
+        head = self._head
+        element = self._slots[head]
+        self._slots[head] = None
+        self._head = (head + 1) % len(self._slots)
+        self._size -= 1
+        self._not_full.notify()
+
+        return element  # type: ignore[return-value]
+
+    def _ordered(self) -> list[Optional[E]]:
+        """The elements in FIFO order. Caller must hold the lock."""
+        end = self._head + self._size
+        if end <= len(self._slots):
+            return self._slots[self._head : end]
+
+        return self._slots[self._head :] + self._slots[: end - len(self._slots)]
@@ -0,0 +1,374 @@
+"""
+    Broadcast (fan-out) ring Queue with per-subscriber cursors implementation in python lang
+"""
+
+import threading
+from collections.abc import Iterable, Iterator, Sized
+from time import monotonic
+from typing import Generic, Optional, TypeVar
+
+from queue.bounded_queue import OverflowPolicy
+from queue.empty_queue_exception import EmptyQueueException
+from queue.full_queue_exception import FullQueueException
+
+E = TypeVar("E")
+
+_POLICIES = (OverflowPolicy.BLOCK, OverflowPolicy.DROP_OLDEST, OverflowPolicy.REJECT)
+
+
+class BroadcastQueue(Sized, Generic[E]):
+    """
+    A thread-safe queue where every subscriber receives every element enqueued after
+    it subscribed, in FIFO order. Elements are stored once, in a ring of `max_capacity`
+    slots, and each `Subscriber` reads it through its own cursor. A slot is reclaimed
+    once the slowest subscriber has read it.
+
+    While the slowest subscriber is `max_capacity` elements behind, the queue is full,
+    and the overflow policy decides: `BLOCK` makes the producer wait for it,
+    `DROP_OLDEST` moves it past its oldest unread element, counted in its `lag`, and
+    `REJECT` raises `FullQueueException`. Elements enqueued with no subscriber are
+    discarded.
+    """
+
+    _slots: list[Optional[E]]
+    _max_capacity: int
+    _overflow_policy: OverflowPolicy
+    # Sequence number of the next element enqueued, and of the oldest one kept.
+    _tail: int
+    _head: int
+    # Subscribers whose cursor is at the head: when none is left, the head moves.
+    _at_head: int
+    _subscribers: list["Subscriber[E]"]
+    _mutex: threading.Lock
+    _not_full: threading.Condition
+    _not_empty: threading.Condition
+    # Threads waiting on each condition, so that enqueuing and reading skip notifying nobody.
+    _waiting_writers: int
+    _waiting_readers: int
+
+    def __init__(self, *, max_capacity: int, overflow_policy: OverflowPolicy = OverflowPolicy.BLOCK) -> None:
+        """
+        :param max_capacity: number of preallocated slots, how far the slowest subscriber can fall behind
+        :param overflow_policy: `BLOCK`, `DROP_OLDEST` or `REJECT`, what to do when the slowest subscriber is that far behind
+        """
+        if max_capacity < 1:
+            raise ValueError("max_capacity must be a positive integer")
+        if overflow_policy not in _POLICIES:
+            raise ValueError(f"BroadcastQueue supports {', '.join(policy.name for policy in _POLICIES)}")
+
+        self._slots = [None] * max_capacity
+        self._max_capacity = max_capacity
+        self._overflow_policy = overflow_policy
+        self._tail = 0
+        self._head = 0
+        self._at_head = 0
+        self._subscribers = []
+        self._mutex = threading.Lock()
+        self._not_full = threading.Condition(self._mutex)
+        self._not_empty = threading.Condition(self._mutex)
+        self._waiting_writers = 0
+        self._waiting_readers = 0
+
+    @property
+    def max_capacity(self) -> int:
+        return self._max_capacity
+
+    @property
+    def overflow_policy(self) -> OverflowPolicy:
+        return self._overflow_policy
+
+    @property
+    def subscribers(self) -> list["Subscriber[E]"]:
+        with self._mutex:
+            return self._subscribers.copy()
+
+    def subscribe(self) -> "Subscriber[E]":
+        """A new subscriber, which receives the elements enqueued from now on"""
+        with self._mutex:
+            subscriber = Subscriber(self, self._tail)
+            self._subscribers.append(subscriber)
+            self._reclaim()
+
+            return subscriber
+
+    def unsubscribe(self, subscriber: "Subscriber[E]") -> None:
+        """Stops delivering to `subscriber`, reclaiming the slots only it hadn't read
+
+        :raises ValueError: if `subscriber` isn't subscribed to this queue
+        """
+        with self._mutex:
+            self._subscribers.remove(subscriber)
+            subscriber._closed = True
+            self._reclaim()
+            self._not_empty.notify_all()
+
+    def enqueue(self, element: E, *, timeout: Optional[float] = None) -> None:
+        """Delivers `element` to every subscriber, applying the overflow policy if the queue is full
+
+        :param timeout: seconds `OverflowPolicy.BLOCK` waits for the slowest subscriber, `None` waits forever
+        :raises FullQueueException: if the queue is full under `REJECT`, or no slot became free within `timeout`
+        """
+        with self._mutex:
+            if not self._subscribers:
+                return
+            if self._tail - self._head >= self._max_capacity:
+                self._make_room(1, timeout)
+                if not self._subscribers:
+                    return
+            self._slots[self._tail % self._max_capacity] = element
+            self._tail += 1
+            if self._waiting_readers:
+                self._not_empty.notify_all()
+
+    def enqueue_many(self, elements: Iterable[E], *, timeout: Optional[float] = None) -> None:
+        """Delivers all `elements` in order, filling as many slots as are free at once
+
+        :raises FullQueueException: under `REJECT` if the batch doesn't fit, in which case nothing is enqueued.
+        Under `BLOCK`, if no slot became free within `timeout`, with the elements before it enqueued.
+        """
+        elements = list(elements)
+        capacity = self._max_capacity
+        with self._mutex:
+            if not self._subscribers:
+                return
+            if self._overflow_policy is OverflowPolicy.REJECT and self._tail - self._head + len(elements) > capacity:
+                raise FullQueueException()
+
+            deadline = None if timeout is None else monotonic() + timeout
+            start = 0
+            while start < len(elements):
+                free = capacity - (self._tail - self._head)
+                if free <= 0:
+                    remaining = None if deadline is None else max(0.0, deadline - monotonic())
+                    self._make_room(min(len(elements) - start, capacity), remaining)
+                    free = capacity - (self._tail - self._head)
+                    if not self._subscribers:
+                        return
+
+                chunk = elements[start : start + free]
+                slot = self._tail % capacity
+                first = min(len(chunk), capacity - slot)
+                self._slots[slot : slot + first] = chunk[:first]
+                self._slots[: len(chunk) - first] = chunk[first:]
+                self._tail += len(chunk)
+                start += len(chunk)
+                if self._waiting_readers:
+                    self._not_empty.notify_all()
+
+    def __len__(self) -> int:
+        """Number of elements kept, those the slowest subscriber hasn't read yet"""
+        return self._tail - self._head
+
+    def _make_room(self, needed: int, timeout: Optional[float]) -> None:
+        """Frees at least one slot, up to `needed`, as the policy allows. Caller must hold the lock and the queue be full."""
+        policy = self._overflow_policy
+        if policy is OverflowPolicy.REJECT:
+            raise FullQueueException()
+
+        if policy is OverflowPolicy.DROP_OLDEST:
+            # Subscribers that are too far behind skip their oldest unread elements.
+            head = self._tail + min(needed, self._max_capacity) - self._max_capacity
+            for subscriber in self._subscribers:
+                if subscriber._cursor < head:
+                    subscriber._lag += head - subscriber._cursor
+                    subscriber._cursor = head
+            self._reclaim()
+            return
+
+        deadline = None if timeout is None else monotonic() + timeout
+        while self._subscribers and self._tail - self._head >= self._max_capacity:
+            remaining = None if deadline is None else deadline - monotonic()
+            if remaining is not None and remaining <= 0:
+                raise FullQueueException()
+            self._waiting_writers += 1
+            try:
+                self._not_full.wait(remaining)
+            finally:
+                self._waiting_writers -= 1
+
+    def _reclaim(self) -> None:
+        """Moves the head to the slowest cursor, releasing the slots before it. Caller must hold the lock."""
+        cursors = [subscriber._cursor for subscriber in self._subscribers]
+        head = min(cursors, default=self._tail)
+        self._at_head = cursors.count(head)
+        if head == self._head:
+            return
+
+        capacity = self._max_capacity
+        start, end = self._head % capacity, head % capacity
+        if start < end:
+            self._slots[start:end] = [None] * (end - start)
+        else:
+            self._slots[start:] = [None] * (capacity - start)
+            self._slots[:end] = [None] * end
+        self._head = head
+        if self._waiting_writers:
+            self._not_full.notify_all()
+
+    def _wait_for_element(self, subscriber: "Subscriber[E]", timeout: Optional[float]) -> None:
+        """Waits until `subscriber` has an unread element. Caller must hold the lock.
+
+        :raises EmptyQueueException: if no element arrived within `timeout`, or the subscriber was unsubscribed
+        """
+        deadline = None if timeout is None else monotonic() + timeout
+        while subscriber._cursor >= self._tail:
+            remaining = None if deadline is None else deadline - monotonic()
+            if subscriber._closed or (remaining is not None and remaining <= 0):
+                raise EmptyQueueException()
+            self._waiting_readers += 1
+            try:
+                self._not_empty.wait(remaining)
+            finally:
+                self._waiting_readers -= 1
+
+
+class Subscriber(Generic[E]):
+    """
+    The reading end of a BroadcastQueue for one consumer, with the read API of a Queue.
+    Each subscriber should be read by a single thread at a time.
+    """
+
+    _queue: BroadcastQueue[E]
+    _cursor: int
+    _lag: int
+    _closed: bool
+
+    def __init__(self, queue: BroadcastQueue[E], cursor: int) -> None:
+        self._queue = queue
+        self._cursor = cursor
+        self._lag = 0
+        self._closed = False
+
+    @property
+    def lag(self) -> int:
+        """Number of elements skipped by `OverflowPolicy.DROP_OLDEST` because this subscriber was too far behind
+
+        :rtype: int
+        """
+        return self._lag
+
+    @property
+    def closed(self) -> bool:
+        return self._closed
+
+    def dequeue(self) -> E:
+        """Removes the next element for this subscriber
+
+        :raises EmptyQueueException: if this subscriber has read every element
+        """
+        queue = self._queue
+        with queue._mutex:
+            cursor = self._cursor
+            if cursor >= queue._tail:
+                raise EmptyQueueException()
+            return self._take_one(cursor)
+
+    def dequeue_many(self, n: int) -> list[E]:
+        """Removes the next `n` elements for this subscriber
+
+        :rtype: list[E]
+        :raises ValueError: if `n` is negative or greater than the number of unread elements
+        """
+        if n < 0:
+            raise ValueError("n must be a non-negative integer")
+        with self._queue._mutex:
+            unread = self._queue._tail - self._cursor
+            if n > unread:
+                raise ValueError(f"Your value for n should be less or equal to {unread}")
+            return self._take(n) if n else []
+
+    def try_dequeue(self) -> Optional[E]:
+        with self._queue._mutex:
+            return self._take_one(self._cursor) if self._cursor < self._queue._tail else None
+
+    def get(self, *, timeout: Optional[float] = None) -> E:
+        """Removes the next element for this subscriber, waiting for one if needed
+
+        :param timeout: seconds to wait for an element, `None` waits forever
+        :raises EmptyQueueException: if no element arrived within `timeout`, or the subscriber was unsubscribed
+        """
+        queue = self._queue
+        with queue._mutex:
+            queue._wait_for_element(self, timeout)
+            return self._take_one(self._cursor)
+
+    def get_many(self, max_items: int, *, timeout: Optional[float] = None) -> list[E]:
+        """Removes up to `max_items` elements in a single critical section, waiting for the first one if needed
+
+        :raises EmptyQueueException: if no element arrived within `timeout`, or the subscriber was unsubscribed
+        """
+        queue = self._queue
+        with queue._mutex:
+            queue._wait_for_element(self, timeout)
+            return self._take(min(max_items, queue._tail - self._cursor))
+
+    @property
+    def peek(self) -> E:
+        with self._queue._mutex:
+            if self._cursor >= self._queue._tail:
+                raise EmptyQueueException()
+            return self._queue._slots[self._cursor % self._queue._max_capacity]  # type: ignore[return-value]
+
+    @property
+    def is_empty(self) -> bool:
+        return len(self) == 0
+
+    @property
+    def is_not_empty(self) -> bool:
+        return not self.is_empty
+
+    def close(self) -> None:
+        """Unsubscribes, if not done yet"""
+        try:
+            self._queue.unsubscribe(self)
+        except ValueError:
+            pass
+
+    def __len__(self) -> int:
+        """Number of elements this subscriber hasn't read yet"""
+        return self._queue._tail - self._cursor
+
+    def __iter__(self) -> Iterator[E]:
+        """Iterates over a copy of the unread elements, in FIFO order"""
+        queue = self._queue
+        with queue._mutex:
+            capacity = queue._max_capacity
+            return iter([queue._slots[sequence % capacity] for sequence in range(self._cursor, queue._tail)])  # type: ignore[misc]
+
+    def __enter__(self) -> "Subscriber[E]":
+        return self
+
+    def __exit__(self, *_: object) -> None:
+        self.close()
+
+    def _take_one(self, cursor: int) -> E:
+        """Reads the element at `cursor`, the next one. Caller must hold the lock with an element unread."""
+        queue = self._queue
+        element = queue._slots[cursor % queue._max_capacity]
+        self._cursor = cursor + 1
+        if cursor == queue._head:
+            queue._at_head -= 1
+            if not queue._at_head:
+                queue._reclaim()
+
+        return element  # type: ignore[return-value]
+
+    def _take(self, n: int) -> list[E]:
+        """Reads the next `n` elements, reclaiming their slots if this was the slowest subscriber.
+        Caller must hold the lock with `n` elements unread.
+        """
+        queue = self._queue
+        capacity = queue._max_capacity
+        cursor = self._cursor
+        start = cursor % capacity
+        if start + n <= capacity:
+            elements = queue._slots[start : start + n]
+        else:
+            elements = queue._slots[start:] + queue._slots[: start + n - capacity]
+        self._cursor = cursor + n
+        if cursor == queue._head:
+            queue._at_head -= 1
+            if not queue._at_head:
+                queue._reclaim()
+
+        return elements  # type: ignore[return-value]
@@ -0,0 +1,6 @@
+from queue.full_queue_exception import FullQueueException
+
+
+class ClosedQueueException(FullQueueException):
+    def __init__(self, message: str = "The queue is closed, it accepts no more elements.") -> None:
+        super().__init__(message)
\ No newline at end of file
@@ -0,0 +1,178 @@
+"""
+    Keyed Queue coalescing pending updates implementation in python lang
+"""
+
+from collections import OrderedDict
+from collections.abc import Callable, Hashable, Iterable, Iterator
+from typing import Generic, Optional, TypeVar, override
+
+from queue.empty_queue_exception import EmptyQueueException
+from queue.full_queue_exception import FullQueueException
+from queue.queue import Queue
+
+K = TypeVar("K", bound=Hashable)
+V = TypeVar("V")
+
+
+class CoalescingQueue(Queue[V], Generic[K, V]):
+    """
+    A queue holding at most one pending element per key. Enqueuing an element whose
+    key is already pending replaces it in place, keeping the FIFO position of the
+    first one, so consumers only see the latest update of each key. With `merge`,
+    the pending element is combined with the new one instead of replaced.
+
+    Elements are kept in an OrderedDict, a hash map over a linked list in insertion
+    order: enqueue, dequeue and `remove` by key are O(1). `max_capacity` bounds the
+    number of pending keys, so an update of a pending key always fits.
+    """
+
+    _pending: OrderedDict[K, V]
+    _key: Callable[[V], K]
+    _merge: Optional[Callable[[V, V], V]]
+    _coalesced: int
+
+    def __init__(
+        self,
+        *,
+        key: Optional[Callable[[V], K]] = None,
+        merge: Optional[Callable[[V, V], V]] = None,
+        max_capacity: Optional[int] = None,
+    ) -> None:
+        """
+        :param key: gives the key of an element, the element itself by default
+        :param merge: called with the pending and the new element of a key, returns the one to keep.
+        By default the new element replaces the pending one.
+        """
+        self._max_capacity = max_capacity
+        self._pending = OrderedDict()
+        self._key = key if key is not None else _identity  # type: ignore[assignment]
+        self._merge = merge
+        self._coalesced = 0
+
+    @property
+    def coalesced(self) -> int:
+        """Number of enqueued elements that were folded into a pending one of the same key
+
+        :rtype: int
+        """
+        return self._coalesced
+
+    @override
+    def enqueue(self, element: V) -> None:
+        """Adds `element` to the end of the queue, or in place of the pending element of its key
+
+        :raises FullQueueException: if the key isn't pending and the queue holds `max_capacity` keys
+        """
+        key = self._key(element)
+        pending = self._pending
+        if key in pending:
+            pending[key] = element if self._merge is None else self._merge(pending[key], element)
+            self._coalesced += 1
+            return
+
+        if self._max_capacity is not None and len(pending) >= self._max_capacity:
+            raise FullQueueException()
+        pending[key] = element
+
+    @override
+    def enqueue_many(self, elements: Iterable[V]) -> None:
+        """Enqueues all `elements` in order, checking the capacity once for the whole batch
+
+        :raises FullQueueException: if the new keys don't fit, in which case nothing is enqueued
+        """
+        elements = list(elements)
+        if self._max_capacity is not None:
+            keys = self._key
+            new_keys = {keys(element) for element in elements}.difference(self._pending)
+            if len(self._pending) + len(new_keys) > self._max_capacity:
+                raise FullQueueException()
+
+        for element in elements:
+            self.enqueue(element)
+
+    @override
+    def dequeue(self) -> V:
+        try:
+            return self._pending.popitem(last=False)[1]
+        except KeyError:
+            raise EmptyQueueException() from None
+
+    def dequeue_item(self) -> tuple[K, V]:
+        """Removes the first element, returned with its key
+
+        :raises EmptyQueueException: if the queue is empty
+        """
+        try:
+            return self._pending.popitem(last=False)
+        except KeyError:
+            raise EmptyQueueException() from None
+
+    @override
+    def dequeue_many(self, n: int) -> list[V]:
+        pending = self._pending
+        if n > len(pending):
+            raise ValueError(f"Your value for n should be less or equal to {len(pending)}")
+
+        if n == len(pending):
+            items = list(pending.values())
+            pending.clear()
+            return items
+
+        popitem = pending.popitem
+        return [popitem(last=False)[1] for _ in range(n)]
+
+    @override
+    def try_dequeue(self) -> Optional[V]:
+        return self._pending.popitem(last=False)[1] if self._pending else None
+
+    def remove(self, key: K) -> V:
+        """Removes the pending element of `key`, in O(1)
+
+        :raises KeyError: if no element of `key` is pending
+        """
+        return self._pending.pop(key)
+
+    def get(self, key: K) -> Optional[V]:
+        """The pending element of `key`, `None` if there's none
+
+        :rtype: Optional[V]
+        """
+        return self._pending.get(key)
+
+    def has_key(self, key: K) -> bool:
+        """Checks if an element of `key` is pending, in O(1)
+
+        :rtype: bool
+        """
+        return key in self._pending
+
+    @property
+    @override
+    def peek(self) -> V:
+        if not self._pending:
+            raise EmptyQueueException()
+        return next(iter(self._pending.values()))
+
+    @override
+    def clear(self) -> None:
+        self._pending.clear()
+
+    @override
+    def __len__(self) -> int:
+        return len(self._pending)
+
+    @override
+    def __contains__(self, item: object) -> bool:
+        return any(element == item for element in self._pending.values())
+
+    @override
+    def __iter__(self) -> Iterator[V]:
+        """Iterates in FIFO order without removing elements
+
+        :raises RuntimeError: from the iterator, if a key is added or removed while iterating
+        """
+        return iter(self._pending.values())
+
+
+def _identity(element: V) -> V:
+    return element
@@ -0,0 +1,238 @@
+"""
+    Queue with a small per-instance footprint implementation in python lang
+"""
+
+from collections import deque
+from collections.abc import Callable, Collection, Iterable, Iterator, Sequence
+from typing import TYPE_CHECKING, Any, Generic, Optional, Self, TypeVar, override
+
+from queue.empty_queue_exception import EmptyQueueException
+from queue.full_queue_exception import FullQueueException
+from queue.queue import Queue
+
+if TYPE_CHECKING:
+    import numpy
+
+    from queue.batching import BatchStats
+
+E = TypeVar("E")
+
+# Every empty queue shares the empty tuple, a singleton in CPython.
+_EMPTY: tuple[()] = ()
+# Up to this many elements are kept in a tuple, replaced on each change, before moving to a deque.
+INLINE_CAPACITY = 4
+
+
+@Queue.register
+class CompactQueue(Collection, Generic[E]):
+    """
+    A FIFO queue for when there are millions of mostly empty ones, e.g. one per
+    connection. An empty instance takes 48 bytes on 64-bit CPython, 120 with 4 elements,
+    against 840 bytes for a `Queue` with its `__dict__` and the block its deque preallocates.
+
+    It declares `__slots__`, so it has no `__dict__`: it can't subclass `Queue`, and is
+    registered as a virtual subclass instead, `isinstance(compact, Queue)` holds. The
+    elements are the shared empty tuple while empty, then a tuple of up to
+    `INLINE_CAPACITY` elements, then a deque, which is dropped again once the queue
+    is emptied. Like `Queue`, it isn't thread-safe.
+    """
+
+    __slots__ = ("_items", "_max_capacity")
+
+    _items: tuple[E, ...] | deque[E]
+    _max_capacity: Optional[int]
+
+    def __init__(self, *, max_capacity: Optional[int] = None) -> None:
+        self._items = _EMPTY
+        self._max_capacity = max_capacity
+
+    @classmethod
+    def from_sequence(cls, sequence: Sequence[E], *, max_capacity: Optional[int] = None) -> Self:
+        if max_capacity is not None and len(sequence) > max_capacity:
+            raise ValueError("Your sequence's length must be less or equal your max capacity")
+
+        queue = cls(max_capacity=max_capacity)
+        queue.enqueue_many(sequence)
+
+        return queue
+
+    @property
+    def max_capacity(self) -> Optional[int]:
+        return self._max_capacity
+
+    @max_capacity.setter
+    def max_capacity(self, new_capacity: Optional[int]) -> None:
+        if new_capacity is not None and new_capacity < len(self._items):
+            raise ValueError(f"Your new capacity shouldn't be less than the len of the queue, {len(self._items)}")
+        self._max_capacity = new_capacity
+
+    def enqueue(self, element: E) -> None:
+        """Adds `element` to the end of the queue
+
+        :raises FullQueueException: if the queue holds `max_capacity` elements
+        """
+        items = self._items
+        if self._max_capacity is not None and len(items) >= self._max_capacity:
+            raise FullQueueException()
+
+        if type(items) is deque:
+            items.append(element)
+        elif len(items) < INLINE_CAPACITY:
+            self._items = (*items, element)
+        else:
+            self._items = deque((*items, element))
+
+    def enqueue_many(self, elements: Iterable[E]) -> None:
+        """Enqueues all `elements` in order, checking the capacity once for the whole batch
+
+        :raises FullQueueException: if the batch doesn't fit, in which case nothing is enqueued
+        """
+        elements = tuple(elements)
+        items = self._items
+        if self._max_capacity is not None and len(items) + len(elements) > self._max_capacity:
+            raise FullQueueException()
+
+        if type(items) is deque:
+            items.extend(elements)
+        elif len(items) + len(elements) <= INLINE_CAPACITY:
+            self._items = (*items, *elements)
+        else:
+            self._items = deque((*items, *elements))
+
+    def dequeue(self) -> E:
+        items = self._items
+        if not items:
+            raise EmptyQueueException()
+
+        if type(items) is deque:
+            element = items.popleft()
+            if not items:
+                self._items = _EMPTY
+            return element
+
+        self._items = items[1:]
+        return items[0]
+
+    def dequeue_many(self, n: int) -> list[E]:
+        """Dequeues the first `n` elements in one step
+
+        :returns: the dequeued elements in FIFO order
+        :rtype: list[E]
+        :raises ValueError: if `n` is negative or greater than the number of elements in queue
+        """
+        if n < 0:
+            raise ValueError("n must be a non-negative integer")
+        items = self._items
+        if n > len(items):
+            raise ValueError(f"Your value for n should be less or equal to {len(items)}")
+
+        if n == len(items):
+            self._items = _EMPTY
+            return list(items)
+
+        if type(items) is deque:
+            popleft = items.popleft
+            return [popleft() for _ in range(n)]
+
+        self._items = items[n:]
+        return list(items[:n])
+
+    def dequeue_array(self, n: int, dtype: Any = None) -> "numpy.ndarray[Any, Any]":
+        """Dequeues the first `n` elements into a NumPy array. Requires `numpy`.
+
+        :param dtype: dtype of the array, inferred from the elements if `None`
+        :rtype: numpy.ndarray
+        :raises ValueError: if `n` is greater than the number of elements in queue
+        """
+        try:
+            import numpy
+        except ImportError as error:
+            raise ImportError("dequeue_array requires numpy, install it with `pip install numpy`") from error
+
+        return numpy.asarray(self.dequeue_many(n), dtype=dtype)
+
+    def try_dequeue(self) -> Optional[E]:
+        return self.dequeue() if self._items else None
+
+    @property
+    def peek(self) -> E:
+        if not self._items:
+            raise EmptyQueueException()
+        return self._items[0]
+
+    def try_peek(self) -> Optional[E]:
+        return self._items[0] if self._items else None
+
+    @property
+    def is_full(self) -> bool:
+        return self._max_capacity is not None and len(self._items) == self._max_capacity
+
+    @property
+    def is_not_full(self) -> bool:
+        return not self.is_full
+
+    @property
+    def is_empty(self) -> bool:
+        return not self._items
+
+    @property
+    def is_not_empty(self) -> bool:
+        return bool(self._items)
+
+    def clear(self) -> None:
+        """Clears queue elements, releasing their storage"""
+        self._items = _EMPTY
+
+    @override
+    def __len__(self) -> int:
+        return len(self._items)
+
+    @override
+    def __contains__(self, item: object) -> bool:
+        return item in self._items
+
+    def snapshot(self) -> list[E]:
+        """Copies the elements in FIFO order
+
+        :rtype: list[E]
+        """
+        return list(self._items)
+
+    def drain(self) -> Iterator[E]:
+        """Dequeues elements while iterating, until the queue is empty
+
+        :rtype: Iterator[E]
+        """
+        while self._items:
+            yield self.dequeue()
+
+    def batches(
+        self,
+        max_size: int,
+        max_linger: Optional[float] = None,
+        max_bytes: Optional[int] = None,
+        *,
+        size_of: Callable[[E], int] = len,  # type: ignore[assignment]
+        flush_on_close: bool = True,
+        stats: Optional["BatchStats"] = None,
+    ) -> Iterator[list[E]]:
+        """Dequeues elements in batches until the queue is empty, see `Queue.batches`"""
+        from queue.batching import batches
+
+        return batches(
+            self, max_size, max_linger, max_bytes, size_of=size_of, flush_on_close=flush_on_close, stats=stats  # type: ignore[arg-type]
+        )
+
+    def _poll(self, max_items: int, timeout: Optional[float]) -> Optional[list[E]]:
+        """Takes up to `max_items` elements for `batches`, never waiting, see `Queue._poll`"""
+        count = min(max_items, len(self._items))
+
+        return self.dequeue_many(count) if count else None
+
+    @override
+    def __iter__(self) -> Iterator[E]:
+        """Iterates in FIFO order without removing elements
+
+        :raises RuntimeError: from the iterator, if a queue past `INLINE_CAPACITY` elements is modified while iterating
+        """
+        return iter(self._items)
@@ -0,0 +1,485 @@
+"""
+    Delay Queue over a hierarchical timing wheel implementation in python lang
+"""
+
+import asyncio
+import threading
+from collections import deque
+from collections.abc import Callable, Iterable, Iterator
+from math import ceil, floor
+from time import monotonic
+from typing import Generic, Optional, TypeVar, override
+
+from queue.empty_queue_exception import EmptyQueueException
+from queue.full_queue_exception import FullQueueException
+from queue.queue import Queue
+
+E = TypeVar("E")
+
+# Each wheel has 2**_BITS slots: a level covers 256 times the span of the one below it.
+_BITS = 8
+_MASK = (1 << _BITS) - 1
+
+
+class Timer(Generic[E]):
+    """Handle of an element scheduled in a DelayQueue, to cancel it"""
+
+    __slots__ = ("element", "deadline", "_bucket", "_level", "_queued", "_cancelled")
+
+    element: E
+    # Tick from which the element is due.
+    deadline: int
+    # Wheel slot holding the timer, `None` once it's due.
+    _bucket: Optional[dict["Timer[E]", None]]
+    _level: int
+    # Whether the element is still in the queue, pending or due.
+    _queued: bool
+    _cancelled: bool
+
+    def __init__(self, element: E, deadline: int) -> None:
+        self.element = element
+        self.deadline = deadline
+        self._bucket = None
+        self._level = 0
+        self._queued = True
+        self._cancelled = False
+
+    @property
+    def cancelled(self) -> bool:
+        return self._cancelled
+
+
+class DelayQueue(Queue[E]):
+    """
+    A queue whose elements become visible to `dequeue` only once their delay is over,
+    earliest deadline first. Deadlines are rounded up to a `tick`, so an element is
+    never due early, and at most one tick late. An element without delay is due at once.
+
+    Pending elements live in a hierarchical timing wheel: level 0 has a slot per tick
+    of the current 256-tick span, level 1 a slot per 256 ticks of the current 65536-tick
+    span, and so on, growing levels as far deadlines need them. Scheduling and
+    cancelling are O(1). Moving the clock forward empties every slot it reaches: the
+    level 0 slot of a tick holds everything due on it, higher slots are redistributed
+    to the levels below when their span starts, and stretches where the lower levels
+    are empty are skipped whole.
+
+    `len` counts every element, due or not, and so does `max_capacity`. It's thread-safe:
+    `get` blocks and `get_async` suspends until an element is due.
+    """
+
+    _tick: float
+    _clock: Callable[[], float]
+    _origin: float
+    _current: int
+    _wheels: list[list[dict[Timer[E], None]]]
+    _counts: list[int]
+    _due: deque[Timer[E]]
+    _size: int
+    _mutex: threading.Lock
+    _changed: threading.Condition
+    _async_waiters: list[tuple[asyncio.AbstractEventLoop, asyncio.Future[None]]]
+
+    def __init__(
+        self,
+        *,
+        max_capacity: Optional[int] = None,
+        tick: float = 0.001,
+        clock: Callable[[], float] = monotonic,
+    ) -> None:
+        """
+        :param tick: resolution of the deadlines, in seconds
+        :param clock: source of the current time in seconds, `time.monotonic` by default
+        """
+        if tick <= 0:
+            raise ValueError("tick must be positive")
+
+        self._max_capacity = max_capacity
+        self._tick = tick
+        self._clock = clock
+        self._origin = clock()
+        self._current = 0
+        self._wheels = []
+        self._counts = []
+        self._due = deque()
+        self._size = 0
+        self._mutex = threading.Lock()
+        self._changed = threading.Condition(self._mutex)
+        self._async_waiters = []
+
+    @property
+    def tick(self) -> float:
+        return self._tick
+
+    @override
+    def enqueue(self, element: E, delay: float = 0.0) -> Timer[E]:
+        """Schedules `element` to be due in `delay` seconds
+
+        :returns: a handle to `cancel` it
+        :raises FullQueueException: if the queue is full
+        """
+        with self._mutex:
+            if self._max_capacity is not None and self._size >= self._max_capacity:
+                raise FullQueueException()
+
+            timer = Timer(element, self._deadline(delay))
+            self._schedule(timer)
+            self._size += 1
+            self._notify()
+
+            return timer
+
+    @override
+    def enqueue_many(self, elements: Iterable[E], delay: float = 0.0) -> list[Timer[E]]:
+        """Schedules all `elements` with the same `delay`, checking the capacity once
+
+        :raises FullQueueException: if the batch doesn't fit, in which case nothing is enqueued
+        """
+        elements = list(elements)
+        with self._mutex:
+            if self._max_capacity is not None and self._size + len(elements) > self._max_capacity:
+                raise FullQueueException()
+
+            deadline = self._deadline(delay)
+            timers = [Timer(element, deadline) for element in elements]
+            for timer in timers:
+                self._schedule(timer)
+            self._size += len(timers)
+            self._notify()
+
+            return timers
+
+    def cancel(self, timer: Timer[E]) -> bool:
+        """Removes the element of `timer` from the queue, in O(1)
+
+        :returns: `True` if it was removed, `False` if it was already dequeued or cancelled
+        """
+        with self._mutex:
+            if not timer._queued:
+                return False
+
+            timer._queued = False
+            timer._cancelled = True
+            if timer._bucket is not None:
+                del timer._bucket[timer]
+                self._counts[timer._level] -= 1
+                timer._bucket = None
+            # Due timers are skipped when they reach the front of the due list.
+            self._size -= 1
+
+            return True
+
+    @override
+    def dequeue(self) -> E:
+        """Removes the due element with the earliest deadline
+
+        :raises EmptyQueueException: if no element is due yet
+        """
+        with self._mutex:
+            self._advance()
+            if not self._skip_cancelled():
+                raise EmptyQueueException()
+            return self._take()
+
+    @override
+    def dequeue_many(self, n: int) -> list[E]:
+        """Removes the `n` due elements with the earliest deadlines
+
+        :raises ValueError: if fewer than `n` elements are due
+        """
+        with self._mutex:
+            self._advance()
+            due = self._due_count()
+            if n > due:
+                raise ValueError(f"Your value for n should be less or equal to {due}")
+
+            items = []
+            while len(items) < n:
+                self._skip_cancelled()
+                items.append(self._take())
+
+            return items
+
+    def dequeue_due(self) -> list[E]:
+        """Removes every due element at once, earliest deadline first
+
+        :rtype: list[E]
+        """
+        with self._mutex:
+            self._advance()
+            items = []
+            for timer in self._due:
+                if not timer._cancelled:
+                    timer._queued = False
+                    items.append(timer.element)
+            self._due.clear()
+            self._size -= len(items)
+
+            return items
+
+    @override
+    def try_dequeue(self) -> Optional[E]:
+        with self._mutex:
+            self._advance()
+            return self._take() if self._skip_cancelled() else None
+
+    def get(self, *, timeout: Optional[float] = None) -> E:
+        """Removes the next due element, waiting for its deadline if needed
+
+        :param timeout: seconds to wait, `None` waits forever
+        :raises EmptyQueueException: if no element became due within `timeout`
+        """
+        deadline = None if timeout is None else self._clock() + timeout
+        with self._changed:
+            while True:
+                self._advance()
+                if self._skip_cancelled():
+                    return self._take()
+
+                wait = self._seconds_to_next_event()
+                if deadline is not None:
+                    remaining = deadline - self._clock()
+                    if remaining <= 0:
+                        raise EmptyQueueException()
+                    wait = remaining if wait is None else min(wait, remaining)
+                self._changed.wait(wait)
+
+    async def get_async(self) -> E:
+        """Removes the next due element, suspending until its deadline if needed"""
+        loop = asyncio.get_running_loop()
+        while True:
+            with self._mutex:
+                self._advance()
+                if self._skip_cancelled():
+                    return self._take()
+                wait = self._seconds_to_next_event()
+                waiter = loop.create_future()
+                self._async_waiters.append((loop, waiter))
+
+            try:
+                await asyncio.wait([waiter], timeout=wait)
+            finally:
+                with self._mutex:
+                    if (loop, waiter) in self._async_waiters:
+                        self._async_waiters.remove((loop, waiter))
+
+    @override
+    def drain(self) -> Iterator[E]:
+        """Dequeues the due elements while iterating, until none is due
+
+        :rtype: Iterator[E]
+        """
+        while (element := self.try_dequeue()) is not None:
+            yield element
+
+    def seconds_to_next_due(self) -> Optional[float]:
+        """Seconds until an element may become due, 0 if one is due, `None` if the queue is empty.
+        It's a lower bound: with far deadlines it's when the wheel next redistributes them.
+        """
+        with self._mutex:
+            self._advance()
+            return self._seconds_to_next_event()
+
+    @property
+    @override
+    def peek(self) -> E:
+        """The due element with the earliest deadline
+
+        :raises EmptyQueueException: if no element is due yet
+        """
+        with self._mutex:
+            self._advance()
+            if not self._skip_cancelled():
+                raise EmptyQueueException()
+            return self._due[0].element
+
+    @override
+    def clear(self) -> None:
+        with self._mutex:
+            for timer in self._due:
+                timer._queued = False
+            self._due.clear()
+            for wheel in self._wheels:
+                for bucket in wheel:
+                    for timer in bucket:
+                        timer._queued = False
+                        timer._bucket = None
+                    bucket.clear()
+            self._counts = [0] * len(self._wheels)
+            self._size = 0
+
+    @override
+    def __len__(self) -> int:
+        return self._size
+
+    @override
+    def __contains__(self, item: object) -> bool:
+        return any(element == item for element in self)
+
+    @override
+    def __iter__(self) -> Iterator[E]:
+        """Iterates over a copy of the elements, due ones first, the others in no particular order"""
+        with self._mutex:
+            self._advance()
+            elements = [timer.element for timer in self._due if not timer._cancelled]
+            for wheel in self._wheels:
+                for bucket in wheel:
+                    elements.extend(timer.element for timer in bucket)
+
+        return iter(elements)
+
+    @override
+    def _poll(self, max_items: int, timeout: Optional[float]) -> Optional[list[E]]:
+        """Takes up to `max_items` due elements for `batches`, waiting up to `timeout` seconds
+        for the next deadline. Like a plain Queue, it has no `close`: `None` once nothing is pending.
+        """
+        deadline = None if timeout is None else self._clock() + timeout
+        with self._changed:
+            while True:
+                self._advance()
+                if self._skip_cancelled():
+                    items = []
+                    while len(items) < max_items and self._skip_cancelled():
+                        items.append(self._take())
+                    return items
+                if not self._size:
+                    return None
+
+                wait = self._seconds_to_next_event()
+                if deadline is not None:
+                    remaining = deadline - self._clock()
+                    if remaining <= 0:
+                        return []
+                    wait = remaining if wait is None else min(wait, remaining)
+                self._changed.wait(wait)
+
+    def _deadline(self, delay: float) -> int:
+        """First tick at which an element delayed by `delay` seconds from now is due. Caller must hold the lock."""
+        if delay <= 0:
+            # Rounding up could put it on the tick after the one the wheel is at.
+            self._advance()
+            return self._current
+
+        return ceil((self._clock() + delay - self._origin) / self._tick)
+
+    def _schedule(self, timer: Timer[E]) -> None:
+        """Puts `timer` in the slot its deadline falls in, or in the due list. Caller must hold the lock."""
+        deadline = timer.deadline
+        current = self._current
+        if deadline <= current:
+            timer._bucket = None
+            self._due.append(timer)
+            return
+
+        # The lowest level whose current span contains the deadline.
+        level = 0
+        while deadline >> (_BITS * (level + 1)) != current >> (_BITS * (level + 1)):
+            level += 1
+        while level >= len(self._wheels):
+            self._wheels.append([{} for _ in range(1 << _BITS)])
+            self._counts.append(0)
+
+        bucket = self._wheels[level][(deadline >> (_BITS * level)) & _MASK]
+        bucket[timer] = None
+        timer._bucket = bucket
+        timer._level = level
+        self._counts[level] += 1
+
+    def _advance(self) -> None:
+        """Moves the wheel up to the current time, making due what expired. Caller must hold the lock."""
+        target = floor((self._clock() - self._origin) / self._tick)
+        wheels = self._wheels
+        counts = self._counts
+        current = self._current
+
+        while current < target:
+            if counts and counts[0]:
+                current += 1
+            else:
+                # Nothing can happen before the next span of the lowest level holding timers.
+                level = 1
+                while level < len(counts) and not counts[level]:
+                    level += 1
+                if level >= len(counts):
+                    current = target
+                    break
+                current = ((current >> (_BITS * level)) + 1) << (_BITS * level)
+                if current > target:
+                    current = target
+                    break
+            self._current = current
+
+            # Higher slots whose span starts now are spread over the levels below, top down.
+            level = 1
+            while level < len(wheels) and not current & ((1 << (_BITS * level)) - 1):
+                level += 1
+            for cascading in range(level - 1, 0, -1):
+                bucket = wheels[cascading][(current >> (_BITS * cascading)) & _MASK]
+                if bucket:
+                    timers = list(bucket)
+                    bucket.clear()
+                    counts[cascading] -= len(timers)
+                    for timer in timers:
+                        self._schedule(timer)
+
+            bucket = wheels[0][current & _MASK] if wheels else None
+            if bucket:
+                for timer in bucket:
+                    timer._bucket = None
+                self._due.extend(bucket)
+                counts[0] -= len(bucket)
+                bucket.clear()
+
+        self._current = current
+
+    def _seconds_to_next_event(self) -> Optional[float]:
+        """Seconds until the wheel reaches a non-empty slot, `None` if nothing is pending. Caller must hold the lock."""
+        if self._due:
+            return 0.0
+
+        current = self._current
+        counts = self._counts
+        if counts and counts[0]:
+            level0 = self._wheels[0]
+            event = current + 1
+            while not level0[event & _MASK]:
+                event += 1
+        else:
+            level = 1
+            while level < len(counts) and not counts[level]:
+                level += 1
+            if level >= len(counts):
+                return None
+            event = ((current >> (_BITS * level)) + 1) << (_BITS * level)
+
+        return max(0.0, self._origin + event * self._tick - self._clock())
+
+    def _skip_cancelled(self) -> bool:
+        """Drops cancelled timers from the front of the due list, `True` if an element is due"""
+        due = self._due
+        while due and due[0]._cancelled:
+            due.popleft()
+
+        return bool(due)
+
+    def _due_count(self) -> int:
+        return sum(1 for timer in self._due if not timer._cancelled)
+
+    def _take(self) -> E:
+        """Pops the first due timer, which isn't cancelled. Caller must hold the lock."""
+        timer = self._due.popleft()
+        timer._queued = False
+        self._size -= 1
+
+        return timer.element
+
+    def _notify(self) -> None:
+        """Wakes the waiters, whose next deadline may have changed. Caller must hold the lock."""
+        self._changed.notify_all()
+        for loop, waiter in self._async_waiters:
+            loop.call_soon_threadsafe(_wake, waiter)
+        self._async_waiters.clear()
+
+
+def _wake(waiter: asyncio.Future[None]) -> None:
+    if not waiter.done():
+        waiter.set_result(None)
@@ -0,0 +1,463 @@
+"""
+    Disk-spilling, crash-recoverable Queue implementation in python lang
+"""
+
+import mmap
+import os
+import pickle
+import struct
+import zlib
+from collections import deque
+from collections.abc import Callable, Iterable, Iterator, Sequence
+from enum import Enum
+from pathlib import Path
+from time import monotonic
+from types import TracebackType
+from typing import BinaryIO, Optional, Self, TypeVar, override
+
+from queue.empty_queue_exception import EmptyQueueException
+from queue.full_queue_exception import FullQueueException
+from queue.queue import Queue
+
+E = TypeVar("E")
+
+# Every record is framed by its payload length and the CRC32 of the payload.
+_RECORD_HEADER = struct.Struct("<II")
+# Segment index and offset of the first record not dequeued yet.
+_CURSOR = struct.Struct("<QQ")
+_CURSOR_FILE = "cursor"
+
+Position = tuple[int, int]
+
+
+class FsyncPolicy(Enum):
+    """When a DurableQueue forces its writes to stable storage"""
+
+    ALWAYS = "always"
+    """Every `enqueue` and `dequeue` is on disk when it returns. Slowest."""
+    INTERVAL = "interval"
+    """Writes are batched and fsynced at most every `fsync_interval` seconds."""
+    NEVER = "never"
+    """Writes are batched and left to the operating system to flush."""
+
+
+class DurableQueue(Queue[E]):
+    """
+    A FIFO queue whose backlog can outgrow memory and survive restarts.
+    Only a bounded head (the next `memory_items` elements to dequeue) and a bounded
+    tail (up to `memory_items` elements not written yet) live in memory; everything
+    in between sits in append-only segment files under `directory`, read back
+    through `mmap`. Reopening the same directory recovers the queue from the log,
+    truncating a torn last write.
+
+    Delivery is at-least-once: the consumer position is checkpointed when the tail
+    is flushed (and on every dequeue with `FsyncPolicy.ALWAYS`), so elements
+    dequeued after the last checkpoint are delivered again after a crash.
+    Elements are stored with `serializer`, `pickle.dumps` by default.
+    """
+
+    _directory: Path
+    _memory_items: int
+    _segment_bytes: int
+    _fsync_policy: FsyncPolicy
+    _fsync_interval: float
+    _serializer: Callable[[E], bytes]
+    _deserializer: Callable[[bytes], E]
+    _head: deque[tuple[E, Position]]
+    _tail: list[bytes]
+    _disk_count: int
+    _first_segment: int
+    _read_position: Position
+    _commit_position: Position
+    _write_segment: int
+    _write_file: BinaryIO
+    _read_map: Optional[mmap.mmap]
+    _read_map_segment: int
+    _next_sync: float
+
+    def __init__(
+        self,
+        directory: str | os.PathLike[str],
+        *,
+        max_capacity: Optional[int] = None,
+        memory_items: int = 1024,
+        segment_bytes: int = 64 * 1024 * 1024,
+        fsync_policy: FsyncPolicy = FsyncPolicy.INTERVAL,
+        fsync_interval: float = 1.0,
+        serializer: Callable[[E], bytes] = pickle.dumps,
+        deserializer: Callable[[bytes], E] = pickle.loads,
+    ) -> None:
+        if memory_items < 1:
+            raise ValueError("memory_items must be a positive integer")
+
+        self._max_capacity = max_capacity
+        self._directory = Path(directory)
+        self._directory.mkdir(parents=True, exist_ok=True)
+        self._memory_items = memory_items
+        self._segment_bytes = segment_bytes
+        self._fsync_policy = fsync_policy
+        self._fsync_interval = fsync_interval
+        self._serializer = serializer
+        self._deserializer = deserializer
+        self._head = deque()
+        self._tail = []
+        self._read_map = None
+        self._read_map_segment = -1
+        self._next_sync = monotonic() + fsync_interval
+
+        self._recover()
+
+    @classmethod
+    @override
+    def from_sequence(
+        cls,
+        sequence: Sequence[E],
+        directory: Optional[str | os.PathLike[str]] = None,
+        *,
+        max_capacity: Optional[int] = None,
+        memory_items: int = 1024,
+        segment_bytes: int = 64 * 1024 * 1024,
+        fsync_policy: FsyncPolicy = FsyncPolicy.INTERVAL,
+        fsync_interval: float = 1.0,
+        serializer: Callable[[E], bytes] = pickle.dumps,
+        deserializer: Callable[[bytes], E] = pickle.loads,
+    ) -> Self:
+        """Opens the queue in `directory` and enqueues `sequence` after the elements it recovered
+
+        :raises ValueError: if `directory` is missing, or `max_capacity` is less than the length of `sequence`
+        :raises FullQueueException: if `sequence` doesn't fit after the recovered elements
+        """
+        if directory is None:
+            raise ValueError("A DurableQueue needs a directory")
+        if max_capacity is not None and len(sequence) > max_capacity:
+            raise ValueError("Your sequence's length must be less or equal your max capacity")
+
+        queue = cls(
+            directory,
+            max_capacity=max_capacity,
+            memory_items=memory_items,
+            segment_bytes=segment_bytes,
+            fsync_policy=fsync_policy,
+            fsync_interval=fsync_interval,
+            serializer=serializer,
+            deserializer=deserializer,
+        )
+        try:
+            queue.enqueue_many(sequence)
+        except FullQueueException:
+            queue.close()
+            raise
+
+        return queue
+
+    @override
+    def enqueue(self, element: E) -> None:
+        if self._max_capacity is not None and len(self) >= self._max_capacity:
+            raise FullQueueException()
+
+        self._tail.append(self._frame(element))
+        self._after_append()
+
+    @override
+    def enqueue_many(self, elements: Iterable[E]) -> None:
+        """Enqueues all `elements` in order, checking the capacity once for the whole batch
+
+        :raises FullQueueException: if the batch doesn't fit, in which case nothing is enqueued
+        """
+        records = [self._frame(element) for element in elements]
+        if self._max_capacity is not None and len(self) + len(records) > self._max_capacity:
+            raise FullQueueException()
+
+        for start in range(0, len(records), self._memory_items):
+            self._tail.extend(records[start : start + self._memory_items])
+            self._after_append()
+
+    @override
+    def dequeue(self) -> E:
+        if not self._head:
+            self._refill()
+            if not self._head:
+                raise EmptyQueueException()
+
+        item, position = self._head.popleft()
+        self._commit(position)
+
+        return item
+
+    @override
+    def try_dequeue(self) -> Optional[E]:
+        try:
+            return self.dequeue()
+        except EmptyQueueException:
+            return None
+
+    @override
+    def dequeue_many(self, n: int) -> list[E]:
+        """Dequeues the first `n` elements, checkpointing the consumer position once
+
+        :raises ValueError: if `n` is greater than the number of elements in queue
+        """
+        if n > len(self):
+            raise ValueError(f"Your value for n should be less or equal to {len(self)}")
+
+        items: list[E] = []
+        while len(items) < n:
+            if not self._head:
+                self._refill()
+            take = min(n - len(items), len(self._head))
+            for _ in range(take - 1):
+                items.append(self._head.popleft()[0])
+            item, position = self._head.popleft()
+            items.append(item)
+            self._commit(position)
+
+        return items
+
+    @property
+    @override
+    def peek(self) -> E:
+        if not self._head:
+            self._refill()
+            if not self._head:
+                raise EmptyQueueException()
+
+        return self._head[0][0]
+
+    def flush(self) -> None:
+        """Writes the in-memory tail to the current segment and checkpoints the consumer
+        position, fsyncing according to the policy."""
+        if self._tail:
+            if self._write_file.tell() >= self._segment_bytes:
+                self._roll_segment()
+
+            self._write_file.write(b"".join(self._tail))
+            self._write_file.flush()
+            self._disk_count += len(self._tail)
+            self._tail.clear()
+
+        if self._fsync_policy is FsyncPolicy.ALWAYS or (
+            self._fsync_policy is FsyncPolicy.INTERVAL and monotonic() >= self._next_sync
+        ):
+            self._fsync()
+        else:
+            self._save_cursor(fsync=False)
+
+    def sync(self) -> None:
+        """Flushes the tail and forces segments and consumer position to stable storage,
+        whatever the policy."""
+        self.flush()
+        self._fsync()
+
+    def close(self) -> None:
+        """Syncs everything to disk and releases files and maps. The queue can't be used afterwards."""
+        self.sync()
+        self._close_read_map()
+        self._write_file.close()
+
+    @override
+    def clear(self) -> None:
+        """Clears queue elements, deleting every segment file"""
+        self._close_read_map()
+        self._write_file.close()
+        for segment in range(self._first_segment, self._write_segment + 1):
+            self._segment_path(segment).unlink(missing_ok=True)
+        (self._directory / _CURSOR_FILE).unlink(missing_ok=True)
+
+        self._head.clear()
+        self._tail.clear()
+        self._recover()
+
+    def __enter__(self) -> Self:
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_value: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        self.close()
+
+    @override
+    def __len__(self) -> int:
+        return len(self._head) + self._disk_count + len(self._tail)
+
+    @override
+    def __contains__(self, item: object) -> bool:
+        return any(element == item for element in self)
+
+    @override
+    def __iter__(self) -> Iterator[E]:
+        """Streams the elements in FIFO order, reading spilled ones from disk lazily"""
+        for item, _ in list(self._head):
+            yield item
+
+        remaining = self._disk_count
+        segment, offset = self._read_position
+        while remaining > 0:
+            path = self._segment_path(segment)
+            if not path.exists() or offset >= path.stat().st_size:
+                segment, offset = segment + 1, 0
+                continue
+
+            with open(path, "rb") as file, mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as view:
+                while remaining > 0 and offset < len(view):
+                    item, offset = self._read_at(view, offset)
+                    remaining -= 1
+                    yield item
+
+        for record in list(self._tail):
+            yield self._deserializer(record[_RECORD_HEADER.size :])
+
+    def _after_append(self) -> None:
+        if (
+            len(self._tail) >= self._memory_items
+            or self._fsync_policy is FsyncPolicy.ALWAYS
+            or (self._fsync_policy is FsyncPolicy.INTERVAL and monotonic() >= self._next_sync)
+        ):
+            self.flush()
+
+    def _frame(self, element: E) -> bytes:
+        payload = self._serializer(element)
+
+        return _RECORD_HEADER.pack(len(payload), zlib.crc32(payload)) + payload
+
+    def _refill(self) -> None:
+        """Loads up to `memory_items` elements into the head, from disk or from the tail"""
+        if self._disk_count == 0:
+            if not self._tail:
+                return
+            self.flush()
+
+        segment, offset = self._read_position
+        while len(self._head) < self._memory_items and self._disk_count > 0:
+            view = self._mapped(segment, offset)
+            if view is None:
+                segment, offset = segment + 1, 0
+                continue
+
+            item, offset = self._read_at(view, offset)
+            self._head.append((item, (segment, offset)))
+            self._disk_count -= 1
+
+        self._read_position = (segment, offset)
+
+    def _read_at(self, view: mmap.mmap, offset: int) -> tuple[E, int]:
+        length, _ = _RECORD_HEADER.unpack_from(view, offset)
+        start = offset + _RECORD_HEADER.size
+
+        return self._deserializer(view[start : start + length]), start + length
+
+    def _mapped(self, segment: int, offset: int) -> Optional[mmap.mmap]:
+        """Map of `segment` covering `offset`, `None` if the segment has no data there"""
+        if self._read_map_segment == segment and self._read_map is not None and offset < len(self._read_map):
+            return self._read_map
+
+        self._close_read_map()
+        path = self._segment_path(segment)
+        if not path.exists() or offset >= path.stat().st_size:
+            return None
+
+        with open(path, "rb") as file:
+            self._read_map = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+        self._read_map_segment = segment
+
+        return self._read_map
+
+    def _close_read_map(self) -> None:
+        if self._read_map is not None:
+            self._read_map.close()
+            self._read_map = None
+            self._read_map_segment = -1
+
+    def _commit(self, position: Position) -> None:
+        previous_segment = self._commit_position[0]
+        self._commit_position = position
+
+        if position[0] > previous_segment:
+            self._save_cursor(fsync=self._fsync_policy is not FsyncPolicy.NEVER)
+            for segment in range(self._first_segment, position[0]):
+                self._segment_path(segment).unlink(missing_ok=True)
+            self._first_segment = position[0]
+        elif self._fsync_policy is FsyncPolicy.ALWAYS:
+            self._save_cursor(fsync=True)
+
+    def _roll_segment(self) -> None:
+        self._fsync()
+        self._write_file.close()
+        self._write_segment += 1
+        self._write_file = open(self._segment_path(self._write_segment), "ab")
+
+    def _fsync(self) -> None:
+        os.fsync(self._write_file.fileno())
+        self._save_cursor(fsync=True)
+        self._next_sync = monotonic() + self._fsync_interval
+
+    def _save_cursor(self, *, fsync: bool) -> None:
+        path = self._directory / _CURSOR_FILE
+        with open(path, "r+b" if path.exists() else "wb") as file:
+            file.write(_CURSOR.pack(*self._commit_position))
+            file.flush()
+            if fsync:
+                os.fsync(file.fileno())
+
+    def _segment_path(self, segment: int) -> Path:
+        return self._directory / f"segment-{segment:08d}.log"
+
+    def _recover(self) -> None:
+        """Rebuilds the queue state from the segments and the cursor on disk"""
+        segments = sorted(int(path.stem.removeprefix("segment-")) for path in self._directory.glob("segment-*.log"))
+        if not segments:
+            segments = [0]
+            self._segment_path(0).touch()
+
+        cursor_path = self._directory / _CURSOR_FILE
+        position: Position = (segments[0], 0)
+        if cursor_path.exists() and cursor_path.stat().st_size == _CURSOR.size:
+            saved: Position = _CURSOR.unpack(cursor_path.read_bytes())
+            if saved[0] in segments:
+                position = saved
+
+        for segment in segments:
+            if segment < position[0]:
+                self._segment_path(segment).unlink()
+        segments = [segment for segment in segments if segment >= position[0]]
+
+        count = 0
+        for index, segment in enumerate(segments):
+            valid_records, valid_end = self._scan(segment, position[1] if segment == position[0] else 0)
+            count += valid_records
+            path = self._segment_path(segment)
+            if valid_end < path.stat().st_size:
+                # A torn or corrupted write: keep the valid prefix, drop what follows.
+                os.truncate(path, valid_end)
+                for later in segments[index + 1 :]:
+                    self._segment_path(later).unlink()
+                segments = segments[: index + 1]
+                break
+
+        self._first_segment = position[0]
+        self._read_position = position
+        self._commit_position = position
+        self._disk_count = count
+        self._write_segment = segments[-1]
+        self._write_file = open(self._segment_path(self._write_segment), "ab")
+
+    def _scan(self, segment: int, offset: int) -> tuple[int, int]:
+        """Counts the valid records of `segment` from `offset`, returns the count and where they end"""
+        path = self._segment_path(segment)
+        size = path.stat().st_size
+        if offset >= size:
+            return 0, offset
+
+        count = 0
+        with open(path, "rb") as file, mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as view:
+            while offset + _RECORD_HEADER.size <= size:
+                length, checksum = _RECORD_HEADER.unpack_from(view, offset)
+                end = offset + _RECORD_HEADER.size + length
+                if end > size or zlib.crc32(view[offset + _RECORD_HEADER.size : end]) != checksum:
+                    break
+                count += 1
+                offset = end
+
+        return count, offset
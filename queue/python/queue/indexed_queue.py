@@ -0,0 +1,102 @@
+"""
+    Queue with hash-indexed membership implementation in python lang
+"""
+
+from collections import Counter, deque
+from collections.abc import Hashable, Iterable, Sized
+from typing import Optional, TypeVar, override
+
+from queue.empty_queue_exception import EmptyQueueException
+from queue.full_queue_exception import FullQueueException
+from queue.queue import Queue
+
+H = TypeVar("H", bound=Hashable)
+
+
+class IndexedQueue(Queue[H]):
+    """
+    A Queue of hashable elements that keeps a counted multiset of them in sync,
+    so `in` and `count` take O(1) instead of scanning the queue. Useful to skip
+    enqueuing jobs that are already pending.
+
+    The multiset costs one dict entry per distinct element, 30 to 60 bytes on
+    64-bit CPython depending on how full the dict table is, on top of the 8 bytes
+    per element of the deque.
+    """
+
+    _counts: Counter[H]
+
+    def __init__(self, *, max_capacity: Optional[int] = None) -> None:
+        super().__init__(max_capacity=max_capacity)
+        # An evicted item would stay in `_counts`.
+        self._internal_deque = deque()
+        self._counts = Counter()
+
+    @override
+    def enqueue(self, element: H) -> None:
+        if self._max_capacity is not None and len(self._internal_deque) >= self._max_capacity:
+            raise FullQueueException()
+
+        self._counts[element] += 1
+        self._internal_deque.append(element)
+
+    @override
+    def enqueue_many(self, elements: Iterable[H]) -> None:
+        if not isinstance(elements, Sized):
+            elements = list(elements)
+
+        # Counted first so unhashable elements are refused before anything is enqueued.
+        counts = Counter(elements)
+        super().enqueue_many(elements)
+        self._counts.update(counts)
+
+    @override
+    def dequeue(self) -> H:
+        if not self._internal_deque:
+            raise EmptyQueueException()
+
+        element = self._internal_deque.popleft()
+        self._forget(element)
+
+        return element
+
+    @override
+    def dequeue_many(self, n: int) -> list[H]:
+        elements = super().dequeue_many(n)
+        for element in elements:
+            self._forget(element)
+
+        return elements
+
+    @override
+    def try_dequeue(self) -> Optional[H]:
+        return self.dequeue() if self._internal_deque else None
+
+    @override
+    def clear(self) -> None:
+        super().clear()
+        self._counts.clear()
+
+    def count(self, element: object) -> int:
+        """Number of times `element` is in the queue, in O(1)
+
+        :rtype: int
+        """
+        try:
+            return self._counts.get(element, 0)  # type: ignore[call-overload]
+        except TypeError:  # unhashable, so it can't be in the queue
+            return 0
+
+    @override
+    def __contains__(self, item: object) -> bool:
+        try:
+            return item in self._counts
+        except TypeError:
+            return False
+
+    def _forget(self, element: H) -> None:
+        remaining = self._counts[element] - 1
+        if remaining:
+            self._counts[element] = remaining
+        else:
+            del self._counts[element]
@@ -0,0 +1,233 @@
+"""
+    Queue with opt-in metrics implementation in python lang
+"""
+
+import threading
+from bisect import bisect_left
+from collections import deque
+from collections.abc import Callable, Iterable, Sized
+from time import perf_counter
+from typing import Any, Optional, TypeVar, override
+
+from queue.empty_queue_exception import EmptyQueueException
+from queue.full_queue_exception import FullQueueException
+from queue.queue import Queue
+
+E = TypeVar("E")
+
+Exporter = Callable[[dict[str, Any]], None]
+
+# Upper bounds, in seconds, of the dwell time histogram buckets.
+DWELL_BUCKETS: tuple[float, ...] = (1e-6, 1e-5, 1e-4, 1e-3, 1e-2, 0.1, 1.0, 10.0, float("inf"))
+
+
+class DwellHistogram:
+    """
+    Histogram of how long sampled elements stayed in a queue. Each bucket counts
+    the samples up to its `DWELL_BUCKETS` bound and above the previous one.
+    """
+
+    counts: list[int]
+    count: int
+    total: float
+
+    def __init__(self) -> None:
+        self.counts = [0] * len(DWELL_BUCKETS)
+        self.count = 0
+        self.total = 0.0
+
+    def record(self, seconds: float) -> None:
+        self.counts[bisect_left(DWELL_BUCKETS, seconds)] += 1
+        self.count += 1
+        self.total += seconds
+
+    def as_dict(self) -> dict[str, Any]:
+        return {
+            "count": self.count,
+            "sum": self.total,
+            "buckets": {f"le_{bound:g}": count for bound, count in zip(DWELL_BUCKETS, self.counts)},
+        }
+
+
+class InstrumentedQueue(Queue[E]):
+    """
+    A Queue that counts what goes through it: enqueued, dequeued and rejected
+    elements, its depth and high-water mark, and a histogram of the time spent
+    in the queue by one element every `sample_every` enqueues.
+
+    The plain `Queue` is left untouched, so code that doesn't opt in pays nothing.
+    Metrics are read with `metrics`, pushed to an `exporter` with `export`, or
+    exported every `export_interval` seconds by a daemon thread until `close`.
+    """
+
+    _enqueued: int
+    # Elements that left the queue, dequeued or cleared: the sequence number of the head
+    _removed: int
+    _cleared: int
+    _rejected: int
+    _high_water_mark: int
+    _sample_every: int
+    # (enqueue sequence number, enqueue time) of the sampled elements still queued
+    _samples: deque[tuple[int, float]]
+    _dwell: DwellHistogram
+    _exporter: Optional[Exporter]
+    _stop_exporting: threading.Event
+    _export_thread: Optional[threading.Thread]
+
+    def __init__(
+        self,
+        *,
+        max_capacity: Optional[int] = None,
+        sample_every: int = 64,
+        exporter: Optional[Exporter] = None,
+        export_interval: Optional[float] = None,
+    ) -> None:
+        """
+        :param sample_every: one element out of `sample_every` gets its dwell time measured
+        :param exporter: called with `metrics()` on every export
+        :param export_interval: seconds between automatic exports, `None` to only export on demand
+        :raises ValueError: if `sample_every` isn't positive, or `export_interval` is given without `exporter`
+        """
+        if sample_every < 1:
+            raise ValueError("sample_every must be positive")
+        if export_interval is not None and exporter is None:
+            raise ValueError("export_interval requires an exporter")
+
+        super().__init__(max_capacity=max_capacity)
+        # An evicted item would never be counted as dequeued.
+        self._internal_deque = deque()
+        self._enqueued = 0
+        self._removed = 0
+        self._cleared = 0
+        self._rejected = 0
+        self._high_water_mark = 0
+        self._sample_every = sample_every
+        self._samples = deque()
+        self._dwell = DwellHistogram()
+        self._exporter = exporter
+        self._stop_exporting = threading.Event()
+        self._export_thread = None
+
+        if export_interval is not None:
+            self._export_thread = threading.Thread(
+                target=self._export_periodically, args=(export_interval,), daemon=True
+            )
+            self._export_thread.start()
+
+    @override
+    def enqueue(self, element: E) -> None:
+        internal_deque = self._internal_deque
+        if self._max_capacity is not None and len(internal_deque) >= self._max_capacity:
+            self._rejected += 1
+            raise FullQueueException()
+        internal_deque.append(element)
+
+        if self._enqueued % self._sample_every == 0:
+            self._samples.append((self._enqueued, perf_counter()))
+        self._enqueued += 1
+        if len(internal_deque) > self._high_water_mark:
+            self._high_water_mark = len(internal_deque)
+
+    @override
+    def enqueue_many(self, elements: Iterable[E]) -> None:
+        if not isinstance(elements, Sized):
+            elements = list(elements)
+
+        try:
+            super().enqueue_many(elements)
+        except FullQueueException:
+            self._rejected += len(elements)
+            raise
+
+        start = self._enqueued
+        self._enqueued += len(elements)
+        first_sampled = -(-start // self._sample_every) * self._sample_every
+        now = perf_counter()
+        self._samples.extend(
+            (sequence, now) for sequence in range(first_sampled, self._enqueued, self._sample_every)
+        )
+        if len(self._internal_deque) > self._high_water_mark:
+            self._high_water_mark = len(self._internal_deque)
+
+    @override
+    def dequeue(self) -> E:
+        internal_deque = self._internal_deque
+        if not internal_deque:
+            raise EmptyQueueException()
+        element = internal_deque.popleft()
+
+        samples = self._samples
+        if samples and samples[0][0] == self._removed:
+            self._dwell.record(perf_counter() - samples.popleft()[1])
+        self._removed += 1
+
+        return element
+
+    @override
+    def dequeue_many(self, n: int) -> list[E]:
+        elements = super().dequeue_many(n)
+        self._consume(len(elements), record=True)
+
+        return elements
+
+    @override
+    def try_dequeue(self) -> Optional[E]:
+        return self.dequeue() if self._internal_deque else None
+
+    @override
+    def clear(self) -> None:
+        cleared = len(self._internal_deque)
+        super().clear()
+        self._cleared += cleared
+        self._consume(cleared, record=False)
+
+    @property
+    def high_water_mark(self) -> int:
+        """Highest depth the queue reached"""
+        return self._high_water_mark
+
+    @property
+    def dwell_histogram(self) -> DwellHistogram:
+        return self._dwell
+
+    def metrics(self) -> dict[str, Any]:
+        """Current metrics as a plain dict, ready to be serialized
+
+        :rtype: dict[str, Any]
+        """
+        return {
+            "enqueued": self._enqueued,
+            "dequeued": self._removed - self._cleared,
+            "cleared": self._cleared,
+            "rejected": self._rejected,
+            "depth": len(self),
+            "high_water_mark": self._high_water_mark,
+            "dwell_seconds": self._dwell.as_dict(),
+        }
+
+    def export(self) -> None:
+        """Calls the exporter, if any, with the current metrics"""
+        if self._exporter is not None:
+            self._exporter(self.metrics())
+
+    def close(self) -> None:
+        """Stops the periodic export, exporting one last time"""
+        if self._export_thread is not None:
+            self._stop_exporting.set()
+            self._export_thread.join()
+            self._export_thread = None
+            self.export()
+
+    def _consume(self, n: int, *, record: bool) -> None:
+        """Accounts for the `n` first elements leaving the queue at once"""
+        self._removed += n
+        samples = self._samples
+        now = perf_counter()
+        while samples and samples[0][0] < self._removed:
+            _, enqueued_at = samples.popleft()
+            if record:
+                self._dwell.record(now - enqueued_at)
+
+    def _export_periodically(self, interval: float) -> None:
+        while not self._stop_exporting.wait(interval):
+            self.export()
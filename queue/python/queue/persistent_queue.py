@@ -0,0 +1,178 @@
+"""
+    Persistent (immutable) Queue implementation in python lang
+"""
+
+from collections.abc import Callable, Collection, Iterable, Iterator
+from typing import Any, Generic, Optional, Self, TypeVar, override
+
+from queue.empty_queue_exception import EmptyQueueException
+
+E = TypeVar("E")
+
+# An immutable linked list: (head, rest) cells, `None` when empty.
+_List = Optional[tuple[Any, "_List"]]
+
+
+class _Stream:
+    """A lazy, memoized linked list cell: `force()` computes (head, rest stream) once, `None` if empty"""
+
+    __slots__ = ("_thunk", "_cell")
+
+    _thunk: Optional[Callable[[], Optional[tuple[Any, "_Stream"]]]]
+    _cell: Optional[tuple[Any, "_Stream"]]
+
+    def __init__(
+        self,
+        cell: Optional[tuple[Any, "_Stream"]] = None,
+        thunk: Optional[Callable[[], Optional[tuple[Any, "_Stream"]]]] = None,
+    ) -> None:
+        self._cell = cell
+        self._thunk = thunk
+
+    def force(self) -> Optional[tuple[Any, "_Stream"]]:
+        if self._thunk is not None:
+            self._cell = self._thunk()
+            self._thunk = None
+        return self._cell
+
+
+_EMPTY_STREAM = _Stream()
+
+
+def _rotate(front: _Stream, rear: tuple[Any, _List], accumulated: _Stream) -> _Stream:
+    """Lazily computes `front + reversed(rear) + accumulated`, one cell per force.
+    Called when `rear` holds exactly one element more than `front`.
+    """
+    rear_head, rear_rest = rear
+    cell = front.force()
+    if cell is None:
+        return _Stream((rear_head, accumulated))
+
+    front_head, front_rest = cell
+    accumulated = _Stream((rear_head, accumulated))
+    return _Stream(
+        (front_head, _Stream(thunk=lambda: _rotate(front_rest, rear_rest, accumulated).force()))  # type: ignore[arg-type]
+    )
+
+
+class PersistentQueue(Collection[E], Generic[E]):
+    """
+    A Queue that is never modified: `enqueue` and `dequeue` return new versions,
+    sharing structure with the older ones, in worst-case O(1).
+
+    It's Okasaki's real-time queue: elements are dequeued from a lazy front stream
+    and enqueued on a rear list. When the rear grows longer than the front it's
+    reversed onto it lazily, and every operation forces one more cell of that
+    work (the schedule), so no single operation pays for a whole reversal, even
+    when old versions are reused.
+    """
+
+    __slots__ = ("_front", "_rear", "_schedule", "_length")
+
+    _front: _Stream
+    _rear: _List
+    # Suffix of `_front` still to be forced, as long as `_front` minus `_rear`.
+    _schedule: _Stream
+    _length: int
+
+    def __init__(self) -> None:
+        self._front = _EMPTY_STREAM
+        self._rear = None
+        self._schedule = _EMPTY_STREAM
+        self._length = 0
+
+    @classmethod
+    def empty(cls) -> Self:
+        return cls()
+
+    @classmethod
+    def from_sequence(cls, sequence: Iterable[E]) -> Self:
+        """Builds a queue with the `sequence` elements enqueued in order"""
+        queue = cls()
+        for element in sequence:
+            queue = queue.enqueue(element)
+
+        return queue
+
+    def enqueue(self, element: E) -> Self:
+        """A new version with `element` at the end, this one is left untouched
+
+        :rtype: Self
+        """
+        return self._step(self._front, (element, self._rear), self._length + 1)
+
+    def dequeue(self) -> Self:
+        """A new version without the first element, read it with `peek`
+
+        :raises EmptyQueueException: if the queue is empty
+        :rtype: Self
+        """
+        cell = self._front.force()
+        if cell is None:
+            raise EmptyQueueException()
+
+        return self._step(cell[1], self._rear, self._length - 1)
+
+    def try_dequeue(self) -> Optional[Self]:
+        return self.dequeue() if self._length else None
+
+    @property
+    def peek(self) -> E:
+        cell = self._front.force()
+        if cell is None:
+            raise EmptyQueueException()
+
+        return cell[0]
+
+    def try_peek(self) -> Optional[E]:
+        cell = self._front.force()
+        return None if cell is None else cell[0]
+
+    @property
+    def is_empty(self) -> bool:
+        return self._length == 0
+
+    @property
+    def is_not_empty(self) -> bool:
+        return self._length != 0
+
+    @override
+    def __len__(self) -> int:
+        return self._length
+
+    @override
+    def __contains__(self, item: object) -> bool:
+        return any(element == item for element in self)
+
+    @override
+    def __iter__(self) -> Iterator[E]:
+        cell = self._front.force()
+        while cell is not None:
+            yield cell[0]
+            cell = cell[1].force()
+
+        rear: list[E] = []
+        node = self._rear
+        while node is not None:
+            rear.append(node[0])
+            node = node[1]
+        yield from reversed(rear)
+
+    @override
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}.from_sequence({list(self)!r})"
+
+    def _step(self, front: _Stream, rear: _List, length: int) -> Self:
+        """Builds the next version, forcing one cell of the schedule or starting a new rotation"""
+        queue = object.__new__(type(self))
+        queue._length = length
+
+        cell = self._schedule.force()
+        if cell is not None:
+            queue._front, queue._rear, queue._schedule = front, rear, cell[1]
+        else:
+            # The schedule ran out, so `rear` just became one element longer than `front`.
+            front = _rotate(front, rear, _EMPTY_STREAM)  # type: ignore[arg-type]
+            queue._front, queue._rear, queue._schedule = front, None, front
+
+        return queue
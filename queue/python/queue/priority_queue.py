@@ -0,0 +1,357 @@
+"""
+    Priority Queue implementations in python lang
+"""
+
+import heapq
+from collections.abc import Callable, Hashable, Iterable, Iterator
+from itertools import count
+from typing import Any, Optional, TypeVar, override
+
+from queue.empty_queue_exception import EmptyQueueException
+from queue.full_queue_exception import FullQueueException
+from queue.queue import Queue
+
+E = TypeVar("E")
+H = TypeVar("H", bound=Hashable)
+
+
+class PriorityQueue(Queue[E]):
+    """
+    A queue that dequeues the element with the lowest priority first, FIFO among equal
+    priorities. It's a d-ary heap: the default `arity=2` is a binary heap run by `heapq`,
+    wider heaps (4 or 8) make `enqueue` cheaper and `dequeue` compare more children.
+
+    The priority of an element is the `priority` given to `enqueue`, else `key(element)`,
+    else the element itself.
+    """
+
+    _heap: list[Any]
+    _arity: int
+    _key: Optional[Callable[[E], Any]]
+    _sequence: Iterator[int]
+
+    def __init__(
+        self,
+        *,
+        max_capacity: Optional[int] = None,
+        key: Optional[Callable[[E], Any]] = None,
+        arity: int = 2,
+    ) -> None:
+        if arity < 2:
+            raise ValueError("arity must be at least 2")
+
+        self._max_capacity = max_capacity
+        self._heap = []
+        self._arity = arity
+        self._key = key
+        self._sequence = count()
+
+    @property
+    def arity(self) -> int:
+        """Number of children per node of the heap"""
+        return self._arity
+
+    @override
+    def enqueue(self, element: E, priority: Any = None) -> None:
+        """Adds `element` with the given `priority`
+
+        :raises FullQueueException: if the queue is full
+        """
+        if self._max_capacity is not None and len(self._heap) >= self._max_capacity:
+            raise FullQueueException()
+
+        entry = [self._priority_of(element, priority), next(self._sequence), element]
+        if self._arity == 2:
+            heapq.heappush(self._heap, entry)
+        else:
+            self._heap.append(entry)
+            _sift_up(self._heap, len(self._heap) - 1, self._arity)
+
+    @override
+    def enqueue_many(self, elements: Iterable[E]) -> None:
+        """Adds all `elements`, with their default priorities, rebuilding the heap in O(n)
+
+        :raises FullQueueException: if the batch doesn't fit, in which case nothing is enqueued
+        """
+        entries = [[self._priority_of(element, None), next(self._sequence), element] for element in elements]
+        if self._max_capacity is not None and len(self._heap) + len(entries) > self._max_capacity:
+            raise FullQueueException()
+
+        self._heap.extend(entries)
+        if self._arity == 2:
+            heapq.heapify(self._heap)
+        else:
+            for index in reversed(range((len(self._heap) - 2) // self._arity + 1)):
+                _sift_down(self._heap, index, self._arity)
+
+    @override
+    def dequeue(self) -> E:
+        return self._pop_entry()[2]
+
+    def dequeue_with_priority(self) -> tuple[E, Any]:
+        """Removes the element with the lowest priority
+
+        :returns: the element and its priority
+        :rtype: tuple[E, Any]
+        :raises EmptyQueueException: if the queue is empty
+        """
+        priority, _, element = self._pop_entry()
+
+        return element, priority
+
+    @override
+    def try_dequeue(self) -> Optional[E]:
+        try:
+            return self.dequeue()
+        except EmptyQueueException:
+            return None
+
+    @override
+    def dequeue_many(self, n: int) -> list[E]:
+        """Dequeues the `n` elements with the lowest priorities, in priority order
+
+        :raises ValueError: if `n` is greater than the number of elements in queue
+        """
+        if n > len(self._heap):
+            raise ValueError(f"Your value for n should be less or equal to {len(self._heap)}")
+
+        return [self._pop_entry()[2] for _ in range(n)]
+
+    @property
+    @override
+    def peek(self) -> E:
+        if not self._heap:
+            raise EmptyQueueException()
+
+        return self._heap[0][2]
+
+    @override
+    def clear(self) -> None:
+        """Clears queue elements"""
+        self._heap.clear()
+
+    @override
+    def __len__(self) -> int:
+        return len(self._heap)
+
+    @override
+    def __contains__(self, item: object) -> bool:
+        return any(entry[2] == item for entry in self._heap)
+
+    @override
+    def __iter__(self) -> Iterator[E]:
+        """Iterates over a sorted copy of the queue, in dequeue order"""
+        return (entry[2] for entry in sorted(self._heap))
+
+    def _priority_of(self, element: E, priority: Any) -> Any:
+        if priority is not None:
+            return priority
+        if self._key is not None:
+            return self._key(element)
+        return element
+
+    def _pop_entry(self) -> list[Any]:
+        heap = self._heap
+        if not heap:
+            raise EmptyQueueException()
+
+        if self._arity == 2:
+            return heapq.heappop(heap)
+
+        last = heap.pop()
+        if not heap:
+            return last
+        top, heap[0] = heap[0], last
+        _sift_down(heap, 0, self._arity)
+
+        return top
+
+
+class IndexedPriorityQueue(PriorityQueue[H]):
+    """
+    A priority queue whose elements are also their handles: each element is hashable
+    and present at most once, so its priority can be changed or the element removed
+    in O(log n), as Dijkstra and schedulers need. A map from element to heap position
+    is kept in sync by every sift.
+    """
+
+    _positions: dict[H, int]
+
+    def __init__(
+        self,
+        *,
+        max_capacity: Optional[int] = None,
+        key: Optional[Callable[[H], Any]] = None,
+        arity: int = 2,
+    ) -> None:
+        super().__init__(max_capacity=max_capacity, key=key, arity=arity)
+        self._positions = {}
+
+    @override
+    def enqueue(self, element: H, priority: Any = None) -> None:
+        """Adds `element` with the given `priority`
+
+        :raises ValueError: if `element` is already in the queue, use `update` instead
+        :raises FullQueueException: if the queue is full
+        """
+        if element in self._positions:
+            raise ValueError(f"{element!r} is already in the queue")
+        if self._max_capacity is not None and len(self._heap) >= self._max_capacity:
+            raise FullQueueException()
+
+        self._heap.append([self._priority_of(element, priority), next(self._sequence), element])
+        _sift_up(self._heap, len(self._heap) - 1, self._arity, self._positions)
+
+    @override
+    def enqueue_many(self, elements: Iterable[H]) -> None:
+        """Adds all `elements` with their default priorities
+
+        :raises ValueError: if an element is repeated or already in the queue
+        :raises FullQueueException: if the batch doesn't fit, in which case nothing is enqueued
+        """
+        elements = list(elements)
+        if len(set(elements)) != len(elements) or any(element in self._positions for element in elements):
+            raise ValueError("Elements of an IndexedPriorityQueue must be unique")
+        if self._max_capacity is not None and len(self._heap) + len(elements) > self._max_capacity:
+            raise FullQueueException()
+
+        for element in elements:
+            self.enqueue(element)
+
+    def priority(self, element: H) -> Any:
+        """Current priority of `element`
+
+        :raises KeyError: if `element` is not in the queue
+        """
+        return self._heap[self._positions[element]][0]
+
+    def update(self, element: H, priority: Any) -> None:
+        """Changes the priority of `element`, up or down, in O(log n)
+
+        :raises KeyError: if `element` is not in the queue
+        """
+        index = self._positions[element]
+        entry = self._heap[index]
+        old_priority, entry[0] = entry[0], priority
+
+        if priority < old_priority:
+            _sift_up(self._heap, index, self._arity, self._positions)
+        else:
+            _sift_down(self._heap, index, self._arity, self._positions)
+
+    def decrease_key(self, element: H, priority: Any) -> None:
+        """Lowers the priority of `element`, moving it towards the front, in O(log n)
+
+        :raises KeyError: if `element` is not in the queue
+        :raises ValueError: if `priority` is greater than the current one
+        """
+        if self.priority(element) < priority:
+            raise ValueError("The new priority must not be greater than the current one")
+
+        self.update(element, priority)
+
+    def enqueue_or_decrease(self, element: H, priority: Any) -> bool:
+        """Adds `element`, or lowers its priority if it's already queued with a greater one
+
+        :returns: `True` if the queue changed, `False` if the current priority was kept
+        :rtype: bool
+        """
+        if element not in self._positions:
+            self.enqueue(element, priority)
+            return True
+        if priority < self.priority(element):
+            self.update(element, priority)
+            return True
+
+        return False
+
+    def remove(self, element: H) -> Any:
+        """Removes `element` wherever it is in the queue, in O(log n)
+
+        :returns: the priority it had
+        :raises KeyError: if `element` is not in the queue
+        """
+        index = self._positions.pop(element)
+        heap = self._heap
+        removed = heap[index]
+        last = heap.pop()
+
+        if index < len(heap):
+            heap[index] = last
+            self._positions[last[2]] = index
+            if last < removed:
+                _sift_up(heap, index, self._arity, self._positions)
+            else:
+                _sift_down(heap, index, self._arity, self._positions)
+
+        return removed[0]
+
+    @override
+    def clear(self) -> None:
+        """Clears queue elements"""
+        self._heap.clear()
+        self._positions.clear()
+
+    @override
+    def __contains__(self, item: object) -> bool:
+        return item in self._positions
+
+    @override
+    def _pop_entry(self) -> list[Any]:
+        heap = self._heap
+        if not heap:
+            raise EmptyQueueException()
+
+        top = heap[0]
+        del self._positions[top[2]]
+        last = heap.pop()
+        if heap:
+            heap[0] = last
+            _sift_down(heap, 0, self._arity, self._positions)
+
+        return top
+
+
+def _sift_up(heap: list[Any], index: int, arity: int, positions: Optional[dict[Any, int]] = None) -> None:
+    """Moves `heap[index]` up until its parent isn't greater, recording moves in `positions`"""
+    entry = heap[index]
+    while index > 0:
+        parent = (index - 1) // arity
+        parent_entry = heap[parent]
+        if not entry < parent_entry:
+            break
+        heap[index] = parent_entry
+        if positions is not None:
+            positions[parent_entry[2]] = index
+        index = parent
+
+    heap[index] = entry
+    if positions is not None:
+        positions[entry[2]] = index
+
+
+def _sift_down(heap: list[Any], index: int, arity: int, positions: Optional[dict[Any, int]] = None) -> None:
+    """Moves `heap[index]` down until no child is smaller, recording moves in `positions`"""
+    size = len(heap)
+    entry = heap[index]
+    while True:
+        first_child = index * arity + 1
+        if first_child >= size:
+            break
+
+        smallest = first_child
+        smallest_entry = heap[first_child]
+        for child in range(first_child + 1, min(first_child + arity, size)):
+            if heap[child] < smallest_entry:
+                smallest, smallest_entry = child, heap[child]
+
+        if not smallest_entry < entry:
+            break
+        heap[index] = smallest_entry
+        if positions is not None:
+            positions[smallest_entry[2]] = index
+        index = smallest
+
+    heap[index] = entry
+    if positions is not None:
+        positions[entry[2]] = index
@@ -3,12 +3,17 @@
 """
 
 from collections import deque
-from collections.abc import Collection, Iterator
-from typing import Generic, Optional, Self, Sequence, TypeVar, override
+from collections.abc import Collection, Iterable, Iterator, Sized
+from typing import TYPE_CHECKING, Any, Callable, Generic, Optional, Self, Sequence, TypeVar, override
 
 from queue.full_queue_exception import FullQueueException
 from queue.empty_queue_exception import EmptyQueueException
 
+if TYPE_CHECKING:
+    import numpy
+
+    from queue.batching import BatchStats
+
 E = TypeVar("E")
 
 
@@ -20,9 +25,10 @@ class Queue(Collection, Generic[E]):
 
     _internal_deque: deque[E]
     _max_capacity: Optional[int]
-    _iterator_index: int = 0
 
     def __init__(self, *, max_capacity: Optional[int] = None) -> None:
+        # `enqueue` checks the capacity first, so `maxlen` never evicts here. Subclasses that track
+        # their elements, or make a full queue wait, use an unbounded deque and check it themselves.
         self._internal_deque = deque(maxlen=max_capacity)
         self._max_capacity = max_capacity
 
@@ -36,9 +42,7 @@ class Queue(Collection, Generic[E]):
             )
 
         queue = cls(max_capacity=max_capacity)
-
-        for item in sequence:
-            queue.enqueue(item)
+        queue.enqueue_many(sequence)
 
         return queue
 
@@ -58,21 +62,73 @@ class Queue(Collection, Generic[E]):
         elif self.max_capacity is not None:
             self._max_capacity = None
 
+        self._resize(self._max_capacity)
+
     def enqueue(self, element: E) -> None:
-        if self.max_capacity is not None and len(self) > self.max_capacity:
+        """Adds `element` to the end of the queue
+
+        :raises FullQueueException: if the queue holds `max_capacity` elements
+        """
+        if self._max_capacity is not None and len(self._internal_deque) >= self._max_capacity:
             raise FullQueueException()
         self._internal_deque.append(element)
 
+    def enqueue_many(self, elements: Iterable[E]) -> None:
+        """Enqueues all `elements` in order, checking the capacity once for the whole batch
+
+        :raises FullQueueException: if the batch doesn't fit, in which case nothing is enqueued
+        """
+        if self._max_capacity is not None:
+            if not isinstance(elements, Sized):
+                elements = list(elements)
+            if len(self._internal_deque) + len(elements) > self._max_capacity:
+                raise FullQueueException()
+
+        self._internal_deque.extend(elements)
+
     def dequeue(self) -> E:
         if self.is_not_empty:
             return self._internal_deque.popleft()
         else:
             raise EmptyQueueException()
 
+    def dequeue_many(self, n: int) -> list[E]:
+        """Dequeues the first `n` elements in one step
+
+        :returns: the dequeued elements in FIFO order
+        :rtype: list[E]
+        :raises ValueError: if `n` is greater than the number of elements in queue
+        """
+        internal_deque = self._internal_deque
+        if n > len(internal_deque):
+            raise ValueError(f"Your value for n should be less or equal to {len(internal_deque)}")
+
+        if n == len(internal_deque):
+            items = list(internal_deque)
+            internal_deque.clear()
+            return items
+
+        popleft = internal_deque.popleft
+        return [popleft() for _ in range(n)]
+
+    def dequeue_array(self, n: int, dtype: Any = None) -> "numpy.ndarray[Any, Any]":
+        """Dequeues the first `n` elements into a NumPy array. Requires `numpy`.
+
+        :param dtype: dtype of the array, inferred from the elements if `None`
+        :rtype: numpy.ndarray
+        :raises ValueError: if `n` is greater than the number of elements in queue
+        """
+        try:
+            import numpy
+        except ImportError as error:
+            raise ImportError("dequeue_array requires numpy, install it with `pip install numpy`") from error
+
+        return numpy.asarray(self.dequeue_many(n), dtype=dtype)
+
     def try_dequeue(self) -> Optional[E]:
         try:
             return self._internal_deque.popleft()
-        except EmptyQueueException:
+        except IndexError:
             return None
 
     @property
@@ -134,16 +190,69 @@ class Queue(Collection, Generic[E]):
     def __contains__(self, item: object) -> bool:
         return item in self._internal_deque
 
+    def snapshot(self) -> list[E]:
+        """Copies the elements in FIFO order, so they can be read while the queue keeps changing
+
+        :rtype: list[E]
+        """
+        return list(self)
+
+    def drain(self) -> Iterator[E]:
+        """Dequeues elements while iterating, until the queue is empty
+
+        :returns: an iterator that removes each element it yields
+        :rtype: Iterator[E]
+        """
+        while self.is_not_empty:
+            yield self.dequeue()
+
+    def batches(
+        self,
+        max_size: int,
+        max_linger: Optional[float] = None,
+        max_bytes: Optional[int] = None,
+        *,
+        size_of: Callable[[E], int] = len,  # type: ignore[assignment]
+        flush_on_close: bool = True,
+        stats: Optional["BatchStats"] = None,
+    ) -> Iterator[list[E]]:
+        """Dequeues elements in batches, each yielded as soon as one of the limits is hit.
+        See `queue.batching.batches`, a plain Queue is closed once it's empty.
+
+        :param max_size: most elements in a batch
+        :param max_linger: most seconds the first element of a batch waits for others, `None` waits for a full batch
+        :param max_bytes: most bytes in a batch, as measured by `size_of`, unless a single element is bigger
+        :param flush_on_close: yield the last partial batch once the queue is closed, instead of discarding it
+        :param stats: records the size of every batch and what ended it
+        """
+        from queue.batching import batches
+
+        return batches(
+            self, max_size, max_linger, max_bytes, size_of=size_of, flush_on_close=flush_on_close, stats=stats
+        )
+
+    def _poll(self, max_items: int, timeout: Optional[float]) -> Optional[list[E]]:
+        """Takes up to `max_items` elements for `batches`, waiting up to `timeout` seconds for the first one.
+        A plain Queue can't be fed while waiting, so it never waits.
+
+        :returns: the elements, empty if `timeout` expired, `None` once no element can come anymore
+        """
+        count = min(max_items, len(self))
+
+        return self.dequeue_many(count) if count else None
+
+    def _resize(self, new_capacity: Optional[int]) -> None:
+        """Rebuilds the deque with `new_capacity` as its `maxlen`, so it never evicts below the capacity.
+        Subclasses that enforce the capacity on an unbounded deque (or keep no deque) are left alone.
+        """
+        internal_deque = getattr(self, "_internal_deque", None)
+        if internal_deque is not None and internal_deque.maxlen is not None:
+            self._internal_deque = deque(internal_deque, maxlen=new_capacity)
+
     @override
     def __iter__(self) -> Iterator[E]:
-        return self
-
-    def __next__(self) -> E:
-        if self._iterator_index < len(self):
-            item = self._internal_deque[self._iterator_index]
-            self._iterator_index += 1
+        """Iterates in FIFO order without removing elements. Each call gets its own cursor.
 
-            return item
-        else:
-            self._iterator_index = 0
-            raise StopIteration
+        :raises RuntimeError: from the iterator, if the queue is modified while iterating
+        """
+        return iter(self._internal_deque)
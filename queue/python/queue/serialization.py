@@ -0,0 +1,142 @@
+"""
+    Binary dump and load of Queues
+
+    A dump is a length-prefixed header followed by chunks of elements:
+
+      - magic `DSAQ` and the header length, `<4sI`;
+      - the header, `<BcQq`: format version, payload typecode, number of elements
+        and max capacity (-1 for none). Readers skip header bytes they don't know;
+      - chunks, until every element was read. Each one starts with `<QI`, its payload
+        length and its number of out-of-band buffers, then the payload, then each
+        buffer as a `<Q` length and its raw bytes.
+
+    By default the payload, typecode `O`, is a pickled list (protocol 5) whose large
+    buffers, like NumPy arrays or `bytearray`s, are written out-of-band, straight from
+    the object's memory. Numbers dumped with an `array` typecode, like `q` or `d`, are
+    written as the raw little-endian bytes of an `array.array` instead.
+"""
+
+import pickle
+import struct
+import sys
+from array import array
+from collections.abc import Iterator
+from itertools import islice
+from typing import Any, BinaryIO, Optional, TypeVar
+
+from queue.queue import Queue
+
+Q = TypeVar("Q", bound=Queue[Any])
+
+_MAGIC = b"DSAQ"
+_VERSION = 1
+_PREFIX = struct.Struct("<4sI")
+_HEADER = struct.Struct("<BcQq")
+_CHUNK = struct.Struct("<QI")
+_BUFFER = struct.Struct("<Q")
+_OBJECTS = "O"
+# Elements per chunk, the unit of memory used by a streaming load.
+CHUNK_ELEMENTS = 65536
+
+
+def dump(queue: Queue[Any], file: BinaryIO, *, typecode: Optional[str] = None) -> None:
+    """Writes the elements of `queue`, in FIFO order, and its capacity to `file`
+
+    :param typecode: an `array` typecode every element fits, like "q" or "d", to write them as raw numbers
+    :raises OverflowError: if an element doesn't fit `typecode`
+    :raises TypeError: if an element isn't a number of the kind of `typecode`
+    """
+    typecode = typecode or _OBJECTS
+    count = len(queue)
+    capacity = queue.max_capacity
+    header = _HEADER.pack(_VERSION, typecode.encode(), count, -1 if capacity is None else capacity)
+    file.write(_PREFIX.pack(_MAGIC, len(header)))
+    file.write(header)
+
+    elements = iter(queue)
+    for _ in range(0, count, CHUNK_ELEMENTS):
+        chunk = list(islice(elements, CHUNK_ELEMENTS))
+        if typecode == _OBJECTS:
+            buffers: list[pickle.PickleBuffer] = []
+            payload = pickle.dumps(chunk, protocol=5, buffer_callback=buffers.append)
+            file.write(_CHUNK.pack(len(payload), len(buffers)))
+            file.write(payload)
+            for buffer in buffers:
+                raw = buffer.raw()
+                file.write(_BUFFER.pack(raw.nbytes))
+                file.write(raw)
+        else:
+            values = array(typecode, chunk)
+            if sys.byteorder == "big":
+                values.byteswap()
+            file.write(_CHUNK.pack(len(values) * values.itemsize, 0))
+            file.write(memoryview(values))
+
+
+def load(file: BinaryIO, cls: type[Q] = Queue) -> Q:  # type: ignore[assignment]
+    """Reads a queue written by `dump`, as an instance of `cls` built with the dumped capacity
+
+    :raises ValueError: if `file` doesn't start with a dump
+    """
+    typecode, count, capacity = _read_header(file)
+    queue = cls(max_capacity=capacity)
+    for chunk in _read_chunks(file, typecode, count):
+        queue.enqueue_many(chunk)
+
+    return queue
+
+
+def iter_load(file: BinaryIO) -> Iterator[Any]:
+    """Yields the elements of a dump in FIFO order, reading one chunk at a time
+
+    :raises ValueError: if `file` doesn't start with a dump
+    """
+    typecode, count, _ = _read_header(file)
+    for chunk in _read_chunks(file, typecode, count):
+        yield from chunk
+
+
+def _read_header(file: BinaryIO) -> tuple[str, int, Optional[int]]:
+    magic, header_length = _PREFIX.unpack(_read_exactly(file, _PREFIX.size))
+    if magic != _MAGIC:
+        raise ValueError("Not a queue dump")
+
+    header = _read_exactly(file, header_length)
+    version, typecode, count, capacity = _HEADER.unpack_from(header)
+    if version != _VERSION:
+        raise ValueError(f"Unsupported queue dump version {version}")
+
+    return typecode.decode(), count, None if capacity < 0 else capacity
+
+
+def _read_chunks(file: BinaryIO, typecode: str, count: int) -> Iterator[array[Any] | list[Any]]:
+    """The elements of each chunk, as an `array` or a list"""
+    read = 0
+    while read < count:
+        payload_length, buffer_count = _CHUNK.unpack(_read_exactly(file, _CHUNK.size))
+        payload = _read_exactly(file, payload_length)
+        buffers = [_read_exactly(file, _BUFFER.unpack(_read_exactly(file, _BUFFER.size))[0]) for _ in range(buffer_count)]
+
+        chunk: array[Any] | list[Any]
+        if typecode == _OBJECTS:
+            chunk = pickle.loads(payload, buffers=buffers)
+        else:
+            chunk = array(typecode)
+            chunk.frombytes(payload)
+            if sys.byteorder == "big":
+                chunk.byteswap()
+        read += len(chunk)
+        yield chunk
+
+
+def _read_exactly(file: BinaryIO, size: int) -> bytearray:
+    data = bytearray(size)
+    view = memoryview(data)
+    filled = 0
+    while filled < size:
+        read = file.readinto(view[filled:])  # type: ignore[attr-defined]
+        if not read:
+            raise ValueError("Truncated queue dump")
+        filled += read
+
+    return data
@@ -0,0 +1,295 @@
+"""
+    Sharded, multi-lane Queue implementation in python lang
+"""
+
+import os
+import threading
+import zlib
+from collections.abc import Callable, Hashable, Iterable, Iterator, Sequence
+from itertools import chain, count
+from typing import Any, Optional, TypeVar, override
+
+from queue.empty_queue_exception import EmptyQueueException
+from queue.full_queue_exception import FullQueueException
+from queue.queue import Queue
+
+E = TypeVar("E")
+
+
+class ShardedQueue(Queue[E]):
+    """
+    A Queue spread over independent lanes, so concurrent producers and consumers
+    touch different lanes instead of serializing on one lock.
+
+    Elements go to the lanes round-robin or, with a `key` function, to the lane of
+    their key's hash: elements with the same key stay in FIFO order among
+    themselves, there's no order between lanes. The hash is the same in every
+    process for ints, `str`, `bytes` and tuples of them (see `stable_hash`), so
+    producers in different processes agree on the lanes. Each consumer thread owns a home
+    lane (assigned round-robin on its first dequeue) and only scans the other
+    lanes, taking their oldest element, when its own is empty.
+
+    Lanes are `Queue`s, unbounded by default. Pass lanes that are safe for the
+    access pattern, e.g. `SharedMemoryQueue`s to share the queue between
+    processes. Dequeues take a lock per lane, so consumers of different lanes
+    don't wait for each other. `len` and `is_empty` read the lane lengths
+    without any lock, in O(lanes), so they may be stale while other threads are
+    working.
+    """
+
+    _lanes: list[Queue[E]]
+    _key: Optional[Callable[[E], Hashable]]
+    _submissions: Iterator[int]
+    _consumers: Iterator[int]
+    _local: threading.local
+    _lane_locks: list[threading.Lock]
+
+    def __init__(
+        self,
+        lanes: Optional[int | Sequence[Queue[E]]] = None,
+        *,
+        key: Optional[Callable[[E], Hashable]] = None,
+        max_capacity: Optional[int] = None,
+    ) -> None:
+        """
+        :param lanes: number of lanes to create, the CPU count by default, or the lane queues themselves
+        :param key: maps each element to the key its lane is chosen by, round-robin if `None`
+        :param max_capacity: capacity of the created lanes all together, split evenly between them, `None` for unbounded
+        :raises ValueError: if there's no lane, or `max_capacity` is given with lane queues
+        """
+        if lanes is None:
+            lanes = os.cpu_count() or 1
+        if isinstance(lanes, int):
+            if max_capacity is None:
+                self._lanes = [Queue() for _ in range(lanes)]
+            else:
+                share, remainder = divmod(max_capacity, max(lanes, 1))
+                self._lanes = [Queue(max_capacity=share + (index < remainder)) for index in range(lanes)]
+        elif max_capacity is not None:
+            raise ValueError("max_capacity only applies to created lanes, bound the lane queues instead")
+        else:
+            self._lanes = list(lanes)
+        if not self._lanes:
+            raise ValueError("A ShardedQueue needs at least one lane")
+
+        self._key = key
+        self._reset_cursors()
+
+    @property
+    @override
+    def max_capacity(self) -> Optional[int]:
+        """Sum of the lanes capacities, `None` if any lane is unbounded"""
+        capacities = [lane.max_capacity for lane in self._lanes]
+        if None in capacities:
+            return None
+
+        return sum(capacities)  # type: ignore[arg-type]
+
+    @property
+    def lanes(self) -> int:
+        return len(self._lanes)
+
+    def lane_lengths(self) -> list[int]:
+        """Number of elements in each lane"""
+        return [len(lane) for lane in self._lanes]
+
+    def lane_of(self, element: E) -> Optional[int]:
+        """The lane `element` is enqueued into, `None` when lanes are chosen round-robin"""
+        if self._key is None:
+            return None
+
+        return stable_hash(self._key(element)) % len(self._lanes)
+
+    @property
+    def home_lane(self) -> int:
+        """The lane owned by the calling thread, the first one its dequeues look at"""
+        home = getattr(self._local, "home", None)
+        if home is None:
+            home = self._local.home = next(self._consumers) % len(self._lanes)
+
+        return home
+
+    @home_lane.setter
+    def home_lane(self, lane: int) -> None:
+        """Makes the calling thread own `lane`, e.g. in child processes, whose threads all start at lane 0"""
+        if not 0 <= lane < len(self._lanes):
+            raise ValueError(f"lane must be between 0 and {len(self._lanes) - 1}")
+        self._local.home = lane
+
+    @override
+    def enqueue(self, element: E) -> None:
+        """Adds `element` to its key's lane, or to the next lane round-robin
+
+        :raises FullQueueException: if its key's lane is full, or every lane when round-robin
+        """
+        lanes = self._lanes
+        if self._key is not None:
+            lanes[stable_hash(self._key(element)) % len(lanes)].enqueue(element)
+            return
+
+        start = next(self._submissions)
+        for offset in range(len(lanes)):
+            try:
+                lanes[(start + offset) % len(lanes)].enqueue(element)
+                return
+            except FullQueueException:
+                pass
+
+        raise FullQueueException()
+
+    @override
+    def enqueue_many(self, elements: Iterable[E]) -> None:
+        """Enqueues `elements`, one lane batch at a time
+
+        :raises FullQueueException: if a lane batch doesn't fit, the lanes before it keep their batch
+        """
+        lanes = self._lanes
+        batches: list[list[E]] = [[] for _ in lanes]
+        if self._key is not None:
+            key = self._key
+            for element in elements:
+                batches[stable_hash(key(element)) % len(lanes)].append(element)
+        else:
+            start = next(self._submissions)
+            for offset, element in enumerate(elements):
+                batches[(start + offset) % len(lanes)].append(element)
+
+        for lane, batch in zip(lanes, batches):
+            if batch:
+                lane.enqueue_many(batch)
+
+    @override
+    def dequeue(self) -> E:
+        """Removes the oldest element of the calling thread's lane, or of the first other lane that has one
+
+        :raises EmptyQueueException: if every lane is empty
+        """
+        for lane, lock in self._scan_order():
+            if len(lane):
+                with lock:
+                    try:
+                        return lane.dequeue()
+                    # Another consumer, maybe in another process, may have emptied the lane since the check.
+                    except (EmptyQueueException, IndexError):
+                        pass
+
+        raise EmptyQueueException()
+
+    @override
+    def dequeue_many(self, n: int) -> list[E]:
+        """Dequeues `n` elements, draining the calling thread's lane first. Fewer are returned
+        if other consumers take some of them in the meantime.
+
+        :raises ValueError: if `n` is negative or greater than the number of elements in queue
+        """
+        if n < 0:
+            raise ValueError("n must be a non-negative integer")
+        if n > len(self):
+            raise ValueError(f"Your value for n should be less or equal to {len(self)}")
+
+        items: list[E] = []
+        for lane, lock in self._scan_order():
+            if len(items) == n:
+                break
+            with lock:
+                taken = min(n - len(items), len(lane))
+                if taken:
+                    try:
+                        items.extend(lane.dequeue_many(taken))
+                    # Only consumers in other processes can empty a shared lane under this lock.
+                    except (ValueError, EmptyQueueException):
+                        pass
+
+        return items
+
+    @override
+    def try_dequeue(self) -> Optional[E]:
+        try:
+            return self.dequeue()
+        except EmptyQueueException:
+            return None
+
+    @property
+    @override
+    def peek(self) -> E:
+        """The element `dequeue` would return, if no other thread takes it first"""
+        for lane, _ in self._scan_order():
+            # An empty lane raises, unlike `try_peek` whose `None` may be an element.
+            try:
+                return lane.peek
+            except EmptyQueueException:
+                pass
+
+        raise EmptyQueueException()
+
+    @property
+    @override
+    def is_full(self) -> bool:
+        return all(lane.is_full for lane in self._lanes)
+
+    @property
+    @override
+    def is_empty(self) -> bool:
+        return not any(len(lane) for lane in self._lanes)
+
+    @override
+    def clear(self) -> None:
+        for lane in self._lanes:
+            lane.clear()
+
+    @override
+    def __len__(self) -> int:
+        return sum([len(lane) for lane in self._lanes])
+
+    @override
+    def __contains__(self, item: object) -> bool:
+        return any(item in lane for lane in self._lanes)
+
+    @override
+    def __iter__(self) -> Iterator[E]:
+        """Iterates lane by lane, each in FIFO order"""
+        return chain.from_iterable(self._lanes)
+
+    def __getstate__(self) -> dict[str, Any]:
+        state = self.__dict__.copy()
+        del state["_submissions"], state["_consumers"], state["_local"], state["_lane_locks"]
+        return state
+
+    def __setstate__(self, state: dict[str, Any]) -> None:
+        self.__dict__.update(state)
+        self._reset_cursors()
+
+    def _reset_cursors(self) -> None:
+        self._submissions = count()
+        self._consumers = count()
+        self._local = threading.local()
+        self._lane_locks = [threading.Lock() for _ in self._lanes]
+
+    def _scan_order(self) -> Iterator[tuple[Queue[E], threading.Lock]]:
+        """The calling thread's lane, then every other lane after it, with their locks"""
+        lanes, locks = self._lanes, self._lane_locks
+        home = self.home_lane
+        for offset in range(len(lanes)):
+            index = (home + offset) % len(lanes)
+            yield lanes[index], locks[index]
+
+
+def stable_hash(key: Hashable) -> int:
+    """Hash of `key` that doesn't change between processes, unlike `hash` of `str` and `bytes`,
+    which is salted per process (see PYTHONHASHSEED). Ints are their own hash, `str` and `bytes`
+    are hashed with CRC32, and tuples combine the hashes of their items. Other keys fall back to
+    `hash`, so they must hash the same in every process, e.g. by having a key function return an int.
+    """
+    if isinstance(key, int):
+        return key
+    if isinstance(key, str):
+        return zlib.crc32(key.encode("utf-8", "surrogatepass"))
+    if isinstance(key, bytes):
+        return zlib.crc32(key)
+    if isinstance(key, tuple):
+        value = len(key)
+        for item in key:
+            value = (value * 1_000_003 ^ stable_hash(item)) & 0xFFFF_FFFF_FFFF_FFFF
+        return value
+
+    return hash(key)
@@ -0,0 +1,334 @@
+"""
+    Cross-process Queue implementation over a shared memory ring buffer
+"""
+
+import multiprocessing
+import struct
+from collections.abc import Iterable, Iterator, Sequence
+from contextlib import contextmanager
+from multiprocessing import resource_tracker
+from multiprocessing.shared_memory import SharedMemory
+from multiprocessing.synchronize import Lock
+from types import TracebackType
+from typing import Any, Optional, Self, override
+
+from queue.empty_queue_exception import EmptyQueueException
+from queue.full_queue_exception import FullQueueException
+from queue.queue import Queue
+
+# Two monotonically increasing counters: records ever dequeued, records ever enqueued.
+_HEADER = struct.Struct("QQ")
+
+
+class SharedMemoryQueue(Queue[Any]):
+    """
+    A FIFO queue of fixed-size records that several processes share without pickling.
+    Records are laid out by a `struct` format and live in a preallocated ring of
+    `max_capacity` slots inside a `multiprocessing.shared_memory` block. A single
+    process-shared lock guards the head and tail counters.
+
+    Pass the queue to child processes as a `multiprocessing.Process` argument: it
+    re-attaches to the same block and lock on the other side. The creating
+    process owns the block and releases it with `unlink`.
+
+    Records with a single field are enqueued and dequeued as bare values, other
+    records as tuples. For NumPy, a dtype matching the struct layout reads the
+    batch views directly, e.g. `numpy.frombuffer(view, dtype)`. The view is
+    released when its `with` block exits, so such arrays must be deleted (or
+    copied) inside the block.
+    """
+
+    _record: struct.Struct
+    _single_field: bool
+    _shared_memory: SharedMemory
+    _lock: Lock
+    _owner: bool
+
+    def __init__(
+        self,
+        record_format: str | struct.Struct,
+        *,
+        max_capacity: int,
+        name: Optional[str] = None,
+    ) -> None:
+        if max_capacity < 1:
+            raise ValueError("max_capacity must be a positive integer")
+
+        self._record = (
+            record_format
+            if isinstance(record_format, struct.Struct)
+            else struct.Struct(record_format)
+        )
+        self._single_field = len(self._record.unpack(bytes(self._record.size))) == 1
+        self._max_capacity = max_capacity
+        self._shared_memory = SharedMemory(
+            name=name,
+            create=True,
+            size=_HEADER.size + max_capacity * self._record.size,
+        )
+        _HEADER.pack_into(self._shared_memory.buf, 0, 0, 0)
+        self._lock = multiprocessing.Lock()
+        self._owner = True
+
+    @classmethod
+    @override
+    def from_sequence(
+        cls,
+        sequence: Sequence[Any],
+        record_format: Optional[str | struct.Struct] = None,
+        *,
+        max_capacity: Optional[int] = None,
+        name: Optional[str] = None,
+    ) -> Self:
+        """
+        :raises ValueError: if `record_format` or `max_capacity` is missing, or `max_capacity` is less than the length of `sequence`
+        """
+        if record_format is None or max_capacity is None:
+            raise ValueError("A SharedMemoryQueue needs a record_format and a max_capacity")
+        if len(sequence) > max_capacity:
+            raise ValueError("Your sequence's length must be less or equal your max capacity")
+
+        queue = cls(record_format, max_capacity=max_capacity, name=name)
+        queue.enqueue_many(sequence)
+
+        return queue
+
+    @property
+    def name(self) -> str:
+        """Name of the shared memory block"""
+        return self._shared_memory.name
+
+    @property
+    def record_size(self) -> int:
+        """Size in bytes of one record"""
+        return self._record.size
+
+    @property
+    @override
+    def max_capacity(self) -> int:
+        """Number of slots in the ring, fixed for the lifetime of the shared block"""
+        return self._max_capacity  # type: ignore
+
+    @override
+    def enqueue(self, element: Any) -> None:
+        with self._lock:
+            head, tail = _HEADER.unpack_from(self._shared_memory.buf, 0)
+            if tail - head >= self._max_capacity:  # type: ignore
+                raise FullQueueException()
+
+            self._pack(tail, element)
+            _HEADER.pack_into(self._shared_memory.buf, 0, head, tail + 1)
+
+    @override
+    def enqueue_many(self, elements: Iterable[Any]) -> None:
+        """Enqueues all `elements` in order under a single lock acquisition
+
+        :raises FullQueueException: if the batch doesn't fit, in which case nothing is enqueued
+        """
+        elements = list(elements)
+
+        with self._lock:
+            head, tail = _HEADER.unpack_from(self._shared_memory.buf, 0)
+            if tail - head + len(elements) > self._max_capacity:  # type: ignore
+                raise FullQueueException()
+
+            for index, element in enumerate(elements, tail):
+                self._pack(index, element)
+            _HEADER.pack_into(self._shared_memory.buf, 0, head, tail + len(elements))
+
+    @override
+    def dequeue(self) -> Any:
+        with self._lock:
+            head, tail = _HEADER.unpack_from(self._shared_memory.buf, 0)
+            if head == tail:
+                raise EmptyQueueException()
+
+            item = self._unpack(head)
+            _HEADER.pack_into(self._shared_memory.buf, 0, head + 1, tail)
+
+            return item
+
+    @override
+    def dequeue_many(self, n: int) -> list[Any]:
+        """Dequeues the first `n` records under a single lock acquisition
+
+        :raises ValueError: if `n` is negative or greater than the number of records in queue
+        """
+        if n < 0:
+            raise ValueError("n must be a non-negative integer")
+
+        with self._lock:
+            head, tail = _HEADER.unpack_from(self._shared_memory.buf, 0)
+            if n > tail - head:
+                raise ValueError(f"Your value for n should be less or equal to {tail - head}")
+
+            items = [self._unpack(index) for index in range(head, head + n)]
+            _HEADER.pack_into(self._shared_memory.buf, 0, head + n, tail)
+
+            return items
+
+    @override
+    def try_dequeue(self) -> Optional[Any]:
+        try:
+            return self.dequeue()
+        except EmptyQueueException:
+            return None
+
+    @property
+    @override
+    def peek(self) -> Any:
+        with self._lock:
+            head, tail = _HEADER.unpack_from(self._shared_memory.buf, 0)
+            if head == tail:
+                raise EmptyQueueException()
+
+            return self._unpack(head)
+
+    @contextmanager
+    def write_slots(self, max_items: int) -> Iterator[memoryview]:
+        """Lends the largest run of contiguous free slots, up to `max_items`, for writing.
+
+        The view holds `len(view) // record_size` records and every slot in it is
+        enqueued when the block exits normally. The queue stays locked meanwhile.
+        The view is released on exit, so buffers made from it must be released first.
+
+        :raises FullQueueException: if the queue is full
+        :raises BufferError: on exit, if a buffer made from the view is still alive, in which case nothing is enqueued
+        """
+        with self._lock:
+            head, tail = _HEADER.unpack_from(self._shared_memory.buf, 0)
+            free = self._max_capacity - (tail - head)  # type: ignore
+            if free == 0:
+                raise FullQueueException()
+
+            count = self._contiguous(tail, min(max_items, free))
+            view = self._slots(tail, count)
+            try:
+                yield view
+            finally:
+                _release(view)
+
+            _HEADER.pack_into(self._shared_memory.buf, 0, head, tail + count)
+
+    @contextmanager
+    def read_slots(self, max_items: int) -> Iterator[memoryview]:
+        """Lends the largest run of contiguous ready records, up to `max_items`, for reading.
+
+        Every record in the view is dequeued when the block exits normally.
+        The queue stays locked meanwhile. The view is released on exit, so buffers
+        made from it must be released first: the slots are reused by later writes.
+
+        :raises EmptyQueueException: if the queue is empty
+        :raises BufferError: on exit, if a buffer made from the view is still alive, in which case nothing is dequeued
+        """
+        with self._lock:
+            head, tail = _HEADER.unpack_from(self._shared_memory.buf, 0)
+            if head == tail:
+                raise EmptyQueueException()
+
+            count = self._contiguous(head, min(max_items, tail - head))
+            view = self._slots(head, count)
+            try:
+                yield view
+            finally:
+                _release(view)
+
+            _HEADER.pack_into(self._shared_memory.buf, 0, head + count, tail)
+
+    @override
+    def clear(self) -> None:
+        """Clears queue elements"""
+        with self._lock:
+            _head, tail = _HEADER.unpack_from(self._shared_memory.buf, 0)
+            _HEADER.pack_into(self._shared_memory.buf, 0, tail, tail)
+
+    def close(self) -> None:
+        """Detaches this process from the shared memory block"""
+        self._shared_memory.close()
+
+    def unlink(self) -> None:
+        """Destroys the shared memory block. Only the creating process should call it."""
+        self._shared_memory.unlink()
+
+    def __enter__(self) -> Self:
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_value: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        self.close()
+        if self._owner:
+            self.unlink()
+
+    @override
+    def __len__(self) -> int:
+        with self._lock:
+            head, tail = _HEADER.unpack_from(self._shared_memory.buf, 0)
+
+        return tail - head
+
+    @override
+    def __contains__(self, item: object) -> bool:
+        return any(element == item for element in self)
+
+    @override
+    def __iter__(self) -> Iterator[Any]:
+        with self._lock:
+            head, tail = _HEADER.unpack_from(self._shared_memory.buf, 0)
+            items = [self._unpack(index) for index in range(head, tail)]
+
+        return iter(items)
+
+    def __getstate__(self) -> dict[str, Any]:
+        return {
+            "record_format": self._record.format,
+            "max_capacity": self._max_capacity,
+            "name": self._shared_memory.name,
+            "lock": self._lock,
+        }
+
+    def __setstate__(self, state: dict[str, Any]) -> None:
+        self._record = struct.Struct(state["record_format"])
+        self._single_field = len(self._record.unpack(bytes(self._record.size))) == 1
+        self._max_capacity = state["max_capacity"]
+        self._shared_memory = SharedMemory(name=state["name"])
+        # Attaching registers the block with the resource tracker again, which
+        # would unlink it when this process exits. Only the creator owns it.
+        resource_tracker.unregister(self._shared_memory._name, "shared_memory")  # type: ignore
+        self._lock = state["lock"]
+        self._owner = False
+
+    def _offset(self, index: int) -> int:
+        return _HEADER.size + (index % self._max_capacity) * self._record.size  # type: ignore
+
+    def _contiguous(self, index: int, count: int) -> int:
+        """Caps `count` so that slots starting at `index` don't wrap around the ring"""
+        return min(count, self._max_capacity - index % self._max_capacity)  # type: ignore
+
+    def _slots(self, index: int, count: int) -> memoryview:
+        offset = self._offset(index)
+
+        return self._shared_memory.buf[offset : offset + count * self._record.size]
+
+    def _pack(self, index: int, element: Any) -> None:
+        if self._single_field:
+            self._record.pack_into(self._shared_memory.buf, self._offset(index), element)
+        else:
+            self._record.pack_into(self._shared_memory.buf, self._offset(index), *element)
+
+    def _unpack(self, index: int) -> Any:
+        values = self._record.unpack_from(self._shared_memory.buf, self._offset(index))
+
+        return values[0] if self._single_field else values
+
+
+def _release(view: memoryview) -> None:
+    try:
+        view.release()
+    except BufferError as error:
+        raise BufferError(
+            "A buffer made from the slots view, e.g. a NumPy array, is still alive, release it inside the with block"
+        ) from error
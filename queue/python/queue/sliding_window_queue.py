@@ -0,0 +1,230 @@
+"""
+    Sliding window Queue with O(1) aggregates implementation in python lang
+"""
+
+import operator
+from collections.abc import Callable, Iterable, Iterator, Mapping, Sequence
+from itertools import chain
+from typing import Any, Optional, Self, TypeVar, override
+
+from queue.empty_queue_exception import EmptyQueueException
+from queue.full_queue_exception import FullQueueException
+from queue.queue import Queue
+
+E = TypeVar("E")
+
+Combine = Callable[[Any, Any], Any]
+
+DEFAULT_AGGREGATES: Mapping[str, Combine] = {"min": min, "max": max, "sum": operator.add}
+
+
+class SlidingWindowQueue(Queue[E]):
+    """
+    A Queue whose aggregates over all its elements (min, max, sum, or any
+    associative `combine` function) are read in amortized O(1).
+
+    Elements are kept in two stacks: new ones are pushed on the back stack,
+    which keeps the running aggregate of its elements, and dequeues pop from
+    the front stack, whose levels hold the aggregate of every element from
+    them to its top. When the front stack runs out the back one is moved over
+    it once, so each element is combined a constant number of times. Combine
+    functions are only assumed associative, not commutative.
+
+    With a `window_size`, enqueuing into a full window slides it: the oldest
+    element is dropped. `max_capacity` keeps the `Queue` meaning, enqueuing
+    into a queue holding that many elements raises `FullQueueException`.
+    """
+
+    _names: dict[str, int]
+    _combines: tuple[Combine, ...]
+    _window_size: Optional[int]
+    # (element, aggregates of it and every element enqueued after it in the front stack), oldest last
+    _front: list[tuple[E, tuple[Any, ...]]]
+    _back: list[E]
+    _back_aggregates: tuple[Any, ...]
+
+    def __init__(
+        self,
+        *,
+        window_size: Optional[int] = None,
+        aggregates: Mapping[str, Combine] = DEFAULT_AGGREGATES,
+        max_capacity: Optional[int] = None,
+    ) -> None:
+        """
+        :param window_size: number of elements kept, the oldest ones slide out of it, `None` for no limit
+        :param aggregates: associative combine functions by name, min, max and sum by default
+        """
+        if window_size is not None and window_size < 1:
+            raise ValueError("window_size must be positive")
+
+        self._names = {name: index for index, name in enumerate(aggregates)}
+        self._combines = tuple(aggregates.values())
+        self._window_size = window_size
+        self._max_capacity = max_capacity
+        self._front = []
+        self._back = []
+        self._back_aggregates = ()
+
+    @classmethod
+    @override
+    def from_sequence(
+        cls,
+        sequence: Sequence[E],
+        *,
+        max_capacity: Optional[int] = None,
+        window_size: Optional[int] = None,
+        aggregates: Mapping[str, Combine] = DEFAULT_AGGREGATES,
+    ) -> Self:
+        """The last `window_size` elements of `sequence` are kept
+
+        :raises ValueError: if `max_capacity` is less than the length of `sequence`
+        """
+        if max_capacity is not None and len(sequence) > max_capacity:
+            raise ValueError("Your sequence's length must be less or equal your max capacity")
+
+        queue = cls(window_size=window_size, aggregates=aggregates, max_capacity=max_capacity)
+        queue.enqueue_many(sequence)
+
+        return queue
+
+    @property
+    def window_size(self) -> Optional[int]:
+        return self._window_size
+
+    @window_size.setter
+    def window_size(self, new_size: Optional[int]) -> None:
+        """Resizes the window
+
+        :raises ValueError: if `new_size` isn't positive or is less than the len of the queue
+        """
+        if new_size is not None:
+            if new_size < 1:
+                raise ValueError("window_size must be positive")
+            if new_size < len(self):
+                raise ValueError(f"Your new window size shouldn't be less than the len of the queue, {len(self)}")
+        self._window_size = new_size
+
+    @override
+    def enqueue(self, element: E) -> None:
+        """Adds `element` to the window, dropping the oldest element if the window is full
+
+        :raises FullQueueException: if the queue holds `max_capacity` elements and the window isn't full
+        """
+        if self._window_size is not None and len(self) >= self._window_size:
+            self.dequeue()
+        elif self._max_capacity is not None and len(self) >= self._max_capacity:
+            raise FullQueueException()
+
+        if self._back:
+            self._back_aggregates = tuple(
+                [combine(value, element) for combine, value in zip(self._combines, self._back_aggregates)]
+            )
+        else:
+            self._back_aggregates = (element,) * len(self._combines)
+        self._back.append(element)
+
+    @override
+    def enqueue_many(self, elements: Iterable[E]) -> None:
+        """Enqueues all `elements` in order, sliding the window as needed
+
+        :raises FullQueueException: if the batch doesn't fit in `max_capacity`, in which case nothing is enqueued
+        """
+        if self._max_capacity is not None:
+            elements = list(elements)
+            length = len(self) + len(elements)
+            if self._window_size is not None:
+                length = min(length, self._window_size)
+            if length > self._max_capacity:
+                raise FullQueueException()
+
+        for element in elements:
+            self.enqueue(element)
+
+    @override
+    def dequeue(self) -> E:
+        if not self._front:
+            if not self._back:
+                raise EmptyQueueException()
+            self._move_back_to_front()
+
+        return self._front.pop()[0]
+
+    @override
+    def dequeue_many(self, n: int) -> list[E]:
+        if n > len(self):
+            raise ValueError(f"Your value for n should be less or equal to {len(self)}")
+
+        return [self.dequeue() for _ in range(n)]
+
+    @override
+    def try_dequeue(self) -> Optional[E]:
+        return self.dequeue() if self else None
+
+    @property
+    @override
+    def peek(self) -> E:
+        if self._front:
+            return self._front[-1][0]
+        if self._back:
+            return self._back[0]
+        raise EmptyQueueException()
+
+    @override
+    def clear(self) -> None:
+        self._front.clear()
+        self._back.clear()
+        self._back_aggregates = ()
+
+    def aggregate(self, name: str) -> Any:
+        """The aggregate called `name` over the elements in the window, oldest first, in O(1)
+
+        :raises KeyError: if there's no aggregate called `name`
+        :raises EmptyQueueException: if the queue is empty
+        """
+        index = self._names[name]
+        if self._front:
+            front_value = self._front[-1][1][index]
+            if self._back:
+                return self._combines[index](front_value, self._back_aggregates[index])
+            return front_value
+        if self._back:
+            return self._back_aggregates[index]
+        raise EmptyQueueException()
+
+    def min(self) -> E:
+        """Smallest element in the window, with the default aggregates"""
+        return self.aggregate("min")
+
+    def max(self) -> E:
+        """Largest element in the window, with the default aggregates"""
+        return self.aggregate("max")
+
+    def sum(self) -> E:
+        """Sum of the elements in the window, with the default aggregates"""
+        return self.aggregate("sum")
+
+    @override
+    def __len__(self) -> int:
+        return len(self._front) + len(self._back)
+
+    @override
+    def __contains__(self, item: object) -> bool:
+        return any(element == item for element in self)
+
+    @override
+    def __iter__(self) -> Iterator[E]:
+        return chain((element for element, _ in reversed(self._front)), self._back)
+
+    def _move_back_to_front(self) -> None:
+        """Moves the back stack over the empty front one, newest first, so the oldest ends on top"""
+        combines = self._combines
+        front = self._front
+        aggregates: tuple[Any, ...] = ()
+        for element in reversed(self._back):
+            if aggregates:
+                aggregates = tuple([combine(element, value) for combine, value in zip(combines, aggregates)])
+            else:
+                aggregates = (element,) * len(combines)
+            front.append((element, aggregates))
+        self._back.clear()
+        self._back_aggregates = ()
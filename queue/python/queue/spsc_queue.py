@@ -0,0 +1,173 @@
+"""
+    Single-producer/single-consumer ring buffer Queue implementation in python lang
+"""
+
+from collections.abc import Iterable, Iterator, Sequence
+from typing import Optional, Self, TypeVar, override
+
+from queue.empty_queue_exception import EmptyQueueException
+from queue.full_queue_exception import FullQueueException
+from queue.queue import Queue
+
+E = TypeVar("E")
+
+
+class SPSCQueue(Queue[E]):
+    """
+    A bounded FIFO queue for exactly one producer thread and one consumer thread.
+    Slots are preallocated in a list of `max_capacity` entries, a power of two so
+    positions wrap with a bit mask. The producer alone writes `_tail`, the consumer
+    alone writes `_head`, so neither side takes a lock: each element is stored in
+    its slot before the index that publishes it moves, and the GIL keeps those
+    writes ordered. On free-threaded builds use `BlockingQueue` instead.
+
+    `clear` belongs to the consumer side: call it from the consumer thread.
+    """
+
+    _slots: list[Optional[E]]
+    _mask: int
+    _head: int
+    _tail: int
+
+    def __init__(self, *, max_capacity: int) -> None:
+        if max_capacity < 1 or max_capacity & (max_capacity - 1):
+            raise ValueError("max_capacity must be a power of two")
+
+        self._max_capacity = max_capacity
+        self._slots = [None] * max_capacity
+        self._mask = max_capacity - 1
+        self._head = 0
+        self._tail = 0
+
+    @classmethod
+    @override
+    def from_sequence(cls, sequence: Sequence[E], *, max_capacity: Optional[int] = None) -> Self:
+        """
+        :raises ValueError: if `max_capacity` is missing, isn't a power of two, or is less than the length of `sequence`
+        """
+        if max_capacity is None:
+            raise ValueError("An SPSCQueue needs a max_capacity, a power of two")
+
+        return super().from_sequence(sequence, max_capacity=max_capacity)
+
+    @property
+    @override
+    def max_capacity(self) -> int:
+        """Number of preallocated slots, fixed at construction"""
+        return self._max_capacity  # type: ignore
+
+    @override
+    def enqueue(self, element: E) -> None:
+        tail = self._tail
+        if tail - self._head == self._max_capacity:
+            raise FullQueueException()
+
+        self._slots[tail & self._mask] = element
+        self._tail = tail + 1
+
+    def try_enqueue(self, element: E) -> bool:
+        """Enqueues `element` if there's a free slot
+
+        :returns: `True` if it was enqueued, `False` if the queue is full
+        :rtype: bool
+        """
+        tail = self._tail
+        if tail - self._head == self._max_capacity:
+            return False
+
+        self._slots[tail & self._mask] = element
+        self._tail = tail + 1
+
+        return True
+
+    @override
+    def enqueue_many(self, elements: Iterable[E]) -> None:
+        """Enqueues all `elements` in order, publishing them to the consumer at once
+
+        :raises FullQueueException: if the batch doesn't fit, in which case nothing is enqueued
+        """
+        elements = list(elements)
+        tail = self._tail
+        if tail - self._head + len(elements) > self._max_capacity:  # type: ignore
+            raise FullQueueException()
+
+        slots, mask = self._slots, self._mask
+        for index, element in enumerate(elements, tail):
+            slots[index & mask] = element
+        self._tail = tail + len(elements)
+
+    @override
+    def dequeue(self) -> E:
+        head = self._head
+        if head == self._tail:
+            raise EmptyQueueException()
+
+        index = head & self._mask
+        item = self._slots[index]
+        self._slots[index] = None
+        self._head = head + 1
+
+        return item  # type: ignore
+
+    @override
+    def try_dequeue(self) -> Optional[E]:
+        head = self._head
+        if head == self._tail:
+            return None
+
+        index = head & self._mask
+        item = self._slots[index]
+        self._slots[index] = None
+        self._head = head + 1
+
+        return item
+
+    @override
+    def dequeue_many(self, n: int) -> list[E]:
+        """Dequeues the first `n` elements, releasing their slots to the producer at once
+
+        :raises ValueError: if `n` is negative or greater than the number of elements in queue
+        """
+        if n < 0:
+            raise ValueError("n must be a non-negative integer")
+        head = self._head
+        if n > self._tail - head:
+            raise ValueError(f"Your value for n should be less or equal to {self._tail - head}")
+
+        slots, mask = self._slots, self._mask
+        items: list[E] = []
+        for position in range(head, head + n):
+            index = position & mask
+            items.append(slots[index])  # type: ignore
+            slots[index] = None
+        self._head = head + n
+
+        return items
+
+    @property
+    @override
+    def peek(self) -> E:
+        head = self._head
+        if head == self._tail:
+            raise EmptyQueueException()
+
+        return self._slots[head & self._mask]  # type: ignore
+
+    @override
+    def clear(self) -> None:
+        """Clears queue elements. Consumer side only."""
+        self.dequeue_many(self._tail - self._head)
+
+    @override
+    def __len__(self) -> int:
+        return self._tail - self._head
+
+    @override
+    def __contains__(self, item: object) -> bool:
+        return any(element == item for element in self)
+
+    @override
+    def __iter__(self) -> Iterator[E]:
+        head, tail, mask = self._head, self._tail, self._mask
+
+        return iter([self._slots[position & mask] for position in range(head, tail)])  # type: ignore
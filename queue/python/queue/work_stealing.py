@@ -0,0 +1,350 @@
+"""
+    Work-stealing deque and executor implementation in python lang
+"""
+
+import multiprocessing
+import random
+import threading
+from collections.abc import Callable, Iterable, Iterator
+from concurrent.futures import Future
+from itertools import count
+from multiprocessing.connection import Connection
+from typing import Any, Literal, Optional, TypeVar, override
+
+from queue.empty_queue_exception import EmptyQueueException
+from queue.queue import Queue
+
+E = TypeVar("E")
+R = TypeVar("R")
+
+
+class WorkStealingDeque(Queue[E]):
+    """
+    A deque shared by one owner and many thieves. The owner pushes and pops at the
+    bottom, LIFO like a Stack, which keeps the most recent (and cache-warm) work
+    local. Thieves steal at the top, FIFO like a Queue, taking the oldest and
+    usually largest tasks.
+
+    On CPython each `deque` append/pop/popleft is atomic, so the owner and the
+    thieves never need a lock: an empty deque is detected by the failed pop itself.
+    `enqueue` and `dequeue` are the owner's `push` and a thief's `steal`. It's
+    unbounded, since checking a capacity would need that lock.
+    """
+
+    def __init__(self, *, max_capacity: Optional[int] = None) -> None:
+        """
+        :param max_capacity: only accepted as `None`, for `from_sequence`
+        :raises ValueError: if `max_capacity` is given
+        """
+        if max_capacity is not None:
+            raise ValueError("A WorkStealingDeque is unbounded")
+
+        super().__init__()
+
+    @property
+    @override
+    def max_capacity(self) -> Optional[int]:
+        return None
+
+    @max_capacity.setter
+    @override
+    def max_capacity(self, new_capacity: Optional[int]) -> None:
+        """
+        :raises ValueError: if `new_capacity` isn't `None`
+        """
+        if new_capacity is not None:
+            raise ValueError("A WorkStealingDeque is unbounded")
+
+    def push(self, element: E) -> None:
+        """Owner side: adds `element` at the bottom"""
+        self._internal_deque.append(element)
+
+    def pop(self) -> E:
+        """Owner side: removes the most recently pushed element
+
+        :raises EmptyQueueException: if the deque is empty
+        """
+        try:
+            return self._internal_deque.pop()
+        except IndexError:
+            raise EmptyQueueException() from None
+
+    def try_pop(self) -> Optional[E]:
+        try:
+            return self._internal_deque.pop()
+        except IndexError:
+            return None
+
+    def steal(self) -> E:
+        """Thief side: removes the oldest element
+
+        :raises EmptyQueueException: if the deque is empty
+        """
+        try:
+            return self._internal_deque.popleft()
+        except IndexError:
+            raise EmptyQueueException() from None
+
+    def try_steal(self) -> Optional[E]:
+        try:
+            return self._internal_deque.popleft()
+        except IndexError:
+            return None
+
+    @override
+    def enqueue(self, element: E) -> None:
+        self._internal_deque.append(element)
+
+    @override
+    def dequeue(self) -> E:
+        return self.steal()
+
+    @override
+    def try_dequeue(self) -> Optional[E]:
+        return self.try_steal()
+
+
+_Task = tuple[Future[Any], Callable[..., Any], tuple[Any, ...], dict[str, Any]]
+
+
+class WorkStealingExecutor:
+    """
+    Runs tasks on `workers` threads, each owning a `WorkStealingDeque`.
+
+    Tasks submitted from a worker go to the bottom of its own deque, others are
+    spread round-robin. A worker runs its own newest task first and, when out of
+    work, steals the oldest task of a randomly chosen victim. `join(future)` from
+    a worker keeps running tasks while it waits, so recursive fork/join code never
+    blocks a worker thread.
+
+    With `mode="process"` each worker thread hands its tasks to a dedicated child
+    process over a pipe, for CPU-bound work the GIL would serialize. Tasks and
+    results must then be picklable, and tasks can't submit subtasks themselves.
+    """
+
+    _deques: list[WorkStealingDeque[_Task]]
+    _threads: list[threading.Thread]
+    _connections: list[Connection]
+    _processes: list[multiprocessing.Process]
+    _local: threading.local
+    _submissions: Iterator[int]
+    _pending: int
+    _pending_lock: threading.Lock
+    _all_done: threading.Condition
+    _work_available: threading.Condition
+    _idle_workers: int
+    # Signals from `submit` to idle workers not consumed yet, at most one per idle worker
+    _wakeups: int
+    _shutdown: bool
+
+    def __init__(self, workers: Optional[int] = None, *, mode: Literal["thread", "process"] = "thread") -> None:
+        """
+        :param workers: number of worker threads, and processes in process mode, the CPU count by default
+        :param mode: "thread" to run tasks in the worker threads, "process" to run them in child processes
+        """
+        workers = workers or multiprocessing.cpu_count()
+        if workers < 1:
+            raise ValueError("workers must be positive")
+        if mode not in ("thread", "process"):
+            raise ValueError(f"Unknown mode {mode!r}")
+
+        self._deques = [WorkStealingDeque() for _ in range(workers)]
+        self._local = threading.local()
+        self._submissions = count()
+        self._pending = 0
+        self._pending_lock = threading.Lock()
+        self._all_done = threading.Condition(self._pending_lock)
+        self._work_available = threading.Condition()
+        self._idle_workers = 0
+        self._wakeups = 0
+        self._shutdown = False
+
+        # Processes are started before any worker thread, so forking copies no running thread.
+        self._connections = []
+        self._processes = []
+        if mode == "process":
+            for _ in range(workers):
+                parent, child = multiprocessing.Pipe()
+                process = multiprocessing.Process(target=_serve, args=(child,), daemon=True)
+                process.start()
+                child.close()
+                self._connections.append(parent)
+                self._processes.append(process)
+
+        self._threads = [
+            threading.Thread(target=self._work, args=(index,), daemon=True) for index in range(workers)
+        ]
+        for thread in self._threads:
+            thread.start()
+
+    def submit(self, function: Callable[..., R], *args: Any, **kwargs: Any) -> Future[R]:
+        """Schedules `function(*args, **kwargs)`
+
+        :returns: a future for its result, to wait on with `join`
+        :raises RuntimeError: if the executor was shut down
+        """
+        if self._shutdown:
+            raise RuntimeError("Cannot submit to a shut down executor")
+
+        future: Future[R] = Future()
+        with self._pending_lock:
+            self._pending += 1
+
+        index = getattr(self._local, "index", None)
+        if index is None:
+            index = next(self._submissions) % len(self._deques)
+        self._deques[index].push((future, function, args, kwargs))
+
+        # Read without the lock: a worker that isn't counted yet looks at the deques once more after it is.
+        if self._idle_workers:
+            with self._work_available:
+                self._wakeups = min(self._wakeups + 1, self._idle_workers)
+                self._work_available.notify()
+
+        return future
+
+    def map(self, function: Callable[..., R], *iterables: Iterable[Any]) -> Iterator[R]:
+        """Submits `function` for each tuple of arguments drawn from `iterables`
+
+        :returns: the results, in the order of the arguments
+        """
+        futures = [self.submit(function, *args) for args in zip(*iterables)]
+
+        return (self.join(future) for future in futures)
+
+    def join(self, future: Optional[Future[R]] = None) -> Optional[R]:
+        """Waits for `future` and returns its result, or for every submitted task if `future` is `None`.
+        Called from a worker, it runs other tasks while waiting instead of blocking.
+
+        :raises: the exception raised by the task of `future`
+        """
+        index = getattr(self._local, "index", None)
+
+        if future is None:
+            if index is not None:
+                raise RuntimeError("join() without a future would wait for the calling task itself")
+            with self._all_done:
+                self._all_done.wait_for(lambda: self._pending == 0)
+            return None
+
+        if index is not None:
+            future.add_done_callback(lambda _: self._wake_idle_workers())
+            while not future.done():
+                task = self._find_task(index)
+                if task is None:
+                    task = self._wait_for_task(index, future.done)
+                if task is not None:
+                    self._run(index, task)
+
+        return future.result()
+
+    def shutdown(self, wait: bool = True) -> None:
+        """Stops the workers once every submitted task ran
+
+        :param wait: waits for the workers (and processes) to stop
+        """
+        self._shutdown = True
+        self._wake_idle_workers()
+
+        if wait:
+            for thread in self._threads:
+                thread.join()
+            for connection, process in zip(self._connections, self._processes):
+                connection.send(None)
+                process.join()
+                connection.close()
+
+    def __enter__(self) -> "WorkStealingExecutor":
+        return self
+
+    def __exit__(self, *_: object) -> None:
+        self.shutdown()
+
+    def _find_task(self, index: int) -> Optional[_Task]:
+        """The newest task of the worker's own deque, or the oldest of a random victim"""
+        task = self._deques[index].try_pop()
+        if task is not None:
+            return task
+
+        workers = len(self._deques)
+        start = random.randrange(workers)
+        for offset in range(workers):
+            victim = (start + offset) % workers
+            if victim != index:
+                task = self._deques[victim].try_steal()
+                if task is not None:
+                    return task
+
+        return None
+
+    def _wait_for_task(self, index: int, done: Callable[[], bool]) -> Optional[_Task]:
+        """Sleeps until `submit` signals a task, then finds it, or until `done()`, returning `None`.
+        `done` must only become true along with a call to `_wake_idle_workers`.
+        """
+        work_available = self._work_available
+        with work_available:
+            self._idle_workers += 1
+        try:
+            # Looked for once more after being counted idle: a task submitted from now on signals.
+            while (task := self._find_task(index)) is None:
+                with work_available:
+                    while not self._wakeups and not done():
+                        work_available.wait()
+                    if not self._wakeups:
+                        return None
+                    self._wakeups -= 1
+
+            return task
+        finally:
+            with work_available:
+                self._idle_workers -= 1
+
+    def _wake_idle_workers(self) -> None:
+        with self._work_available:
+            self._work_available.notify_all()
+
+    def _work(self, index: int) -> None:
+        self._local.index = index
+        while True:
+            task = self._find_task(index)
+            if task is None:
+                task = self._wait_for_task(index, lambda: self._shutdown and self._pending == 0)
+                if task is None:
+                    return
+            self._run(index, task)
+
+    def _run(self, index: int, task: _Task) -> None:
+        future, function, args, kwargs = task
+        if future.set_running_or_notify_cancel():
+            try:
+                if self._connections:
+                    connection = self._connections[index]
+                    connection.send((function, args, kwargs))
+                    succeeded, outcome = connection.recv()
+                else:
+                    succeeded, outcome = True, function(*args, **kwargs)
+            except BaseException as error:
+                succeeded, outcome = False, error
+
+            if succeeded:
+                future.set_result(outcome)
+            else:
+                future.set_exception(outcome)
+
+        with self._all_done:
+            self._pending -= 1
+            finished = self._pending == 0
+            if finished:
+                self._all_done.notify_all()
+        if finished and self._shutdown:
+            self._wake_idle_workers()
+
+
+def _serve(connection: Connection) -> None:
+    """Child process loop of the process mode: runs each received task and sends back its outcome"""
+    while (task := connection.recv()) is not None:
+        function, args, kwargs = task
+        try:
+            connection.send((True, function(*args, **kwargs)))
+        except BaseException as error:
+            connection.send((False, error))
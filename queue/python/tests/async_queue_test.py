@@ -0,0 +1,124 @@
+import asyncio
+import unittest
+
+from queue.async_queue import AsyncQueue
+from queue.empty_queue_exception import EmptyQueueException
+from queue.full_queue_exception import FullQueueException
+from queue.queue import Queue
+
+
+class TestAsyncQueue(unittest.IsolatedAsyncioTestCase):
+    async def test_is_instance(self):
+        async_queue = AsyncQueue[int]()
+
+        self.assertIsInstance(async_queue, AsyncQueue)
+        self.assertIsInstance(async_queue, Queue)
+
+    async def test_nowait_raises(self):
+        async_queue = AsyncQueue[int](max_capacity=1)
+
+        self.assertRaises(EmptyQueueException, async_queue.get_nowait)
+
+        async_queue.put_nowait(1)
+
+        self.assertRaises(FullQueueException, async_queue.put_nowait, 2)
+        self.assertEqual(async_queue.get_nowait(), 1)
+
+    async def test_get_suspends_until_put(self):
+        async_queue = AsyncQueue[str]()
+
+        getter = asyncio.create_task(async_queue.get())
+        await asyncio.sleep(0)
+        self.assertFalse(getter.done())
+
+        await async_queue.put("hello")
+
+        self.assertEqual(await getter, "hello")
+
+    async def test_put_suspends_while_full(self):
+        async_queue = AsyncQueue[int](max_capacity=1)
+        await async_queue.put(1)
+
+        putter = asyncio.create_task(async_queue.put(2))
+        await asyncio.sleep(0)
+        self.assertFalse(putter.done())
+
+        self.assertEqual(await async_queue.get(), 1)
+        await putter
+
+        self.assertEqual(async_queue.get_nowait(), 2)
+
+    async def test_cancelled_getter_does_not_lose_elements(self):
+        async_queue = AsyncQueue[int]()
+
+        first = asyncio.create_task(async_queue.get_many(10))
+        second = asyncio.create_task(async_queue.get_many(10))
+        await asyncio.sleep(0)
+
+        async_queue.put_nowait(1)
+        first.cancel()
+
+        self.assertListEqual(await second, [1])
+        with self.assertRaises(asyncio.CancelledError):
+            await first
+
+    async def test_get_many(self):
+        async_queue = AsyncQueue[int].from_sequence([1, 2, 3, 4, 5], max_capacity=5)
+
+        self.assertListEqual(await async_queue.get_many(2), [1, 2])
+        self.assertListEqual(await async_queue.get_many(10), [3, 4, 5])
+
+        with self.assertRaises(ValueError):
+            await async_queue.get_many(0)
+
+    async def test_batches_wake_waiters(self):
+        async_queue = AsyncQueue[int](max_capacity=2)
+
+        getters = [asyncio.create_task(async_queue.get()) for _ in range(2)]
+        await asyncio.sleep(0)
+        async_queue.enqueue_many([1, 2])
+        self.assertListEqual(sorted(await asyncio.gather(*getters)), [1, 2])
+
+        async_queue.enqueue_many([3, 4])
+        putter = asyncio.create_task(async_queue.put(5))
+        await asyncio.sleep(0)
+        self.assertListEqual(async_queue.dequeue_many(2), [3, 4])
+        await putter
+        self.assertEqual(async_queue.get_nowait(), 5)
+
+    async def test_async_for(self):
+        async_queue = AsyncQueue[int](max_capacity=4)
+        received: list[int] = []
+
+        async def consume() -> None:
+            async for item in async_queue:
+                received.append(item)
+                if item == 99:
+                    return
+
+        consumer = asyncio.create_task(consume())
+
+        for item in range(100):
+            await async_queue.put(item)
+
+        await consumer
+
+        self.assertListEqual(received, list(range(100)))
+
+    async def test_many_concurrent_consumers(self):
+        async_queue = AsyncQueue[int](max_capacity=64)
+        consumers_count = 2_000
+
+        consumers = [asyncio.create_task(async_queue.get()) for _ in range(consumers_count)]
+
+        for item in range(consumers_count):
+            await async_queue.put(item)
+
+        results = await asyncio.gather(*consumers)
+
+        self.assertListEqual(sorted(results), list(range(consumers_count)))
+        self.assertTrue(async_queue.is_empty)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,117 @@
+import threading
+import time
+import unittest
+
+from queue.batching import BatchStats, batches, consume_batches
+from queue.blocking_queue import BlockingQueue
+from queue.delay_queue import DelayQueue
+from queue.queue import Queue
+
+
+class TestBatches(unittest.TestCase):
+    def test_plain_queue_is_batched_until_empty(self):
+        queue = Queue[int].from_sequence(range(10))
+        stats = BatchStats()
+        self.assertListEqual(list(queue.batches(4, stats=stats)), [[0, 1, 2, 3], [4, 5, 6, 7], [8, 9]])
+        self.assertTrue(queue.is_empty)
+        self.assertEqual(stats.batches, 3)
+        self.assertEqual(stats.elements, 10)
+        self.assertDictEqual(stats.flushes, {"size": 2, "bytes": 0, "linger": 0, "close": 1})
+        self.assertEqual(stats.as_dict()["sizes"]["le_2"], 1)
+        self.assertEqual(stats.as_dict()["sizes"]["le_4"], 2)
+        self.assertRaises(ValueError, queue.batches, 0)
+        self.assertRaises(ValueError, batches, queue, 1, max_bytes=0)
+        self.assertRaises(ValueError, batches, queue, 1, max_linger=-1)
+
+    def test_max_bytes(self):
+        queue = Queue[bytes].from_sequence([b"aaa", b"bb", b"c", b"dddddd", b"ee"])
+        stats = BatchStats()
+        self.assertListEqual(
+            list(queue.batches(10, max_bytes=4, stats=stats)), [[b"aaa"], [b"bb", b"c"], [b"dddddd"], [b"ee"]]
+        )
+        self.assertEqual(stats.bytes, 14)
+        self.assertEqual(stats.flushes["bytes"], 3)
+
+    def test_linger_yields_partial_batches(self):
+        queue = BlockingQueue[int]()
+        queue.enqueue_many([1, 2])
+        stream = queue.batches(100, max_linger=0.02)
+        start = time.monotonic()
+        self.assertListEqual(next(stream), [1, 2])
+        self.assertGreaterEqual(time.monotonic() - start, 0.02)
+        queue.put(3)
+        queue.close()
+        self.assertListEqual(list(stream), [[3]])
+
+    def test_waits_for_elements_until_closed(self):
+        queue = BlockingQueue[int](max_capacity=4)
+        produced = list(range(100))
+
+        def produce():
+            for element in produced:
+                queue.put(element)
+            queue.close()
+
+        producer = threading.Thread(target=produce)
+        producer.start()
+        consumed = [element for batch in queue.batches(8) for element in batch]
+        producer.join(timeout=1)
+        self.assertListEqual(consumed, produced)
+
+    def test_close_without_flush_discards_the_rest(self):
+        queue = BlockingQueue[int]()
+        queue.enqueue_many([1, 2, 3, 4, 5])
+        queue.close()
+        stats = BatchStats()
+        self.assertListEqual(list(queue.batches(2, flush_on_close=False, stats=stats)), [[1, 2], [3, 4]])
+        self.assertEqual(stats.discarded, 1)
+
+    def test_delay_queue_batches_wait_for_deadlines(self):
+        queue = DelayQueue[int].from_sequence([1, 2, 3])
+        self.assertListEqual(list(queue.batches(2)), [[1, 2], [3]])
+        queue.enqueue(4)
+        queue.enqueue(5, delay=0.02)
+        queue.enqueue(6, delay=10)
+        timer = queue.enqueue(7, delay=10)
+        stream = queue.batches(10, max_linger=0.05)
+        start = time.monotonic()
+        self.assertListEqual(next(stream), [4, 5])
+        self.assertGreaterEqual(time.monotonic() - start, 0.02)
+        queue.cancel(timer)
+        self.assertEqual(len(queue), 1)
+
+
+class TestConsumeBatches(unittest.TestCase):
+    def test_workers_get_every_batch(self):
+        queue = BlockingQueue[int]()
+        queue.enqueue_many(range(1000))
+        queue.close()
+        consumed: list[int] = []
+        lock = threading.Lock()
+
+        def sink(batch):
+            time.sleep(0.001)
+            with lock:
+                consumed.extend(batch)
+
+        stats = consume_batches(queue, sink, 64, workers=4, max_in_flight=2)
+        self.assertListEqual(sorted(consumed), list(range(1000)))
+        self.assertEqual(stats.batches, 16)
+        self.assertEqual(stats.flushes["size"], 15)
+        self.assertRaises(ValueError, consume_batches, queue, sink, 1, workers=0)
+
+    def test_sink_error_stops_consumption(self):
+        queue = BlockingQueue[int]()
+        queue.enqueue_many(range(100))
+        queue.close()
+
+        def sink(batch):
+            raise RuntimeError(batch[0])
+
+        with self.assertRaises(RuntimeError):
+            consume_batches(queue, sink, 10, max_in_flight=1)
+        self.assertGreater(len(queue), 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,197 @@
+import threading
+import unittest
+
+from queue.blocking_queue import BlockingQueue
+from queue.closed_queue_exception import ClosedQueueException
+from queue.empty_queue_exception import EmptyQueueException
+from queue.full_queue_exception import FullQueueException
+from queue.queue import Queue
+
+
+class TestBlockingQueue(unittest.TestCase):
+    def test_is_instance(self):
+        blocking_queue = BlockingQueue[int]()
+
+        self.assertIsInstance(blocking_queue, BlockingQueue)
+        self.assertIsInstance(blocking_queue, Queue)
+
+    def test_put_nowait_rejects_instead_of_evicting(self):
+        blocking_queue = BlockingQueue[int](max_capacity=2)
+
+        blocking_queue.put_nowait(1)
+        blocking_queue.put_nowait(2)
+
+        self.assertTrue(blocking_queue.is_full)
+        self.assertRaises(FullQueueException, blocking_queue.put_nowait, 3)
+        self.assertRaises(FullQueueException, blocking_queue.enqueue, 3)
+        self.assertEqual(blocking_queue.get_nowait(), 1)
+
+    def test_timeouts(self):
+        blocking_queue = BlockingQueue[int](max_capacity=1)
+
+        self.assertRaises(EmptyQueueException, blocking_queue.get, timeout=0.01)
+
+        blocking_queue.put(1)
+
+        self.assertRaises(FullQueueException, blocking_queue.put, 2, timeout=0.01)
+        self.assertEqual(blocking_queue.get(timeout=0.01), 1)
+        self.assertRaises(EmptyQueueException, blocking_queue.get_nowait)
+
+    def test_put_blocks_until_a_slot_is_free(self):
+        blocking_queue = BlockingQueue[int](max_capacity=1)
+        blocking_queue.put(1)
+
+        producer = threading.Thread(target=blocking_queue.put, args=(2,))
+        producer.start()
+        producer.join(timeout=0.05)
+        self.assertTrue(producer.is_alive())
+
+        self.assertEqual(blocking_queue.get(), 1)
+        producer.join(timeout=1)
+
+        self.assertFalse(producer.is_alive())
+        self.assertEqual(blocking_queue.get_nowait(), 2)
+
+    def test_get_many(self):
+        blocking_queue = BlockingQueue[int].from_sequence([1, 2, 3, 4, 5])
+
+        self.assertListEqual(blocking_queue.get_many(3), [1, 2, 3])
+        self.assertListEqual(blocking_queue.get_many(10), [4, 5])
+        self.assertListEqual(blocking_queue.get_many(10, timeout=0.01), [])
+        self.assertRaises(ValueError, blocking_queue.get_many, 0)
+
+    def test_batches_keep_join_accounting(self):
+        blocking_queue = BlockingQueue[int](max_capacity=3)
+
+        blocking_queue.enqueue_many([1, 2])
+        self.assertRaises(FullQueueException, blocking_queue.enqueue_many, [3, 4])
+        self.assertListEqual(blocking_queue.dequeue_many(2), [1, 2])
+
+        blocking_queue.task_done()
+        blocking_queue.task_done()
+        blocking_queue.join()
+
+    def test_task_done_and_join(self):
+        blocking_queue = BlockingQueue[int]()
+        results: list[int] = []
+
+        def consume() -> None:
+            while True:
+                item = blocking_queue.get()
+                results.append(item)
+                blocking_queue.task_done()
+
+        threading.Thread(target=consume, daemon=True).start()
+
+        for item in range(100):
+            blocking_queue.put(item)
+
+        blocking_queue.join()
+
+        self.assertListEqual(results, list(range(100)))
+        self.assertRaises(ValueError, blocking_queue.task_done)
+
+    def test_many_producers_and_consumers_lose_nothing(self):
+        blocking_queue = BlockingQueue[int](max_capacity=8)
+        per_producer = 500
+        producers_count = 4
+        consumed: list[int] = []
+        consumed_lock = threading.Lock()
+
+        def produce(offset: int) -> None:
+            for item in range(offset, offset + per_producer):
+                blocking_queue.put(item)
+
+        def consume() -> None:
+            while True:
+                batch = blocking_queue.get_many(16)
+                if None in batch:
+                    with consumed_lock:
+                        consumed.extend(item for item in batch if item is not None)
+                    return
+                with consumed_lock:
+                    consumed.extend(batch)
+
+        consumer = threading.Thread(target=consume)
+        consumer.start()
+        producers = [
+            threading.Thread(target=produce, args=(index * per_producer,))
+            for index in range(producers_count)
+        ]
+        for producer in producers:
+            producer.start()
+        for producer in producers:
+            producer.join()
+
+        blocking_queue.put(None)  # type: ignore
+        consumer.join(timeout=5)
+
+        self.assertListEqual(sorted(consumed), list(range(per_producer * producers_count)))
+
+    def test_growing_max_capacity_wakes_producers(self):
+        blocking_queue = BlockingQueue[int](max_capacity=1)
+        blocking_queue.put(1)
+
+        producer = threading.Thread(target=blocking_queue.put, args=(2,))
+        producer.start()
+        producer.join(timeout=0.05)
+        self.assertTrue(producer.is_alive())
+
+        blocking_queue.max_capacity = 2
+        producer.join(timeout=1)
+
+        self.assertFalse(producer.is_alive())
+        self.assertEqual(len(blocking_queue), 2)
+
+    def test_close_wakes_waiting_consumers(self):
+        blocking_queue = BlockingQueue[int]()
+        blocking_queue.put(1)
+        errors = []
+
+        def consume():
+            try:
+                blocking_queue.get()
+            except EmptyQueueException as error:
+                errors.append(error)
+
+        consumer = threading.Thread(target=consume)
+        blocking_queue.close()
+        self.assertTrue(blocking_queue.closed)
+        self.assertEqual(blocking_queue.get(), 1)
+        consumer.start()
+        consumer.join(timeout=1)
+
+        self.assertFalse(consumer.is_alive())
+        self.assertEqual(len(errors), 1)
+        self.assertRaises(EmptyQueueException, blocking_queue.get, timeout=10)
+
+    def test_close_rejects_and_wakes_producers(self):
+        blocking_queue = BlockingQueue[int](max_capacity=1)
+        blocking_queue.put(1)
+        errors = []
+
+        def produce():
+            try:
+                blocking_queue.put(2)
+            except ClosedQueueException as error:
+                errors.append(error)
+
+        producer = threading.Thread(target=produce)
+        producer.start()
+        producer.join(timeout=0.05)
+        self.assertTrue(producer.is_alive())
+
+        blocking_queue.close()
+        producer.join(timeout=1)
+
+        self.assertFalse(producer.is_alive())
+        self.assertEqual(len(errors), 1)
+        self.assertIsInstance(errors[0], FullQueueException)
+        self.assertEqual(blocking_queue.get(), 1)
+        self.assertRaises(ClosedQueueException, blocking_queue.put_nowait, 3)
+        self.assertRaises(ClosedQueueException, blocking_queue.enqueue_many, [3])
+        self.assertTrue(blocking_queue.is_empty)
+
+
+if __name__ == "__main__":
+    unittest.main()
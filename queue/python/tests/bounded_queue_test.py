@@ -0,0 +1,100 @@
+import threading
+import unittest
+
+from queue.bounded_queue import BoundedQueue, OverflowPolicy
+from queue.empty_queue_exception import EmptyQueueException
+from queue.full_queue_exception import FullQueueException
+from queue.queue import Queue
+
+
+class TestBoundedQueue(unittest.TestCase):
+    def test_is_instance(self):
+        self.assertIsInstance(BoundedQueue[int](max_capacity=1), Queue)
+        self.assertRaises(ValueError, BoundedQueue, max_capacity=0)
+        self.assertRaises(ValueError, BoundedQueue, max_capacity=1, overflow_policy=OverflowPolicy.SPILL)
+
+    def test_fifo_across_the_ring(self):
+        queue = BoundedQueue[int](max_capacity=3)
+        queue.enqueue_many([1, 2])
+        self.assertEqual(queue.dequeue(), 1)
+        queue.enqueue_many([3, 4])
+        self.assertTrue(queue.is_full)
+        self.assertListEqual(list(queue), [2, 3, 4])
+        self.assertIn(4, queue)
+        self.assertEqual(queue.peek, 2)
+        self.assertListEqual(queue.dequeue_many(2), [2, 3])
+        self.assertEqual(queue.try_dequeue(), 4)
+        self.assertIsNone(queue.try_dequeue())
+        self.assertRaises(EmptyQueueException, queue.dequeue)
+        self.assertRaises(ValueError, queue.dequeue_many, 1)
+
+    def test_from_sequence_needs_a_capacity(self):
+        queue = BoundedQueue[int].from_sequence([1, 2], max_capacity=3)
+        self.assertListEqual(list(queue), [1, 2])
+        self.assertEqual(queue.max_capacity, 3)
+        self.assertRaises(ValueError, BoundedQueue[int].from_sequence, [1, 2])
+
+    def test_reject(self):
+        queue = BoundedQueue[int](max_capacity=2)
+        queue.enqueue_many([1, 2])
+        self.assertRaises(FullQueueException, queue.enqueue, 3)
+        self.assertRaises(FullQueueException, queue.enqueue_many, [3, 4])
+        self.assertListEqual(list(queue), [1, 2])
+        self.assertEqual(queue.overflows["reject"], 3)
+
+    def test_drop_oldest(self):
+        queue = BoundedQueue[int](max_capacity=2, overflow_policy=OverflowPolicy.DROP_OLDEST)
+        queue.enqueue_many([1, 2, 3])
+        queue.enqueue(4)
+        self.assertListEqual(list(queue), [3, 4])
+        self.assertEqual(queue.overflows["drop_oldest"], 2)
+
+    def test_drop_newest(self):
+        queue = BoundedQueue[int](max_capacity=2, overflow_policy=OverflowPolicy.DROP_NEWEST)
+        queue.enqueue_many([1, 2, 3])
+        queue.enqueue(4)
+        self.assertListEqual(list(queue), [1, 2])
+        self.assertEqual(queue.overflows["drop_newest"], 2)
+
+    def test_spill(self):
+        spilled: list[int] = []
+        queue = BoundedQueue[int](max_capacity=1, overflow_policy=OverflowPolicy.SPILL, spill=spilled.append)
+        queue.enqueue_many([1, 2, 3])
+        self.assertListEqual(list(queue), [1])
+        self.assertListEqual(spilled, [2, 3])
+        self.assertEqual(queue.overflows["spill"], 2)
+
+    def test_block(self):
+        queue = BoundedQueue[int](max_capacity=1, overflow_policy=OverflowPolicy.BLOCK)
+        queue.enqueue(1)
+        self.assertRaises(FullQueueException, queue.enqueue, 2, timeout=0.01)
+        self.assertEqual(queue.overflows["block"], 1)
+
+        producer = threading.Thread(target=queue.enqueue, args=(2,))
+        producer.start()
+        self.assertEqual(queue.dequeue(), 1)
+        producer.join(timeout=1)
+        self.assertFalse(producer.is_alive())
+        self.assertListEqual(list(queue), [2])
+
+    def test_resize_keeps_order(self):
+        queue = BoundedQueue[int](max_capacity=3)
+        queue.enqueue_many([0, 1, 2])
+        queue.dequeue()
+        queue.enqueue(3)
+
+        queue.max_capacity = 5
+        queue.enqueue_many([4, 5])
+        self.assertListEqual(list(queue), [1, 2, 3, 4, 5])
+        self.assertEqual(len(queue._slots), 5)
+        self.assertRaises(ValueError, setattr, queue, "max_capacity", 4)
+        self.assertRaises(ValueError, setattr, queue, "max_capacity", None)
+
+        queue.clear()
+        queue.max_capacity = 1
+        self.assertTrue(queue.is_empty)
+        self.assertEqual(queue.max_capacity, 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,107 @@
+import threading
+import unittest
+
+from queue.bounded_queue import OverflowPolicy
+from queue.broadcast_queue import BroadcastQueue
+from queue.empty_queue_exception import EmptyQueueException
+from queue.full_queue_exception import FullQueueException
+
+
+class TestBroadcastQueue(unittest.TestCase):
+    def test_every_subscriber_gets_every_element(self):
+        queue = BroadcastQueue[int](max_capacity=4)
+        self.assertRaises(ValueError, BroadcastQueue, max_capacity=0)
+        self.assertRaises(ValueError, BroadcastQueue, max_capacity=1, overflow_policy=OverflowPolicy.SPILL)
+        queue.enqueue(0)
+        first, second = queue.subscribe(), queue.subscribe()
+        queue.enqueue_many([1, 2, 3])
+        self.assertEqual(len(queue), 3)
+        self.assertEqual(first.peek, 1)
+        self.assertEqual(first.dequeue(), 1)
+        self.assertListEqual(list(first), [2, 3])
+        late = queue.subscribe()
+        queue.enqueue(4)
+        self.assertListEqual(first.dequeue_many(3), [2, 3, 4])
+        self.assertListEqual(second.dequeue_many(4), [1, 2, 3, 4])
+        self.assertEqual(late.dequeue(), 4)
+        self.assertTrue(first.is_empty)
+        self.assertIsNone(second.try_dequeue())
+        self.assertRaises(EmptyQueueException, late.dequeue)
+        self.assertRaises(ValueError, late.dequeue_many, 1)
+        self.assertEqual(len(queue), 0)
+
+    def test_slots_are_reclaimed_by_the_slowest_subscriber(self):
+        queue = BroadcastQueue[object](max_capacity=4)
+        fast, slow = queue.subscribe(), queue.subscribe()
+        queue.enqueue_many(["a", "b", "c"])
+        fast.dequeue_many(3)
+        self.assertEqual(len(queue), 3)
+        slow.dequeue_many(2)
+        self.assertEqual(len(queue), 1)
+        self.assertListEqual(queue._slots, [None, None, "c", None])
+        slow.close()
+        self.assertTrue(slow.closed)
+        self.assertEqual(len(queue), 0)
+        self.assertListEqual(queue.subscribers, [fast])
+
+    def test_dequeue_many_bounds(self):
+        queue = BroadcastQueue[int](max_capacity=4)
+        subscriber = queue.subscribe()
+        queue.enqueue(1)
+        queue.enqueue(2)
+        subscriber.dequeue()
+        self.assertRaises(ValueError, subscriber.dequeue_many, -1)
+        self.assertListEqual(subscriber.dequeue_many(0), [])
+        self.assertListEqual(list(subscriber), [2])
+        self.assertEqual(len(subscriber), 1)
+        self.assertEqual(queue._at_head, 1)
+
+    def test_reject(self):
+        queue = BroadcastQueue[int](max_capacity=2, overflow_policy=OverflowPolicy.REJECT)
+        subscriber = queue.subscribe()
+        queue.enqueue_many([1, 2])
+        self.assertRaises(FullQueueException, queue.enqueue, 3)
+        self.assertRaises(FullQueueException, queue.enqueue_many, [3])
+        self.assertListEqual(list(subscriber), [1, 2])
+
+    def test_drop_oldest_reports_lag(self):
+        queue = BroadcastQueue[int](max_capacity=3, overflow_policy=OverflowPolicy.DROP_OLDEST)
+        fast, slow = queue.subscribe(), queue.subscribe()
+        for element in range(5):
+            queue.enqueue(element)
+            fast.dequeue()
+        queue.enqueue_many(range(5, 9))
+        self.assertListEqual(list(slow), [6, 7, 8])
+        self.assertEqual(slow.lag, 6)
+        self.assertListEqual(fast.dequeue_many(3), [6, 7, 8])
+        self.assertEqual(fast.lag, 1)
+
+    def test_block_waits_for_the_slowest_subscriber(self):
+        queue = BroadcastQueue[int](max_capacity=2)
+        subscriber = queue.subscribe()
+        queue.enqueue_many([1, 2])
+        self.assertRaises(FullQueueException, queue.enqueue, 3, timeout=0.01)
+        received: list[int] = []
+
+        def consume() -> None:
+            while len(received) < 102:
+                received.extend(subscriber.get_many(10, timeout=5))
+
+        consumer = threading.Thread(target=consume)
+        consumer.start()
+        queue.enqueue_many(range(3, 103), timeout=5)
+        consumer.join()
+        self.assertListEqual(received, list(range(1, 103)))
+
+    def test_get_stops_when_unsubscribed(self):
+        queue = BroadcastQueue[int](max_capacity=2)
+        subscriber = queue.subscribe()
+        self.assertRaises(EmptyQueueException, subscriber.get, timeout=0.01)
+        threading.Timer(0.01, queue.enqueue, [1]).start()
+        self.assertEqual(subscriber.get(timeout=5), 1)
+        threading.Timer(0.01, subscriber.close).start()
+        self.assertRaises(EmptyQueueException, subscriber.get)
+
+
+if __name__ == "__main__":
+    unittest.main()
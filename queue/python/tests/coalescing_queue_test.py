@@ -0,0 +1,76 @@
+import pickle
+import unittest
+from operator import itemgetter
+
+from queue.coalescing_queue import CoalescingQueue
+from queue.empty_queue_exception import EmptyQueueException
+from queue.full_queue_exception import FullQueueException
+from queue.queue import Queue
+
+
+class TestCoalescingQueue(unittest.TestCase):
+    def test_is_instance(self):
+        self.assertIsInstance(CoalescingQueue[str, str](), Queue)
+
+    def test_updates_replace_pending_ones_in_place(self):
+        queue = CoalescingQueue[str, tuple[str, int]](key=itemgetter(0))
+        queue.enqueue_many([("a", 1), ("b", 1), ("a", 2), ("c", 1), ("a", 3)])
+        self.assertEqual(len(queue), 3)
+        self.assertEqual(queue.coalesced, 2)
+        self.assertListEqual(list(queue), [("a", 3), ("b", 1), ("c", 1)])
+        self.assertIn(("a", 3), queue)
+        self.assertNotIn(("a", 1), queue)
+        self.assertTrue(queue.has_key("b"))
+        self.assertEqual(queue.get("c"), ("c", 1))
+        self.assertIsNone(queue.get("d"))
+        self.assertEqual(queue.peek, ("a", 3))
+        self.assertEqual(queue.dequeue(), ("a", 3))
+        queue.enqueue(("a", 4))
+        self.assertTupleEqual(queue.dequeue_item(), ("b", ("b", 1)))
+        self.assertListEqual(queue.dequeue_many(2), [("c", 1), ("a", 4)])
+        self.assertIsNone(queue.try_dequeue())
+        self.assertRaises(EmptyQueueException, queue.dequeue)
+        self.assertRaises(EmptyQueueException, queue.dequeue_item)
+        self.assertRaises(ValueError, queue.dequeue_many, 1)
+
+    def test_merge(self):
+        queue = CoalescingQueue[str, tuple[str, int]](
+            key=itemgetter(0), merge=lambda pending, new: (pending[0], pending[1] + new[1])
+        )
+        queue.enqueue_many([("hits", 1), ("misses", 1), ("hits", 5)])
+        self.assertListEqual(queue.dequeue_many(2), [("hits", 6), ("misses", 1)])
+
+    def test_remove(self):
+        queue = CoalescingQueue[int, int]()
+        queue.enqueue_many([1, 2, 3, 2])
+        self.assertEqual(queue.remove(2), 2)
+        self.assertRaises(KeyError, queue.remove, 2)
+        self.assertListEqual(list(queue), [1, 3])
+        queue.clear()
+        self.assertTrue(queue.is_empty)
+
+    def test_capacity_counts_keys(self):
+        queue = CoalescingQueue[int, int](max_capacity=2)
+        queue.enqueue_many([1, 2])
+        queue.enqueue(1)
+        self.assertTrue(queue.is_full)
+        self.assertRaises(FullQueueException, queue.enqueue, 3)
+        self.assertRaises(FullQueueException, queue.enqueue_many, [2, 3])
+        queue.enqueue_many([2, 1, 2])
+        self.assertListEqual(list(queue), [1, 2])
+        self.assertEqual(queue.coalesced, 4)
+        queue.max_capacity = 3
+        queue.enqueue(3)
+        self.assertRaises(ValueError, setattr, queue, "max_capacity", 1)
+
+    def test_pickle(self):
+        queue = CoalescingQueue[int, int](max_capacity=4)
+        queue.enqueue_many([1, 2, 1])
+        copy = pickle.loads(pickle.dumps(queue))
+        self.assertListEqual(list(copy), [1, 2])
+        self.assertEqual(copy.coalesced, 1)
+        self.assertEqual(copy.max_capacity, 4)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,67 @@
+import pickle
+import unittest
+
+from queue.compact_queue import INLINE_CAPACITY, CompactQueue
+from queue.empty_queue_exception import EmptyQueueException
+from queue.full_queue_exception import FullQueueException
+from queue.queue import Queue
+
+
+class TestCompactQueue(unittest.TestCase):
+    def test_is_instance(self):
+        queue = CompactQueue[int]()
+        self.assertIsInstance(queue, Queue)
+        self.assertFalse(hasattr(queue, "__dict__"))
+
+    def test_has_the_queue_api(self):
+        queue = CompactQueue[int].from_sequence(range(5))
+        self.assertListEqual([name for name in dir(Queue) if not name.startswith("_") and not hasattr(queue, name)], [])
+        self.assertListEqual(list(queue.batches(2)), [[0, 1], [2, 3], [4]])
+        self.assertTrue(queue.is_empty)
+
+    def test_fifo_across_storages(self):
+        for count in (0, 1, INLINE_CAPACITY, INLINE_CAPACITY + 1, 100):
+            queue = CompactQueue[int]()
+            for element in range(count):
+                queue.enqueue(element)
+            self.assertEqual(len(queue), count)
+            self.assertListEqual(list(queue), list(range(count)))
+            self.assertEqual(queue.try_peek(), 0 if count else None)
+            self.assertListEqual(list(queue.drain()), list(range(count)))
+            self.assertIs(queue._items, CompactQueue()._items)
+            self.assertRaises(EmptyQueueException, queue.dequeue)
+            self.assertRaises(EmptyQueueException, lambda: queue.peek)
+
+    def test_dequeue_many(self):
+        for count in (3, 10):
+            queue = CompactQueue[int].from_sequence(range(count))
+            self.assertListEqual(queue.dequeue_many(2), [0, 1])
+            self.assertIn(2, queue)
+            self.assertRaises(ValueError, queue.dequeue_many, count)
+            self.assertRaises(ValueError, queue.dequeue_many, -1)
+            self.assertEqual(len(queue), count - 2)
+            self.assertListEqual(queue.dequeue_many(count - 2), list(range(2, count)))
+            self.assertIsNone(queue.try_dequeue())
+
+    def test_capacity(self):
+        queue = CompactQueue[int](max_capacity=2)
+        queue.enqueue_many([1, 2])
+        self.assertTrue(queue.is_full)
+        self.assertRaises(FullQueueException, queue.enqueue, 3)
+        self.assertRaises(FullQueueException, queue.enqueue_many, [3])
+        self.assertRaises(ValueError, setattr, queue, "max_capacity", 1)
+        self.assertRaises(ValueError, CompactQueue.from_sequence, [1, 2], max_capacity=1)
+        queue.max_capacity = None
+        queue.enqueue(3)
+        queue.clear()
+        self.assertTrue(queue.is_empty)
+
+    def test_pickle(self):
+        queue = CompactQueue[int].from_sequence(range(6), max_capacity=8)
+        copy = pickle.loads(pickle.dumps(queue))
+        self.assertListEqual(list(copy), list(queue))
+        self.assertEqual(copy.max_capacity, 8)
+
+
+if __name__ == "__main__":
+    unittest.main()
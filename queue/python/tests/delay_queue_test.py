@@ -0,0 +1,125 @@
+import asyncio
+import random
+import threading
+import unittest
+
+from queue.delay_queue import DelayQueue
+from queue.empty_queue_exception import EmptyQueueException
+from queue.full_queue_exception import FullQueueException
+from queue.queue import Queue
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class TestDelayQueue(unittest.TestCase):
+    def setUp(self):
+        self.clock = FakeClock()
+        self.queue = DelayQueue[int](tick=1.0, clock=self.clock)
+
+    def test_is_instance(self):
+        self.assertIsInstance(self.queue, Queue)
+        self.assertRaises(ValueError, DelayQueue, tick=0)
+
+    def test_elements_are_hidden_until_due(self):
+        self.queue.enqueue(1, 5)
+        self.queue.enqueue(2, 2)
+        self.queue.enqueue(3)
+        self.assertEqual(len(self.queue), 3)
+        self.assertEqual(self.queue.dequeue(), 3)
+        self.assertRaises(EmptyQueueException, self.queue.dequeue)
+        self.assertIsNone(self.queue.try_dequeue())
+        self.assertIsNone(self.queue.try_peek())
+        self.assertRaises(ValueError, self.queue.dequeue_many, 1)
+        self.assertEqual(self.queue.seconds_to_next_due(), 2)
+        self.clock.now = 1.5
+        self.assertIsNone(self.queue.try_dequeue())
+        self.clock.now = 2
+        self.assertEqual(self.queue.peek, 2)
+        self.assertEqual(self.queue.dequeue(), 2)
+        self.clock.now = 10
+        self.assertListEqual(self.queue.dequeue_due(), [1])
+        self.assertTrue(self.queue.is_empty)
+        self.assertIsNone(self.queue.seconds_to_next_due())
+
+    def test_deadlines_are_rounded_up_to_a_tick(self):
+        queue = DelayQueue[str](tick=0.5, clock=self.clock)
+        queue.enqueue("a", 0.7)
+        self.clock.now = 0.9
+        self.assertListEqual(queue.dequeue_due(), [])
+        self.clock.now = 1.0
+        self.assertListEqual(queue.dequeue_due(), ["a"])
+
+    def test_no_delay_is_due_at_once(self):
+        self.clock.now = 0.5
+        self.queue.enqueue(1)
+        self.queue.enqueue_many([2, 3], delay=-1)
+        self.assertListEqual(self.queue.dequeue_many(3), [1, 2, 3])
+        self.assertListEqual(DelayQueue[int].from_sequence([1, 2, 3]).dequeue_many(1), [1])
+
+    def test_far_deadlines_cascade_in_order(self):
+        delays = random.Random(7).sample(range(1, 300_000), 2000)
+        for delay in delays:
+            self.queue.enqueue(delay, delay)
+        expired: list[int] = []
+        for now in sorted(random.Random(8).sample(range(300_000), 500)) + [300_000]:
+            self.clock.now = now
+            batch = self.queue.dequeue_due()
+            self.assertTrue(all(delay <= now for delay in batch))
+            self.assertTrue(all(delay > now for delay in self.queue))
+            expired.extend(batch)
+        self.assertListEqual(expired, sorted(delays))
+
+    def test_cancel(self):
+        far = self.queue.enqueue(1, 70_000)
+        near = self.queue.enqueue(2, 3)
+        due = self.queue.enqueue(3)
+        self.assertTrue(self.queue.cancel(far))
+        self.assertTrue(self.queue.cancel(due))
+        self.assertFalse(self.queue.cancel(due))
+        self.assertTrue(far.cancelled)
+        self.assertEqual(len(self.queue), 1)
+        self.assertNotIn(1, self.queue)
+        self.clock.now = 100_000
+        self.assertListEqual(self.queue.dequeue_due(), [2])
+        self.assertFalse(self.queue.cancel(near))
+        self.assertFalse(near.cancelled)
+
+    def test_capacity(self):
+        queue = DelayQueue[int](max_capacity=2, clock=self.clock)
+        queue.enqueue_many([1, 2], 10)
+        self.assertTrue(queue.is_full)
+        self.assertRaises(FullQueueException, queue.enqueue, 3)
+        self.assertRaises(FullQueueException, queue.enqueue_many, [3])
+        queue.clear()
+        self.assertTrue(queue.is_empty)
+        self.clock.now = 20
+        self.assertListEqual(queue.dequeue_due(), [])
+
+    def test_get_waits_for_the_deadline(self):
+        queue = DelayQueue[str](tick=0.005)
+        self.assertRaises(EmptyQueueException, queue.get, timeout=0.01)
+        queue.enqueue("later", 0.05)
+        self.assertRaises(EmptyQueueException, queue.get, timeout=0.01)
+        self.assertEqual(queue.get(timeout=5), "later")
+        threading.Timer(0.02, queue.enqueue, ["soon"]).start()
+        self.assertEqual(queue.get(), "soon")
+
+    def test_get_async(self):
+        queue = DelayQueue[str](tick=0.005)
+
+        async def main() -> list[str]:
+            queue.enqueue("later", 0.05)
+            asyncio.get_running_loop().call_later(0.01, queue.enqueue, "sooner", 0.01)
+            return [await queue.get_async(), await queue.get_async()]
+
+        self.assertListEqual(asyncio.run(asyncio.wait_for(main(), 5)), ["sooner", "later"])
+
+
+if __name__ == "__main__":
+    unittest.main()
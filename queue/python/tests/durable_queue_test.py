@@ -0,0 +1,111 @@
+import os
+import tempfile
+import unittest
+from pathlib import Path
+
+from queue.durable_queue import DurableQueue, FsyncPolicy
+from queue.empty_queue_exception import EmptyQueueException
+from queue.full_queue_exception import FullQueueException
+from queue.queue import Queue
+
+
+class TestDurableQueue(unittest.TestCase):
+    def setUp(self):
+        self._temporary_directory = tempfile.TemporaryDirectory()
+        self.directory = Path(self._temporary_directory.name)
+
+    def tearDown(self):
+        self._temporary_directory.cleanup()
+
+    def test_is_instance(self):
+        with DurableQueue[int](self.directory) as durable_queue:
+            self.assertIsInstance(durable_queue, Queue)
+
+    def test_from_sequence(self):
+        self.assertRaises(ValueError, DurableQueue.from_sequence, [1, 2])
+        self.assertRaises(ValueError, DurableQueue.from_sequence, [1, 2], self.directory, max_capacity=1)
+
+        with DurableQueue[int].from_sequence(range(10), self.directory, memory_items=2, segment_bytes=64) as durable_queue:
+            self.assertEqual(len(durable_queue), 10)
+
+        with DurableQueue[int].from_sequence([10], self.directory) as reopened:
+            self.assertListEqual(reopened.dequeue_many(11), list(range(11)))
+
+    def test_fifo_across_memory_and_disk(self):
+        with DurableQueue[int](self.directory, memory_items=8, segment_bytes=256) as durable_queue:
+            self.assertRaises(EmptyQueueException, durable_queue.dequeue)
+
+            for item in range(100):
+                durable_queue.enqueue(item)
+
+            self.assertEqual(len(durable_queue), 100)
+            self.assertEqual(durable_queue.peek, 0)
+            self.assertLessEqual(len(durable_queue._head), 8)
+            self.assertLessEqual(len(durable_queue._tail), 8)
+            self.assertListEqual(list(durable_queue), list(range(100)))
+            self.assertIn(57, durable_queue)
+
+            self.assertListEqual([durable_queue.dequeue() for _ in range(30)], list(range(30)))
+            durable_queue.enqueue_many(range(100, 110))
+            self.assertListEqual(durable_queue.dequeue_many(80), list(range(30, 110)))
+            self.assertTrue(durable_queue.is_empty)
+            self.assertIsNone(durable_queue.try_dequeue())
+
+    def test_consumed_segments_are_deleted(self):
+        with DurableQueue[int](self.directory, memory_items=4, segment_bytes=128) as durable_queue:
+            durable_queue.enqueue_many(range(200))
+            durable_queue.flush()
+            segments_before = len(list(self.directory.glob("segment-*.log")))
+
+            durable_queue.dequeue_many(190)
+
+            self.assertGreater(segments_before, 2)
+            self.assertLess(len(list(self.directory.glob("segment-*.log"))), segments_before)
+
+    def test_recovers_after_reopening(self):
+        with DurableQueue[str](self.directory, memory_items=4, segment_bytes=64) as durable_queue:
+            durable_queue.enqueue_many(f"item-{index}" for index in range(20))
+            self.assertListEqual(durable_queue.dequeue_many(5), [f"item-{index}" for index in range(5)])
+
+        with DurableQueue[str](self.directory, memory_items=4) as reopened:
+            self.assertEqual(len(reopened), 15)
+            self.assertListEqual(reopened.dequeue_many(15), [f"item-{index}" for index in range(5, 20)])
+
+    def test_torn_write_is_truncated(self):
+        with DurableQueue[int](self.directory, fsync_policy=FsyncPolicy.ALWAYS) as durable_queue:
+            durable_queue.enqueue(1)
+            durable_queue.enqueue(2)
+
+        segment = sorted(self.directory.glob("segment-*.log"))[-1]
+        size = segment.stat().st_size
+        with open(segment, "ab") as file:
+            file.write(b"\x10\x00\x00\x00garbage")
+
+        with DurableQueue[int](self.directory) as reopened:
+            self.assertEqual(segment.stat().st_size, size)
+            self.assertListEqual(reopened.dequeue_many(2), [1, 2])
+
+    def test_max_capacity_rejects_instead_of_evicting(self):
+        with DurableQueue[int](self.directory, max_capacity=3, memory_items=2) as durable_queue:
+            durable_queue.enqueue_many([1, 2, 3])
+
+            self.assertTrue(durable_queue.is_full)
+            self.assertRaises(FullQueueException, durable_queue.enqueue, 4)
+            self.assertRaises(FullQueueException, durable_queue.enqueue_many, [4])
+            self.assertEqual(durable_queue.dequeue(), 1)
+
+    def test_clear(self):
+        with DurableQueue[int](self.directory, memory_items=2, segment_bytes=32) as durable_queue:
+            durable_queue.enqueue_many(range(20))
+            durable_queue.clear()
+
+            self.assertTrue(durable_queue.is_empty)
+            self.assertEqual(len(os.listdir(self.directory)), 1)
+
+            durable_queue.enqueue(5)
+
+            self.assertEqual(durable_queue.dequeue(), 5)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,60 @@
+import unittest
+
+from queue.empty_queue_exception import EmptyQueueException
+from queue.full_queue_exception import FullQueueException
+from queue.indexed_queue import IndexedQueue
+from queue.queue import Queue
+
+
+class TestIndexedQueue(unittest.TestCase):
+    def test_is_instance(self):
+        self.assertIsInstance(IndexedQueue[int](), Queue)
+
+    def test_membership_follows_the_queue(self):
+        queue = IndexedQueue[str].from_sequence(["a", "b", "a"])
+        queue.enqueue("c")
+
+        self.assertEqual(queue.count("a"), 2)
+        self.assertIn("c", queue)
+        self.assertNotIn("z", queue)
+        self.assertNotIn(["unhashable"], queue)
+        self.assertEqual(queue.count(["unhashable"]), 0)
+
+        self.assertEqual(queue.dequeue(), "a")
+        self.assertEqual(queue.count("a"), 1)
+
+        self.assertListEqual(queue.dequeue_many(2), ["b", "a"])
+        self.assertNotIn("a", queue)
+        self.assertNotIn("b", queue)
+        self.assertEqual(queue.try_dequeue(), "c")
+        self.assertIsNone(queue.try_dequeue())
+        self.assertRaises(EmptyQueueException, queue.dequeue)
+        self.assertEqual(len(queue._counts), 0)
+
+    def test_clear(self):
+        queue = IndexedQueue[int].from_sequence([1, 2, 3])
+
+        queue.clear()
+
+        self.assertNotIn(1, queue)
+        self.assertTrue(queue.is_empty)
+
+    def test_full_queue_keeps_index_in_sync(self):
+        queue = IndexedQueue[int](max_capacity=2)
+        queue.enqueue_many([1, 2])
+
+        self.assertRaises(FullQueueException, queue.enqueue, 3)
+        self.assertRaises(FullQueueException, queue.enqueue_many, [3])
+        self.assertNotIn(3, queue)
+        self.assertListEqual(list(queue), [1, 2])
+
+    def test_unhashable_elements_are_rejected(self):
+        queue = IndexedQueue()
+
+        self.assertRaises(TypeError, queue.enqueue, [1])
+        self.assertRaises(TypeError, queue.enqueue_many, [2, [1]])
+        self.assertTrue(queue.is_empty)
+
+
+if __name__ == "__main__":
+    unittest.main()
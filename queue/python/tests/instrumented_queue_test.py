@@ -0,0 +1,90 @@
+import threading
+import unittest
+
+from queue.empty_queue_exception import EmptyQueueException
+from queue.full_queue_exception import FullQueueException
+from queue.instrumented_queue import InstrumentedQueue
+from queue.queue import Queue
+
+
+class TestInstrumentedQueue(unittest.TestCase):
+    def test_is_instance(self):
+        self.assertIsInstance(InstrumentedQueue[int](), Queue)
+
+    def test_counters_and_high_water_mark(self):
+        queue = InstrumentedQueue[int]()
+
+        queue.enqueue_many(range(10))
+        queue.dequeue_many(4)
+        queue.enqueue(10)
+        queue.dequeue()
+        queue.clear()
+
+        self.assertRaises(EmptyQueueException, queue.dequeue)
+        self.assertIsNone(queue.try_dequeue())
+
+        metrics = queue.metrics()
+
+        self.assertEqual(metrics["enqueued"], 11)
+        self.assertEqual(metrics["dequeued"], 5)
+        self.assertEqual(metrics["cleared"], 6)
+        self.assertEqual(metrics["depth"], 0)
+        self.assertEqual(metrics["high_water_mark"], 10)
+
+    def test_rejected_on_full(self):
+        queue = InstrumentedQueue[int](max_capacity=2)
+
+        self.assertRaises(FullQueueException, queue.enqueue_many, [1, 2, 3])
+
+        self.assertEqual(queue.metrics()["rejected"], 3)
+        self.assertTrue(queue.is_empty)
+
+    def test_enqueue_on_full_rejects_instead_of_evicting(self):
+        queue = InstrumentedQueue[int](max_capacity=2)
+        queue.enqueue(1)
+        queue.enqueue(2)
+
+        self.assertRaises(FullQueueException, queue.enqueue, 3)
+
+        self.assertEqual(queue.metrics()["rejected"], 1)
+        self.assertListEqual(list(queue), [1, 2])
+
+    def test_dwell_histogram_samples(self):
+        queue = InstrumentedQueue[int](sample_every=4)
+
+        queue.enqueue_many(range(10))
+        for _ in range(3):
+            queue.enqueue(0)
+        queue.dequeue_many(5)
+        while queue.is_not_empty:
+            queue.dequeue()
+
+        dwell = queue.metrics()["dwell_seconds"]
+
+        # Sequence numbers 0, 4, 8 and 12 are sampled.
+        self.assertEqual(dwell["count"], 4)
+        self.assertEqual(sum(dwell["buckets"].values()), 4)
+        self.assertGreaterEqual(dwell["sum"], 0)
+
+    def test_exporters(self):
+        exported: list[dict] = []
+        exported_twice = threading.Event()
+
+        def exporter(metrics: dict) -> None:
+            exported.append(metrics)
+            if len(exported) >= 2:
+                exported_twice.set()
+
+        queue = InstrumentedQueue[int](exporter=exporter, export_interval=0.01)
+        queue.enqueue(1)
+
+        self.assertTrue(exported_twice.wait(timeout=5))
+
+        queue.close()
+
+        self.assertEqual(exported[-1]["depth"], 1)
+        self.assertRaises(ValueError, InstrumentedQueue, export_interval=1.0)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,49 @@
+import random
+import unittest
+
+from queue.empty_queue_exception import EmptyQueueException
+from queue.persistent_queue import PersistentQueue
+
+
+class TestPersistentQueue(unittest.TestCase):
+    def test_empty(self):
+        queue = PersistentQueue[int].empty()
+
+        self.assertTrue(queue.is_empty)
+        self.assertRaises(EmptyQueueException, queue.dequeue)
+        self.assertRaises(EmptyQueueException, lambda: queue.peek)
+        self.assertIsNone(queue.try_peek())
+        self.assertIsNone(queue.try_dequeue())
+
+    def test_versions_are_independent(self):
+        base = PersistentQueue[int].from_sequence([1, 2, 3])
+        left = base.enqueue(4)
+        right = base.dequeue().enqueue(5)
+
+        self.assertListEqual(list(base), [1, 2, 3])
+        self.assertListEqual(list(left), [1, 2, 3, 4])
+        self.assertListEqual(list(right), [2, 3, 5])
+        self.assertEqual(right.peek, 2)
+        self.assertEqual(len(left), 4)
+        self.assertIn(5, right)
+        self.assertNotIn(5, left)
+        self.assertEqual(repr(right), "PersistentQueue.from_sequence([2, 3, 5])")
+
+    def test_matches_a_list_across_random_versions(self):
+        versions = [(PersistentQueue[int].empty(), [])]
+
+        for step in range(2_000):
+            queue, expected = random.choice(versions)
+            if expected and random.random() < 0.4:
+                self.assertEqual(queue.peek, expected[0])
+                versions.append((queue.dequeue(), expected[1:]))
+            else:
+                versions.append((queue.enqueue(step), expected + [step]))
+
+        for queue, expected in versions:
+            self.assertListEqual(list(queue), expected)
+            self.assertEqual(len(queue), len(expected))
+
+
+if __name__ == "__main__":
+    unittest.main()
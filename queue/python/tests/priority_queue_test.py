@@ -0,0 +1,131 @@
+import random
+import unittest
+
+from queue.empty_queue_exception import EmptyQueueException
+from queue.full_queue_exception import FullQueueException
+from queue.priority_queue import IndexedPriorityQueue, PriorityQueue
+from queue.queue import Queue
+
+
+class TestPriorityQueue(unittest.TestCase):
+    def test_is_instance(self):
+        self.assertIsInstance(PriorityQueue[int](), Queue)
+        self.assertIsInstance(IndexedPriorityQueue[str](), PriorityQueue)
+
+    def test_dequeues_lowest_priority_first(self):
+        for arity in (2, 3, 4, 8):
+            numbers = [random.randint(0, 1000) for _ in range(200)]
+            self.assertEqual(PriorityQueue[int].from_sequence(numbers).peek, min(numbers))
+
+            priority_queue = PriorityQueue[int](arity=arity)
+            priority_queue.enqueue_many(numbers[:100])
+            for number in numbers[100:]:
+                priority_queue.enqueue(number)
+
+            self.assertEqual(priority_queue.peek, min(numbers))
+            self.assertListEqual(list(priority_queue), sorted(numbers))
+            self.assertListEqual(priority_queue.dequeue_many(len(numbers)), sorted(numbers))
+
+    def test_explicit_priority_key_and_fifo_ties(self):
+        priority_queue = PriorityQueue[str](key=len)
+
+        priority_queue.enqueue("ccc")
+        priority_queue.enqueue("a")
+        priority_queue.enqueue("b")
+        priority_queue.enqueue("urgent", priority=0)
+
+        self.assertEqual(priority_queue.dequeue_with_priority(), ("urgent", 0))
+        self.assertListEqual(priority_queue.dequeue_many(3), ["a", "b", "ccc"])
+
+    def test_empty_and_full(self):
+        priority_queue = PriorityQueue[int](max_capacity=2, arity=4)
+
+        self.assertRaises(EmptyQueueException, priority_queue.dequeue)
+        self.assertIsNone(priority_queue.try_dequeue())
+
+        priority_queue.enqueue(2)
+        priority_queue.enqueue(1)
+
+        self.assertTrue(priority_queue.is_full)
+        self.assertRaises(FullQueueException, priority_queue.enqueue, 0)
+        self.assertRaises(FullQueueException, priority_queue.enqueue_many, [0])
+        self.assertIn(2, priority_queue)
+
+        priority_queue.clear()
+
+        self.assertTrue(priority_queue.is_empty)
+
+    def test_invalid_arity(self):
+        self.assertRaises(ValueError, PriorityQueue, arity=1)
+
+
+class TestIndexedPriorityQueue(unittest.TestCase):
+    def test_decrease_key_update_and_remove(self):
+        for arity in (2, 4):
+            priority_queue = IndexedPriorityQueue[str](arity=arity)
+            for name, priority in {"a": 5, "b": 3, "c": 8, "d": 1}.items():
+                priority_queue.enqueue(name, priority)
+
+            self.assertIn("c", priority_queue)
+            self.assertRaises(ValueError, priority_queue.enqueue, "a", 0)
+
+            priority_queue.decrease_key("c", 0)
+            self.assertEqual(priority_queue.peek, "c")
+            self.assertRaises(ValueError, priority_queue.decrease_key, "c", 10)
+
+            priority_queue.update("c", 10)
+            self.assertEqual(priority_queue.priority("c"), 10)
+            self.assertEqual(priority_queue.remove("b"), 3)
+            self.assertNotIn("b", priority_queue)
+            self.assertRaises(KeyError, priority_queue.remove, "b")
+
+            self.assertListEqual(priority_queue.dequeue_many(3), ["d", "a", "c"])
+            self.assertTrue(priority_queue.is_empty)
+
+    def test_randomized_against_sorting(self):
+        priorities: dict[int, int] = {}
+        priority_queue = IndexedPriorityQueue[int](arity=3)
+
+        for _ in range(2000):
+            element = random.randrange(300)
+            operation = random.random()
+            if element not in priorities:
+                priorities[element] = random.randrange(1000)
+                priority_queue.enqueue(element, priorities[element])
+            elif operation < 0.4:
+                priorities[element] = random.randrange(1000)
+                priority_queue.update(element, priorities[element])
+            elif operation < 0.6:
+                del priorities[element]
+                priority_queue.remove(element)
+            elif operation < 0.7:
+                expected = min(priorities.items(), key=lambda item: item[1])[1]
+                element, priority = priority_queue.dequeue_with_priority()
+                self.assertEqual(priority, expected)
+                del priorities[element]
+
+        drained = [priority_queue.dequeue_with_priority()[1] for _ in range(len(priority_queue))]
+
+        self.assertListEqual(drained, sorted(priorities.values()))
+
+    def test_enqueue_or_decrease(self):
+        priority_queue = IndexedPriorityQueue[str]()
+
+        self.assertTrue(priority_queue.enqueue_or_decrease("a", 5))
+        self.assertFalse(priority_queue.enqueue_or_decrease("a", 7))
+        self.assertTrue(priority_queue.enqueue_or_decrease("a", 2))
+        self.assertEqual(priority_queue.priority("a"), 2)
+
+    def test_enqueue_many_requires_unique_elements(self):
+        priority_queue = IndexedPriorityQueue[int](max_capacity=3)
+
+        self.assertRaises(ValueError, priority_queue.enqueue_many, [1, 1])
+        self.assertRaises(FullQueueException, priority_queue.enqueue_many, [1, 2, 3, 4])
+
+        priority_queue.enqueue_many([3, 1, 2])
+
+        self.assertListEqual(list(priority_queue), [1, 2, 3])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,5 +1,7 @@
+import importlib.util
 import unittest
 
+from queue.full_queue_exception import FullQueueException
 from queue.queue import Queue
 
 
@@ -45,6 +47,98 @@ class TestQueue(unittest.TestCase):
         empty_but_with_max_capacity = Queue[float](max_capacity=10)
         self.assertEqual(len(empty_but_with_max_capacity), 0)
 
+    def test_enqueue_many(self):
+        queue = Queue[int]()
+        queue.enqueue_many(range(5))
+        self.assertEqual(len(queue), 5)
+        self.assertEqual(queue.peek, 0)
+
+        bounded = Queue[int](max_capacity=4)
+        bounded.enqueue_many([1, 2])
+        self.assertRaises(FullQueueException, bounded.enqueue_many, (item for item in [3, 4, 5]))
+        self.assertEqual(len(bounded), 2)
+
+        bounded.enqueue_many([3, 4])
+        self.assertTrue(bounded.is_full)
+
+    def test_full_queue_rejects_instead_of_evicting(self):
+        queue = Queue[int].from_sequence([1, 2], max_capacity=2)
+
+        self.assertRaises(FullQueueException, queue.enqueue, 3)
+        self.assertListEqual(list(queue), [1, 2])
+
+        queue.max_capacity = 3
+        queue.enqueue(3)
+        self.assertRaises(FullQueueException, queue.enqueue, 4)
+        self.assertListEqual(list(queue), [1, 2, 3])
+
+        queue.max_capacity = None
+        queue.enqueue_many([4, 5])
+        self.assertListEqual(list(queue), [1, 2, 3, 4, 5])
+        self.assertRaises(ValueError, setattr, queue, "max_capacity", 4)
+
+    def test_try_dequeue(self):
+        queue = Queue[int].from_sequence([1])
+        self.assertEqual(queue.try_dequeue(), 1)
+        self.assertIsNone(queue.try_dequeue())
+
+    def test_dequeue_many(self):
+        queue = Queue[int].from_sequence([1, 2, 3, 4, 5])
+
+        self.assertListEqual(queue.dequeue_many(2), [1, 2])
+        self.assertRaises(ValueError, queue.dequeue_many, 4)
+        self.assertListEqual(queue.dequeue_many(3), [3, 4, 5])
+        self.assertTrue(queue.is_empty)
+        self.assertListEqual(queue.dequeue_many(0), [])
+
+    @unittest.skipUnless(importlib.util.find_spec("numpy"), "requires numpy")
+    def test_dequeue_array(self):
+        queue = Queue[float].from_sequence([1.0, 2.0, 3.0])
+
+        array = queue.dequeue_array(2, dtype="float64")
+
+        self.assertListEqual(array.tolist(), [1.0, 2.0])
+        self.assertEqual(array.dtype.name, "float64")
+        self.assertEqual(len(queue), 1)
+
+    def test_independent_iterators(self):
+        queue = Queue[int].from_sequence([1, 2, 3])
+
+        pairs = [(outer, inner) for outer in queue for inner in queue]
+
+        self.assertEqual(len(pairs), 9)
+        self.assertListEqual(list(queue), [1, 2, 3])
+        self.assertListEqual(list(queue), [1, 2, 3])
+
+    def test_iterator_fails_fast_on_modification(self):
+        queue = Queue[int].from_sequence([1, 2, 3])
+        iterator = iter(queue)
+        next(iterator)
+
+        queue.enqueue(4)
+
+        self.assertRaises(RuntimeError, next, iterator)
+
+    def test_snapshot(self):
+        queue = Queue[int].from_sequence([1, 2, 3])
+
+        for item in queue.snapshot():
+            queue.enqueue(item * 10)
+
+        self.assertListEqual(queue.snapshot(), [1, 2, 3, 10, 20, 30])
+
+    def test_drain(self):
+        queue = Queue[int].from_sequence([1, 2, 3])
+        drained = []
+
+        for item in queue.drain():
+            drained.append(item)
+            if item == 1:
+                queue.enqueue(4)
+
+        self.assertListEqual(drained, [1, 2, 3, 4])
+        self.assertTrue(queue.is_empty)
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,72 @@
+import io
+import pickle
+import unittest
+
+from queue import serialization
+from queue.blocking_queue import BlockingQueue
+from queue.bounded_queue import BoundedQueue, OverflowPolicy
+from queue.queue import Queue
+
+
+class TestSerialization(unittest.TestCase):
+    def dumped(self, queue: Queue, **kwargs) -> io.BytesIO:
+        file = io.BytesIO()
+        serialization.dump(queue, file, **kwargs)
+        file.seek(0)
+        return file
+
+    def test_objects_round_trip(self):
+        elements = ["a", (1, 2), None, bytearray(b"payload"), 3.5]
+        queue = Queue.from_sequence(elements, max_capacity=10)
+
+        loaded = serialization.load(self.dumped(queue))
+
+        self.assertListEqual(list(loaded), elements)
+        self.assertEqual(loaded.max_capacity, 10)
+        self.assertListEqual(list(serialization.iter_load(self.dumped(queue))), elements)
+
+    def test_typed_numbers(self):
+        queue = Queue.from_sequence(range(serialization.CHUNK_ELEMENTS * 2 + 5))
+
+        file = self.dumped(queue, typecode="q")
+
+        self.assertEqual(len(file.getvalue()), 8 * len(queue) + 3 * 12 + 26)
+        self.assertListEqual(list(serialization.load(file, BlockingQueue)), list(queue))
+        self.assertRaises(OverflowError, serialization.dump, Queue.from_sequence([2**64]), io.BytesIO(), typecode="q")
+
+    def test_streaming_reads_one_chunk_at_a_time(self):
+        file = self.dumped(Queue.from_sequence([float(index) for index in range(serialization.CHUNK_ELEMENTS + 1)]), typecode="d")
+        elements = serialization.iter_load(file)
+
+        self.assertEqual(next(elements), 0.0)
+        self.assertLess(file.tell(), serialization.CHUNK_ELEMENTS * 8 + 100)
+        self.assertEqual(sum(1 for _ in elements), serialization.CHUNK_ELEMENTS)
+
+    def test_empty_queue(self):
+        self.assertTrue(serialization.load(self.dumped(Queue())).is_empty)
+
+    def test_rejects_other_files(self):
+        self.assertRaises(ValueError, serialization.load, io.BytesIO(b"not a dump"))
+        truncated = self.dumped(Queue.from_sequence([1, 2, 3])).getvalue()[:-1]
+        self.assertRaises(ValueError, serialization.load, io.BytesIO(truncated))
+
+    def test_pickle_queues_with_locks(self):
+        blocking = BlockingQueue[int].from_sequence([1, 2], max_capacity=3)
+        bounded = BoundedQueue[int](max_capacity=2, overflow_policy=OverflowPolicy.DROP_OLDEST)
+        bounded.enqueue_many([1, 2, 3])
+
+        blocking_copy = pickle.loads(pickle.dumps(blocking))
+        bounded_copy = pickle.loads(pickle.dumps(bounded))
+
+        blocking_copy.put(3)
+        self.assertListEqual(list(blocking_copy), [1, 2, 3])
+        blocking_copy.get()
+        blocking_copy.task_done()
+        self.assertEqual(blocking_copy._unfinished_tasks, 2)
+        bounded_copy.enqueue(4)
+        self.assertListEqual(list(bounded_copy), [3, 4])
+        self.assertEqual(bounded_copy.overflows["drop_oldest"], 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
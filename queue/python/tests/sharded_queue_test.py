@@ -0,0 +1,184 @@
+import os
+import pickle
+import subprocess
+import sys
+import threading
+import unittest
+import zlib
+from typing import Optional
+
+from queue.blocking_queue import BlockingQueue
+from queue.empty_queue_exception import EmptyQueueException
+from queue.full_queue_exception import FullQueueException
+from queue.queue import Queue
+from queue.sharded_queue import ShardedQueue, stable_hash
+
+
+class TestShardedQueue(unittest.TestCase):
+    def test_is_instance(self):
+        self.assertIsInstance(ShardedQueue[int](2), Queue)
+        self.assertRaises(ValueError, ShardedQueue, 0)
+
+    def test_round_robin_spreads_over_lanes(self):
+        queue = ShardedQueue[int](3)
+        queue.enqueue_many(range(4))
+        queue.enqueue(4)
+
+        self.assertListEqual(queue.lane_lengths(), [2, 2, 1])
+        self.assertEqual(len(queue), 5)
+        self.assertIsNone(queue.lane_of(0))
+        self.assertCountEqual(list(queue), range(5))
+        self.assertIn(4, queue)
+        self.assertIsNone(queue.max_capacity)
+
+    def test_key_keeps_order_per_key(self):
+        queue = ShardedQueue[tuple[str, int]](4, key=lambda element: element[0])
+        for index in range(20):
+            queue.enqueue(("ab"[index % 2], index))
+
+        self.assertEqual(queue.lane_of(("a", 0)), queue.lane_of(("a", 99)))
+        per_key: dict[str, list[int]] = {"a": [], "b": []}
+        for key, index in queue.drain():
+            per_key[key].append(index)
+        self.assertListEqual(per_key["a"], list(range(0, 20, 2)))
+        self.assertListEqual(per_key["b"], list(range(1, 20, 2)))
+
+    def test_key_lanes_are_the_same_in_every_process(self):
+        script = (
+            "from queue.sharded_queue import ShardedQueue\n"
+            "queue = ShardedQueue(7, key=lambda element: element)\n"
+            "print([queue.lane_of(key) for key in ('a', 'order-42', b'bytes', ('a', 1), 12)])"
+        )
+        lanes = {
+            subprocess.run(
+                [sys.executable, "-c", script],
+                cwd=os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+                env={**os.environ, "PYTHONHASHSEED": seed},
+                capture_output=True,
+                text=True,
+                check=True,
+            ).stdout
+            for seed in ("1", "2", "3")
+        }
+        self.assertEqual(len(lanes), 1)
+        self.assertEqual(stable_hash("a"), zlib.crc32(b"a"))
+        self.assertEqual(stable_hash(-3), -3)
+
+    def test_dequeue_prefers_home_lane_then_scans(self):
+        queue = ShardedQueue[int](3)
+        queue.enqueue_many([0, 1, 2, 3])
+        queue.home_lane = 1
+
+        self.assertEqual(queue.peek, 1)
+        self.assertEqual(queue.dequeue(), 1)
+        self.assertEqual(queue.dequeue(), 2)
+        self.assertEqual(queue.dequeue(), 0)
+        self.assertEqual(queue.try_dequeue(), 3)
+        self.assertTrue(queue.is_empty)
+        self.assertIsNone(queue.try_dequeue())
+        self.assertRaises(EmptyQueueException, queue.dequeue)
+        self.assertRaises(EmptyQueueException, lambda: queue.peek)
+        with self.assertRaises(ValueError):
+            queue.home_lane = 3
+
+    def test_dequeue_many_and_clear(self):
+        queue = ShardedQueue[int](2)
+        queue.enqueue_many(range(6))
+        queue.home_lane = 0
+
+        self.assertListEqual(queue.dequeue_many(4), [0, 2, 4, 1])
+        self.assertRaises(ValueError, queue.dequeue_many, 3)
+        queue.clear()
+        self.assertEqual(len(queue), 0)
+
+    def test_bounded_lanes(self):
+        queue = ShardedQueue[int]([BlockingQueue(max_capacity=1), BlockingQueue(max_capacity=1)])
+        queue.enqueue(1)
+        queue.enqueue(2)
+
+        self.assertEqual(queue.max_capacity, 2)
+        self.assertTrue(queue.is_full)
+        self.assertRaises(FullQueueException, queue.enqueue, 3)
+
+    def test_pickle_keeps_lanes_and_resets_cursors(self):
+        queue = ShardedQueue[int](2)
+        queue.enqueue_many([1, 2, 3])
+        queue.home_lane = 1
+
+        copy = pickle.loads(pickle.dumps(queue))
+
+        self.assertListEqual(copy.lane_lengths(), [2, 1])
+        self.assertEqual(copy.home_lane, 0)
+
+    def test_concurrent_producers_and_consumers(self):
+        queue = ShardedQueue[int](4)
+        received: list[int] = []
+        lock = threading.Lock()
+        done = threading.Event()
+
+        def produce(start: int) -> None:
+            for element in range(start, start + 1000):
+                queue.enqueue(element)
+
+        def consume() -> None:
+            while not done.is_set() or queue.is_not_empty:
+                element = queue.try_dequeue()
+                if element is not None:
+                    with lock:
+                        received.append(element)
+
+        consumers = [threading.Thread(target=consume) for _ in range(4)]
+        producers = [threading.Thread(target=produce, args=(start,)) for start in range(0, 4000, 1000)]
+        for thread in consumers + producers:
+            thread.start()
+        for thread in producers:
+            thread.join()
+        done.set()
+        for thread in consumers:
+            thread.join()
+
+        self.assertListEqual(sorted(received), list(range(4000)))
+
+
+    def test_from_sequence_splits_the_capacity(self):
+        queue = ShardedQueue[int].from_sequence(range(5), max_capacity=5)
+        self.assertEqual(queue.max_capacity, 5)
+        self.assertCountEqual(list(queue), range(5))
+        self.assertRaises(FullQueueException, queue.enqueue, 5)
+        self.assertRaises(ValueError, ShardedQueue, [Queue[int]()], max_capacity=1)
+
+    def test_peek_sees_none_elements(self):
+        queue = ShardedQueue[Optional[int]](2)
+        queue.home_lane = 0
+        queue.enqueue(None)
+        self.assertIsNone(queue.peek)
+        self.assertEqual(len(queue), 1)
+        queue.dequeue()
+        self.assertRaises(EmptyQueueException, lambda: queue.peek)
+
+    def test_concurrent_dequeue_many(self):
+        queue = ShardedQueue[int](4)
+        queue.enqueue_many(range(4000))
+        received: list[int] = []
+        lock = threading.Lock()
+
+        def consume() -> None:
+            while queue.is_not_empty:
+                try:
+                    items = queue.dequeue_many(min(7, len(queue)))
+                except ValueError:  # other consumers emptied the queue since `len`
+                    continue
+                with lock:
+                    received.extend(items)
+
+        consumers = [threading.Thread(target=consume) for _ in range(4)]
+        for thread in consumers:
+            thread.start()
+        for thread in consumers:
+            thread.join()
+
+        self.assertListEqual(sorted(received), list(range(4000)))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,150 @@
+import importlib.util
+import multiprocessing
+import struct
+import unittest
+
+from queue.empty_queue_exception import EmptyQueueException
+from queue.full_queue_exception import FullQueueException
+from queue.queue import Queue
+from queue.shared_memory_queue import SharedMemoryQueue
+
+
+def _produce(shared_queue: SharedMemoryQueue, count: int) -> None:
+    for index in range(count):
+        while True:
+            try:
+                shared_queue.enqueue((index, index * 0.5))
+                break
+            except FullQueueException:
+                pass
+    shared_queue.close()
+
+
+class TestSharedMemoryQueue(unittest.TestCase):
+    def test_is_instance(self):
+        with SharedMemoryQueue("q", max_capacity=4) as shared_queue:
+            self.assertIsInstance(shared_queue, SharedMemoryQueue)
+            self.assertIsInstance(shared_queue, Queue)
+
+    def test_enqueue_and_dequeue(self):
+        with SharedMemoryQueue("qd", max_capacity=3) as shared_queue:
+            self.assertTrue(shared_queue.is_empty)
+            self.assertRaises(EmptyQueueException, shared_queue.dequeue)
+            self.assertIsNone(shared_queue.try_dequeue())
+
+            for index in range(3):
+                shared_queue.enqueue((index, float(index)))
+
+            self.assertTrue(shared_queue.is_full)
+            self.assertEqual(len(shared_queue), 3)
+            self.assertRaises(FullQueueException, shared_queue.enqueue, (3, 3.0))
+            self.assertEqual(shared_queue.peek, (0, 0.0))
+            self.assertIn((1, 1.0), shared_queue)
+            self.assertListEqual(list(shared_queue), [(0, 0.0), (1, 1.0), (2, 2.0)])
+
+            self.assertEqual(shared_queue.dequeue(), (0, 0.0))
+            shared_queue.enqueue((3, 3.0))
+
+            self.assertListEqual(
+                [shared_queue.dequeue() for _ in range(3)],
+                [(1, 1.0), (2, 2.0), (3, 3.0)],
+            )
+
+    def test_batches(self):
+        with SharedMemoryQueue("i", max_capacity=4) as shared_queue:
+            shared_queue.enqueue_many([1, 2, 3])
+
+            self.assertRaises(FullQueueException, shared_queue.enqueue_many, [4, 5])
+            self.assertListEqual(shared_queue.dequeue_many(2), [1, 2])
+            self.assertRaises(ValueError, shared_queue.dequeue_many, 2)
+            self.assertRaises(ValueError, shared_queue.dequeue_many, -1)
+            self.assertEqual(len(shared_queue), 1)
+
+            shared_queue.enqueue_many([4, 5, 6])
+
+            self.assertListEqual(shared_queue.dequeue_many(4), [3, 4, 5, 6])
+
+    def test_single_field_records_are_bare_values(self):
+        with SharedMemoryQueue("d", max_capacity=2) as shared_queue:
+            shared_queue.enqueue(1.5)
+
+            self.assertEqual(shared_queue.dequeue(), 1.5)
+
+    def test_batch_slots_stop_at_the_ring_end(self):
+        record = struct.Struct("i")
+        with SharedMemoryQueue(record, max_capacity=4) as shared_queue:
+            shared_queue.enqueue(0)
+            shared_queue.enqueue(1)
+            shared_queue.dequeue()
+
+            with shared_queue.write_slots(10) as view:
+                self.assertEqual(len(view), 2 * record.size)
+                view[:] = struct.pack("ii", 2, 3)
+
+            with shared_queue.write_slots(10) as view:
+                self.assertEqual(len(view), record.size)
+                record.pack_into(view, 0, 4)
+
+            self.assertTrue(shared_queue.is_full)
+
+            with shared_queue.read_slots(10) as view:
+                self.assertListEqual([value for (value,) in record.iter_unpack(view)], [1, 2, 3])
+
+            with shared_queue.read_slots(10) as view:
+                self.assertListEqual([value for (value,) in record.iter_unpack(view)], [4])
+
+            self.assertTrue(shared_queue.is_empty)
+
+    def test_failed_batch_is_not_committed(self):
+        with SharedMemoryQueue("i", max_capacity=4) as shared_queue:
+            with self.assertRaises(RuntimeError):
+                with shared_queue.write_slots(2):
+                    raise RuntimeError()
+
+            self.assertTrue(shared_queue.is_empty)
+
+    def test_from_sequence(self):
+        self.assertRaises(ValueError, SharedMemoryQueue.from_sequence, [1, 2])
+        self.assertRaises(ValueError, SharedMemoryQueue.from_sequence, [1, 2], "i")
+        self.assertRaises(ValueError, SharedMemoryQueue.from_sequence, [1, 2], "i", max_capacity=1)
+
+        with SharedMemoryQueue.from_sequence([1, 2], "i", max_capacity=4) as shared_queue:
+            self.assertListEqual(shared_queue.dequeue_many(2), [1, 2])
+
+    @unittest.skipUnless(importlib.util.find_spec("numpy"), "requires numpy")
+    def test_live_export_of_slots_view(self):
+        import numpy
+
+        with SharedMemoryQueue("i", max_capacity=4) as shared_queue:
+            shared_queue.enqueue_many([1, 2, 3, 4])
+
+            with shared_queue.read_slots(2) as view:
+                self.assertListEqual(numpy.frombuffer(view, numpy.int32).tolist(), [1, 2])
+
+            with self.assertRaises(BufferError):
+                with shared_queue.read_slots(2) as view:
+                    values = numpy.frombuffer(view, numpy.int32)
+            del values
+
+            self.assertEqual(len(shared_queue), 2)
+
+    def test_cross_process(self):
+        count = 1000
+        with SharedMemoryQueue("qd", max_capacity=16) as shared_queue:
+            producer = multiprocessing.Process(target=_produce, args=(shared_queue, count))
+            producer.start()
+
+            received: list[tuple[int, float]] = []
+            while len(received) < count:
+                item = shared_queue.try_dequeue()
+                if item is not None:
+                    received.append(item)
+
+            producer.join()
+
+            self.assertEqual(producer.exitcode, 0)
+            self.assertListEqual(received, [(index, index * 0.5) for index in range(count)])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,95 @@
+import random
+import unittest
+
+from queue.empty_queue_exception import EmptyQueueException
+from queue.full_queue_exception import FullQueueException
+from queue.queue import Queue
+from queue.sliding_window_queue import SlidingWindowQueue
+
+
+class TestSlidingWindowQueue(unittest.TestCase):
+    def test_is_instance(self):
+        self.assertIsInstance(SlidingWindowQueue[int](), Queue)
+
+    def test_fifo(self):
+        queue = SlidingWindowQueue[int]()
+        self.assertRaises(EmptyQueueException, queue.dequeue)
+        self.assertIsNone(queue.try_dequeue())
+
+        queue.enqueue_many([1, 2, 3])
+        self.assertEqual(queue.dequeue(), 1)
+        queue.enqueue(4)
+
+        self.assertEqual(queue.peek, 2)
+        self.assertListEqual(list(queue), [2, 3, 4])
+        self.assertIn(4, queue)
+        self.assertListEqual(queue.dequeue_many(3), [2, 3, 4])
+        self.assertRaises(EmptyQueueException, lambda: queue.peek)
+
+    def test_window_size(self):
+        queue = SlidingWindowQueue[int].from_sequence([0, 1, 2, 3], window_size=3)
+        self.assertEqual(queue.window_size, 3)
+        self.assertListEqual(list(queue), [1, 2, 3])
+        queue.enqueue(4)
+        self.assertListEqual(list(queue), [2, 3, 4])
+        queue.window_size = 4
+        queue.enqueue(5)
+        self.assertListEqual(list(queue), [2, 3, 4, 5])
+        self.assertEqual(queue.sum(), 14)
+        with self.assertRaises(ValueError):
+            queue.window_size = 2
+        with self.assertRaises(ValueError):
+            queue.window_size = 0
+        queue.window_size = None
+        queue.enqueue(6)
+        self.assertEqual(len(queue), 5)
+        self.assertRaises(ValueError, SlidingWindowQueue[int], window_size=0)
+
+    def test_max_capacity_rejects_instead_of_sliding(self):
+        queue = SlidingWindowQueue[int].from_sequence([1, 2, 3], max_capacity=3)
+        self.assertTrue(queue.is_full)
+        self.assertRaises(FullQueueException, queue.enqueue, 4)
+        self.assertRaises(FullQueueException, queue.enqueue_many, [4])
+        self.assertListEqual(list(queue), [1, 2, 3])
+        self.assertRaises(ValueError, SlidingWindowQueue[int].from_sequence, [1, 2], max_capacity=1)
+        queue.max_capacity = 4
+        queue.enqueue(4)
+        self.assertEqual(queue.sum(), 10)
+
+        windowed = SlidingWindowQueue[int](window_size=2, max_capacity=3)
+        windowed.enqueue_many(range(10))
+        self.assertListEqual(list(windowed), [8, 9])
+
+    def test_aggregates_match_a_rescan(self):
+        queue = SlidingWindowQueue[int](window_size=50)
+        window: list[int] = []
+
+        for _ in range(1_000):
+            value = random.randint(-1_000, 1_000)
+            queue.enqueue(value)
+            window = (window + [value])[-50:]
+
+            self.assertEqual(queue.min(), min(window))
+            self.assertEqual(queue.max(), max(window))
+            self.assertEqual(queue.sum(), sum(window))
+
+        self.assertEqual(len(queue), 50)
+        self.assertFalse(queue.is_full)
+
+    def test_non_commutative_combine(self):
+        queue = SlidingWindowQueue[str](window_size=3, aggregates={"text": lambda left, right: left + right})
+
+        queue.enqueue_many("abcd")
+        self.assertEqual(queue.aggregate("text"), "bcd")
+
+        queue.dequeue()
+        queue.enqueue("e")
+        self.assertEqual(queue.aggregate("text"), "cde")
+        self.assertRaises(KeyError, queue.aggregate, "sum")
+
+        queue.clear()
+        self.assertRaises(EmptyQueueException, queue.aggregate, "text")
+
+
+if __name__ == "__main__":
+    unittest.main()
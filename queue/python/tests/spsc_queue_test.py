@@ -0,0 +1,94 @@
+import threading
+import unittest
+from time import sleep
+
+from queue.empty_queue_exception import EmptyQueueException
+from queue.full_queue_exception import FullQueueException
+from queue.queue import Queue
+from queue.spsc_queue import SPSCQueue
+
+
+class TestSPSCQueue(unittest.TestCase):
+    def test_is_instance(self):
+        spsc_queue = SPSCQueue[int](max_capacity=4)
+
+        self.assertIsInstance(spsc_queue, SPSCQueue)
+        self.assertIsInstance(spsc_queue, Queue)
+
+    def test_capacity_must_be_a_power_of_two(self):
+        self.assertRaises(ValueError, SPSCQueue, max_capacity=6)
+        self.assertRaises(ValueError, SPSCQueue, max_capacity=0)
+        self.assertEqual(SPSCQueue[int](max_capacity=8).max_capacity, 8)
+
+    def test_enqueue_and_dequeue_wrap_around(self):
+        spsc_queue = SPSCQueue[int](max_capacity=4)
+
+        self.assertRaises(EmptyQueueException, spsc_queue.dequeue)
+        self.assertIsNone(spsc_queue.try_dequeue())
+
+        for round_number in range(3):
+            spsc_queue.enqueue_many(range(round_number, round_number + 3))
+            spsc_queue.enqueue(99)
+
+            self.assertTrue(spsc_queue.is_full)
+            self.assertRaises(FullQueueException, spsc_queue.enqueue, 100)
+            self.assertFalse(spsc_queue.try_enqueue(100))
+            self.assertEqual(spsc_queue.peek, round_number)
+            self.assertIn(99, spsc_queue)
+            self.assertListEqual(list(spsc_queue), [round_number, round_number + 1, round_number + 2, 99])
+
+            self.assertEqual(spsc_queue.dequeue(), round_number)
+            self.assertListEqual(spsc_queue.dequeue_many(3), [round_number + 1, round_number + 2, 99])
+            self.assertTrue(spsc_queue.is_empty)
+
+    def test_batch_that_does_not_fit_is_rejected(self):
+        spsc_queue = SPSCQueue[int](max_capacity=2)
+
+        self.assertRaises(FullQueueException, spsc_queue.enqueue_many, [1, 2, 3])
+        self.assertTrue(spsc_queue.is_empty)
+        self.assertRaises(ValueError, spsc_queue.dequeue_many, 1)
+
+    def test_from_sequence_needs_a_capacity(self):
+        spsc_queue = SPSCQueue[int].from_sequence([1, 2, 3], max_capacity=4)
+
+        self.assertListEqual(list(spsc_queue), [1, 2, 3])
+        self.assertRaises(ValueError, SPSCQueue[int].from_sequence, [1, 2, 3])
+
+    def test_negative_dequeue_many_is_rejected(self):
+        spsc_queue = SPSCQueue[int].from_sequence([1, 2], max_capacity=2)
+
+        self.assertRaises(ValueError, spsc_queue.dequeue_many, -1)
+        self.assertListEqual(spsc_queue.dequeue_many(2), [1, 2])
+        self.assertTrue(spsc_queue.is_empty)
+
+    def test_dequeue_releases_slots(self):
+        spsc_queue = SPSCQueue[object](max_capacity=2)
+        spsc_queue.enqueue(object())
+        spsc_queue.dequeue()
+
+        self.assertListEqual(spsc_queue._slots, [None, None])
+
+    def test_one_producer_one_consumer(self):
+        spsc_queue = SPSCQueue[int](max_capacity=16)
+        count = 20_000
+        received: list[int] = []
+
+        def produce() -> None:
+            for item in range(count):
+                while not spsc_queue.try_enqueue(item):
+                    sleep(0)
+
+        producer = threading.Thread(target=produce)
+        producer.start()
+        while len(received) < count:
+            if spsc_queue.is_not_empty:
+                received.append(spsc_queue.dequeue())
+            else:
+                sleep(0)
+        producer.join()
+
+        self.assertListEqual(received, list(range(count)))
+
+
+if __name__ == "__main__":
+    unittest.main()
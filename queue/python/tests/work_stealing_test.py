@@ -0,0 +1,97 @@
+import time
+import unittest
+
+from queue.empty_queue_exception import EmptyQueueException
+from queue.queue import Queue
+from queue.work_stealing import WorkStealingDeque, WorkStealingExecutor
+
+
+def tree_sum(executor: WorkStealingExecutor, depth: int) -> int:
+    if depth == 0:
+        return 1
+    left = executor.submit(tree_sum, executor, depth - 1)
+    right = executor.submit(tree_sum, executor, depth - 1)
+    return executor.join(left) + executor.join(right)
+
+
+def square(value: int) -> int:
+    return value * value
+
+
+class TestWorkStealingDeque(unittest.TestCase):
+    def test_is_instance(self):
+        self.assertIsInstance(WorkStealingDeque[int](), Queue)
+
+    def test_owner_lifo_thief_fifo(self):
+        work = WorkStealingDeque[int]()
+        for task in range(4):
+            work.push(task)
+
+        self.assertEqual(work.pop(), 3)
+        self.assertEqual(work.steal(), 0)
+        self.assertEqual(work.dequeue(), 1)
+        self.assertEqual(work.try_pop(), 2)
+        self.assertIsNone(work.try_pop())
+        self.assertIsNone(work.try_steal())
+        self.assertRaises(EmptyQueueException, work.pop)
+        self.assertRaises(EmptyQueueException, work.steal)
+
+    def test_from_sequence(self):
+        work = WorkStealingDeque[int].from_sequence([1, 2, 3])
+        self.assertEqual(work.pop(), 3)
+        self.assertEqual(work.steal(), 1)
+        self.assertRaises(ValueError, WorkStealingDeque[int].from_sequence, [1], max_capacity=1)
+        self.assertRaises(ValueError, setattr, work, "max_capacity", 10)
+        work.max_capacity = None
+        self.assertIsNone(work.max_capacity)
+
+
+class TestWorkStealingExecutor(unittest.TestCase):
+    def test_idle_workers_sleep_until_submit(self):
+        with WorkStealingExecutor(4) as executor:
+            self.assertEqual(executor.join(executor.submit(square, 3)), 9)
+            scans = 0
+            find_task = executor._find_task
+
+            def counting_find_task(index):
+                nonlocal scans
+                scans += 1
+                return find_task(index)
+
+            executor._find_task = counting_find_task  # type: ignore[method-assign]
+            time.sleep(0.05)
+            self.assertEqual(scans, 0)
+            self.assertListEqual(list(executor.map(square, range(10))), [value * value for value in range(10)])
+
+    def test_recursive_fork_join_with_fewer_workers_than_depth(self):
+        with WorkStealingExecutor(2) as executor:
+            self.assertEqual(executor.join(executor.submit(tree_sum, executor, 10)), 1024)
+
+    def test_map_and_join_all(self):
+        results: list[int] = []
+
+        with WorkStealingExecutor(4) as executor:
+            self.assertListEqual(list(executor.map(pow, [2, 3, 4], [2, 2, 2])), [4, 9, 16])
+
+            for value in range(100):
+                executor.submit(results.append, value)
+            executor.join()
+
+            self.assertListEqual(sorted(results), list(range(100)))
+
+        self.assertRaises(RuntimeError, executor.submit, print)
+
+    def test_exceptions_are_raised_by_join(self):
+        with WorkStealingExecutor(2) as executor:
+            future = executor.submit(int, "not a number")
+
+            self.assertRaises(ValueError, executor.join, future)
+
+    def test_process_mode(self):
+        with WorkStealingExecutor(2, mode="process") as executor:
+            self.assertListEqual(list(executor.map(square, range(10))), [value * value for value in range(10)])
+            self.assertRaises(ValueError, executor.join, executor.submit(int, "x"))
+
+
+if __name__ == "__main__":
+    unittest.main()
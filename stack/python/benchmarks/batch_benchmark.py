@@ -0,0 +1,55 @@
+"""Bulk push_all/pop_n against per-item push/pop loops.
+
+Run from `stack/python`:
+    python -m benchmarks.batch_benchmark [--items N]
+"""
+
+import argparse
+from time import perf_counter
+from typing import Callable
+
+from module.stack import Stack
+
+
+def timed(operation: Callable[[], object]) -> float:
+    start = perf_counter()
+    operation()
+    return perf_counter() - start
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--items", type=int, default=1_000_000)
+    args = parser.parse_args()
+
+    items = list(range(args.items))
+    results: dict[str, float] = {}
+
+    def push_loop() -> None:
+        stack = Stack[int]()
+        for item in items:
+            stack.push(item)
+
+    def pop_loop() -> None:
+        for _ in range(args.items):
+            loaded.pop()
+
+    results["push loop"] = timed(push_loop)
+    results["push_all"] = timed(lambda: Stack[int]().push_all(items))
+
+    loaded = Stack[int].from_sequence(items)
+    results["pop loop"] = timed(pop_loop)
+
+    loaded = Stack[int].from_sequence(items)
+    results["pop_n (half)"] = timed(lambda: list(loaded.pop_n(args.items // 2)))
+
+    loaded = Stack[int].from_sequence(items)
+    results["pop_all"] = timed(lambda: list(loaded.pop_all()))
+
+    print(f"{args.items:,} items")
+    for label, elapsed in results.items():
+        print(f"{label:<14} {elapsed * 1e3:>9.1f} ms {elapsed / args.items * 1e9:>8.1f} ns/item")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,51 @@
+"""Memory taken by many small Stacks against CompactStacks.
+
+Builds N instances of each class, empty then holding 4 elements, and reports the
+bytes traced per instance, not counting the elements nor the list holding them.
+
+Run from `stack/python`:
+    python -m benchmarks.compact_stack_benchmark [--instances N]
+"""
+
+import argparse
+import gc
+import tracemalloc
+from typing import Any
+
+from module.compact_stack import CompactStack
+from module.stack import Stack
+
+ELEMENTS = (1, 2, 3, 4)
+
+
+def bytes_per_instance(cls: type[Any], instances: int, elements: tuple[int, ...]) -> float:
+    """Bytes per instance of [cls] holding [elements]."""
+    gc.collect()
+    holder: list[Any] = [None] * instances
+    tracemalloc.start()
+    for index in range(instances):
+        stack = cls()
+        stack.push_all(elements)
+        holder[index] = stack
+    allocated, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del holder
+
+    return allocated / instances
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--instances", type=int, default=1_000_000)
+    args = parser.parse_args()
+
+    print(f"{args.instances:,} instances")
+    print(f"{'':<14} {'empty':>12} {'4 elements':>12}")
+    for cls in (Stack, CompactStack):
+        empty = bytes_per_instance(cls, args.instances, ())
+        full = bytes_per_instance(cls, args.instances, ELEMENTS)
+        print(f"{cls.__name__:<14} {empty:>10.0f} B {full:>10.0f} B")
+
+
+if __name__ == "__main__":
+    main()
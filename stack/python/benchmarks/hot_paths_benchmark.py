@@ -0,0 +1,101 @@
+"""Hot paths of Stack (push, pop, pop_n, __contains__, __iter__, from_sequence)
+against list, collections.deque and the standard library queue.LifoQueue, at sizes
+from 10 to 10M, plus the memory each structure takes per element.
+
+Store a run with `--output baseline.json`, then check later runs against it with
+`--baseline baseline.json [--threshold 0.1] [--operation-threshold contains=0.25]`;
+the exit code is 1 when an operation got slower than its threshold.
+
+Run from `stack/python`:
+    python -m benchmarks.hot_paths_benchmark [--sizes N ...] [--no-memory]
+"""
+
+import queue
+import sys
+from collections import deque
+from typing import Any, Callable
+
+from benchmarking.regression import Case, main
+from module.stack import Stack
+
+
+def push_all(push: Callable[[int], None], items: list[int]) -> Callable[[], None]:
+    def operation() -> None:
+        for item in items:
+            push(item)
+
+    return operation
+
+
+def pop_all(pop: Callable[[], int], size: int) -> Callable[[], None]:
+    def operation() -> None:
+        for _ in range(size):
+            pop()
+
+    return operation
+
+
+def pop_n(stack: Stack[int]) -> Callable[[], None]:
+    # All but one element, so pop_n doesn't take the pop_all shortcut.
+    return lambda: stack.pop_n(len(stack) - 1)
+
+
+def delete_slice(sequence: list[int]) -> Callable[[], None]:
+    def operation() -> None:
+        del sequence[1:]
+
+    return operation
+
+
+def filled_lifo_queue(items: list[int]) -> queue.LifoQueue[int]:
+    lifo_queue = queue.LifoQueue[int]()
+    for item in items:
+        lifo_queue.put_nowait(item)
+
+    return lifo_queue
+
+
+def contains_missing(structure: Any) -> Callable[[], bool]:
+    return lambda: -1 in structure
+
+
+def iterate(structure: Any) -> Callable[[], None]:
+    def operation() -> None:
+        for _ in structure:
+            pass
+
+    return operation
+
+
+CASES = [
+    Case("Stack", "push", lambda items: push_all(Stack[int]().push, items)),
+    Case("Stack", "pop", lambda items: pop_all(Stack[int].from_sequence(items).pop, len(items))),
+    Case("Stack", "pop_n", lambda items: pop_n(Stack[int].from_sequence(items))),
+    Case("Stack", "contains", lambda items: contains_missing(Stack[int].from_sequence(items))),
+    Case("Stack", "iter", lambda items: iterate(Stack[int].from_sequence(items))),
+    Case("Stack", "from_sequence", lambda items: lambda: Stack[int].from_sequence(items)),
+    Case("deque", "push", lambda items: push_all(deque[int]().append, items)),
+    Case("deque", "pop", lambda items: pop_all(deque(items).pop, len(items))),
+    Case("deque", "contains", lambda items: contains_missing(deque(items))),
+    Case("deque", "iter", lambda items: iterate(reversed(deque(items)))),
+    Case("deque", "from_sequence", lambda items: lambda: deque(items)),
+    Case("list", "push", lambda items: push_all([].append, items)),
+    Case("list", "pop", lambda items: pop_all(list(items).pop, len(items))),
+    Case("list", "pop_n", lambda items: delete_slice(list(items))),
+    Case("list", "contains", lambda items: contains_missing(list(items))),
+    Case("list", "iter", lambda items: iterate(reversed(list(items)))),
+    Case("list", "from_sequence", lambda items: lambda: list(items)),
+    Case("queue.LifoQueue", "push", lambda items: push_all(queue.LifoQueue[int]().put_nowait, items)),
+    Case("queue.LifoQueue", "pop", lambda items: pop_all(filled_lifo_queue(items).get_nowait, len(items))),
+]
+
+BUILDERS: dict[str, Callable[[list[int]], object]] = {
+    "Stack": lambda items: Stack[int].from_sequence(items),
+    "deque": deque,
+    "list": list,
+    "queue.LifoQueue": filled_lifo_queue,
+}
+
+
+if __name__ == "__main__":
+    sys.exit(main(__doc__ or "", CASES, BUILDERS))
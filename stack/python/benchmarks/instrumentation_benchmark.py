@@ -0,0 +1,43 @@
+"""Overhead of InstrumentedStack against the plain Stack, per push + pop pair,
+with every element sampled for the dwell histogram and with the default sampling.
+
+Run from `stack/python`:
+    python -m benchmarks.instrumentation_benchmark [--items N]
+"""
+
+import argparse
+from time import perf_counter
+from typing import Callable
+
+from module.instrumented_stack import InstrumentedStack
+from module.stack import Stack
+
+
+def round_trip(factory: Callable[[], Stack[int]], items: int) -> float:
+    stack = factory()
+    start = perf_counter()
+    for item in range(items):
+        stack.push(item)
+    for _ in range(items):
+        stack.pop()
+    return (perf_counter() - start) / items * 1e9
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--items", type=int, default=1_000_000)
+    args = parser.parse_args()
+
+    factories: dict[str, Callable[[], Stack[int]]] = {
+        "Stack": Stack[int],
+        "InstrumentedStack(sample_every=64)": InstrumentedStack[int],
+        "InstrumentedStack(sample_every=1)": lambda: InstrumentedStack[int](sample_every=1),
+    }
+    baseline = round_trip(Stack[int], args.items)
+    for name, factory in factories.items():
+        elapsed = round_trip(factory, args.items)
+        print(f"{name:<36} {elapsed:>7.1f} ns/item  ({elapsed / baseline:.2f}x)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,52 @@
+"""Membership checks of IndexedStack against the linear scan of Stack, plus the memory
+each stack takes per element (the multiset adds a dict entry per distinct element).
+
+Run from `stack/python`:
+    python -m benchmarks.membership_benchmark [--checks N]
+"""
+
+import argparse
+import random
+import tracemalloc
+from time import perf_counter
+
+from module.indexed_stack import IndexedStack
+from module.stack import Stack
+
+
+def per_check(stack: Stack[int], candidates: list[int]) -> float:
+    start = perf_counter()
+    for candidate in candidates:
+        if candidate not in stack:
+            pass
+    return (perf_counter() - start) / len(candidates) * 1e9
+
+
+def bytes_per_element(stack_class: type[Stack[int]], elements: list[int]) -> float:
+    tracemalloc.start()
+    stack = stack_class.from_sequence(elements)
+    allocated, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del stack
+    return allocated / len(elements)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--checks", type=int, default=1_000)
+    args = parser.parse_args()
+
+    print(f"{'size':>10} {'stack':<14} {'per check':>14} {'memory':>12}")
+    for size in (1_000, 10_000, 100_000):
+        elements = list(range(size))
+        # Half of the candidates are in the stack, half aren't.
+        candidates = [random.randrange(size * 2) for _ in range(args.checks)]
+        for stack_class in (Stack, IndexedStack):
+            stack = stack_class[int].from_sequence(elements)
+            elapsed = per_check(stack, candidates)
+            memory = bytes_per_element(stack_class, elements)
+            print(f"{size:>10,} {stack_class.__name__:<14} {elapsed:>11,.0f} ns {memory:>8.1f} B/el")
+
+
+if __name__ == "__main__":
+    main()
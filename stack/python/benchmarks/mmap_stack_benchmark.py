@@ -0,0 +1,54 @@
+"""Push/pop throughput of MmapStack and the time to reopen it as the history grows.
+
+Reopening should stay flat whatever the number of records, since only the
+header is read.
+
+Run from `stack/python`:
+    python -m benchmarks.mmap_stack_benchmark [--payload-bytes N]
+"""
+
+import argparse
+import os
+import tempfile
+from time import perf_counter
+
+from module.mmap_stack import MmapStack
+
+
+def run(path: str, items: int, payload: bytes) -> tuple[float, float, float]:
+    with MmapStack[bytes](path, serializer=bytes, deserializer=bytes) as stack:
+        start = perf_counter()
+        for _ in range(items):
+            stack.push(payload)
+        push_rate = items / (perf_counter() - start)
+
+    start = perf_counter()
+    reopened = MmapStack[bytes](path, serializer=bytes, deserializer=bytes)
+    reopen_time = perf_counter() - start
+
+    start = perf_counter()
+    while reopened.is_not_empty:
+        reopened.pop()
+    pop_rate = items / (perf_counter() - start)
+    reopened.close()
+
+    return push_rate, pop_rate, reopen_time
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--payload-bytes", type=int, default=256)
+    args = parser.parse_args()
+
+    payload = b"x" * args.payload_bytes
+    print(f"{args.payload_bytes} byte records")
+    print(f"{'records':>12} {'push/s':>12} {'pop/s':>12} {'reopen':>10}")
+
+    for items in (1_000, 100_000, 1_000_000):
+        with tempfile.TemporaryDirectory() as directory:
+            push_rate, pop_rate, reopen_time = run(os.path.join(directory, "stack"), items, payload)
+        print(f"{items:>12,} {push_rate:>12,.0f} {pop_rate:>12,.0f} {reopen_time * 1e6:>7.0f} us")
+
+
+if __name__ == "__main__":
+    main()
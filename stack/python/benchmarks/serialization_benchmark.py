@@ -0,0 +1,65 @@
+"""Binary dump and load of Stacks against plain pickle.
+
+Run from `stack/python`:
+    python -m benchmarks.serialization_benchmark [--items N]
+"""
+
+import argparse
+import io
+import pickle
+from time import perf_counter
+from typing import Any, Callable
+
+from module import serialization
+from module.stack import Stack
+from module.typed_stack import TypedStack
+
+
+def timed(operation: Callable[[], Any]) -> tuple[float, Any]:
+    start = perf_counter()
+    result = operation()
+    return perf_counter() - start, result
+
+
+def bench_pickle(stack: Stack[Any]) -> tuple[float, float, int]:
+    """Seconds to pickle and unpickle [stack] with protocol 5, and the pickle size."""
+    buffers: list[pickle.PickleBuffer] = []
+    dump_seconds, data = timed(lambda: pickle.dumps(stack, protocol=5, buffer_callback=buffers.append))
+    load_seconds, _ = timed(lambda: pickle.loads(data, buffers=buffers))
+
+    return dump_seconds, load_seconds, len(data) + sum(buffer.raw().nbytes for buffer in buffers)
+
+
+def bench_dump(stack: Stack[Any], cls: type[Stack[Any]]) -> tuple[float, float, int]:
+    """Seconds to dump and load [stack] as [cls], and the dump size."""
+    file = io.BytesIO()
+    dump_seconds, _ = timed(lambda: serialization.dump(stack, file))
+    file.seek(0)
+    load_seconds, _ = timed(lambda: serialization.load(file, cls))
+
+    return dump_seconds, load_seconds, len(file.getvalue())
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--items", type=int, default=1_000_000)
+    args = parser.parse_args()
+
+    cases: dict[str, tuple[Stack[Any], type[Stack[Any]]]] = {
+        "Stack of ints": (Stack.from_sequence(list(range(args.items))), Stack),
+        "Stack of strings": (Stack.from_sequence([str(index) for index in range(args.items)]), Stack),
+        "Stack of 64 KiB bytearrays": (Stack.from_sequence([bytearray(65536) for _ in range(256)]), Stack),
+        "TypedStack('d')": (TypedStack.from_sequence([float(index) for index in range(args.items)], "d"), TypedStack),
+    }
+
+    print(f"{'':<28} {'':<6} {'dump':>10} {'load':>10} {'size':>14}")
+    for label, (stack, cls) in cases.items():
+        for method, (dump_seconds, load_seconds, size) in (
+            ("pickle", bench_pickle(stack)),
+            ("dump", bench_dump(stack, cls)),
+        ):
+            print(f"{label:<28} {method:<6} {dump_seconds * 1e3:>7.1f} ms {load_seconds * 1e3:>7.1f} ms {size:>14,} B")
+
+
+if __name__ == "__main__":
+    main()
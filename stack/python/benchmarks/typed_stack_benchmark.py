@@ -0,0 +1,79 @@
+"""Memory and throughput of TypedStack against the deque-backed Stack.
+
+Run from `stack/python`:
+    python -m benchmarks.typed_stack_benchmark [--items N]
+"""
+
+import argparse
+import tracemalloc
+from time import perf_counter
+from typing import Any, Callable
+
+from module.stack import Stack
+
+
+def measure_memory(factory: Callable[[], Stack[Any]], values: list[Any]) -> int:
+    """Bytes allocated by a stack holding [values], boxed numbers included.
+
+    Numbers are created inside the traced region, as a parser would, so the
+    deque-backed stack is charged for the objects it keeps alive.
+    """
+    tracemalloc.start()
+    stack = factory()
+    for value in values:
+        stack.push(value * 1)
+    allocated, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    del stack
+    return allocated
+
+
+def measure_throughput(factory: Callable[[], Stack[Any]], values: list[Any]) -> tuple[float, float]:
+    """Seconds to push then pop all [values] one by one, and to do it in bulk."""
+    stack = factory()
+
+    start = perf_counter()
+    for value in values:
+        stack.push(value)
+    while stack.is_not_empty:
+        stack.pop()
+    per_item = perf_counter() - start
+
+    start = perf_counter()
+    stack.push_all(values)
+    for _ in stack.pop_n(len(values)):
+        pass
+    bulk = perf_counter() - start
+
+    return per_item, bulk
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--items", type=int, default=1_000_000)
+    args = parser.parse_args()
+
+    cases: list[tuple[str, list[Any], Callable[[], Stack[Any]]]] = [
+        ("float, Stack", [float(i) for i in range(args.items)], Stack),
+        ("float, Stack.typed('d')", [float(i) for i in range(args.items)], lambda: Stack.typed("d")),
+        ("int, Stack", list(range(args.items)), Stack),
+        ("int, Stack.typed('q')", list(range(args.items)), lambda: Stack.typed("q")),
+    ]
+
+    print(f"{args.items:,} elements")
+    print(f"{'case':<26} {'bytes/elem':>10} {'push+pop ns/op':>15} {'bulk ns/op':>11}")
+
+    for label, values, factory in cases:
+        allocated = measure_memory(factory, values)
+        per_item, bulk = measure_throughput(factory, values)
+        per_op = 2 * args.items
+
+        print(
+            f"{label:<26} {allocated / args.items:>10.1f}"
+            f" {per_item / per_op * 1e9:>15.1f} {bulk / per_op * 1e9:>11.1f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,187 @@
+"""A Stack implementation that keeps running aggregates (min, max, sum, ...) for each level.
+
+Raises:
+    EmptyStackError: When tried to pop, peek or aggregate when the stack is empty.
+
+Returns:
+    AggregatingStack: A Stack whose aggregates are read in O(1).
+"""
+
+import operator
+from collections import deque
+from collections.abc import Callable, Mapping, Sequence
+from typing import Any, Iterator, TypeVar, override
+
+from module.errors.empty_stack_error import EmptyStackError
+from module.stack import Stack
+
+E = TypeVar("E")
+
+Combine = Callable[[Any, Any], Any]
+
+DEFAULT_AGGREGATES: Mapping[str, Combine] = {"min": min, "max": max, "sum": operator.add}
+
+
+class AggregatingStack(Stack[E]):
+    """A Stack that stores, next to each element, the aggregates of every element up to it.
+
+    Each aggregate is built with an associative `combine(accumulated, element)` function,
+    `min`, `max` and `operator.add` by default, so reading it is O(1) after any push
+    or pop, at the cost of one tuple per element.
+
+    Args:
+        Stack (E): Base class, whose API is kept.
+
+    Raises:
+        EmptyStackError: When `top`, `pop` and aggregate operations are made when the stack is empty.
+        KeyError: When asking for an aggregate the stack wasn't created with.
+
+    Returns:
+        AggregatingStack[E]: An instance of AggregatingStack.
+    """
+
+    _names: dict[str, int]
+    _combines: tuple[Combine, ...]
+    # Aggregates of the elements from the bottom up to the same level, one value per combine.
+    _levels: deque[tuple[Any, ...]]
+
+    def __init__(self, aggregates: Mapping[str, Combine] = DEFAULT_AGGREGATES) -> None:
+        """Creates an empty stack maintaining the given [aggregates].
+
+        Args:
+            aggregates (Mapping[str, Combine], optional): Associative functions by name. Defaults to min, max and sum.
+        """
+        super().__init__()
+        self._names = {name: index for index, name in enumerate(aggregates)}
+        self._combines = tuple(aggregates.values())
+        self._levels = deque()
+
+    @override
+    def push(self, element: E) -> None:
+        """Adds [element] to top of the stack, updating the aggregates.
+
+        Args:
+            element (E): Element to be added.
+        """
+        levels = self._levels
+        if levels:
+            below = levels[-1]
+            levels.append(tuple([combine(value, element) for combine, value in zip(self._combines, below)]))
+        else:
+            levels.append((element,) * len(self._combines))
+        self._internal_deque.append(element)
+        if self._undo_log is not None:
+            self._undo_log = self._undo_log.push(("pop", 1))
+
+    @override
+    def push_all(self, sequence: Sequence[E]) -> None:
+        """Pushes all elements of the [sequence] to the stack, in order.
+
+        Args:
+            sequence (Sequence[E]): Sequence to be added.
+        """
+        for element in sequence:
+            self.push(element)
+
+    @override
+    def pop(self) -> E:
+        """Removes the element at the top of the stack (the last added one).
+
+        Raises:
+            EmptyStackError: When the stack has no elements, this exception will be raised.
+
+        Returns:
+            E: The last element added in the stack.
+        """
+        if not self._internal_deque:
+            raise EmptyStackError()
+
+        self._levels.pop()
+        element = self._internal_deque.pop()
+        if self._undo_log is not None:
+            self._undo_log = self._undo_log.push(("push", [element]))
+
+        return element
+
+    @override
+    def pop_all(self) -> Iterator[E]:
+        """Pop all elements of the stack and clears the stack in a single step.
+
+        Returns:
+            Iterator[E]: Iterator of all elements in the stack in LIFO order.
+        """
+        self._levels.clear()
+
+        return super().pop_all()
+
+    @override
+    def pop_n(self, n: int) -> Iterator[E]:
+        """Pops the first [n] elements in LIFO order. They're removed right away, not while iterating.
+
+        Args:
+            n (int): Quantity of elements to be popped.
+
+        Raises:
+            ValueError: When [n] is higher than actual quantity of elements.
+
+        Returns:
+            Iterator[E]: Elements popped.
+        """
+        if n == len(self._internal_deque):
+            return self.pop_all()
+
+        popped = super().pop_n(n)
+        pop_level = self._levels.pop
+        for _ in range(n):
+            pop_level()
+
+        return popped
+
+    @override
+    def clear(self) -> None:
+        """Clear the stack of all of its elements."""
+        super().clear()
+        self._levels.clear()
+
+    def aggregate(self, name: str) -> Any:
+        """The aggregate called [name] over all elements of the stack, in O(1).
+
+        Args:
+            name (str): One of the names given when creating the stack.
+
+        Raises:
+            EmptyStackError: When the stack is empty.
+            KeyError: When there's no aggregate called [name].
+
+        Returns:
+            Any: The combination of every element, from the bottom to the top.
+        """
+        index = self._names[name]
+        if not self._levels:
+            raise EmptyStackError(message="Tried to aggregate an empty stack")
+
+        return self._levels[-1][index]
+
+    def min(self) -> E:
+        """Smallest element of the stack, when created with the default aggregates.
+
+        Returns:
+            E: The smallest element.
+        """
+        return self.aggregate("min")
+
+    def max(self) -> E:
+        """Largest element of the stack, when created with the default aggregates.
+
+        Returns:
+            E: The largest element.
+        """
+        return self.aggregate("max")
+
+    def sum(self) -> E:
+        """Sum of the elements of the stack, when created with the default aggregates.
+
+        Returns:
+            E: The sum of every element.
+        """
+        return self.aggregate("sum")
@@ -0,0 +1,167 @@
+"""An asyncio-native Stack implementation.
+
+Returns:
+    AsyncStack: A Stack whose `pop` suspends instead of raising when empty.
+"""
+
+import asyncio
+from collections import deque
+from collections.abc import AsyncIterator, Sequence
+from typing import TypeVar, override
+
+from module.errors.empty_stack_error import EmptyStackError
+from module.stack import Stack
+
+E = TypeVar("E")
+
+
+class AsyncStack(Stack[E]):
+    """A Stack for asyncio code, where consumers wait for elements instead of polling.
+
+    Each waiting consumer is parked on its own future and woken by `push`, so
+    thousands of coroutines can share one stack without polling. It's not
+    thread-safe: use it from a single event loop.
+
+    Returns:
+        AsyncStack[E]: An instance of AsyncStack.
+    """
+
+    _poppers: deque[asyncio.Future[None]]
+
+    def __init__(self) -> None:
+        """Initializes the instance of an empty async stack."""
+        super().__init__()
+        self._poppers = deque()
+
+    @override
+    def push(self, element: E) -> None:
+        """Adds [element] to top of the stack and wakes one waiting consumer.
+
+        Args:
+            element (E): Element to be added.
+        """
+        self._internal_deque.append(element)
+        if self._undo_log is not None:
+            self._undo_log = self._undo_log.push(("pop", 1))
+        self._wakeup_next()
+
+    @override
+    def push_all(self, sequence: Sequence[E]) -> None:
+        """Pushes all elements of the [sequence] to the stack, waking as many waiting consumers.
+
+        Args:
+            sequence (Sequence[E]): Sequence to be added.
+        """
+        self._internal_deque.extend(sequence)
+        if self._undo_log is not None:
+            self._undo_log = self._undo_log.push(("pop", len(sequence)))
+
+        for _ in range(len(sequence)):
+            if not self._wakeup_next():
+                break
+
+    @override
+    async def pop(self) -> E:  # type: ignore[override]
+        """Removes the element at the top of the stack, suspending until there is one.
+
+        Returns:
+            E: The last element added in the stack.
+        """
+        while not self._internal_deque:
+            await self._wait()
+
+        return self.pop_nowait()
+
+    def pop_nowait(self) -> E:
+        """Removes the element at the top of the stack without waiting. Synchronous counterpart of `pop`.
+
+        Raises:
+            EmptyStackError: When the stack has no elements, this exception will be raised.
+
+        Returns:
+            E: The last element added in the stack.
+        """
+        if self._internal_deque:
+            element = self._internal_deque.pop()
+            if self._undo_log is not None:
+                self._undo_log = self._undo_log.push(("push", [element]))
+
+            return element
+        else:
+            raise EmptyStackError()
+
+    @override
+    def pop_or_none(self) -> E | None:
+        """Removes the element at the top of the stack without waiting, `None` if the stack is empty.
+
+        Returns:
+            E | None: Last element added in the stack, `None` if the stack is empty.
+        """
+        try:
+            return self.pop_nowait()
+        except EmptyStackError:
+            return None
+
+    async def pop_many(self, max_items: int) -> list[E]:
+        """Removes up to [max_items] elements in LIFO order once at least one is available.
+
+        The batch is taken without suspending after the wait, so cancelling the call either
+        removes nothing or returns the whole batch.
+
+        Args:
+            max_items (int): Maximum quantity of elements to be popped.
+
+        Raises:
+            ValueError: When [max_items] is not a positive integer.
+
+        Returns:
+            list[E]: Popped elements in LIFO order, never empty.
+        """
+        if max_items < 1:
+            raise ValueError("max_items must be a positive integer")
+
+        while not self._internal_deque:
+            await self._wait()
+
+        internal_deque = self._internal_deque
+        popped = [internal_deque.pop() for _ in range(min(max_items, len(internal_deque)))]
+        if self._undo_log is not None:
+            self._undo_log = self._undo_log.push(("push", popped[::-1]))
+
+        return popped
+
+    async def __aiter__(self) -> AsyncIterator[E]:
+        """Pops elements in LIFO order as they arrive, suspending while the stack is empty.
+
+        Yields:
+            AsyncIterator[E]: Popped elements.
+        """
+        while True:
+            yield await self.pop()
+
+    async def _wait(self) -> None:
+        waiter = asyncio.get_running_loop().create_future()
+        self._poppers.append(waiter)
+
+        try:
+            await waiter
+        except BaseException:
+            waiter.cancel()
+            try:
+                self._poppers.remove(waiter)
+            except ValueError:
+                pass
+            # This waiter may have been woken just before being cancelled,
+            # hand the wakeup over so no element goes unnoticed.
+            if not waiter.cancelled() and self._internal_deque:
+                self._wakeup_next()
+            raise
+
+    def _wakeup_next(self) -> bool:
+        while self._poppers:
+            waiter = self._poppers.popleft()
+            if not waiter.done():
+                waiter.set_result(None)
+                return True
+
+        return False
@@ -0,0 +1,299 @@
+"""A Stack implementation with a small per-instance footprint, for millions of mostly empty stacks.
+
+Raises:
+    EmptyStackError: When tried to pop or peek when the stack is empty.
+
+Returns:
+    CompactStack: A Stack without `__dict__` whose storage is created lazily.
+"""
+
+from collections.abc import Sequence
+from types import TracebackType
+from typing import Any, Collection, Generic, Iterator, NoReturn, Self, TypeVar, override
+
+from module.errors.empty_stack_error import EmptyStackError
+from module.stack import Stack
+
+E = TypeVar("E")
+
+# Every empty stack shares the empty tuple, a singleton in CPython.
+_EMPTY: tuple[()] = ()
+# Up to this many elements are kept in a tuple, replaced on each change, before moving to a list.
+INLINE_CAPACITY = 4
+
+
+@Stack.register
+class CompactStack(Collection[E], Generic[E]):
+    """A Stack whose instances take 40 bytes when empty, and 112 with 4 elements, against
+    832 bytes for a `Stack` (its object, `__dict__` and preallocated deque block) on 64-bit CPython.
+
+    It declares `__slots__`, so it has no `__dict__`: it can't subclass `Stack`, and is
+    registered as a virtual subclass instead, `isinstance(compact, Stack)` holds. Its only
+    slot holds the shared empty tuple while empty, then a tuple of up to `INLINE_CAPACITY`
+    elements, then a list, which is dropped again once the stack is emptied.
+
+    It implements the `Stack` API but for savepoints, which would cost a slot on every
+    instance: `savepoint`, `rollback` and `release_savepoints` raise `TypeError`.
+
+    Args:
+        Collection : Base class that describes actual class as a Collection.
+        Generic (E): The type of the elements.
+
+    Raises:
+        EmptyStackError: When `top` and `pop` operations are made when the stack is empty.
+
+    Returns:
+        CompactStack[E]: An instance of CompactStack.
+    """
+
+    __slots__ = ("_items",)
+
+    _items: tuple[E, ...] | list[E]
+
+    def __init__(self) -> None:
+        """Initializes the instance of an empty stack, without allocating storage."""
+        self._items = _EMPTY
+
+    @classmethod
+    def from_sequence(cls, sequence: Sequence[E]) -> Self:
+        """Factory constructor to initialize an instance of stack from a [sequence].
+
+        Args:
+            sequence (Sequence[E]): A sequence, like list, tuple, etc. It'll be iterated over from start to the end.
+
+        Returns:
+            Self: An instance of CompactStack filled with the [sequence] elements.
+        """
+        stack = cls()
+        stack.push_all(sequence)
+
+        return stack
+
+    @classmethod
+    def empty(cls) -> Self:
+        """Initializes an instance of an empty stack. Alias to the common constructor.
+
+        Returns:
+            Self: An empty instance of the class CompactStack.
+        """
+        return cls()
+
+    typed = staticmethod(Stack.typed)
+
+    def push(self, element: E) -> None:
+        """Adds [element] to top of the stack.
+
+        Args:
+            element (E): Element to be added.
+        """
+        items = self._items
+        if type(items) is list:
+            items.append(element)
+        elif len(items) < INLINE_CAPACITY:
+            self._items = (*items, element)
+        else:
+            self._items = [*items, element]
+
+    def push_all(self, sequence: Sequence[E]) -> None:
+        """Pushes all elements of the [sequence] to the stack in a single step.
+
+        Args:
+            sequence (Sequence[E]): Sequence to be added.
+        """
+        items = self._items
+        if type(items) is list:
+            items.extend(sequence)
+        elif len(items) + len(sequence) <= INLINE_CAPACITY:
+            self._items = (*items, *sequence)
+        else:
+            self._items = [*items, *sequence]
+
+    def pop(self) -> E:
+        """Removes the element at the top of the stack (the last added one).
+
+        Raises:
+            EmptyStackError: When the stack has no elements, this exception will be raised.
+
+        Returns:
+            E: The last element added in the stack.
+        """
+        items = self._items
+        if not items:
+            raise EmptyStackError()
+
+        if type(items) is list:
+            element = items.pop()
+            if not items:
+                self._items = _EMPTY
+            return element
+
+        self._items = items[:-1]
+        return items[-1]
+
+    def pop_or_none(self) -> E | None:
+        """Removes the element at the top of the stack. Alternative that returns `None` instead to raise `EmptyStackError`.
+
+        Returns:
+            E | None: Last element added in the stack, `None` if the stack is empty.
+        """
+        try:
+            return self.pop()
+        except EmptyStackError:
+            return None
+
+    def pop_all(self) -> Iterator[E]:
+        """Pop all elements of the stack and clears the stack in a single step.
+
+        Returns:
+            Iterator[E]: Iterator of all elements in the stack in LIFO order.
+        """
+        popped = self._items
+        self._items = _EMPTY
+
+        return reversed(popped)
+
+    def pop_n(self, n: int) -> Iterator[E]:
+        """Pops the first [n] elements in LIFO order. They're removed right away, not while iterating.
+
+        Args:
+            n (int): Quantity of elements to be popped.
+
+        Raises:
+            ValueError: When [n] is higher than actual quantity of elements.
+
+        Returns:
+            Iterator[E]: Elements popped.
+        """
+        items = self._items
+        if len(items) < n:
+            raise ValueError(f"Your value for n should be less or equal to {len(items)}")
+        elif n == len(items):
+            return self.pop_all()
+        elif n <= 0:
+            return iter(())
+
+        popped = items[-n:]
+        if type(items) is list:
+            del items[-n:]
+        else:
+            self._items = items[:-n]
+
+        return reversed(popped)
+
+    def pop_n_or_all(self, n: int) -> Iterator[E]:
+        """Tries to pop the first [n] elements in LIFO order. Alternative to pop_n that not raises.
+
+        Args:
+            n (int): Number of elements to try to pop.
+
+        Returns:
+            Iterator[E]: The first [n] elements in LIFO order, or all of them if there are fewer.
+        """
+        try:
+            return self.pop_n(n)
+        except ValueError:
+            return self.pop_all()
+
+    def clear(self) -> None:
+        """Clear the stack of all of its elements, releasing its storage."""
+        self._items = _EMPTY
+
+    def savepoint(self) -> NoReturn:
+        """Not supported, use a `Stack`.
+
+        Raises:
+            TypeError: Always, recording an undo log would cost a slot on every instance.
+        """
+        raise TypeError("CompactStack doesn't support savepoints, use a Stack")
+
+    def rollback(self, savepoint: Any) -> NoReturn:
+        """Not supported, see `savepoint`."""
+        raise TypeError("CompactStack doesn't support savepoints, use a Stack")
+
+    def release_savepoints(self) -> NoReturn:
+        """Not supported, see `savepoint`."""
+        raise TypeError("CompactStack doesn't support savepoints, use a Stack")
+
+    def top(self) -> E:
+        """The element at the 'top' of the stack.
+
+        Raises:
+            EmptyStackError: When the stack is empty.
+
+        Returns:
+            E: The element at the 'top' of the stack, without remove it.
+        """
+        if not self._items:
+            raise EmptyStackError(message="Tried to peek in an empty stack")
+
+        return self._items[-1]
+
+    def top_or_none(self) -> E | None:
+        """The element at top of the stack. Alternative that not raises to `top`.
+
+        Returns:
+            E | None: The element at the top of the stack, `None` if the stack is empty.
+        """
+        return self._items[-1] if self._items else None
+
+    @property
+    def is_empty(self) -> bool:
+        """Check if the stack is empty.
+
+        Returns:
+            bool: `True` if the stack is empty, `False` otherwise.
+        """
+        return not self._items
+
+    @property
+    def is_not_empty(self) -> bool:
+        """Checks if the stack is not empty
+
+        Returns:
+            bool: `True` if has at least one element, `False` otherwise
+        """
+        return bool(self._items)
+
+    @override
+    def __len__(self) -> int:
+        """Number of items in the stack.
+
+        Returns:
+            int: Number of items in the stack.
+        """
+        return len(self._items)
+
+    @override
+    def __contains__(self, element: object) -> bool:
+        """Checks if the [element] is in the stack.
+
+        Args:
+            element (object): Element to be searched.
+
+        Returns:
+            bool: `True` if the element is in the stack, `False` otherwise.
+        """
+        return element in self._items
+
+    @override
+    def __iter__(self) -> Iterator[E]:
+        """Iterator of the stack in LIFO order.
+
+        Yields:
+            Iterator[E]: An Iterator of the actual stack in LIFO order.
+        """
+        return reversed(self._items)
+
+    def __enter__(self) -> Self:
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_value: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        self.clear()
+
+        if exc_type is not None:
+            raise exc_type()
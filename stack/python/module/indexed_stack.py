@@ -0,0 +1,165 @@
+"""A Stack implementation with hash-indexed membership, where `in` and `count` take O(1).
+
+Raises:
+    EmptyStackError: When tried to pop or peek when the stack is empty.
+
+Returns:
+    IndexedStack: A Stack of hashable elements with a counted multiset of them.
+"""
+
+from collections import Counter
+from collections.abc import Hashable, Iterable, Sequence
+from typing import Iterator, TypeVar, override
+
+from module.errors.empty_stack_error import EmptyStackError
+from module.stack import Stack
+
+H = TypeVar("H", bound=Hashable)
+
+
+class IndexedStack(Stack[H]):
+    """A Stack of hashable elements that keeps a counted multiset of them in sync,
+    so `in` and `count` take O(1) instead of scanning the stack.
+
+    Repeated elements share a single counter, so a stack of few distinct values
+    indexes cheaply. Every push and pop updates the counter once, popped elements
+    are forgotten as soon as their count drops to zero.
+
+    Args:
+        Stack (H): Base class, whose API is kept.
+
+    Raises:
+        EmptyStackError: When `top` and `pop` operations are made when the stack is empty.
+        TypeError: When an unhashable element is pushed.
+
+    Returns:
+        IndexedStack[H]: An instance of IndexedStack.
+    """
+
+    _counts: Counter[H]
+
+    def __init__(self) -> None:
+        super().__init__()
+        self._counts = Counter()
+
+    @override
+    def push(self, element: H) -> None:
+        """Adds [element] to top of the stack.
+
+        Args:
+            element (H): Element to be added.
+        """
+        self._counts[element] += 1
+        self._internal_deque.append(element)
+        if self._undo_log is not None:
+            self._undo_log = self._undo_log.push(("pop", 1))
+
+    @override
+    def push_all(self, sequence: Sequence[H]) -> None:
+        """Pushes all elements of the [sequence] to the stack in a single step.
+
+        Args:
+            sequence (Sequence[H]): Sequence to be added.
+        """
+        # Counted first so unhashable elements are refused before anything is pushed.
+        counts = Counter(sequence)
+        super().push_all(sequence)
+        self._counts.update(counts)
+
+    @override
+    def pop(self) -> H:
+        """Removes the element at the top of the stack (the last added one).
+
+        Raises:
+            EmptyStackError: When the stack has no elements, this exception will be raised.
+
+        Returns:
+            H: The last element added in the stack.
+        """
+        if not self._internal_deque:
+            raise EmptyStackError()
+
+        element = self._internal_deque.pop()
+        self._forget(element)
+        if self._undo_log is not None:
+            self._undo_log = self._undo_log.push(("push", [element]))
+
+        return element
+
+    @override
+    def pop_all(self) -> Iterator[H]:
+        """Pop all elements of the stack and clears the stack in a single step.
+
+        Returns:
+            Iterator[H]: Iterator of all elements in the stack in LIFO order.
+        """
+        self._counts.clear()
+
+        return super().pop_all()
+
+    @override
+    def pop_n(self, n: int) -> Iterator[H]:
+        """Pops the first [n] elements in LIFO order. They're removed right away, not while iterating.
+
+        Args:
+            n (int): Quantity of elements to be popped.
+
+        Raises:
+            ValueError: When [n] is higher than actual quantity of elements.
+
+        Returns:
+            Iterator[H]: Elements popped.
+        """
+        if n == len(self._internal_deque):
+            return self.pop_all()
+
+        popped = list(super().pop_n(n))
+        self._forget_all(popped)
+
+        return iter(popped)
+
+    @override
+    def clear(self) -> None:
+        """Clear the stack of all of its elements."""
+        super().clear()
+        self._counts.clear()
+
+    def count(self, element: object) -> int:
+        """Number of times [element] is in the stack, in O(1).
+
+        Args:
+            element (object): Element to be counted.
+
+        Returns:
+            int: How many times [element] was pushed and not popped yet.
+        """
+        try:
+            return self._counts.get(element, 0)  # type: ignore[call-overload]
+        except TypeError:  # unhashable, so it can't be in the stack
+            return 0
+
+    @override
+    def __contains__(self, element: object) -> bool:
+        """Checks if the [element] is in the Stack, in O(1).
+
+        Args:
+            element (object): Element to be searched.
+
+        Returns:
+            bool: `True` if the element is in the stack, `False` otherwise.
+        """
+        try:
+            return element in self._counts
+        except TypeError:
+            return False
+
+    def _forget(self, element: H) -> None:
+        remaining = self._counts[element] - 1
+        if remaining:
+            self._counts[element] = remaining
+        else:
+            del self._counts[element]
+
+    def _forget_all(self, elements: Iterable[H]) -> None:
+        for element in elements:
+            self._forget(element)
@@ -0,0 +1,270 @@
+"""A Stack implementation with opt-in metrics: counters, depth, high-water mark and dwell times.
+
+Raises:
+    EmptyStackError: When tried to pop or peek when the stack is empty.
+
+Returns:
+    InstrumentedStack: A Stack that records what goes through it.
+"""
+
+import threading
+from bisect import bisect_left
+from collections.abc import Callable, Sequence
+from time import perf_counter
+from typing import Any, Iterator, TypeVar, override
+
+from module.errors.empty_stack_error import EmptyStackError
+from module.stack import Stack
+
+E = TypeVar("E")
+
+Exporter = Callable[[dict[str, Any]], None]
+
+# Upper bounds, in seconds, of the dwell time histogram buckets, those of the queue package's
+# `InstrumentedQueue`, so both export the same `dwell_seconds` layout.
+DWELL_BUCKETS: tuple[float, ...] = (1e-6, 1e-5, 1e-4, 1e-3, 1e-2, 0.1, 1.0, 10.0, float("inf"))
+
+
+class InstrumentedStack(Stack[E]):
+    """A Stack that counts pushed, popped and cleared elements, tracks its depth and high-water mark,
+    and measures the time spent in the stack by one element every `sample_every` pushes.
+
+    Popping a sampled element records its dwell time, clearing forgets it. Samples are
+    matched by depth, since a stack element can only leave from its own level. Metrics
+    are read with `metrics`, pushed to an `exporter` with `export`, or exported every
+    `export_interval` seconds by a daemon thread until `close`.
+
+    Args:
+        Stack (E): Base class, whose API is kept.
+
+    Raises:
+        EmptyStackError: When `top` and `pop` operations are made when the stack is empty.
+        ValueError: When `sample_every` isn't positive, or `export_interval` is given without `exporter`.
+
+    Returns:
+        InstrumentedStack[E]: An instance of InstrumentedStack.
+    """
+
+    _pushed: int
+    _popped: int
+    _cleared: int
+    _high_water_mark: int
+    _sample_every: int
+    # (index in the stack, push time) of the sampled elements still in the stack, bottom first
+    _samples: list[tuple[int, float]]
+    # Samples in each `DWELL_BUCKETS` bucket, and the sum of their dwell times
+    _dwell_counts: list[int]
+    _dwell_total: float
+    _exporter: Exporter | None
+    _stop_exporting: threading.Event
+    _export_thread: threading.Thread | None
+
+    def __init__(
+        self,
+        *,
+        sample_every: int = 64,
+        exporter: Exporter | None = None,
+        export_interval: float | None = None,
+    ) -> None:
+        """Creates an empty instrumented stack.
+
+        Args:
+            sample_every (int, optional): One element out of [sample_every] gets its dwell time measured. Defaults to 64.
+            exporter (Exporter | None, optional): Called with `metrics()` on every export. Defaults to None.
+            export_interval (float | None, optional): Seconds between automatic exports, `None` to only export on demand. Defaults to None.
+        """
+        if sample_every < 1:
+            raise ValueError("sample_every must be positive")
+        if export_interval is not None and exporter is None:
+            raise ValueError("export_interval requires an exporter")
+
+        super().__init__()
+        self._pushed = 0
+        self._popped = 0
+        self._cleared = 0
+        self._high_water_mark = 0
+        self._sample_every = sample_every
+        self._samples = []
+        self._dwell_counts = [0] * len(DWELL_BUCKETS)
+        self._dwell_total = 0.0
+        self._exporter = exporter
+        self._stop_exporting = threading.Event()
+        self._export_thread = None
+
+        if export_interval is not None:
+            self._export_thread = threading.Thread(
+                target=self._export_periodically, args=(export_interval,), daemon=True
+            )
+            self._export_thread.start()
+
+    @property
+    def high_water_mark(self) -> int:
+        """Highest depth the stack reached.
+
+        Returns:
+            int: The maximum number of elements the stack held at once.
+        """
+        return self._high_water_mark
+
+    @property
+    def dwell_histogram(self) -> dict[str, Any]:
+        """Time spent in the stack by the sampled elements.
+
+        Returns:
+            dict[str, Any]: Number of samples, their sum and the count of each bucket, up to its bound.
+        """
+        return {
+            "count": sum(self._dwell_counts),
+            "sum": self._dwell_total,
+            "buckets": {f"le_{bound:g}": count for bound, count in zip(DWELL_BUCKETS, self._dwell_counts)},
+        }
+
+    @override
+    def push(self, element: E) -> None:
+        """Adds [element] to top of the stack.
+
+        Args:
+            element (E): Element to be added.
+        """
+        internal_deque = self._internal_deque
+        if self._pushed % self._sample_every == 0:
+            self._samples.append((len(internal_deque), perf_counter()))
+        internal_deque.append(element)
+        if self._undo_log is not None:
+            self._undo_log = self._undo_log.push(("pop", 1))
+        self._pushed += 1
+        if len(internal_deque) > self._high_water_mark:
+            self._high_water_mark = len(internal_deque)
+
+    @override
+    def push_all(self, sequence: Sequence[E]) -> None:
+        """Pushes all elements of the [sequence] to the stack in a single step.
+
+        Args:
+            sequence (Sequence[E]): Sequence to be added.
+        """
+        base = len(self._internal_deque) - self._pushed
+        first_sampled = -(-self._pushed // self._sample_every) * self._sample_every
+        super().push_all(sequence)
+        self._pushed += len(sequence)
+
+        now = perf_counter()
+        self._samples.extend(
+            (base + pushed, now) for pushed in range(first_sampled, self._pushed, self._sample_every)
+        )
+        if len(self._internal_deque) > self._high_water_mark:
+            self._high_water_mark = len(self._internal_deque)
+
+    @override
+    def pop(self) -> E:
+        """Removes the element at the top of the stack (the last added one).
+
+        Raises:
+            EmptyStackError: When the stack has no elements, this exception will be raised.
+
+        Returns:
+            E: The last element added in the stack.
+        """
+        internal_deque = self._internal_deque
+        if not internal_deque:
+            raise EmptyStackError()
+
+        element = internal_deque.pop()
+        self._popped += 1
+        if self._undo_log is not None:
+            self._undo_log = self._undo_log.push(("push", [element]))
+
+        samples = self._samples
+        if samples and samples[-1][0] == len(internal_deque):
+            self._record_dwell(perf_counter() - samples.pop()[1])
+
+        return element
+
+    @override
+    def pop_all(self) -> Iterator[E]:
+        """Pop all elements of the stack and clears the stack in a single step.
+
+        Returns:
+            Iterator[E]: Iterator of all elements in the stack in LIFO order.
+        """
+        popped = len(self._internal_deque)
+        elements = super().pop_all()
+        self._popped += popped
+        self._drop_samples(record=True)
+
+        return elements
+
+    @override
+    def pop_n(self, n: int) -> Iterator[E]:
+        """Pops the first [n] elements in LIFO order. They're removed right away, not while iterating.
+
+        Args:
+            n (int): Quantity of elements to be popped.
+
+        Raises:
+            ValueError: When [n] is higher than actual quantity of elements.
+
+        Returns:
+            Iterator[E]: Elements popped.
+        """
+        if n == len(self._internal_deque):
+            return self.pop_all()
+
+        elements = super().pop_n(n)
+        self._popped += n
+        self._drop_samples(record=True)
+
+        return elements
+
+    @override
+    def clear(self) -> None:
+        """Clear the stack of all of its elements."""
+        self._cleared += len(self._internal_deque)
+        super().clear()
+        self._drop_samples(record=False)
+
+    def metrics(self) -> dict[str, Any]:
+        """Current metrics as a plain dict, ready to be serialized.
+
+        Returns:
+            dict[str, Any]: Counters, depth, high-water mark and dwell histogram.
+        """
+        return {
+            "pushed": self._pushed,
+            "popped": self._popped,
+            "cleared": self._cleared,
+            "depth": len(self),
+            "high_water_mark": self._high_water_mark,
+            "dwell_seconds": self.dwell_histogram,
+        }
+
+    def export(self) -> None:
+        """Calls the exporter, if any, with the current metrics."""
+        if self._exporter is not None:
+            self._exporter(self.metrics())
+
+    def close(self) -> None:
+        """Stops the periodic export, exporting one last time."""
+        if self._export_thread is not None:
+            self._stop_exporting.set()
+            self._export_thread.join()
+            self._export_thread = None
+            self.export()
+
+    def _drop_samples(self, *, record: bool) -> None:
+        """Forgets the samples of elements above the current top, recording their dwell time if [record]."""
+        samples = self._samples
+        depth = len(self._internal_deque)
+        now = perf_counter()
+        while samples and samples[-1][0] >= depth:
+            _, pushed_at = samples.pop()
+            if record:
+                self._record_dwell(now - pushed_at)
+
+    def _record_dwell(self, seconds: float) -> None:
+        self._dwell_counts[bisect_left(DWELL_BUCKETS, seconds)] += 1
+        self._dwell_total += seconds
+
+    def _export_periodically(self, interval: float) -> None:
+        while not self._stop_exporting.wait(interval):
+            self.export()
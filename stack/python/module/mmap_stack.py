@@ -0,0 +1,341 @@
+"""A file-backed Stack implementation, whose records live in memory-mapped files.
+
+Raises:
+    EmptyStackError: When tried to pop or peek when the stack is empty.
+
+Returns:
+    MmapStack: A Stack that persists across process restarts.
+"""
+
+import mmap
+import os
+import pickle
+import struct
+from collections.abc import Callable, Sequence
+from pathlib import Path
+from types import TracebackType
+from typing import Iterator, Self, TypeVar, override
+
+from module.errors.empty_stack_error import EmptyStackError
+from module.stack import Stack
+
+E = TypeVar("E")
+
+_MAGIC = b"MSTK"
+_VERSION = 1
+# Magic, format version and number of records, at the start of the index file.
+_HEADER = struct.Struct("<4sIQ")
+# End offset, in the data file, of each record.
+_OFFSET = struct.Struct("<Q")
+_INITIAL_BYTES = mmap.PAGESIZE * 16
+
+
+class MmapStack(Stack[E]):
+    """A Stack whose records are kept in two memory-mapped files next to [path].
+
+    `<path>.data` holds the serialized records back to back, append-only, and
+    `<path>.index` holds a small header with the number of records followed by
+    the end offset of each record. Opening an existing stack only maps both files,
+    so it costs the same whatever the size, and popping just lowers the record
+    count: the space is reused by the next pushes. Iteration streams records from
+    the map in LIFO order without loading the whole stack.
+
+    The record count is written after the record itself; call `flush` to force
+    both files to disk, for instance at checkpoints. Unlike `Stack`, leaving a
+    `with` block closes the stack instead of clearing it.
+
+    Args:
+        Stack (E): Base class, whose API is kept.
+
+    Raises:
+        EmptyStackError: When `top` and `pop` operations are made when the stack is empty.
+        ValueError: When the files at [path] aren't an MmapStack.
+
+    Returns:
+        MmapStack[E]: An instance of MmapStack.
+    """
+
+    _path: Path
+    _serializer: Callable[[E], bytes]
+    _deserializer: Callable[[bytes], E]
+    _data_file: int
+    _index_file: int
+    _data: mmap.mmap
+    _index: mmap.mmap
+    _count: int
+
+    def __init__(
+        self,
+        path: str | os.PathLike[str],
+        *,
+        serializer: Callable[[E], bytes] = pickle.dumps,
+        deserializer: Callable[[bytes], E] = pickle.loads,
+    ) -> None:
+        """Opens the stack stored at [path], creating it if it doesn't exist.
+
+        Args:
+            path (str | os.PathLike[str]): Base path, `.data` and `.index` are appended to it.
+            serializer (Callable[[E], bytes], optional): Turns elements into bytes. Defaults to `pickle.dumps`.
+            deserializer (Callable[[bytes], E], optional): Turns bytes back into elements. Defaults to `pickle.loads`.
+        """
+        self._path = Path(path)
+        self._serializer = serializer
+        self._deserializer = deserializer
+
+        self._data_file = os.open(f"{self._path}.data", os.O_RDWR | os.O_CREAT)
+        self._index_file = os.open(f"{self._path}.index", os.O_RDWR | os.O_CREAT)
+        self._data = _map(self._data_file)
+        self._index = _map(self._index_file)
+
+        magic, version, count = _HEADER.unpack_from(self._index, 0)
+        if magic == bytes(4):
+            _HEADER.pack_into(self._index, 0, _MAGIC, _VERSION, 0)
+            count = 0
+        elif magic != _MAGIC or version != _VERSION:
+            self.close()
+            raise ValueError(f"{self._path} is not an MmapStack")
+
+        self._count = count
+
+    @classmethod
+    @override
+    def from_sequence(cls, sequence: Sequence[E], path: str | os.PathLike[str]) -> Self:
+        """Factory constructor to open the stack at [path] and push the [sequence] elements.
+
+        Args:
+            sequence (Sequence[E]): A sequence, like list, tuple, etc. It'll be iterated over from start to the end.
+            path (str | os.PathLike[str]): Base path of the files.
+
+        Returns:
+            Self: An instance of MmapStack with the [sequence] elements on top.
+        """
+        stack = cls(path)
+        stack.push_all(sequence)
+
+        return stack
+
+    @classmethod
+    @override
+    def empty(cls, path: str | os.PathLike[str]) -> Self:
+        """Opens the stack at [path] and clears it, dropping whatever was stored there.
+
+        Args:
+            path (str | os.PathLike[str]): Base path of the files.
+
+        Returns:
+            Self: An empty instance of MmapStack.
+        """
+        stack = cls(path)
+        stack.clear()
+
+        return stack
+
+    @property
+    def path(self) -> Path:
+        """Base path of the files of the stack.
+
+        Returns:
+            Path: The path given when opening the stack.
+        """
+        return self._path
+
+    @override
+    def push(self, element: E) -> None:
+        """Adds [element] to top of the stack.
+
+        Args:
+            element (E): Element to be added.
+        """
+        self._append([self._serializer(element)])
+        if self._undo_log is not None:
+            self._undo_log = self._undo_log.push(("pop", 1))
+
+    @override
+    def push_all(self, sequence: Sequence[E]) -> None:
+        """Pushes all elements of the [sequence] to the stack, updating the record count once.
+
+        Args:
+            sequence (Sequence[E]): Sequence to be added.
+        """
+        self._append([self._serializer(element) for element in sequence])
+        if self._undo_log is not None:
+            self._undo_log = self._undo_log.push(("pop", len(sequence)))
+
+    @override
+    def pop(self) -> E:
+        """Removes the element at the top of the stack (the last added one).
+
+        Raises:
+            EmptyStackError: When the stack has no elements, this exception will be raised.
+
+        Returns:
+            E: The last element added in the stack.
+        """
+        if self._count == 0:
+            raise EmptyStackError()
+
+        element = self._read(self._count - 1)
+        self._set_count(self._count - 1)
+        if self._undo_log is not None:
+            self._undo_log = self._undo_log.push(("push", [element]))
+
+        return element
+
+    @override
+    def pop_all(self) -> Iterator[E]:
+        """Pop all elements of the stack and clears the stack
+
+        Returns:
+            Iterator[E]: Iterator of all elements in the stack in LIFO order.
+        """
+        return self.pop_n(self._count)
+
+    @override
+    def pop_n(self, n: int) -> Iterator[E]:
+        """Pops the first [n] elements in LIFO order, lowering the record count once.
+
+        Args:
+            n (int): Quantity of elements to be popped.
+
+        Raises:
+            ValueError: When [n] is higher than actual quantity of elements.
+
+        Returns:
+            Iterator[E]: Elements popped.
+        """
+        if self._count < n:
+            raise ValueError(f"Your value for n should be less or equal to {self._count}")
+
+        popped = [self._read(index) for index in range(self._count - 1, self._count - 1 - n, -1)]
+        self._set_count(self._count - n)
+        if self._undo_log is not None:
+            self._undo_log = self._undo_log.push(("push", popped[::-1]))
+
+        return iter(popped)
+
+    @override
+    def clear(self) -> None:
+        """Clear the stack of all of its elements."""
+        if self._undo_log is not None:
+            self._undo_log = self._undo_log.push(("push", [self._read(index) for index in range(self._count)]))
+        self._set_count(0)
+
+    @override
+    def top(self) -> E:
+        """The element at the 'top' of the stack.
+
+        Raises:
+            EmptyStackError: When the stack is empty.
+
+        Returns:
+            E: The element at the 'top' of the stack, without remove it.
+        """
+        if self._count == 0:
+            raise EmptyStackError(message="Tried to peek in an empty stack")
+
+        return self._read(self._count - 1)
+
+    def flush(self) -> None:
+        """Forces the records, then the index, to disk."""
+        self._data.flush()
+        self._index.flush()
+
+    def close(self) -> None:
+        """Flushes and unmaps the files. The stack can't be used afterwards."""
+        if not self._data.closed:
+            self.flush()
+            self._data.close()
+            self._index.close()
+            os.close(self._data_file)
+            os.close(self._index_file)
+
+    @override
+    def __len__(self) -> int:
+        """Number of items in the stack.
+
+        Returns:
+            int: Number of items in the stack.
+        """
+        return self._count
+
+    @override
+    def __contains__(self, element: object) -> bool:
+        """Checks if the [element] is in the Stack, deserializing records from the top down.
+
+        Args:
+            element (object): Element to be searched.
+
+        Returns:
+            bool: `True` if the element is in the stack, `False` otherwise.
+        """
+        return any(item == element for item in self)
+
+    @override
+    def __iter__(self) -> Iterator[E]:
+        """Iterator of the stack in LIFO order, reading one record at a time from the map.
+
+        Yields:
+            Iterator[E]: An Iterator of the actual stack in LIFO order.
+        """
+        for index in range(self._count - 1, -1, -1):
+            yield self._read(index)
+
+    @override
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_value: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        self.close()
+
+    def _end(self, index: int) -> int:
+        """End offset of the record at [index], the start of the next one."""
+        if index < 0:
+            return 0
+
+        return _OFFSET.unpack_from(self._index, _HEADER.size + index * _OFFSET.size)[0]
+
+    def _read(self, index: int) -> E:
+        return self._deserializer(self._data[self._end(index - 1) : self._end(index)])
+
+    def _append(self, records: list[bytes]) -> None:
+        start = self._end(self._count - 1)
+        needed_data = start + sum(len(record) for record in records)
+        needed_index = _HEADER.size + (self._count + len(records)) * _OFFSET.size
+        self._data = _ensure_size(self._data, self._data_file, needed_data)
+        self._index = _ensure_size(self._index, self._index_file, needed_index)
+
+        offset = start
+        for index, record in enumerate(records, self._count):
+            end = offset + len(record)
+            self._data[offset:end] = record
+            _OFFSET.pack_into(self._index, _HEADER.size + index * _OFFSET.size, end)
+            offset = end
+
+        self._set_count(self._count + len(records))
+
+    def _set_count(self, count: int) -> None:
+        self._count = count
+        _HEADER.pack_into(self._index, 0, _MAGIC, _VERSION, count)
+
+
+def _map(file: int) -> mmap.mmap:
+    if os.fstat(file).st_size == 0:
+        os.ftruncate(file, _INITIAL_BYTES)
+
+    return mmap.mmap(file, 0)
+
+
+def _ensure_size(mapped: mmap.mmap, file: int, needed: int) -> mmap.mmap:
+    """Grows [file] geometrically until it holds [needed] bytes, returning its new map."""
+    size = len(mapped)
+    if needed <= size:
+        return mapped
+
+    while size < needed:
+        size *= 2
+    mapped.close()
+    os.ftruncate(file, size)
+
+    return mmap.mmap(file, 0)
@@ -0,0 +1,228 @@
+"""An immutable Stack implementation, a cons list whose versions share structure.
+
+Raises:
+    EmptyStackError: When tried to pop or peek when the stack is empty.
+
+Returns:
+    PersistentStack: A Stack where every operation returns a new version in O(1).
+"""
+
+from collections.abc import Collection, Iterable
+from typing import Any, Generic, Iterator, Self, TypeVar, override
+
+from module.errors.empty_stack_error import EmptyStackError
+
+E = TypeVar("E")
+
+
+class PersistentStack(Collection[E], Generic[E]):
+    """A Stack that is never modified: `push` and `pop` return new versions in O(1).
+
+    Each version is a node pointing to the version below it, so versions share
+    every element they have in common and keeping old ones around (to backtrack,
+    or to hand out a snapshot) costs nothing more than the nodes pushed since.
+
+    Args:
+        Collection : Base class that describes actual class as a Collection.
+        Generic (E): For compatibility reasons, base class that describes the content of this class should have the same type.
+
+    Raises:
+        EmptyStackError: When `top` and `pop` operations are made when the stack is empty.
+
+    Returns:
+        PersistentStack[E]: A version of the stack.
+    """
+
+    __slots__ = ("_top", "_rest", "_length")
+
+    _top: E
+    _rest: "PersistentStack[E] | None"
+    _length: int
+
+    _empty: "PersistentStack[Any] | None" = None
+
+    def __new__(cls) -> Self:
+        """Returns the empty stack, shared by every empty version."""
+        empty = cls.__dict__.get("_empty")
+        if empty is None:
+            empty = super().__new__(cls)
+            empty._rest = None
+            empty._length = 0
+            cls._empty = empty
+
+        return empty
+
+    @classmethod
+    def empty(cls) -> Self:
+        """The empty stack.
+
+        Returns:
+            Self: The empty version, shared by all empty stacks.
+        """
+        return cls()
+
+    @classmethod
+    def from_sequence(cls, sequence: Iterable[E]) -> Self:
+        """Factory constructor to build a stack from a [sequence].
+
+        Args:
+            sequence (Iterable[E]): Elements to be pushed, from the start to the end.
+
+        Returns:
+            Self: A stack with the last element of [sequence] on top.
+        """
+        return cls().push_all(sequence)
+
+    def push(self, element: E) -> Self:
+        """A new version with [element] on top of this one.
+
+        Args:
+            element (E): Element to be added.
+
+        Returns:
+            Self: The new version, this one is left untouched.
+        """
+        node = object.__new__(type(self))
+        node._top = element
+        node._rest = self
+        node._length = self._length + 1
+
+        return node
+
+    def push_all(self, sequence: Iterable[E]) -> Self:
+        """A new version with all elements of the [sequence] pushed in order.
+
+        Args:
+            sequence (Iterable[E]): Elements to be added.
+
+        Returns:
+            Self: The new version, this one is left untouched.
+        """
+        version = self
+        for element in sequence:
+            version = version.push(element)
+
+        return version
+
+    def pop(self) -> Self:
+        """The version below this one, without its top element.
+
+        Raises:
+            EmptyStackError: When the stack has no elements, this exception will be raised.
+
+        Returns:
+            Self: The previous version.
+        """
+        if self._rest is None:
+            raise EmptyStackError()
+
+        return self._rest  # type: ignore[return-value]
+
+    def pop_n(self, n: int) -> Self:
+        """The version [n] levels below this one.
+
+        Args:
+            n (int): Quantity of elements to be popped.
+
+        Raises:
+            ValueError: When [n] is higher than actual quantity of elements.
+
+        Returns:
+            Self: The version without the [n] top elements.
+        """
+        if n > self._length:
+            raise ValueError(f"Your value for n should be less or equal to {self._length}")
+
+        version = self
+        for _ in range(n):
+            version = version._rest  # type: ignore[assignment]
+
+        return version
+
+    def top(self) -> E:
+        """The element at the 'top' of the stack.
+
+        Raises:
+            EmptyStackError: When the stack is empty.
+
+        Returns:
+            E: The last element pushed.
+        """
+        if self._rest is None:
+            raise EmptyStackError(message="Tried to peek in an empty stack")
+
+        return self._top
+
+    def top_or_none(self) -> E | None:
+        """The element at the 'top' of the stack, or `None` if it is empty.
+
+        Returns:
+            E | None: The last element pushed, `None` if the stack is empty.
+        """
+        return None if self._rest is None else self._top
+
+    @property
+    def is_empty(self) -> bool:
+        """Checks if the stack is empty.
+
+        Returns:
+            bool: `True` if the stack has no elements, `False` otherwise.
+        """
+        return self._rest is None
+
+    @property
+    def is_not_empty(self) -> bool:
+        """Checks if the stack has at least one element.
+
+        Returns:
+            bool: `True` if the stack has elements, `False` otherwise.
+        """
+        return self._rest is not None
+
+    @override
+    def __len__(self) -> int:
+        """Number of items in the stack, in O(1).
+
+        Returns:
+            int: Number of items in the stack.
+        """
+        return self._length
+
+    @override
+    def __contains__(self, element: object) -> bool:
+        """Checks if the [element] is in the Stack.
+
+        Args:
+            element (object): Element to be searched.
+
+        Returns:
+            bool: `True` if the element is in the stack, `False` otherwise.
+        """
+        return any(item == element for item in self)
+
+    @override
+    def __iter__(self) -> Iterator[E]:
+        """Iterator of the stack in LIFO order.
+
+        Yields:
+            Iterator[E]: An Iterator of this version in LIFO order.
+        """
+        version = self
+        while version._rest is not None:
+            yield version._top
+            version = version._rest
+
+    def __reduce__(self) -> tuple[Any, ...]:
+        """Pickles and copies the elements, rebuilt through `from_sequence`.
+
+        `__new__` returns the shared empty stack, so restoring the slots on the
+        object it gives would turn the empty stack into a copy of this one.
+
+        Returns:
+            tuple[Any, ...]: `from_sequence` and the elements, from the bottom to the top.
+        """
+        return type(self).from_sequence, (list(reversed(list(self))),)
+
+    @override
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}.from_sequence({list(reversed(list(self)))!r})"
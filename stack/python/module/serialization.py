@@ -0,0 +1,179 @@
+"""Binary dump and load of Stacks.
+
+A dump is a length-prefixed header followed by chunks of elements, bottom to top:
+
+- magic `DSAS` and the header length, `<4sI`;
+- the header, `<BcQ`: format version, payload typecode and number of elements.
+  Readers skip header bytes they don't know;
+- chunks, until every element was read. Each one starts with `<QI`, its payload
+  length and its number of out-of-band buffers, then the payload, then each
+  buffer as a `<Q` length and its raw bytes.
+
+A `TypedStack`, or numbers dumped with an `array` typecode, are written as the raw
+little-endian bytes of an `array.array`, straight from its memory. Other elements,
+typecode `O`, are a pickled list (protocol 5) whose large buffers, like NumPy arrays
+or `bytearray`s, are written out-of-band, without being copied into the pickle.
+
+Raises:
+    ValueError: When loading something that isn't a complete stack dump.
+
+Returns:
+    Stack: The loaded stack, or its elements one chunk at a time with `iter_load`.
+"""
+
+import pickle
+import struct
+import sys
+from array import array
+from collections.abc import Collection, Iterator
+from itertools import islice
+from typing import Any, BinaryIO, TypeVar
+
+from module.stack import Stack
+from module.typed_stack import TypedStack
+
+S = TypeVar("S", bound=Stack[Any])
+
+_MAGIC = b"DSAS"
+_VERSION = 1
+_PREFIX = struct.Struct("<4sI")
+_HEADER = struct.Struct("<BcQ")
+_CHUNK = struct.Struct("<QI")
+_BUFFER = struct.Struct("<Q")
+_OBJECTS = "O"
+# Elements per chunk, the unit of memory used by a streaming load.
+CHUNK_ELEMENTS = 65536
+
+
+def dump(stack: Stack[Any], file: BinaryIO, *, typecode: str | None = None) -> None:
+    """Writes the elements of [stack] to [file], from the bottom to the top.
+
+    Args:
+        stack (Stack[Any]): Stack to be written, it's left untouched.
+        file (BinaryIO): A file opened for binary writing.
+        typecode (str | None, optional): An `array` typecode every element fits, to write them as raw numbers.
+            Defaults to the typecode of a `TypedStack`, and to pickling the elements otherwise.
+
+    Raises:
+        OverflowError: When an element doesn't fit [typecode].
+        TypeError: When an element isn't a number of the kind of [typecode].
+    """
+    if isinstance(stack, TypedStack) and typecode in (None, stack.typecode):
+        with memoryview(stack) as view:
+            _write(file, stack.typecode, view)
+    elif typecode is not None:
+        with memoryview(array(typecode, reversed(list(stack)))) as view:
+            _write(file, typecode, view)
+    else:
+        # The deque of the base class is already bottom to top, other stacks are reversed once.
+        elements = getattr(stack, "_internal_deque", None)
+        _write(file, _OBJECTS, list(stack)[::-1] if elements is None else elements)
+
+
+def load(file: BinaryIO, cls: type[S] = Stack) -> S:  # type: ignore[assignment]
+    """Reads a stack written by `dump`.
+
+    Args:
+        file (BinaryIO): A file opened for binary reading, positioned at the start of a dump.
+        cls (type[S], optional): Class of the stack to build, a `TypedStack` gets the dumped typecode. Defaults to Stack.
+
+    Raises:
+        ValueError: When [file] doesn't hold a complete stack dump.
+
+    Returns:
+        S: A stack with the dumped elements, the last one on top.
+    """
+    typecode, count = _read_header(file)
+    stack = cls(typecode) if issubclass(cls, TypedStack) else cls()  # type: ignore[call-arg]
+    for chunk in _read_chunks(file, typecode, count):
+        stack.push_all(chunk)
+
+    return stack
+
+
+def iter_load(file: BinaryIO) -> Iterator[Any]:
+    """Reads the elements of a dump one chunk at a time, without building a stack.
+
+    Args:
+        file (BinaryIO): A file opened for binary reading, positioned at the start of a dump.
+
+    Raises:
+        ValueError: When [file] doesn't hold a complete stack dump.
+
+    Yields:
+        Iterator[Any]: The elements, from the bottom to the top.
+    """
+    typecode, count = _read_header(file)
+    for chunk in _read_chunks(file, typecode, count):
+        yield from chunk
+
+
+def _write(file: BinaryIO, typecode: str, values: memoryview | Collection[Any]) -> None:
+    header = _HEADER.pack(_VERSION, typecode.encode(), len(values))
+    file.write(_PREFIX.pack(_MAGIC, len(header)))
+    file.write(header)
+
+    elements = iter(values)
+    for start in range(0, len(values), CHUNK_ELEMENTS):
+        if isinstance(values, memoryview):
+            view = values[start : start + CHUNK_ELEMENTS]
+            if sys.byteorder == "big":
+                swapped = array(typecode, view.tobytes())
+                swapped.byteswap()
+                view = memoryview(swapped)
+            file.write(_CHUNK.pack(view.nbytes, 0))
+            file.write(view)
+        else:
+            buffers: list[pickle.PickleBuffer] = []
+            payload = pickle.dumps(list(islice(elements, CHUNK_ELEMENTS)), protocol=5, buffer_callback=buffers.append)
+            file.write(_CHUNK.pack(len(payload), len(buffers)))
+            file.write(payload)
+            for buffer in buffers:
+                raw = buffer.raw()
+                file.write(_BUFFER.pack(raw.nbytes))
+                file.write(raw)
+
+
+def _read_header(file: BinaryIO) -> tuple[str, int]:
+    magic, header_length = _PREFIX.unpack(_read_exactly(file, _PREFIX.size))
+    if magic != _MAGIC:
+        raise ValueError("Not a stack dump")
+
+    header = _read_exactly(file, header_length)
+    version, typecode, count = _HEADER.unpack_from(header)
+    if version != _VERSION:
+        raise ValueError(f"Unsupported stack dump version {version}")
+
+    return typecode.decode(), count
+
+
+def _read_chunks(file: BinaryIO, typecode: str, count: int) -> Iterator[array[Any] | list[Any]]:
+    read = 0
+    while read < count:
+        payload_length, buffer_count = _CHUNK.unpack(_read_exactly(file, _CHUNK.size))
+        payload = _read_exactly(file, payload_length)
+        buffers = [_read_exactly(file, _BUFFER.unpack(_read_exactly(file, _BUFFER.size))[0]) for _ in range(buffer_count)]
+
+        chunk: array[Any] | list[Any]
+        if typecode == _OBJECTS:
+            chunk = pickle.loads(payload, buffers=buffers)
+        else:
+            chunk = array(typecode)
+            chunk.frombytes(payload)
+            if sys.byteorder == "big":
+                chunk.byteswap()
+        read += len(chunk)
+        yield chunk
+
+
+def _read_exactly(file: BinaryIO, size: int) -> bytearray:
+    data = bytearray(size)
+    view = memoryview(data)
+    filled = 0
+    while filled < size:
+        read = file.readinto(view[filled:])  # type: ignore[attr-defined]
+        if not read:
+            raise ValueError("Truncated stack dump")
+        filled += read
+
+    return data
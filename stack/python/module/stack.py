@@ -11,13 +11,23 @@ Returns:
 from collections import deque
 from contextlib import AbstractContextManager
 from types import TracebackType
-from typing import Collection, Generic, Iterator, Self, TypeVar, override
+from typing import TYPE_CHECKING, Any, Collection, Generic, Iterator, Self, TypeVar, override
 from collections.abc import Sequence
 
 from module.errors.empty_stack_error import EmptyStackError
+from module.persistent_stack import PersistentStack
+
+if TYPE_CHECKING:
+    from module.typed_stack import TypedStack
 
 E = TypeVar("E")
 
+# Undo log entries: ("pop", count) removes the `count` top elements, ("push", elements)
+# pushes `elements` back, bottom first. A savepoint is a version of the log. Each log
+# starts with a ("root", token) entry of its own, never undone, so that it shares no
+# version with the logs of other stacks or with one released before.
+Savepoint = PersistentStack[tuple[str, Any]]
+
 
 class Stack(Collection[E], Generic[E], AbstractContextManager[Self]):  # type: ignore
     """A collection that behaves like a Stack.
@@ -35,6 +45,8 @@ class Stack(Collection[E], Generic[E], AbstractContextManager[Self]):  # type: i
     """
 
     _internal_deque: deque[E]
+    # Only recorded between `savepoint` and `release_savepoints`.
+    _undo_log: Savepoint | None = None
 
     def __init__(self) -> None:
         """Initializes the instance of an empty stack."""
@@ -52,9 +64,7 @@ class Stack(Collection[E], Generic[E], AbstractContextManager[Self]):  # type: i
             Self: An instance of Stack filled with the [sequence] elements.
         """
         stack = cls()
-
-        for item in sequence:
-            stack.push(item)
+        stack.push_all(sequence)
 
         return stack
 
@@ -69,6 +79,22 @@ class Stack(Collection[E], Generic[E], AbstractContextManager[Self]):  # type: i
         """
         return cls()
 
+    @staticmethod
+    def typed(typecode: str) -> "TypedStack[Any]":
+        """Initializes an empty stack of numbers stored unboxed in an `array.array`.
+
+        Prefer it for large stacks of ints or floats, see `TypedStack`.
+
+        Args:
+            typecode (str): An `array` typecode, like 'd' for floats or 'q' for ints.
+
+        Returns:
+            TypedStack[Any]: An empty instance of TypedStack.
+        """
+        from module.typed_stack import TypedStack
+
+        return TypedStack(typecode)
+
     def push(self, element: E) -> None:
         """Adds [element] to top of the stack.
 
@@ -76,16 +102,18 @@ class Stack(Collection[E], Generic[E], AbstractContextManager[Self]):  # type: i
             element (E): Element to be added.
         """
         self._internal_deque.append(element)
+        if self._undo_log is not None:
+            self._undo_log = self._undo_log.push(("pop", 1))
 
     def push_all(self, sequence: Sequence[E]) -> None:
-        """Pushes all elements of the [sequence] to the stack.
+        """Pushes all elements of the [sequence] to the stack in a single step.
 
         Args:
             sequence (Sequence[E]): Sequence to be added.
         """
-
-        for item in sequence:
-            self.push(item)
+        self._internal_deque.extend(sequence)
+        if self._undo_log is not None:
+            self._undo_log = self._undo_log.push(("pop", len(sequence)))
 
     def pop(self) -> E:
         """Removes the element at the top of the stack (the last added one).
@@ -97,7 +125,11 @@ class Stack(Collection[E], Generic[E], AbstractContextManager[Self]):  # type: i
             E: The last element added in the stack.
         """
         if len(self._internal_deque) > 0:
-            return self._internal_deque.pop()
+            element = self._internal_deque.pop()
+            if self._undo_log is not None:
+                self._undo_log = self._undo_log.push(("push", [element]))
+
+            return element
         else:
             raise EmptyStackError()
 
@@ -113,33 +145,41 @@ class Stack(Collection[E], Generic[E], AbstractContextManager[Self]):  # type: i
             return None
 
     def pop_all(self) -> Iterator[E]:
-        """Pop all elements of the stack and clears the stack
+        """Pop all elements of the stack and clears the stack in a single step.
 
-        Yields:
+        Returns:
             Iterator[E]: Iterator of all elements in the stack in LIFO order.
         """
-        while self.is_not_empty:
-            yield self.pop()
+        popped = list(self._internal_deque)
+        self._internal_deque.clear()
+        if self._undo_log is not None:
+            self._undo_log = self._undo_log.push(("push", popped))
 
-        self.clear()
+        return reversed(popped)
 
     def pop_n(self, n: int) -> Iterator[E]:
-        """Pops the first [n] elements in LIFO order.
+        """Pops the first [n] elements in LIFO order. They're removed right away, not while iterating.
 
         Args:
-            n (int): Quantity of elements to be popeds.
+            n (int): Quantity of elements to be popped.
 
         Raises:
             ValueError: When [n] is higher than actual quantity of elements.
 
-        Yields:
+        Returns:
             Iterator[E]: Elements popped.
         """
         if len(self) < n:
             raise ValueError(f"Your value for n should be less or equal to {len(self)}")
+        elif n == len(self):
+            return self.pop_all()
         else:
-            for _ in range(n):
-                yield self.pop()
+            pop = self._internal_deque.pop
+            popped = [pop() for _ in range(n)]
+            if self._undo_log is not None:
+                self._undo_log = self._undo_log.push(("push", popped[::-1]))
+
+            return iter(popped)
 
     def pop_n_or_all(self, n: int) -> Iterator[E]:
         """Tries to pop the first [n] elements in LIFO order. Alternative to pop_n that not raises.
@@ -157,8 +197,70 @@ class Stack(Collection[E], Generic[E], AbstractContextManager[Self]):  # type: i
 
     def clear(self) -> None:
         """Clear the stack of all of its elements."""
+        if self._undo_log is not None:
+            self._undo_log = self._undo_log.push(("push", list(self._internal_deque)))
         self._internal_deque.clear()
 
+    def savepoint(self) -> Savepoint:
+        """Marks the current state, to come back to it with `rollback`. Takes O(1).
+
+        From the first savepoint on, each change records how to undo it in a persistent
+        log, whose versions are the savepoints: nested savepoints share it. Subclasses
+        that replace the mutating methods record their changes the same way.
+
+        Returns:
+            Savepoint: An opaque token for `rollback`.
+        """
+        if self._undo_log is None:
+            self._undo_log = PersistentStack[tuple[str, Any]].empty().push(("root", object()))
+
+        return self._undo_log
+
+    def rollback(self, savepoint: Savepoint) -> None:
+        """Undoes every change made since [savepoint], in O(changes). The savepoint stays valid.
+
+        Args:
+            savepoint (Savepoint): A token returned by `savepoint` on this stack.
+
+        Raises:
+            ValueError: When [savepoint] was taken on another stack, or was released or rolled back past.
+        """
+        log = self._undo_log
+        version = log
+        while version is not savepoint:
+            if version is None or version.is_empty:
+                raise ValueError("Unknown savepoint, it may have been released or rolled back past")
+            version = version.pop()
+
+        # Undoing goes through the public methods, without being recorded itself.
+        self._undo_log = None
+        try:
+            while log is not savepoint:
+                assert log is not None
+                undo, payload = log.top()
+                if undo == "pop":
+                    self.pop_n(payload)
+                else:
+                    self.push_all(payload)
+                log = log.pop()
+        finally:
+            self._undo_log = log
+
+    def release_savepoints(self) -> None:
+        """Forgets every savepoint and stops recording changes."""
+        self._undo_log = None
+
+    def __getstate__(self) -> dict[str, Any]:
+        """Pickles the elements without the undo log: savepoints don't outlive the stack they were taken on.
+
+        Returns:
+            dict[str, Any]: The attributes to pickle.
+        """
+        state = self.__dict__.copy()
+        state.pop("_undo_log", None)
+
+        return state
+
     def top(self) -> E:
         """The element at the 'top' of the stack.
 
@@ -0,0 +1,268 @@
+"""A compact Stack implementation for numbers, stored in a contiguous `array.array`.
+
+Raises:
+    EmptyStackError: When tried to pop or peek when the stack is empty.
+
+Returns:
+    TypedStack: A Stack of machine numbers of a single `array` typecode.
+"""
+
+import pickle
+import sys
+from array import array
+from collections.abc import Iterable, Sequence
+from typing import Any, Iterator, Self, TypeVar, override
+
+from module.errors.empty_stack_error import EmptyStackError
+from module.stack import Stack
+
+E = TypeVar("E", int, float)
+
+
+class TypedStack(Stack[E]):
+    """A Stack of numbers stored unboxed in an `array.array` of a single typecode.
+
+    Each element takes `itemsize` bytes (8 for 'd' or 'q') instead of a full Python
+    object plus a deque slot. The stack exposes the buffer protocol, so
+    `memoryview(stack)` snapshots its contents in push order without copying.
+    The stack can't grow or shrink while such a view is alive, release the view first.
+
+    Args:
+        Stack (E): Base class, whose whole API is kept.
+
+    Raises:
+        EmptyStackError: When `top` and `pop` operations are made when the stack is empty.
+        BufferError: When the stack is resized while a `memoryview` of it is alive.
+
+    Returns:
+        TypedStack[E]: An instance of TypedStack.
+    """
+
+    _internal_array: array[E]
+
+    def __init__(self, typecode: str = "d") -> None:
+        """Initializes the instance of an empty stack.
+
+        Args:
+            typecode (str, optional): An `array` typecode, like 'd', 'q' or 'i'. Defaults to 'd'.
+        """
+        # The deque of the base class is never created, the array replaces it.
+        self._internal_array = array(typecode)
+
+    @classmethod
+    @override
+    def from_sequence(cls, sequence: Sequence[E], typecode: str = "d") -> Self:
+        """Factory constructor to initialize an instance of stack from a [sequence].
+
+        Args:
+            sequence (Sequence[E]): A sequence, like list, tuple, array, etc. It'll be iterated over from start to the end.
+            typecode (str, optional): An `array` typecode. Defaults to 'd'.
+
+        Returns:
+            Self: An instance of TypedStack filled with the [sequence] elements.
+        """
+        stack = cls(typecode)
+        stack.push_all(sequence)
+
+        return stack
+
+    @classmethod
+    @override
+    def empty(cls, typecode: str = "d") -> Self:
+        """Initializes an instance of an empty stack. Alias to the common constructor.
+
+        Args:
+            typecode (str, optional): An `array` typecode. Defaults to 'd'.
+
+        Returns:
+            Self: An empty instance of the class TypedStack.
+        """
+        return cls(typecode)
+
+    @property
+    def typecode(self) -> str:
+        """The `array` typecode of the elements.
+
+        Returns:
+            str: The typecode, like 'd'.
+        """
+        return self._internal_array.typecode
+
+    @property
+    def itemsize(self) -> int:
+        """Size in bytes of each element.
+
+        Returns:
+            int: Bytes per element.
+        """
+        return self._internal_array.itemsize
+
+    @override
+    def push(self, element: E) -> None:
+        """Adds [element] to top of the stack.
+
+        Args:
+            element (E): Element to be added.
+        """
+        self._internal_array.append(element)
+        if self._undo_log is not None:
+            self._undo_log = self._undo_log.push(("pop", 1))
+
+    @override
+    def push_all(self, sequence: Iterable[E]) -> None:
+        """Pushes all elements of the [sequence] to the stack in a single step.
+
+        Args:
+            sequence (Iterable[E]): Elements to be added, an `array` of the same typecode is copied as a block.
+        """
+        length = len(self._internal_array)
+        self._internal_array.extend(sequence)
+        if self._undo_log is not None:
+            self._undo_log = self._undo_log.push(("pop", len(self._internal_array) - length))
+
+    @override
+    def pop(self) -> E:
+        """Removes the element at the top of the stack (the last added one).
+
+        Raises:
+            EmptyStackError: When the stack has no elements, this exception will be raised.
+
+        Returns:
+            E: The last element added in the stack.
+        """
+        if len(self._internal_array) > 0:
+            element = self._internal_array.pop()
+            if self._undo_log is not None:
+                self._undo_log = self._undo_log.push(("push", [element]))
+
+            return element
+        else:
+            raise EmptyStackError()
+
+    @override
+    def pop_all(self) -> Iterator[E]:
+        """Pop all elements of the stack and clears the stack in a single step. They're removed right away, not while iterating.
+
+        Returns:
+            Iterator[E]: Iterator of all elements in the stack in LIFO order.
+        """
+        return self.pop_n(len(self))
+
+    @override
+    def pop_n(self, n: int) -> Iterator[E]:
+        """Pops the first [n] elements in LIFO order, removing them in one step.
+
+        Args:
+            n (int): Quantity of elements to be popped.
+
+        Raises:
+            ValueError: When [n] is higher than actual quantity of elements.
+
+        Returns:
+            Iterator[E]: Elements popped.
+        """
+        if len(self) < n:
+            raise ValueError(f"Your value for n should be less or equal to {len(self)}")
+
+        start = len(self._internal_array) - n
+        popped = self._internal_array[start:]
+        del self._internal_array[start:]
+        if self._undo_log is not None:
+            self._undo_log = self._undo_log.push(("push", popped))
+
+        return reversed(popped)
+
+    @override
+    def clear(self) -> None:
+        """Clear the stack of all of its elements."""
+        if self._undo_log is not None:
+            self._undo_log = self._undo_log.push(("push", self._internal_array[:]))
+        del self._internal_array[:]
+
+    @override
+    def top(self) -> E:
+        """The element at the 'top' of the stack.
+
+        Raises:
+            EmptyStackError: When the stack is empty.
+
+        Returns:
+            E: The element at the 'top' of the stack, without remove it.
+        """
+        if len(self._internal_array) > 0:
+            return self._internal_array[-1]
+        else:
+            raise EmptyStackError(message="Tried to peek in an empty stack")
+
+    @override
+    def __len__(self) -> int:
+        """Number of items in the stack.
+
+        Returns:
+            int: Number of items in the stack.
+        """
+        return len(self._internal_array)
+
+    @override
+    def __contains__(self, element: object) -> bool:
+        """Checks if the [element] is in the Stack.
+
+        Args:
+            element (object): Element to be searched.
+
+        Returns:
+            bool: `True` if the element is in the stack, `False` otherwise.
+        """
+        return element in self._internal_array
+
+    @override
+    def __iter__(self) -> Iterator[E]:
+        """Iterator of the stack in LIFO order.
+
+        Yields:
+            Iterator[E]: An Iterator of the actual stack in LIFO order.
+        """
+        return reversed(self._internal_array)
+
+    @override
+    def __reduce_ex__(self, protocol: Any) -> Any:
+        """Pickles the elements as a single buffer, in native byte order, recorded along so
+        that a host of the other byte order swaps them back on load.
+
+        With protocol 5 the buffer is a `pickle.PickleBuffer`, which a pickler given a
+        `buffer_callback` hands over out-of-band instead of copying it into the pickle.
+
+        Args:
+            protocol (Any): The pickle protocol.
+
+        Returns:
+            Any: How to rebuild the stack.
+        """
+        state = self.__getstate__()
+        del state["_internal_array"]
+        data = pickle.PickleBuffer(self._internal_array) if protocol >= 5 else self._internal_array.tobytes()
+
+        return _from_buffer, (type(self), self.typecode, data, sys.byteorder), state or None
+
+    def __buffer__(self, flags: int) -> memoryview:
+        """Exposes the elements, bottom to top, through the buffer protocol.
+
+        Returns:
+            memoryview: A view of the underlying array, sharing its memory.
+        """
+        return memoryview(self._internal_array)
+
+    def __release_buffer__(self, view: memoryview) -> None:
+        view.release()
+
+
+def _from_buffer(
+    cls: type[TypedStack[Any]], typecode: str, data: Any, byteorder: str = sys.byteorder
+) -> TypedStack[Any]:
+    """Rebuilds a pickled TypedStack from its typecode and the bytes of its elements, in [byteorder]."""
+    stack = cls(typecode)
+    stack._internal_array.frombytes(memoryview(data).cast("B"))
+    if byteorder != sys.byteorder:
+        stack._internal_array.byteswap()
+
+    return stack
@@ -0,0 +1,76 @@
+from module.stack import Stack
+from module.aggregating_stack import AggregatingStack
+
+import math
+import unittest
+
+from module.errors.empty_stack_error import EmptyStackError
+
+
+class TestAggregatingStack(unittest.TestCase):
+    def test_isinstance(self):
+        self.assertIsInstance(AggregatingStack[int](), Stack)
+
+    def test_default_aggregates_follow_push_and_pop(self):
+        stack = AggregatingStack[int].from_sequence([5, 1, 8])
+
+        self.assertEqual((stack.min(), stack.max(), stack.sum()), (1, 8, 14))
+
+        stack.push(0)
+
+        self.assertEqual((stack.min(), stack.max(), stack.sum()), (0, 8, 14))
+
+        stack.pop()
+        list(stack.pop_n(1))
+
+        self.assertEqual((stack.min(), stack.max(), stack.sum()), (1, 5, 6))
+
+        list(stack.pop_all())
+
+        self.assertRaises(EmptyStackError, stack.min)
+
+        stack.push(3)
+
+        self.assertEqual(stack.sum(), 3)
+
+        stack.clear()
+
+        self.assertRaises(EmptyStackError, stack.max)
+
+    def test_custom_combine(self):
+        stack = AggregatingStack[str]({"concatenated": lambda left, right: left + right})
+
+        stack.push_all(["a", "b", "c"])
+
+        self.assertEqual(stack.aggregate("concatenated"), "abc")
+
+        self.assertRaises(KeyError, stack.aggregate, "sum")
+
+        gcd_stack = AggregatingStack[int]({"gcd": math.gcd})
+        gcd_stack.push_all([12, 18, 27])
+
+        self.assertEqual(gcd_stack.aggregate("gcd"), 3)
+
+        gcd_stack.pop()
+
+        self.assertEqual(gcd_stack.aggregate("gcd"), 6)
+
+
+    def test_savepoint_rollback(self):
+        stack = AggregatingStack[int].from_sequence([1, 2, 3])
+
+        savepoint = stack.savepoint()
+        stack.push(4)
+        stack.push(5)
+        stack.pop()
+        list(stack.pop_n(3))
+        stack.push(0)
+        stack.rollback(savepoint)
+
+        self.assertListEqual(list(stack), [3, 2, 1])
+
+        self.assertEqual((stack.min(), stack.max(), stack.sum()), (1, 3, 6))
+
+
+if __name__ == "__main__":
+    unittest.main()
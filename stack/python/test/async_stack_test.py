@@ -0,0 +1,104 @@
+from module.async_stack import AsyncStack
+from module.stack import Stack
+
+import asyncio
+import unittest
+
+from module.errors.empty_stack_error import EmptyStackError
+
+
+class TestAsyncStack(unittest.IsolatedAsyncioTestCase):
+    async def test_isinstance(self):
+        async_stack = AsyncStack[int]()
+
+        self.assertIsInstance(async_stack, AsyncStack)
+
+        self.assertIsInstance(async_stack, Stack)
+
+    async def test_pop_suspends_until_push(self):
+        async_stack = AsyncStack[int]()
+
+        popper = asyncio.create_task(async_stack.pop())
+        await asyncio.sleep(0)
+
+        self.assertFalse(popper.done())
+
+        async_stack.push(7)
+
+        self.assertEqual(await popper, 7)
+
+    async def test_pop_nowait(self):
+        async_stack = AsyncStack[int].from_sequence([1, 2])
+
+        self.assertEqual(async_stack.pop_nowait(), 2)
+
+        self.assertEqual(async_stack.pop_or_none(), 1)
+
+        self.assertIsNone(async_stack.pop_or_none())
+
+        self.assertRaises(EmptyStackError, async_stack.pop_nowait)
+
+    async def test_pop_many(self):
+        async_stack = AsyncStack[int].from_sequence([1, 2, 3, 4, 5])
+
+        self.assertListEqual(await async_stack.pop_many(2), [5, 4])
+
+        self.assertListEqual(await async_stack.pop_many(10), [3, 2, 1])
+
+        with self.assertRaises(ValueError):
+            await async_stack.pop_many(0)
+
+    async def test_cancelled_popper_does_not_lose_elements(self):
+        async_stack = AsyncStack[int]()
+
+        first = asyncio.create_task(async_stack.pop_many(10))
+        second = asyncio.create_task(async_stack.pop_many(10))
+        await asyncio.sleep(0)
+
+        async_stack.push(1)
+        first.cancel()
+
+        self.assertListEqual(await second, [1])
+
+        with self.assertRaises(asyncio.CancelledError):
+            await first
+
+    async def test_push_all_wakes_consumers(self):
+        async_stack = AsyncStack[int]()
+
+        poppers = [asyncio.create_task(async_stack.pop()) for _ in range(3)]
+        await asyncio.sleep(0)
+
+        async_stack.push_all([1, 2, 3])
+
+        self.assertListEqual(sorted(await asyncio.gather(*poppers)), [1, 2, 3])
+
+    async def test_async_for(self):
+        async_stack = AsyncStack[str].from_sequence(["a", "b"])
+        received: list[str] = []
+
+        async for item in async_stack:
+            received.append(item)
+            if async_stack.is_empty:
+                break
+
+        self.assertListEqual(received, ["b", "a"])
+
+
+    async def test_savepoint_rollback(self):
+        async_stack = AsyncStack[int].from_sequence([1, 2, 3])
+
+        savepoint = async_stack.savepoint()
+        async_stack.push(4)
+        async_stack.push(5)
+        await async_stack.pop()
+        async_stack.pop_nowait()
+        await async_stack.pop_many(2)
+        async_stack.push_all([6, 7])
+        async_stack.rollback(savepoint)
+
+        self.assertListEqual(list(async_stack), [3, 2, 1])
+
+
+if __name__ == "__main__":
+    unittest.main()
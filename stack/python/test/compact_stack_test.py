@@ -0,0 +1,88 @@
+from module.stack import Stack
+
+import pickle
+import unittest
+
+from module.compact_stack import INLINE_CAPACITY, CompactStack
+from module.errors.empty_stack_error import EmptyStackError
+
+
+class TestCompactStack(unittest.TestCase):
+    def test_isinstance(self):
+        stack = CompactStack[int]()
+
+        self.assertIsInstance(stack, Stack)
+
+        self.assertFalse(hasattr(stack, "__dict__"))
+
+        self.assertRaises(AttributeError, setattr, stack, "other", 1)
+
+    def test_has_the_stack_api(self):
+        stack = CompactStack[int]()
+
+        self.assertListEqual([name for name in dir(Stack) if not name.startswith("_") and not hasattr(stack, name)], [])
+
+        self.assertEqual(CompactStack.typed("q").typecode, "q")
+
+        self.assertRaises(TypeError, stack.savepoint)
+
+        self.assertRaises(TypeError, stack.rollback, None)
+
+    def test_lifo_across_storages(self):
+        for count in (0, 1, INLINE_CAPACITY, INLINE_CAPACITY + 1, 100):
+            stack = CompactStack[int]()
+
+            for element in range(count):
+                stack.push(element)
+
+            self.assertEqual(len(stack), count)
+
+            self.assertListEqual(list(stack), list(reversed(range(count))))
+
+            self.assertEqual(stack.top_or_none(), count - 1 if count else None)
+
+            self.assertListEqual([stack.pop() for _ in range(count)], list(reversed(range(count))))
+
+            self.assertTrue(stack.is_empty)
+
+            self.assertRaises(EmptyStackError, stack.pop)
+
+            self.assertRaises(EmptyStackError, stack.top)
+
+    def test_batches(self):
+        stack = CompactStack[int].from_sequence([1, 2, 3])
+
+        stack.push_all([4, 5, 6])
+
+        self.assertIn(5, stack)
+
+        self.assertListEqual(list(stack.pop_n(4)), [6, 5, 4, 3])
+
+        self.assertRaises(ValueError, stack.pop_n, 3)
+
+        self.assertListEqual(list(stack.pop_n(0)), [])
+
+        self.assertListEqual(list(stack.pop_n_or_all(5)), [2, 1])
+
+        self.assertIsNone(stack.pop_or_none())
+
+    def test_emptied_stacks_share_the_empty_storage(self):
+        stack = CompactStack[int].from_sequence(range(10))
+
+        list(stack.pop_n(10))
+
+        self.assertIs(stack._items, CompactStack()._items)
+
+        with CompactStack[int].from_sequence([1, 2]) as other:
+            other.push(3)
+
+        self.assertTrue(other.is_empty)
+
+    def test_pickle(self):
+        stack = CompactStack[int].from_sequence(range(6))
+
+        self.assertListEqual(list(pickle.loads(pickle.dumps(stack))), list(stack))
+
+
+if __name__ == "__main__":
+    unittest.main()
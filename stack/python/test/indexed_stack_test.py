@@ -0,0 +1,81 @@
+from module.stack import Stack
+from module.indexed_stack import IndexedStack
+
+import unittest
+
+from module.errors.empty_stack_error import EmptyStackError
+
+
+class TestIndexedStack(unittest.TestCase):
+    def test_isinstance(self):
+        self.assertIsInstance(IndexedStack[int](), Stack)
+
+    def test_membership_follows_the_stack(self):
+        stack = IndexedStack[str].from_sequence(["a", "b", "a"])
+        stack.push("c")
+
+        self.assertEqual(stack.count("a"), 2)
+
+        self.assertIn("c", stack)
+
+        self.assertNotIn("z", stack)
+
+        self.assertNotIn(["unhashable"], stack)
+
+        self.assertEqual(stack.pop(), "c")
+
+        self.assertNotIn("c", stack)
+
+        self.assertListEqual(list(stack.pop_n(2)), ["a", "b"])
+
+        self.assertEqual(stack.count("a"), 1)
+
+        self.assertNotIn("b", stack)
+
+        self.assertListEqual(list(stack.pop_all()), ["a"])
+
+        self.assertNotIn("a", stack)
+
+        self.assertRaises(EmptyStackError, stack.pop)
+
+        self.assertIsNone(stack.pop_or_none())
+
+    def test_clear(self):
+        stack = IndexedStack[int].from_sequence([1, 2, 3])
+
+        stack.clear()
+
+        self.assertNotIn(1, stack)
+
+        self.assertTrue(stack.is_empty)
+
+    def test_unhashable_elements_are_rejected(self):
+        stack = IndexedStack()
+
+        self.assertRaises(TypeError, stack.push, [1])
+
+        self.assertRaises(TypeError, stack.push_all, [2, [1]])
+
+        self.assertTrue(stack.is_empty)
+
+
+    def test_savepoint_rollback(self):
+        stack = IndexedStack[int].from_sequence([1, 2, 3])
+
+        savepoint = stack.savepoint()
+        stack.push(4)
+        stack.push(5)
+        stack.pop()
+        list(stack.pop_n(2))
+        stack.push_all([6, 6])
+        stack.rollback(savepoint)
+
+        self.assertListEqual(list(stack), [3, 2, 1])
+
+        self.assertEqual(stack.count(3), 1)
+
+        self.assertNotIn(6, stack)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,92 @@
+from module.stack import Stack
+from module.instrumented_stack import InstrumentedStack
+
+import threading
+import unittest
+
+from module.errors.empty_stack_error import EmptyStackError
+
+
+class TestInstrumentedStack(unittest.TestCase):
+    def test_isinstance(self):
+        self.assertIsInstance(InstrumentedStack[int](), Stack)
+
+    def test_counters_and_high_water_mark(self):
+        stack = InstrumentedStack[int]()
+
+        stack.push_all(range(10))
+        list(stack.pop_n(4))
+        stack.push(10)
+        stack.pop()
+        stack.clear()
+
+        self.assertRaises(EmptyStackError, stack.pop)
+
+        self.assertIsNone(stack.pop_or_none())
+
+        metrics = stack.metrics()
+
+        self.assertEqual(metrics["pushed"], 11)
+
+        self.assertEqual(metrics["popped"], 5)
+
+        self.assertEqual(metrics["cleared"], 6)
+
+        self.assertEqual(metrics["depth"], 0)
+
+        self.assertEqual(metrics["high_water_mark"], 10)
+
+    def test_dwell_histogram_samples(self):
+        stack = InstrumentedStack[int](sample_every=4)
+
+        stack.push_all(range(10))
+        for _ in range(3):
+            stack.push(0)
+        stack.pop()
+        list(stack.pop_n(5))
+        list(stack.pop_all())
+
+        dwell = stack.metrics()["dwell_seconds"]
+
+        # The 1st, 5th, 9th and 13th pushed elements are sampled.
+        self.assertEqual(dwell["count"], 4)
+
+        self.assertEqual(sum(dwell["buckets"].values()), 4)
+
+    def test_exporters(self):
+        exported: list[dict] = []
+        exported_twice = threading.Event()
+
+        def exporter(metrics: dict) -> None:
+            exported.append(metrics)
+            if len(exported) >= 2:
+                exported_twice.set()
+
+        stack = InstrumentedStack[int](exporter=exporter, export_interval=0.01)
+        stack.push(1)
+
+        self.assertTrue(exported_twice.wait(timeout=5))
+
+        stack.close()
+
+        self.assertEqual(exported[-1]["depth"], 1)
+
+        self.assertRaises(ValueError, InstrumentedStack, export_interval=1.0)
+
+
+    def test_savepoint_rollback(self):
+        stack = InstrumentedStack[int].from_sequence([1, 2, 3])
+
+        savepoint = stack.savepoint()
+        stack.push(4)
+        stack.push(5)
+        stack.pop()
+        list(stack.pop_n(2))
+        stack.clear()
+        stack.rollback(savepoint)
+
+        self.assertListEqual(list(stack), [3, 2, 1])
+
+
+if __name__ == "__main__":
+    unittest.main()
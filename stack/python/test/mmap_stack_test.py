@@ -0,0 +1,120 @@
+from module.stack import Stack
+from module.mmap_stack import MmapStack
+
+import os
+import tempfile
+import unittest
+
+from module.errors.empty_stack_error import EmptyStackError
+
+
+class TestMmapStack(unittest.TestCase):
+    def setUp(self):
+        self._temporary_directory = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self._temporary_directory.name, "history")
+
+    def tearDown(self):
+        self._temporary_directory.cleanup()
+
+    def test_isinstance(self):
+        with MmapStack[int](self.path) as stack:
+            self.assertIsInstance(stack, Stack)
+
+    def test_push_pop_top(self):
+        with MmapStack[str](self.path) as stack:
+            self.assertTrue(stack.is_empty)
+
+            self.assertRaises(EmptyStackError, stack.pop)
+
+            self.assertRaises(EmptyStackError, stack.top)
+
+            self.assertIsNone(stack.pop_or_none())
+
+            stack.push("a")
+            stack.push("b")
+
+            self.assertEqual(stack.top(), "b")
+
+            self.assertEqual(stack.pop(), "b")
+
+            self.assertEqual(len(stack), 1)
+
+            self.assertIn("a", stack)
+
+            self.assertNotIn("b", stack)
+
+    def test_pop_n_and_iter_are_lifo(self):
+        with MmapStack[int].from_sequence(range(10), self.path) as stack:
+            self.assertListEqual(list(stack), list(range(9, -1, -1)))
+
+            self.assertListEqual(list(stack.pop_n(3)), [9, 8, 7])
+
+            self.assertRaises(ValueError, stack.pop_n, 8)
+
+            self.assertListEqual(list(stack.pop_n_or_all(100)), list(range(6, -1, -1)))
+
+            self.assertTrue(stack.is_empty)
+
+    def test_reopen_keeps_records(self):
+        with MmapStack[dict[str, int]](self.path) as stack:
+            stack.push_all([{"step": step} for step in range(1_000)])
+            stack.pop_n(400)
+
+        with MmapStack[dict[str, int]](self.path) as reopened:
+            self.assertEqual(len(reopened), 600)
+
+            self.assertEqual(reopened.top(), {"step": 599})
+
+    def test_pop_space_is_reused(self):
+        payload = b"x" * 1_000
+
+        with MmapStack[bytes](self.path, serializer=bytes, deserializer=bytes) as stack:
+            for _ in range(100):
+                stack.push(payload)
+            size = os.path.getsize(f"{self.path}.data")
+
+            for _ in range(50):
+                stack.pop()
+                stack.push(b"y" * 1_000)
+
+            self.assertEqual(os.path.getsize(f"{self.path}.data"), size)
+
+            self.assertEqual(stack.top(), b"y" * 1_000)
+
+    def test_empty_clears_existing_records(self):
+        with MmapStack[int].from_sequence([1, 2, 3], self.path):
+            pass
+
+        with MmapStack[int].empty(self.path) as stack:
+            self.assertTrue(stack.is_empty)
+
+    def test_path_is_required(self):
+        self.assertRaises(TypeError, MmapStack.empty)
+
+        self.assertRaises(TypeError, MmapStack.from_sequence, [1])
+
+    def test_rejects_foreign_files(self):
+        with open(f"{self.path}.index", "wb") as file:
+            file.write(b"nope" + bytes(100))
+
+        self.assertRaises(ValueError, MmapStack, self.path)
+
+
+    def test_savepoint_rollback(self):
+        with MmapStack[int](self.path) as stack:
+            stack.push_all([1, 2, 3])
+
+            savepoint = stack.savepoint()
+            stack.push(4)
+            stack.push(5)
+            stack.pop()
+            list(stack.pop_n(2))
+            stack.push_all([6, 7])
+            stack.clear()
+            stack.rollback(savepoint)
+
+            self.assertListEqual(list(stack), [3, 2, 1])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,72 @@
+from module.persistent_stack import PersistentStack
+
+import copy
+import pickle
+import unittest
+
+from module.errors.empty_stack_error import EmptyStackError
+
+
+class TestPersistentStack(unittest.TestCase):
+    def test_empty_is_shared(self):
+        empty = PersistentStack[int].empty()
+
+        self.assertIs(empty, PersistentStack[str]())
+
+        self.assertTrue(empty.is_empty)
+
+        self.assertRaises(EmptyStackError, empty.pop)
+
+        self.assertRaises(EmptyStackError, empty.top)
+
+        self.assertIsNone(empty.top_or_none())
+
+    def test_versions_share_structure(self):
+        base = PersistentStack[int].from_sequence([1, 2, 3])
+        left = base.push(4)
+        right = base.push(5)
+
+        self.assertListEqual(list(base), [3, 2, 1])
+
+        self.assertListEqual(list(left), [4, 3, 2, 1])
+
+        self.assertListEqual(list(right), [5, 3, 2, 1])
+
+        self.assertIs(left.pop(), base)
+
+        self.assertIs(right.pop_n(2), base.pop())
+
+        self.assertEqual(left.top(), 4)
+
+        self.assertEqual(len(left), 4)
+
+        self.assertIn(2, right)
+
+        self.assertNotIn(4, right)
+
+        self.assertRaises(ValueError, base.pop_n, 4)
+
+    def test_pickle_and_copy(self):
+        stack = PersistentStack[int].from_sequence([1, 2, 3])
+
+        for clone in (pickle.loads(pickle.dumps(stack)), copy.copy(stack), copy.deepcopy(stack)):
+            self.assertListEqual(list(clone), [3, 2, 1])
+
+            self.assertEqual(len(clone), 3)
+
+        empty = PersistentStack[int].empty()
+
+        self.assertTrue(empty.is_empty)
+
+        self.assertEqual(len(empty), 0)
+
+        self.assertIs(pickle.loads(pickle.dumps(empty)), empty)
+
+        self.assertIs(copy.deepcopy(empty), empty)
+
+    def test_repr(self):
+        self.assertEqual(repr(PersistentStack.from_sequence([1, 2])), "PersistentStack.from_sequence([1, 2])")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,112 @@
+from module.stack import Stack
+from module.typed_stack import TypedStack
+from module import serialization
+
+import io
+import pickle
+import sys
+from array import array
+import unittest
+
+
+class TestSerialization(unittest.TestCase):
+    def dumped(self, stack: Stack, **kwargs) -> io.BytesIO:
+        file = io.BytesIO()
+        serialization.dump(stack, file, **kwargs)
+        file.seek(0)
+        return file
+
+    def test_objects_round_trip(self):
+        elements = ["a", (1, 2), None, bytearray(b"payload"), 3.5]
+        stack = Stack.from_sequence(elements)
+
+        loaded = serialization.load(self.dumped(stack))
+
+        self.assertListEqual(list(loaded), list(stack))
+
+        self.assertEqual(loaded.top(), 3.5)
+
+        self.assertListEqual(list(serialization.iter_load(self.dumped(stack))), elements)
+
+    def test_typed_stack_round_trip(self):
+        stack = TypedStack.from_sequence(range(serialization.CHUNK_ELEMENTS * 2 + 5), "q")
+
+        file = self.dumped(stack)
+        loaded = serialization.load(file, TypedStack)
+
+        self.assertEqual(len(file.getvalue()), 8 * len(stack) + 3 * 12 + 18)
+
+        self.assertEqual(loaded.typecode, "q")
+
+        self.assertListEqual(list(loaded), list(stack))
+
+        stack.push(1)
+
+        self.assertEqual(len(stack), serialization.CHUNK_ELEMENTS * 2 + 6)
+
+    def test_numbers_of_a_plain_stack(self):
+        stack = Stack.from_sequence([1.5, 2.5])
+
+        loaded = serialization.load(self.dumped(stack, typecode="d"))
+
+        self.assertListEqual(list(loaded), [2.5, 1.5])
+
+        self.assertRaises(TypeError, serialization.dump, Stack.from_sequence(["a"]), io.BytesIO(), typecode="d")
+
+    def test_streaming_reads_one_chunk_at_a_time(self):
+        file = self.dumped(TypedStack.from_sequence(range(serialization.CHUNK_ELEMENTS + 1), "d"))
+        elements = serialization.iter_load(file)
+
+        self.assertEqual(next(elements), 0.0)
+
+        self.assertLess(file.tell(), serialization.CHUNK_ELEMENTS * 8 + 100)
+
+        self.assertEqual(sum(1 for _ in elements), serialization.CHUNK_ELEMENTS)
+
+    def test_rejects_other_files(self):
+        self.assertRaises(ValueError, serialization.load, io.BytesIO(b"not a dump"))
+
+        truncated = self.dumped(Stack.from_sequence([1, 2, 3])).getvalue()[:-1]
+
+        self.assertRaises(ValueError, serialization.load, io.BytesIO(truncated))
+
+    def test_pickle(self):
+        stack = Stack.from_sequence([1, 2])
+        stack.savepoint()
+
+        copy = pickle.loads(pickle.dumps(stack))
+
+        self.assertListEqual(list(copy), [2, 1])
+
+        self.assertIsNone(copy._undo_log)
+
+    def test_pickle_typed_stack_out_of_band(self):
+        stack = TypedStack.from_sequence([float(index) for index in range(10_000)], "d")
+        buffers: list[pickle.PickleBuffer] = []
+
+        data = pickle.dumps(stack, protocol=5, buffer_callback=buffers.append)
+        copy = pickle.loads(data, buffers=buffers)
+
+        self.assertEqual(len(buffers), 1)
+
+        self.assertLess(len(data), 200)
+
+        self.assertListEqual(list(copy), list(stack))
+
+        self.assertListEqual(list(pickle.loads(pickle.dumps(stack, protocol=4))), list(stack))
+
+    def test_pickle_typed_stack_from_the_other_byte_order(self):
+        stack = TypedStack.from_sequence([1, 2, 3], "q")
+        rebuild, (cls, typecode, data, byteorder), state = stack.__reduce_ex__(4)
+
+        self.assertEqual(byteorder, sys.byteorder)
+
+        foreign = array(typecode, data)
+        foreign.byteswap()
+        other_byteorder = "big" if sys.byteorder == "little" else "little"
+
+        self.assertListEqual(list(rebuild(cls, typecode, foreign.tobytes(), other_byteorder)), [3, 2, 1])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -204,6 +204,19 @@ class TestStack(unittest.TestCase):
         with self.assertRaises(ValueError):
             list(my_stack.pop_n(10))
 
+    def test_pop_n_removes_eagerly(self):
+        my_stack = Stack[int].from_sequence([1, 2, 3, 4])
+
+        popped_items = my_stack.pop_n(2)
+
+        self.assertEqual(len(my_stack), 2)
+
+        self.assertListEqual(list(popped_items), [4, 3])
+
+        self.assertListEqual(list(my_stack.pop_n_or_all(5)), [2, 1])
+
+        self.assertTrue(my_stack.is_empty)
+
     def try_pop_n(self):
         int_tuple = (1, 2, 3, 4, 5, 6)
         my_stack = Stack[int].from_sequence(int_tuple)
@@ -220,6 +233,54 @@ class TestStack(unittest.TestCase):
 
         self.assertGreater(NUMBER_OF_ITEMS_TO_POP, len(popped_items))
 
+    def test_savepoint_rollback(self):
+        my_stack = Stack[int].from_sequence([1, 2, 3])
+
+        outer = my_stack.savepoint()
+        my_stack.push(4)
+        my_stack.pop_n(2)
+
+        inner = my_stack.savepoint()
+        my_stack.push_all([7, 8])
+        my_stack.clear()
+        my_stack.push(9)
+
+        my_stack.rollback(inner)
+
+        self.assertListEqual(list(my_stack), [2, 1])
+
+        my_stack.pop_all()
+        my_stack.rollback(outer)
+
+        self.assertListEqual(list(my_stack), [3, 2, 1])
+
+        self.assertRaises(ValueError, my_stack.rollback, inner)
+
+        my_stack.release_savepoints()
+
+        self.assertRaises(ValueError, my_stack.rollback, outer)
+
+    def test_rollback_rejects_foreign_savepoints(self):
+        my_stack = Stack[int].from_sequence([1, 2, 3])
+        other_stack = Stack[int].from_sequence([1, 2, 3])
+
+        released = my_stack.savepoint()
+        my_stack.release_savepoints()
+        current = my_stack.savepoint()
+        my_stack.push(4)
+        other_stack.savepoint()
+        other_stack.pop()
+
+        self.assertRaises(ValueError, my_stack.rollback, released)
+
+        self.assertRaises(ValueError, other_stack.rollback, current)
+
+        self.assertListEqual(list(other_stack), [2, 1])
+
+        my_stack.rollback(current)
+
+        self.assertListEqual(list(my_stack), [3, 2, 1])
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,118 @@
+from module.stack import Stack
+from module.typed_stack import TypedStack
+
+import unittest
+
+from module.errors.empty_stack_error import EmptyStackError
+
+
+class TestTypedStack(unittest.TestCase):
+    def test_isinstance(self):
+        typed = Stack.typed("d")
+
+        self.assertIsInstance(typed, TypedStack)
+
+        self.assertIsInstance(typed, Stack)
+
+        self.assertEqual(typed.typecode, "d")
+
+        self.assertEqual(typed.itemsize, 8)
+
+    def test_push_pop_top(self):
+        stack = TypedStack[int]("q")
+
+        self.assertTrue(stack.is_empty)
+
+        self.assertRaises(EmptyStackError, stack.pop)
+
+        self.assertRaises(EmptyStackError, stack.top)
+
+        stack.push(1)
+        stack.push(2)
+
+        self.assertEqual(stack.top(), 2)
+
+        self.assertEqual(stack.pop(), 2)
+
+        self.assertEqual(len(stack), 1)
+
+        self.assertIsNone(Stack.typed("q").pop_or_none())
+
+        with self.assertRaises(TypeError):
+            stack.push("not a number")  # type: ignore
+
+    def test_from_sequence_and_iteration(self):
+        stack = TypedStack[float].from_sequence([1.0, 2.0, 3.0])
+
+        self.assertListEqual(list(stack), [3.0, 2.0, 1.0])
+
+        self.assertIn(2.0, stack)
+
+        self.assertNotIn(5.0, stack)
+
+    def test_push_all_and_pop_n(self):
+        stack = TypedStack[int].from_sequence(range(10), typecode="i")
+
+        stack.push_all([10, 11])
+
+        self.assertEqual(len(stack), 12)
+
+        self.assertListEqual(list(stack.pop_n(3)), [11, 10, 9])
+
+        self.assertEqual(len(stack), 9)
+
+        with self.assertRaises(ValueError):
+            stack.pop_n(10)
+
+        self.assertListEqual(list(stack.pop_n_or_all(20)), list(reversed(range(9))))
+
+        self.assertTrue(stack.is_empty)
+
+    def test_pop_all(self):
+        stack = TypedStack[int].from_sequence([1, 2, 3], typecode="q")
+
+        self.assertListEqual(list(stack.pop_all()), [3, 2, 1])
+
+        self.assertTrue(stack.is_empty)
+
+    def test_buffer_protocol(self):
+        stack = TypedStack[float].from_sequence([1.5, 2.5])
+
+        with memoryview(stack) as view:
+            self.assertEqual(view.format, "d")
+
+            self.assertListEqual(view.tolist(), [1.5, 2.5])
+
+            with self.assertRaises(BufferError):
+                stack.push(3.5)
+
+        stack.push(3.5)
+
+        self.assertEqual(len(stack), 3)
+
+    def test_context_manager(self):
+        with Stack.typed("d") as stack:
+            stack.push(1.0)
+
+            self.assertEqual(len(stack), 1)
+
+        self.assertTrue(stack.is_empty)
+
+
+    def test_savepoint_rollback(self):
+        stack = TypedStack[int].from_sequence([1, 2, 3], "q")
+
+        savepoint = stack.savepoint()
+        stack.push(4)
+        stack.push(5)
+        stack.pop()
+        list(stack.pop_n(2))
+        stack.push_all(range(6, 9))
+        stack.clear()
+        stack.rollback(savepoint)
+
+        self.assertListEqual(list(stack), [3, 2, 1])
+
+
+if __name__ == "__main__":
+    unittest.main()